@@ -17,8 +17,8 @@ import asyncio
 import json
 import logging
 import os
+import random
 import shutil
-import socket
 import subprocess
 import sys
 import time
@@ -112,6 +112,8 @@ class HealthMonitorAgent:
 
     Responsibilities:
     - Continuous heartbeat monitoring of all nodes and MCP servers
+      (concurrent, time-boxed probes on jittered per-node schedules that
+      back off healthy nodes and probe failing ones sooner)
     - Latency and error rate tracking
     - Non-destructive auto-fixes (restart, cache clear, port rebind)
     - Destructive fix proposals with checkpoint creation
@@ -140,6 +142,17 @@ class HealthMonitorAgent:
         self.error_counts: Dict[str, int] = {}
         self.restart_counts: Dict[str, int] = {}
 
+        # Per-node schedule (monotonic times) and current base intervals
+        self.next_check_at: Dict[str, float] = {}
+        self.check_intervals: Dict[str, float] = {}
+
+        # Registry write coalescing: last persisted status per node
+        self._registry_status: Dict[str, Optional[str]] = {
+            node_id: node.get("status") for node_id, node in self.nodes.items()
+        }
+        self._registry_refreshed_at = time.monotonic()
+        self._last_report: Optional[Tuple[Dict[str, str], float]] = None
+
         # Fix tracking
         self.pending_fixes: List[FixAction] = []
         self.fix_history: List[FixAction] = []
@@ -154,23 +167,31 @@ class HealthMonitorAgent:
         """Load health monitoring configuration from policies."""
         policies_path = self.infrastructure_path / "profiles" / "policies.json"
 
-        if policies_path.exists():
-            with open(policies_path, "r") as f:
-                policies = json.load(f)
-                return policies.get("workspace_policies", {}).get(
-                    "health_monitoring", {}
-                )
-
         # Default configuration
-        return {
+        config = {
             "heartbeat_interval_seconds": 30,
             "latency_threshold_ms": 5000,
             "error_rate_threshold_percent": 10,
             "auto_restart_enabled": True,
             "max_auto_restart_attempts": 3,
             "checkpoint_before_destructive": True,
+            "max_concurrent_checks": 10,
+            "check_timeout_seconds": 10,
+            "max_check_interval_seconds": 120,
+            "failing_check_interval_seconds": 10,
+            "schedule_jitter_percent": 10,
+            "registry_refresh_seconds": 300,
         }
 
+        if policies_path.exists():
+            with open(policies_path, "r") as f:
+                policies = json.load(f)
+                config.update(
+                    policies.get("workspace_policies", {}).get("health_monitoring", {})
+                )
+
+        return config
+
     def _load_node_registry(self) -> Dict[str, Any]:
         """Load node registry from infrastructure."""
         registry_path = self.infrastructure_path / "nodes" / "registry.json"
@@ -207,24 +228,19 @@ class HealthMonitorAgent:
             HealthCheckResult with status and details
         """
         node_name = node_config.get("name", node_id)
-        endpoint = node_config.get("endpoint", "")
-        health_endpoint = node_config.get("health_endpoint")
-        node_type = node_config.get("type", "unknown")
+        timeout = self.config["check_timeout_seconds"]
 
         result = HealthCheckResult(
             node_id=node_id, node_name=node_name, status=HealthStatus.UNKNOWN
         )
 
-        # Check based on node type
-        if node_type in ["database", "cache"]:
-            # Check TCP connectivity for databases
-            result = await self._check_tcp_health(node_id, node_config, result)
-        elif health_endpoint and AIOHTTP_AVAILABLE:
-            # HTTP health check
-            result = await self._check_http_health(node_id, node_config, result)
-        else:
-            # Fallback to port check
-            result = await self._check_port_health(node_id, node_config, result)
+        try:
+            result = await asyncio.wait_for(
+                self._probe_node(node_id, node_config, result), timeout
+            )
+        except asyncio.TimeoutError:
+            result.status = HealthStatus.UNHEALTHY
+            result.error_message = f"Health check timed out after {timeout}s"
 
         # Update health state
         self.health_state[node_id] = result
@@ -237,6 +253,23 @@ class HealthMonitorAgent:
 
         return result
 
+    async def _probe_node(
+        self, node_id: str, node_config: Dict[str, Any], result: HealthCheckResult
+    ) -> HealthCheckResult:
+        """Run the check that fits the node type."""
+        health_endpoint = node_config.get("health_endpoint")
+        node_type = node_config.get("type", "unknown")
+
+        if node_type in ["database", "cache"]:
+            # Check TCP connectivity for databases
+            return await self._check_tcp_health(node_id, node_config, result)
+        elif health_endpoint and AIOHTTP_AVAILABLE:
+            # HTTP health check
+            return await self._check_http_health(node_id, node_config, result)
+        else:
+            # Fallback to port check
+            return await self._check_port_health(node_id, node_config, result)
+
     async def _check_http_health(
         self, node_id: str, node_config: Dict[str, Any], result: HealthCheckResult
     ) -> HealthCheckResult:
@@ -295,20 +328,13 @@ class HealthMonitorAgent:
         start_time = time.time()
 
         try:
-            # Create socket connection
-            loop = asyncio.get_event_loop()
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(5)
-
-            await loop.run_in_executor(None, lambda: sock.connect(("localhost", port)))
+            await self._open_port(port, timeout=5)
 
             latency = (time.time() - start_time) * 1000
             result.latency_ms = latency
             result.status = HealthStatus.HEALTHY
 
-            sock.close()
-
-        except socket.timeout:
+        except asyncio.TimeoutError:
             result.status = HealthStatus.UNHEALTHY
             result.error_message = "Connection timeout"
         except ConnectionRefusedError:
@@ -331,37 +357,101 @@ class HealthMonitorAgent:
             return result
 
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(2)
-            connection = sock.connect_ex(("localhost", port))
-            sock.close()
-
-            if connection == 0:
-                result.status = HealthStatus.HEALTHY
-            else:
-                result.status = HealthStatus.UNHEALTHY
-                result.error_message = f"Port {port} not responding"
+            await self._open_port(port, timeout=2)
+            result.status = HealthStatus.HEALTHY
 
+        except (OSError, asyncio.TimeoutError):
+            result.status = HealthStatus.UNHEALTHY
+            result.error_message = f"Port {port} not responding"
         except Exception as e:
             result.status = HealthStatus.UNHEALTHY
             result.error_message = str(e)
 
         return result
 
+    @staticmethod
+    async def _open_port(port: int, timeout: float):
+        """Open and close a TCP connection to localhost without blocking the loop."""
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection("localhost", port), timeout
+        )
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+
     async def check_all_nodes(self) -> Dict[str, HealthCheckResult]:
         """Check health of all registered nodes."""
-        results = {}
+        return await self._check_nodes(list(self.nodes))
+
+    async def check_due_nodes(self) -> Dict[str, HealthCheckResult]:
+        """Check the nodes whose scheduled check time has come."""
+        now = time.monotonic()
+        due = [
+            node_id
+            for node_id in self.nodes
+            if self.next_check_at.get(node_id, 0.0) <= now
+        ]
+        return await self._check_nodes(due)
+
+    async def _check_nodes(self, node_ids: List[str]) -> Dict[str, HealthCheckResult]:
+        """Probe nodes concurrently, reschedule them and persist the results."""
+        if not node_ids:
+            return {}
+
+        semaphore = asyncio.Semaphore(self.config["max_concurrent_checks"])
 
-        for node_id, node_config in self.nodes.items():
-            result = await self.check_node_health(node_id, node_config)
-            results[node_id] = result
+        async def probe(node_id: str) -> HealthCheckResult:
+            async with semaphore:
+                return await self.check_node_health(node_id, self.nodes[node_id])
+
+        checked = await asyncio.gather(*(probe(node_id) for node_id in node_ids))
+        results = dict(zip(node_ids, checked))
+
+        for node_id, result in results.items():
             logger.info(f"Health check {node_id}: {result.status.value}")
+            self._schedule_next_check(node_id, result)
 
         # Update registry with results
         await self._update_registry(results)
 
         return results
 
+    def _schedule_next_check(self, node_id: str, result: HealthCheckResult) -> float:
+        """
+        Pick the node's next check time. Healthy nodes back off (doubling up
+        to max_check_interval_seconds), failing nodes are probed every
+        failing_check_interval_seconds and degraded ones at the heartbeat
+        interval. Jitter keeps nodes from being probed in lockstep.
+        """
+        base = self.config["heartbeat_interval_seconds"]
+        previous = self.check_intervals.get(node_id)
+
+        if result.status == HealthStatus.HEALTHY:
+            if previous is None or previous < base:
+                interval = base
+            else:
+                interval = min(previous * 2, self.config["max_check_interval_seconds"])
+        elif result.status == HealthStatus.DEGRADED:
+            interval = base
+        else:
+            interval = min(self.config["failing_check_interval_seconds"], base)
+
+        self.check_intervals[node_id] = interval
+        jitter = self.config["schedule_jitter_percent"] / 100
+        delay = interval * random.uniform(1 - jitter, 1 + jitter)
+        self.next_check_at[node_id] = time.monotonic() + delay
+        return delay
+
+    def _seconds_until_next_check(self) -> float:
+        """Time to sleep before the next node is due (1s to heartbeat interval)."""
+        base = self.config["heartbeat_interval_seconds"]
+        scheduled = [self.next_check_at.get(node_id, 0.0) for node_id in self.nodes]
+        if not scheduled:
+            return base
+        return min(max(min(scheduled) - time.monotonic(), 1.0), base)
+
     async def check_mcp_servers(self) -> Dict[str, HealthCheckResult]:
         """Check health of all MCP servers."""
         mcp_servers = self._load_mcp_servers()
@@ -385,28 +475,65 @@ class HealthMonitorAgent:
         return results
 
     async def _update_registry(self, results: Dict[str, HealthCheckResult]):
-        """Update node registry with health check results."""
+        """
+        Update node registry with health check results.
+
+        Only nodes whose status changed are written; every
+        registry_refresh_seconds all nodes get a fresh last_health_check.
+        Nothing is written when there is nothing to update.
+        """
         registry_path = self.infrastructure_path / "nodes" / "registry.json"
 
         if not registry_path.exists():
             return
 
+        now = time.monotonic()
+        refresh = (
+            now - self._registry_refreshed_at >= self.config["registry_refresh_seconds"]
+        )
+        updates = {
+            node_id: result
+            for node_id, result in results.items()
+            if result.status.value != self._registry_status.get(node_id)
+        }
+        if refresh:
+            updates.update(
+                (node_id, self.health_state[node_id])
+                for node_id in self.nodes
+                if node_id in self.health_state
+            )
+
+        if not updates:
+            return
+
         try:
-            with open(registry_path, "r") as f:
-                registry = json.load(f)
+            await asyncio.to_thread(self._write_registry, registry_path, updates)
+        except Exception as e:
+            logger.error(f"Failed to update registry: {e}")
+            return
 
-            for node_id, result in results.items():
-                if node_id in registry.get("nodes", {}):
-                    registry["nodes"][node_id]["status"] = result.status.value
-                    registry["nodes"][node_id]["last_health_check"] = result.last_check
+        for node_id, result in updates.items():
+            self._registry_status[node_id] = result.status.value
+        if refresh:
+            self._registry_refreshed_at = now
 
-            registry["updated_at"] = datetime.now().isoformat()
+    @staticmethod
+    def _write_registry(registry_path: Path, updates: Dict[str, HealthCheckResult]):
+        """Apply results to the registry file, replacing it atomically."""
+        with open(registry_path, "r") as f:
+            registry = json.load(f)
 
-            with open(registry_path, "w") as f:
-                json.dump(registry, f, indent=2)
+        for node_id, result in updates.items():
+            if node_id in registry.get("nodes", {}):
+                registry["nodes"][node_id]["status"] = result.status.value
+                registry["nodes"][node_id]["last_health_check"] = result.last_check
 
-        except Exception as e:
-            logger.error(f"Failed to update registry: {e}")
+        registry["updated_at"] = datetime.now().isoformat()
+
+        tmp_path = registry_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(registry, f, indent=2)
+        os.replace(tmp_path, registry_path)
 
     # =========================================================================
     # Non-Destructive Fixes
@@ -784,41 +911,63 @@ class HealthMonitorAgent:
         self.is_monitoring = True
         logger.info("Starting health monitoring")
 
-        interval = self.config.get("heartbeat_interval_seconds", 30)
-
         while self.is_monitoring:
             try:
-                # Check all nodes
-                results = await self.check_all_nodes()
-
-                # Check MCP servers
-                mcp_results = await self.check_mcp_servers()
-
-                # Attempt auto-healing for unhealthy nodes
-                for node_id, result in results.items():
-                    if result.status in [HealthStatus.UNHEALTHY, HealthStatus.DEGRADED]:
-                        await self.auto_heal(result)
-
-                # Log summary
-                healthy = sum(
-                    1 for r in results.values() if r.status == HealthStatus.HEALTHY
-                )
-                total = len(results)
-                logger.info(f"Health check complete: {healthy}/{total} nodes healthy")
-
-                # Write health report
-                await self._write_health_report(results, mcp_results)
+                # Check the nodes that are due
+                results = await self.check_due_nodes()
+
+                if results:
+                    # Check MCP servers
+                    mcp_results = await self.check_mcp_servers()
+
+                    # Attempt auto-healing for unhealthy nodes
+                    for node_id, result in results.items():
+                        if result.status in [
+                            HealthStatus.UNHEALTHY,
+                            HealthStatus.DEGRADED,
+                        ]:
+                            await self.auto_heal(result)
+
+                    # Summarise the latest result of every node
+                    latest = {
+                        node_id: self.health_state[node_id]
+                        for node_id in self.nodes
+                        if node_id in self.health_state
+                    }
+                    healthy = sum(
+                        1 for r in latest.values() if r.status == HealthStatus.HEALTHY
+                    )
+                    logger.info(
+                        f"Health check complete: {len(results)} checked, "
+                        f"{healthy}/{len(latest)} nodes healthy"
+                    )
+
+                    # Write health report
+                    if self._report_due(latest):
+                        await self._write_health_report(latest, mcp_results)
 
             except Exception as e:
                 logger.error(f"Health monitoring error: {e}")
 
-            await asyncio.sleep(interval)
+            await asyncio.sleep(self._seconds_until_next_check())
 
     def stop_monitoring(self):
         """Stop health monitoring."""
         self.is_monitoring = False
         logger.info("Stopping health monitoring")
 
+    def _report_due(self, latest: Dict[str, HealthCheckResult]) -> bool:
+        """Report when a status changed or a heartbeat interval has passed."""
+        statuses = {node_id: r.status.value for node_id, r in latest.items()}
+        now = time.monotonic()
+        if self._last_report is not None:
+            last_statuses, last_at = self._last_report
+            interval = self.config["heartbeat_interval_seconds"]
+            if statuses == last_statuses and now - last_at < interval:
+                return False
+        self._last_report = (statuses, now)
+        return True
+
     async def _write_health_report(
         self,
         node_results: Dict[str, HealthCheckResult],
@@ -11,6 +11,7 @@ from .workspace_scanner_agent import (
     ComponentType,
     DirectoryInfo,
     FileInfo,
+    WorkspaceDelta,
     WorkspaceMap,
     WorkspaceScannerAgent,
     detect_capabilities,
@@ -20,6 +21,7 @@ from .workspace_scanner_agent import (
 __all__ = [
     "WorkspaceScannerAgent",
     "WorkspaceMap",
+    "WorkspaceDelta",
     "FileInfo",
     "DirectoryInfo",
     "AgentInstructionFile",
@@ -10,6 +10,9 @@ Features:
 - Agent instruction file extraction
 - Capability mapping (TTS, STT, calendar, email, image gen, etc.)
 - File change monitoring with automatic map updates
+- Incremental rescans: files whose mtime and size match the saved map are
+  reused, changed files are analyzed in a process pool, and each scan
+  reports the files added, changed and removed
 - Integration with Infrastructure Agent for context distribution
 - Langflow/n8n workflow integration for automated analysis
 
@@ -25,6 +28,8 @@ import re
 import sys
 import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -232,6 +237,33 @@ class WorkspaceMap:
     file_hashes: Dict[str, str]  # path -> hash for change detection
 
 
+@dataclass
+class WorkspaceDelta:
+    """Files added, changed and removed since the previous map"""
+
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0  # Files reused from the previous map without reading
+    analyzed: int = 0  # Files read and analyzed by this scan
+    duration_seconds: float = 0.0
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+
+# WorkspaceMap sections holding per-file entries besides `files`
+_FILE_SECTIONS = (
+    "agents",
+    "instruction_files",
+    "langflow_flows",
+    "n8n_workflows",
+    "integrations",
+    "tools",
+)
+
+
 # ============================================================================
 # Capability Detection
 # ============================================================================
@@ -528,6 +560,24 @@ def compute_file_hash(content: str) -> str:
     return hashlib.sha256(content.encode()).hexdigest()[:16]
 
 
+def _modified_iso(stat: os.stat_result) -> str:
+    """Modification time in the format stored in FileInfo.modified."""
+    return datetime.fromtimestamp(stat.st_mtime).isoformat()
+
+
+# Scanner used by process-pool workers, created once per worker process
+_worker_scanner: Optional["WorkspaceScannerAgent"] = None
+
+
+def _init_worker(workspace_root: str) -> None:
+    global _worker_scanner
+    _worker_scanner = WorkspaceScannerAgent(workspace_root)
+
+
+def _analyze_in_worker(item: Tuple[str, os.stat_result]) -> Optional[Dict[str, Any]]:
+    return _worker_scanner._analyze_file(*item)
+
+
 # ============================================================================
 # Workspace Scanner Agent
 # ============================================================================
@@ -578,6 +628,10 @@ class WorkspaceScannerAgent:
         ".xml",
     }
 
+    # Below this many changed files, analysis runs inline: starting a
+    # process pool costs more than it saves
+    PARALLEL_MIN_FILES = 200
+
     def __init__(self, workspace_root: Optional[str] = None):
         """Initialize the workspace scanner."""
         self.workspace_root = Path(
@@ -587,101 +641,132 @@ class WorkspaceScannerAgent:
         self.map_path.parent.mkdir(parents=True, exist_ok=True)
 
         self.workspace_map: Optional[WorkspaceMap] = None
+        self.last_delta: Optional[WorkspaceDelta] = None
         self.observer: Optional[Observer] = None
         self._lock = threading.Lock()
 
         logger.info(f"WorkspaceScannerAgent initialized at {self.workspace_root}")
 
-    def scan_workspace(self) -> WorkspaceMap:
+    def scan_workspace(
+        self, incremental: bool = False, workers: Optional[int] = None
+    ) -> WorkspaceMap:
         """
         Perform a deep recursive scan of the entire workspace.
 
+        Args:
+            incremental: Reuse entries from the previous map (in memory, or
+                loaded from map_path) for files whose mtime and size are
+                unchanged; only new and modified files are read
+            workers: Processes used to analyze files (default: CPU count);
+                small batches are analyzed inline
+
         Returns:
-            Complete WorkspaceMap with all components
+            Complete WorkspaceMap with all components. The difference from
+            the previous map is available as `last_delta`.
         """
-        logger.info("Starting deep workspace scan...")
+        start = time.perf_counter()
+        previous = self.workspace_map
+        if incremental and previous is None:
+            previous = self.load_map()
+        reusable = previous if incremental else None
+        logger.info(
+            "Starting incremental workspace scan..."
+            if reusable
+            else "Starting deep workspace scan..."
+        )
 
-        directories: Dict[str, DirectoryInfo] = {}
-        files: Dict[str, FileInfo] = {}
-        agents: Dict[str, Dict[str, Any]] = {}
-        instruction_files: Dict[str, AgentInstructionFile] = {}
-        capabilities: Dict[str, List[str]] = {}
-        langflow_flows: Dict[str, Dict[str, Any]] = {}
-        n8n_workflows: Dict[str, Dict[str, Any]] = {}
-        native_pipelines: Dict[str, Dict[str, Any]] = {}
-        integrations: Dict[str, Dict[str, Any]] = {}
-        tools: Dict[str, Dict[str, Any]] = {}
-        file_hashes: Dict[str, str] = {}
-
-        # Walk the entire workspace
+        # Walk the entire workspace, stat'ing each eligible file once
+        walked: List[Tuple[Path, List[str], List[str]]] = []
+        file_stats: Dict[str, os.stat_result] = {}
         for root, dirs, filenames in os.walk(self.workspace_root):
             root_path = Path(root)
-            relative_root = root_path.relative_to(self.workspace_root)
 
             # Skip excluded directories
             dirs[:] = [
                 d for d in dirs if d not in self.SKIP_DIRS and not d.startswith(".")
             ]
+            walked.append((root_path, list(dirs), filenames))
 
-            # Process directory
-            dir_info = self._process_directory(root_path, dirs, filenames)
-            directories[str(relative_root)] = dir_info
-
-            # Process files
             for filename in filenames:
                 file_path = root_path / filename
-                ext = file_path.suffix.lower()
 
-                # Only process certain file types
-                if ext not in self.SCAN_EXTENSIONS:
+                # Only process certain file types; the saved map is skipped
+                # so saving it does not show up as a change
+                if (
+                    file_path.suffix.lower() not in self.SCAN_EXTENSIONS
+                    or file_path == self.map_path
+                ):
                     continue
 
                 try:
-                    file_info = self._process_file(file_path)
-                    if file_info:
-                        rel_path = str(file_path.relative_to(self.workspace_root))
-                        files[rel_path] = file_info
-                        file_hashes[rel_path] = file_info.hash
-
-                        # Track capabilities
-                        for cap in file_info.capabilities:
-                            if cap not in capabilities:
-                                capabilities[cap] = []
-                            capabilities[cap].append(rel_path)
-
-                        # Categorize by type
-                        if file_info.component_type == ComponentType.AGENT.value:
-                            agents[rel_path] = self._extract_agent_info(
-                                file_path, file_info
-                            )
-                        elif (
-                            file_info.component_type == ComponentType.INSTRUCTION.value
-                        ):
-                            instr = self._parse_instruction_file(file_path)
-                            if instr:
-                                instruction_files[rel_path] = instr
-                        elif file_info.component_type == ComponentType.FLOW.value:
-                            flow_info = self._parse_langflow_flow(file_path)
-                            if flow_info:
-                                langflow_flows[rel_path] = flow_info
-                        elif file_info.component_type == ComponentType.WORKFLOW.value:
-                            workflow_info = self._parse_n8n_workflow(file_path)
-                            if workflow_info:
-                                n8n_workflows[rel_path] = workflow_info
-                        elif (
-                            file_info.component_type == ComponentType.INTEGRATION.value
-                        ):
-                            integrations[rel_path] = self._extract_integration_info(
-                                file_path, file_info
-                            )
-                        elif file_info.component_type == ComponentType.TOOL.value:
-                            tools[rel_path] = self._extract_tool_info(
-                                file_path, file_info
-                            )
-
-                except Exception as e:
+                    file_stats[str(file_path.relative_to(self.workspace_root))] = (
+                        file_path.stat()
+                    )
+                except OSError as e:
                     logger.warning(f"Error processing {file_path}: {e}")
 
+        # Only files that are new or whose stat changed are read
+        stale = {
+            rel_path: stat
+            for rel_path, stat in file_stats.items()
+            if not self._is_unchanged(reusable, rel_path, stat)
+        }
+        analyzed = self._analyze_files(stale, workers)
+
+        files: Dict[str, Dict[str, Any]] = {}
+        sections: Dict[str, Dict[str, Any]] = {name: {} for name in _FILE_SECTIONS}
+        for rel_path in file_stats:
+            if rel_path in analyzed:
+                record = analyzed[rel_path]
+                if not record:
+                    continue
+                files[rel_path] = record["file"]
+                if record["entry"] is not None:
+                    sections[record["section"]][rel_path] = record["entry"]
+            else:
+                files[rel_path] = reusable.files[rel_path]
+                for name in _FILE_SECTIONS:
+                    entry = getattr(reusable, name).get(rel_path)
+                    if entry is not None:
+                        sections[name][rel_path] = entry
+
+        delta = self._compute_delta(previous, files, analyzed)
+
+        # Reused agent entries record whether a flow or workflow exists for
+        # them, which changes when those files come and go
+        if reusable and any(
+            self._is_flow_or_workflow(rel_path)
+            for rel_path in delta.added + delta.removed
+        ):
+            for rel_path, agent in sections["agents"].items():
+                agent_path = self.workspace_root / rel_path
+                agent["has_langflow_flow"] = self._check_langflow_flow_exists(agent_path)
+                agent["has_n8n_workflow"] = self._check_n8n_workflow_exists(agent_path)
+
+        # Process directories; descriptions come from README.md / __init__.py,
+        # so they are reused unless one of those files changed
+        touched = set(stale) | set(delta.removed)
+        directories: Dict[str, Dict[str, Any]] = {}
+        for root_path, dirs, filenames in walked:
+            relative_root = str(root_path.relative_to(self.workspace_root))
+            old_dir = reusable.directories.get(relative_root) if reusable else None
+            if old_dir is not None and not any(
+                str(Path(relative_root) / name) in touched
+                for name in ("README.md", "__init__.py")
+            ):
+                description = old_dir.get("description")
+            else:
+                description = self._get_directory_description(root_path)
+            directories[relative_root] = asdict(
+                self._process_directory(root_path, dirs, filenames, description)
+            )
+
+        # Track capabilities
+        capabilities: Dict[str, List[str]] = {}
+        for rel_path, file_info in files.items():
+            for cap in file_info.get("capabilities", []):
+                capabilities.setdefault(cap, []).append(rel_path)
+
         # Load native pipelines from connections.json
         native_pipelines = self._load_native_pipelines()
 
@@ -689,38 +774,156 @@ class WorkspaceScannerAgent:
         now = datetime.now().isoformat()
         self.workspace_map = WorkspaceMap(
             version="1.0.0",
-            generated_at=now,
+            generated_at=previous.generated_at if reusable else now,
             last_updated=now,
             root_path=str(self.workspace_root),
             total_files=len(files),
             total_directories=len(directories),
-            total_agents=len(agents),
-            total_pipelines=len(langflow_flows)
-            + len(n8n_workflows)
+            total_agents=len(sections["agents"]),
+            total_pipelines=len(sections["langflow_flows"])
+            + len(sections["n8n_workflows"])
             + len(native_pipelines),
             total_capabilities=len(capabilities),
-            directories={k: asdict(v) for k, v in directories.items()},
-            files={k: asdict(v) for k, v in files.items()},
-            agents=agents,
-            instruction_files={k: asdict(v) for k, v in instruction_files.items()},
+            directories=directories,
+            files=files,
             capabilities=capabilities,
-            langflow_flows=langflow_flows,
-            n8n_workflows=n8n_workflows,
             native_pipelines=native_pipelines,
-            integrations=integrations,
-            tools=tools,
-            file_hashes=file_hashes,
+            file_hashes={k: v["hash"] for k, v in files.items()},
+            **sections,
         )
 
+        delta.duration_seconds = round(time.perf_counter() - start, 4)
+        self.last_delta = delta
+
         logger.info(
             f"Scan complete: {len(files)} files, {len(directories)} dirs, "
-            f"{len(agents)} agents, {len(capabilities)} capabilities"
+            f"{len(sections['agents'])} agents, {len(capabilities)} capabilities "
+            f"(+{len(delta.added)} ~{len(delta.changed)} -{len(delta.removed)}, "
+            f"{delta.analyzed} analyzed in {delta.duration_seconds}s)"
         )
 
         return self.workspace_map
 
+    @staticmethod
+    def _is_unchanged(
+        previous: Optional[WorkspaceMap], rel_path: str, stat: os.stat_result
+    ) -> bool:
+        """Whether the previous map's entry for a file still matches its stat."""
+        if previous is None:
+            return False
+        old = previous.files.get(rel_path)
+        return (
+            old is not None
+            and old.get("size") == stat.st_size
+            and old.get("modified") == _modified_iso(stat)
+        )
+
+    def _is_flow_or_workflow(self, rel_path: str) -> bool:
+        parts = Path(rel_path).parts[:2]
+        return parts in (("langflow", "flows"), ("n8n", "workflows"))
+
+    def _compute_delta(
+        self,
+        previous: Optional[WorkspaceMap],
+        files: Dict[str, Dict[str, Any]],
+        analyzed: Dict[str, Optional[Dict[str, Any]]],
+    ) -> WorkspaceDelta:
+        old_hashes = previous.file_hashes if previous else {}
+        delta = WorkspaceDelta(
+            unchanged=len(files) - len(analyzed), analyzed=len(analyzed)
+        )
+        for rel_path, file_info in files.items():
+            if rel_path not in old_hashes:
+                delta.added.append(rel_path)
+            elif rel_path in analyzed and old_hashes[rel_path] != file_info["hash"]:
+                delta.changed.append(rel_path)
+        delta.removed = [p for p in old_hashes if p not in files]
+        return delta
+
+    def _analyze_files(
+        self, file_stats: Dict[str, os.stat_result], workers: Optional[int] = None
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Analyze files, in a process pool when there are enough of them. The
+        stat results from the walk are reused rather than stat'ing again.
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(file_stats) < self.PARALLEL_MIN_FILES:
+            return self._analyze_inline(file_stats)
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(str(self.workspace_root),),
+            ) as pool:
+                chunksize = max(1, len(file_stats) // (workers * 4))
+                results = pool.map(
+                    _analyze_in_worker, file_stats.items(), chunksize=chunksize
+                )
+                return dict(zip(file_stats, results))
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning(f"Process pool unavailable, analyzing inline: {e}")
+            return self._analyze_inline(file_stats)
+
+    def _analyze_inline(
+        self, file_stats: Dict[str, os.stat_result]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        return {
+            rel_path: self._analyze_file(rel_path, stat)
+            for rel_path, stat in file_stats.items()
+        }
+
+    def _analyze_file(
+        self, rel_path: str, stat: Optional[os.stat_result] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read and analyze one file. Returns its FileInfo and, for agents,
+        instructions, flows, workflows, integrations and tools, the map
+        section and entry describing it (as plain dicts).
+        """
+        file_path = self.workspace_root / rel_path
+        try:
+            file_info = self._process_file(file_path, stat)
+        except Exception as e:
+            logger.warning(f"Error processing {file_path}: {e}")
+            return None
+        if not file_info:
+            return None
+
+        section, entry = None, None
+        try:
+            section, entry = self._categorize(file_path, file_info)
+        except Exception as e:
+            logger.warning(f"Error processing {file_path}: {e}")
+        return {"file": asdict(file_info), "section": section, "entry": entry}
+
+    def _categorize(
+        self, file_path: Path, file_info: FileInfo
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Categorize by type: the map section and entry for a file."""
+        component_type = file_info.component_type
+        if component_type == ComponentType.AGENT.value:
+            return "agents", self._extract_agent_info(file_path, file_info)
+        if component_type == ComponentType.INSTRUCTION.value:
+            instr = self._parse_instruction_file(file_path)
+            return "instruction_files", asdict(instr) if instr else None
+        if component_type == ComponentType.FLOW.value:
+            return "langflow_flows", self._parse_langflow_flow(file_path)
+        if component_type == ComponentType.WORKFLOW.value:
+            return "n8n_workflows", self._parse_n8n_workflow(file_path)
+        if component_type == ComponentType.INTEGRATION.value:
+            return "integrations", self._extract_integration_info(file_path, file_info)
+        if component_type == ComponentType.TOOL.value:
+            return "tools", self._extract_tool_info(file_path, file_info)
+        return None, None
+
     def _process_directory(
-        self, path: Path, subdirs: List[str], files: List[str]
+        self,
+        path: Path,
+        subdirs: List[str],
+        files: List[str],
+        description: Optional[str] = None,
     ) -> DirectoryInfo:
         """Process a directory and extract metadata."""
         relative = path.relative_to(self.workspace_root)
@@ -732,13 +935,16 @@ class WorkspaceScannerAgent:
             file_count=len(files),
             subdirs=subdirs,
             component_type=component_type.value,
-            description=self._get_directory_description(path),
+            description=description,
             capabilities=[],
         )
 
-    def _process_file(self, path: Path) -> Optional[FileInfo]:
-        """Process a file and extract metadata."""
+    def _process_file(
+        self, path: Path, stat: Optional[os.stat_result] = None
+    ) -> Optional[FileInfo]:
+        """Process a file and extract metadata (stat'ing it unless `stat` is given)."""
         try:
+            stat = stat or path.stat()
             content = path.read_text(encoding="utf-8", errors="ignore")
         except Exception:
             return None
@@ -754,8 +960,8 @@ class WorkspaceScannerAgent:
             path=str(relative),
             name=path.name,
             extension=path.suffix,
-            size=path.stat().st_size,
-            modified=datetime.fromtimestamp(path.stat().st_mtime).isoformat(),
+            size=stat.st_size,
+            modified=_modified_iso(stat),
             hash=compute_file_hash(content),
             component_type=component_type.value,
             language=get_file_language(path.suffix),
@@ -1234,11 +1440,24 @@ def main():
     parser.add_argument("--output", "-o", help="Output file path")
     parser.add_argument("--watch", action="store_true", help="Watch for changes")
     parser.add_argument("--summary", action="store_true", help="Print summary only")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-read files changed since the saved map",
+    )
+    parser.add_argument("--workers", type=int, help="Processes for file analysis")
 
     args = parser.parse_args()
 
     scanner = WorkspaceScannerAgent(args.workspace)
-    workspace_map = scanner.scan_workspace()
+    workspace_map = scanner.scan_workspace(
+        incremental=args.incremental, workers=args.workers
+    )
+    delta = scanner.last_delta
+    print(
+        f"Scan: +{len(delta.added)} ~{len(delta.changed)} -{len(delta.removed)} "
+        f"({delta.unchanged} unchanged) in {delta.duration_seconds}s"
+    )
 
     if args.summary:
         print("\n" + "=" * 60)
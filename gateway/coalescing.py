@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Request coalescing and fair per-backend concurrency for the Agent Gateway
+
+- RequestCoalescer: concurrent requests with the same key share one
+  upstream call; later callers await the call already in flight
+- FairLimiter: caps concurrent calls to one backend and hands free slots
+  to waiting clients in round-robin order, so a workflow that fires many
+  requests at once cannot starve the others
+"""
+
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict
+
+
+def request_key(payload: Dict[str, Any]) -> str:
+    """Stable key for a request payload."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class RequestCoalescer:
+    """Share one in-flight call between concurrent identical requests."""
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def run(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await `call()` or, if a call with the same key is in flight, its
+        result. A caller that goes away does not cancel the shared call.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _finished(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception retrieved even if every caller went away
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._inflight),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+        }
+
+
+class FairLimiter:
+    """
+    At most `limit` concurrent holders. When a slot frees up it goes to the
+    next waiting client in turn, not to whoever queued first.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = max(1, limit)
+        self.active = 0
+        self._queues: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+
+    @property
+    def queued(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    @asynccontextmanager
+    async def slot(self, client: str) -> AsyncIterator[None]:
+        await self._acquire(client)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, client: str) -> None:
+        if self.active < self.limit and not self._queues:
+            self.active += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(client, deque()).append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation
+                self._release()
+            else:
+                queue = self._queues.get(client)
+                if queue is not None and waiter in queue:
+                    queue.remove(waiter)
+                    if not queue:
+                        del self._queues[client]
+            raise
+
+    def _release(self) -> None:
+        self.active -= 1
+        while self.active < self.limit and self._queues:
+            client, queue = next(iter(self._queues.items()))
+            waiter = queue.popleft()
+            if queue:
+                # Round robin: this client goes to the back of the line
+                self._queues.move_to_end(client)
+            else:
+                del self._queues[client]
+            if waiter.done():
+                continue
+            self.active += 1
+            waiter.set_result(None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "queued": self.queued,
+            "waiting_clients": len(self._queues),
+        }
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Bounded executors for blocking work in the OsMEN Agent Gateway
+
+Keeps slow, blocking calls off the event loop:
+- CLIRunner: CLI bridges (gh copilot, aws) as async subprocesses, with a
+  concurrency cap, timeouts that kill the child, and cancellation when the
+  client goes away
+- IntegrationExecutor: a dedicated thread pool for sync integrations
+  (calendar, task manager) plus reuse of their long-lived objects, each
+  confined to its own thread
+- EventLoopLagMonitor: measures how late the loop wakes up, so regressions
+  show up in /metrics/runtime and the logs
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class CLIRunner:
+    """Run CLI commands as async subprocesses, at most `max_concurrency` at once."""
+
+    def __init__(self, max_concurrency: int = 4):
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.running = 0
+        self.waiting = 0
+        self.completed = 0
+        self.timeouts = 0
+
+    async def run(
+        self,
+        cmd: Sequence[str],
+        timeout: float,
+        env: Optional[Mapping[str, str]] = None,
+    ) -> subprocess.CompletedProcess:
+        """
+        Drop-in for `subprocess.run(cmd, capture_output=True, text=True,
+        timeout=timeout)`: raises subprocess.TimeoutExpired on timeout and
+        FileNotFoundError when the executable is missing. The timeout
+        starts once a slot is free.
+        """
+        semaphore = self._semaphore_for_loop()
+        self.waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.running += 1
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=dict(env) if env is not None else None,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                await self._kill(process)
+                raise subprocess.TimeoutExpired(list(cmd), timeout)
+            except asyncio.CancelledError:
+                await self._kill(process)
+                raise
+        finally:
+            self.running -= 1
+            semaphore.release()
+
+        self.completed += 1
+        return subprocess.CompletedProcess(
+            list(cmd),
+            process.returncode,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace"),
+        )
+
+    def _semaphore_for_loop(self) -> asyncio.Semaphore:
+        # The runner is a module singleton; a semaphore is bound to the loop
+        # it first blocks on, so each app lifespan's loop gets its own
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    @staticmethod
+    async def _kill(process: asyncio.subprocess.Process) -> None:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "running": self.running,
+            "waiting": self.waiting,
+            "completed": self.completed,
+            "timeouts": self.timeouts,
+        }
+
+
+class IntegrationExecutor:
+    """
+    Dedicated thread pool for blocking integration calls.
+
+    Separate from the loop's default executor (used by asyncio.to_thread
+    elsewhere), so a burst of slow integration calls cannot starve other
+    offloaded work. Shared instances wrap clients that are not thread-safe
+    (googleapiclient over httplib2), so each one is built and called on
+    its own single-thread executor via `run_shared`.
+
+    Pools are created on first use, so the module-level executor survives
+    `shutdown()` at the end of one app lifespan and serves the next.
+    """
+
+    def __init__(self, max_workers: int = 8):
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._instances: Dict[str, Any] = {}
+        self._instance_locks: Dict[str, asyncio.Lock] = {}
+        self._instance_executors: Dict[str, ThreadPoolExecutor] = {}
+        self.pending = 0
+        self.completed = 0
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking callable in the pool and await its result."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="gateway-integration"
+            )
+        return await self._run_in(self._executor, func, *args, **kwargs)
+
+    async def run_shared(self, name: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a call on the shared instance `name` (e.g. one of its bound
+        methods). Calls on one instance run one at a time, on the thread
+        that built it; waiting callers do not hold a pool thread.
+        """
+        return await self._run_in(self._instance_executor(name), func, *args, **kwargs)
+
+    async def _run_in(
+        self, executor: ThreadPoolExecutor, func: Callable[..., Any], *args, **kwargs
+    ) -> Any:
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, functools.partial(func, *args, **kwargs)
+            )
+        finally:
+            self.pending -= 1
+            self.completed += 1
+
+    def _instance_executor(self, name: str) -> ThreadPoolExecutor:
+        executor = self._instance_executors.get(name)
+        if executor is None:
+            executor = self._instance_executors[name] = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"gateway-integration-{name}"
+            )
+        return executor
+
+    async def shared(self, name: str, factory: Callable[[], Any]) -> Any:
+        """
+        Build `factory()` on the instance's own thread on first use and
+        reuse it afterwards. Concurrent first callers wait for one
+        construction; a failed construction is retried by the next caller.
+        """
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        lock = self._instance_locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            if name not in self._instances:
+                self._instances[name] = await self.run_shared(name, factory)
+        return self._instances[name]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "pending": self.pending,
+            "completed": self.completed,
+            "shared_instances": sorted(self._instances),
+        }
+
+    def shutdown(self) -> None:
+        """
+        Stop the pools. Shared instances are dropped with the threads they
+        belong to; later calls start fresh pools and rebuild them.
+        """
+        executors = list(self._instance_executors.values())
+        if self._executor is not None:
+            executors.append(self._executor)
+        for executor in executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+        self._instance_executors.clear()
+        self._instances.clear()
+        self._instance_locks.clear()
+
+
+class EventLoopLagMonitor:
+    """
+    Sleep for `interval` seconds in a loop and record how late each wake-up
+    is. Lag above `warn_after` seconds means something blocked the loop.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.5,
+        warn_after: float = 0.1,
+        window: int = 240,
+    ):
+        self.interval = interval
+        self.warn_after = warn_after
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.max_lag = 0.0
+        self.slow_ticks = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, loop.time() - expected))
+
+    def record(self, lag: float) -> None:
+        self._samples.append(lag)
+        self.max_lag = max(self.max_lag, lag)
+        if lag > self.warn_after:
+            self.slow_ticks += 1
+            logger.warning("Event loop lag %.0f ms", lag * 1000)
+
+    def _percentile(self, ordered: List[float], q: float) -> float:
+        index = min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def stats(self) -> Dict[str, Any]:
+        ordered = sorted(self._samples)
+        if not ordered:
+            return {"samples": 0, "slow_ticks": self.slow_ticks}
+        return {
+            "samples": len(ordered),
+            "last_ms": round(self._samples[-1] * 1000, 3),
+            "p50_ms": round(self._percentile(ordered, 50) * 1000, 3),
+            "p99_ms": round(self._percentile(ordered, 99) * 1000, 3),
+            "max_ms": round(self.max_lag * 1000, 3),
+            "slow_ticks": self.slow_ticks,
+        }
+
+
+cli_runner = CLIRunner(max_concurrency=int(os.getenv("GATEWAY_CLI_CONCURRENCY", "4")))
+integration_executor = IntegrationExecutor(
+    max_workers=int(os.getenv("GATEWAY_INTEGRATION_WORKERS", "8"))
+)
+loop_monitor = EventLoopLagMonitor(
+    interval=float(os.getenv("GATEWAY_LOOP_LAG_INTERVAL", "0.5")),
+    warn_after=float(os.getenv("GATEWAY_LOOP_LAG_WARN", "0.1")),
+)
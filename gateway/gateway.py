@@ -8,17 +8,18 @@ import asyncio
 import json
 import logging
 import os
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import asyncpg
 import httpx
 import redis.asyncio as redis
-from fastapi import Depends, FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from starlette.middleware.httpsredirect import HTTPSRedirectMiddleware
 
@@ -32,6 +33,21 @@ try:
 except ImportError:  # pragma: no cover
     from resilience import retryable_llm_call
 
+try:
+    from .executors import cli_runner, integration_executor, loop_monitor
+except ImportError:  # pragma: no cover
+    from executors import cli_runner, integration_executor, loop_monitor
+
+try:
+    from .coalescing import FairLimiter, RequestCoalescer, request_key
+except ImportError:  # pragma: no cover
+    from coalescing import FairLimiter, RequestCoalescer, request_key
+
+try:
+    from database.run_storage import close_run_storage
+except ImportError:  # database package not deployed with the gateway
+    close_run_storage = None
+
 from integrations.paths import (
     WorkspaceNotConfiguredError,
     get_vault_root,
@@ -80,7 +96,10 @@ class CompletionRequest(BaseModel):
     model: Optional[str] = None
     temperature: float = 0.7
     max_tokens: int = 2048
-    stream: bool = False
+    stream: bool = Field(
+        default=False,
+        description="Stream tokens as server-sent events (ollama and lmstudio)",
+    )
 
 
 class CompletionResponse(BaseModel):
@@ -119,10 +138,58 @@ class WorkspaceMapUpdatedRequest(BaseModel):
     """Notify the gateway that the workspace map has been updated."""
 
     workspace_path: str = Field(..., description="External semester workspace path")
+    rescan: bool = Field(
+        False,
+        description="Incrementally rescan the workspace and save the map before loading",
+    )
+
+
+class LatencyHistogram:
+    """Cumulative probe latency histogram (Prometheus-style buckets, in ms)."""
+
+    BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+
+    def observe(self, latency_ms: float) -> None:
+        index = len(self.BUCKETS_MS)
+        for i, bound in enumerate(self.BUCKETS_MS):
+            if latency_ms <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.sum_ms += latency_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        buckets: Dict[str, int] = {}
+        running = 0
+        for bound, count in zip(self.BUCKETS_MS + ("+Inf",), self.counts):
+            running += count
+            buckets[str(bound)] = running
+        return {
+            "count": self.count,
+            "sum_ms": round(self.sum_ms, 3),
+            "buckets": buckets,
+        }
 
 
 class ServiceHealthMonitor:
-    """Perform health checks against core infrastructure services."""
+    """
+    Perform health checks against core infrastructure services.
+
+    Probes run on a background schedule (start()/stop(), driven by the app
+    lifespan) over long-lived clients: the gateway's httpx client and the
+    rate limiter's Redis pool when attached, and a one-connection asyncpg
+    pool. Health endpoints are answered from the latest snapshot along
+    with its age; without the scheduler, a snapshot older than the
+    interval is refreshed on demand, shared by concurrent callers.
+    """
+
+    SERVICES = ("postgres", "redis", "chromadb", "qdrant", "langflow", "n8n")
 
     def __init__(self):
         self.postgres_config = {
@@ -150,43 +217,83 @@ class ServiceHealthMonitor:
             f"http://{os.getenv('N8N_HOST', 'n8n')}:{os.getenv('N8N_PORT', '5678')}",
         )
         self.http_timeout = float(os.getenv("SERVICE_HEALTH_TIMEOUT", "5"))
+        self.interval = float(os.getenv("HEALTH_CHECK_INTERVAL", "15"))
+        self.stale_after = float(
+            os.getenv("HEALTH_STALE_AFTER", str(self.interval * 3))
+        )
+        # Upper bound for one service's probe (ChromaDB tries several paths)
+        self.probe_timeout = float(
+            os.getenv("HEALTH_PROBE_TIMEOUT", str(self.http_timeout * 2))
+        )
+
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._redis_client: Optional[redis.Redis] = None
+        self._owned: List[Any] = []  # Clients created here, closed on stop()
+        self._pg_pool: Optional[asyncpg.Pool] = None
+        self._histograms = {name: LatencyHistogram() for name in self.SERVICES}
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._snapshot_at = 0.0
+        self._refreshing: Optional[asyncio.Task] = None
+        self._scheduler: Optional[asyncio.Task] = None
+
+    def attach(
+        self,
+        http_client: Optional[httpx.AsyncClient] = None,
+        redis_client: Optional[redis.Redis] = None,
+    ) -> None:
+        """Probe through shared clients instead of creating our own."""
+        if http_client is not None:
+            self._http_client = http_client
+        if redis_client is not None:
+            self._redis_client = redis_client
+
+    def _http(self) -> httpx.AsyncClient:
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(timeout=self.http_timeout)
+            self._owned.append(self._http_client)
+        return self._http_client
+
+    def _redis(self) -> redis.Redis:
+        if self._redis_client is None:
+            self._redis_client = redis.Redis(
+                host=self.redis_config["host"],
+                port=self.redis_config["port"],
+                password=self.redis_config["password"],
+                encoding="utf-8",
+                decode_responses=True,
+            )
+            self._owned.append(self._redis_client)
+        return self._redis_client
 
     async def check_postgres(self) -> Tuple[bool, str]:
         """Verify PostgreSQL connectivity with a lightweight query."""
-        conn = None
         try:
-            conn = await asyncpg.connect(
-                user=self.postgres_config["user"],
-                password=self.postgres_config["password"],
-                database=self.postgres_config["database"],
-                host=self.postgres_config["host"],
-                port=self.postgres_config["port"],
-                timeout=self.postgres_config["timeout"],
-            )
-            await conn.execute("SELECT 1")
+            if self._pg_pool is None:
+                self._pg_pool = await asyncpg.create_pool(
+                    user=self.postgres_config["user"],
+                    password=self.postgres_config["password"],
+                    database=self.postgres_config["database"],
+                    host=self.postgres_config["host"],
+                    port=self.postgres_config["port"],
+                    timeout=self.postgres_config["timeout"],
+                    min_size=1,
+                    max_size=1,
+                )
+            async with self._pg_pool.acquire(
+                timeout=self.postgres_config["timeout"]
+            ) as conn:
+                await conn.execute("SELECT 1")
             return True, "PostgreSQL responded to SELECT 1"
         except Exception as exc:
             return False, f"PostgreSQL error: {exc}"
-        finally:
-            if conn:
-                await conn.close()
 
     async def check_redis(self) -> Tuple[bool, str]:
         """Verify Redis availability using PING."""
-        client = redis.Redis(
-            host=self.redis_config["host"],
-            port=self.redis_config["port"],
-            password=self.redis_config["password"],
-            encoding="utf-8",
-            decode_responses=True,
-        )
         try:
-            pong = await client.ping()
+            pong = await self._redis().ping()
             return True, f"Redis responded with {pong}"
         except Exception as exc:
             return False, f"Redis error: {exc}"
-        finally:
-            await client.close()
 
     async def check_qdrant(self) -> Tuple[bool, str]:
         """Verify Qdrant REST API health endpoint (optional, legacy)."""
@@ -232,8 +339,7 @@ class ServiceHealthMonitor:
     ) -> Tuple[bool, str]:
         """Perform a simple HTTP GET and report status."""
         try:
-            async with httpx.AsyncClient(timeout=self.http_timeout) as client:
-                response = await client.get(url)
+            response = await self._http().get(url, timeout=self.http_timeout)
             ok = response.status_code in expected
             detail = f"HTTP {response.status_code}"
             try:
@@ -248,57 +354,143 @@ class ServiceHealthMonitor:
             return False, str(exc)
 
     async def collect(self) -> Dict[str, Dict[str, Any]]:
-        """Gather health for all registered services concurrently."""
-        checks = {
-            "postgres": self.check_postgres(),
-            "redis": self.check_redis(),
-            "chromadb": self.check_chromadb(),
-            "qdrant": self.check_qdrant(),  # Legacy, disabled by default
-            "langflow": self.check_langflow(),
-            "n8n": self.check_n8n(),
-        }
-        tasks = {name: asyncio.create_task(coro) for name, coro in checks.items()}
-        results: Dict[str, Dict[str, Any]] = {}
-        for name, task in tasks.items():
+        """Probe all services now and return their health."""
+        return (await self.refresh())["services"]
+
+    async def refresh(self) -> Dict[str, Any]:
+        """Probe all services concurrently; concurrent callers share one run."""
+        if self._refreshing is None or self._refreshing.done():
+            self._refreshing = asyncio.create_task(self._probe_all())
+        # A cancelled request must not cancel the run other callers await
+        return await asyncio.shield(self._refreshing)
+
+    async def _probe_all(self) -> Dict[str, Any]:
+        async def probe(name: str) -> Tuple[str, Dict[str, Any]]:
+            start = time.perf_counter()
             try:
-                ok, detail = await task
+                ok, detail = await asyncio.wait_for(
+                    getattr(self, f"check_{name}")(), timeout=self.probe_timeout
+                )
+            except asyncio.TimeoutError:
+                ok, detail = False, f"Timed out after {self.probe_timeout}s"
             except Exception as exc:
                 ok, detail = False, f"Unexpected error: {exc}"
-            results[name] = {"ok": ok, "detail": detail}
-        return results
-
-    async def summary(self) -> Dict[str, Any]:
-        """Return overall health summary including per-service detail."""
-        services = await self.collect()
-        status = (
-            "healthy" if all(entry["ok"] for entry in services.values()) else "degraded"
-        )
-        return {
-            "status": status,
+            latency_ms = (time.perf_counter() - start) * 1000
+            self._histograms[name].observe(latency_ms)
+            return name, {"ok": ok, "detail": detail, "latency_ms": round(latency_ms, 2)}
+
+        services = dict(await asyncio.gather(*(probe(name) for name in self.SERVICES)))
+        self._snapshot = {
+            "status": (
+                "healthy" if all(entry["ok"] for entry in services.values()) else "degraded"
+            ),
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "services": services,
         }
+        self._snapshot_at = time.monotonic()
+        return self._snapshot
+
+    async def _current(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Latest snapshot and its staleness metadata."""
+        age = time.monotonic() - self._snapshot_at
+        if self._snapshot is None or (not self.running and age > self.interval):
+            await self.refresh()
+            age = time.monotonic() - self._snapshot_at
+        return self._snapshot, {
+            "age_seconds": round(age, 3),
+            "stale": age > self.stale_after,
+        }
+
+    async def summary(self) -> Dict[str, Any]:
+        """Return overall health summary including per-service detail."""
+        snapshot, freshness = await self._current()
+        status = snapshot["status"]
+        if freshness["stale"]:
+            # The scheduler has stopped producing results; don't vouch for them
+            status = "degraded"
+        return {**snapshot, "status": status, **freshness}
 
     async def service_status(self, service: str) -> Optional[Dict[str, Any]]:
         """Return the health status for a single named service."""
         service_name = service.lower()
-        check_method = getattr(self, f"check_{service_name}", None)
-        if not check_method:
+        if service_name not in self.SERVICES:
             return None
-        ok, detail = await check_method()
+        snapshot, freshness = await self._current()
         return {
             "service": service_name,
-            "ok": ok,
-            "detail": detail,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            **snapshot["services"][service_name],
+            "timestamp": snapshot["timestamp"],
+            **freshness,
+            "latency_histogram": self._histograms[service_name].to_dict(),
         }
 
+    @property
+    def running(self) -> bool:
+        return self._scheduler is not None and not self._scheduler.done()
+
+    def start(self) -> None:
+        """Start probing every `interval` seconds in the background."""
+        if not self.running:
+            self._scheduler = asyncio.create_task(self._schedule())
+
+    async def _schedule(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as exc:
+                logger.warning("Health refresh failed: %s", exc)
+            await asyncio.sleep(self.interval)
+
+    async def stop(self) -> None:
+        """Stop the scheduler and close the clients this monitor created."""
+        for task in (self._scheduler, self._refreshing):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._scheduler = self._refreshing = None
+        if self._pg_pool is not None:
+            await self._pg_pool.close()
+            self._pg_pool = None
+        for client in self._owned:
+            try:
+                if isinstance(client, httpx.AsyncClient):
+                    await client.aclose()
+                else:
+                    await client.close()
+            except Exception as exc:
+                logger.debug("Error closing health client: %s", exc)
+        if self._http_client in self._owned:
+            self._http_client = None
+        if self._redis_client in self._owned:
+            self._redis_client = None
+        self._owned = []
+
 
 health_monitor = ServiceHealthMonitor()
 
 
 class AgentGateway:
-    """Gateway for routing requests to different LLM agents"""
+    """
+    Gateway for routing requests to different LLM agents.
+
+    Concurrent identical completions share one upstream call, and each
+    backend has a concurrency limit (GATEWAY_CONCURRENCY_<AGENT>) whose
+    queue is served round-robin across clients.
+    """
+
+    # Default concurrent upstream calls per backend; local servers get few
+    BACKEND_CONCURRENCY = {
+        "openai": 16,
+        "copilot": 4,
+        "amazonq": 4,
+        "claude": 16,
+        "lmstudio": 1,
+        "ollama": 2,
+    }
+    STREAMING_AGENTS = ("ollama", "lmstudio")
 
     def __init__(self):
         self.openai_key = os.getenv("OPENAI_API_KEY")
@@ -312,11 +504,42 @@ class AgentGateway:
         self.ollama_url = os.getenv("OLLAMA_URL", "http://ollama:11434")
 
         self.client = httpx.AsyncClient(timeout=120.0)
+        self.coalescer = RequestCoalescer()
+        self.limiters = {
+            agent: FairLimiter(
+                int(os.getenv(f"GATEWAY_CONCURRENCY_{agent.upper()}", str(default)))
+            )
+            for agent, default in self.BACKEND_CONCURRENCY.items()
+        }
 
-    async def completion(self, request: CompletionRequest) -> CompletionResponse:
+    async def completion(
+        self, request: CompletionRequest, client: str = "anonymous"
+    ) -> CompletionResponse:
         """Route completion request to appropriate agent"""
         agent = request.agent.lower()
+        if agent not in self.limiters:
+            raise HTTPException(status_code=400, detail=f"Unknown agent: {agent}")
 
+        key = request_key(
+            {
+                "agent": agent,
+                "model": request.model,
+                "prompt": request.prompt,
+                "temperature": request.temperature,
+                "max_tokens": request.max_tokens,
+            }
+        )
+        return await self.coalescer.run(
+            key, lambda: self._limited_completion(agent, request, client)
+        )
+
+    async def _limited_completion(
+        self, agent: str, request: CompletionRequest, client: str
+    ) -> CompletionResponse:
+        async with self.limiters[agent].slot(client):
+            return await self._dispatch(agent, request)
+
+    async def _dispatch(self, agent: str, request: CompletionRequest) -> CompletionResponse:
         if agent == "openai":
             return await self._openai_completion(request)
         elif agent == "copilot":
@@ -332,6 +555,33 @@ class AgentGateway:
         else:
             raise HTTPException(status_code=400, detail=f"Unknown agent: {agent}")
 
+    async def stream_completion(
+        self, request: CompletionRequest, client: str = "anonymous"
+    ) -> AsyncIterator[str]:
+        """
+        Yield completion text as the backend produces it (ollama and
+        lmstudio). Holds a backend slot until the stream ends or the caller
+        goes away; streams are not coalesced.
+        """
+        agent = request.agent.lower()
+        if agent not in self.STREAMING_AGENTS:
+            raise HTTPException(
+                status_code=400, detail=f"Streaming is not supported for {agent}"
+            )
+        async with self.limiters[agent].slot(client):
+            if agent == "ollama":
+                chunks = self._ollama_stream(request)
+            else:
+                chunks = self._lmstudio_stream(request)
+            async for chunk in chunks:
+                yield chunk
+
+    def completion_stats(self) -> Dict[str, Any]:
+        return {
+            "coalescing": self.coalescer.stats(),
+            "backends": {agent: limiter.stats() for agent, limiter in self.limiters.items()},
+        }
+
     @retryable_llm_call(max_attempts=3)
     async def _openai_completion(
         self, request: CompletionRequest
@@ -409,11 +659,9 @@ class AgentGateway:
                 # Format: gh copilot suggest "what to do" --shell-out
                 cmd = ["gh", "copilot", "suggest", "--shell-out", prompt]
 
-            # Run the command
-            result = subprocess.run(
+            # Run the command off the event loop
+            result = await cli_runner.run(
                 cmd,
-                capture_output=True,
-                text=True,
                 timeout=60,
                 env={
                     **os.environ,
@@ -533,7 +781,7 @@ class AgentGateway:
                 "/dev/stdout",  # Output to stdout for capture
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = await cli_runner.run(cmd, timeout=120)
 
             if result.returncode == 0:
                 try:
@@ -675,6 +923,60 @@ class AgentGateway:
                 detail="Ollama not reachable. Start with: docker-compose --profile ollama up -d",
             )
 
+    async def _ollama_stream(self, request: CompletionRequest) -> AsyncIterator[str]:
+        model = request.model or os.getenv("OLLAMA_MODEL", "llama2")
+        payload = {"model": model, "prompt": request.prompt, "stream": True}
+
+        try:
+            async with self.client.stream(
+                "POST", f"{self.ollama_url}/api/generate", json=payload
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    data = json.loads(line)
+                    if data.get("response"):
+                        yield data["response"]
+                    if data.get("done"):
+                        break
+        except httpx.ConnectError:
+            raise HTTPException(
+                status_code=503,
+                detail="Ollama not reachable. Start with: docker-compose --profile ollama up -d",
+            )
+
+    async def _lmstudio_stream(self, request: CompletionRequest) -> AsyncIterator[str]:
+        model = request.model or os.getenv("LM_STUDIO_MODEL", "local-model")
+        payload = {
+            "model": model,
+            "messages": [{"role": "user", "content": request.prompt}],
+            "temperature": request.temperature,
+            "max_tokens": request.max_tokens,
+            "stream": True,
+        }
+
+        try:
+            async with self.client.stream(
+                "POST", f"{self.lm_studio_url}/chat/completions", json=payload
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:") :].strip()
+                    if data == "[DONE]":
+                        break
+                    choices = json.loads(data).get("choices") or [{}]
+                    content = choices[0].get("delta", {}).get("content")
+                    if content:
+                        yield content
+        except httpx.ConnectError:
+            raise HTTPException(
+                status_code=503,
+                detail="LM Studio not reachable. Please start LM Studio on host and enable API server.",
+            )
+
     async def list_agents(self) -> Dict[str, Any]:
         """List available agents and their status"""
         agents = {
@@ -707,8 +1009,16 @@ class AgentGateway:
 async def lifespan(app: FastAPI):
     """Lifespan context manager"""
     logger.info("Starting OsMEN Agent Gateway")
+    health_monitor.start()
+    loop_monitor.start()
     yield
     logger.info("Shutting down OsMEN Agent Gateway")
+    await loop_monitor.stop()
+    await health_monitor.stop()
+    if close_run_storage is not None:
+        # Flush buffered run steps and tool calls before exiting
+        await close_run_storage()
+    integration_executor.shutdown()
 
 
 app = FastAPI(
@@ -749,6 +1059,8 @@ DEFAULT_RATE_LIMIT = max(1, int(os.getenv("RATE_LIMIT_PER_MINUTE", "120") or 120
 completion_guard = rate_limiter.guard("completion", DEFAULT_RATE_LIMIT, 60)
 agents_guard = rate_limiter.guard("agents", max(30, DEFAULT_RATE_LIMIT // 4), 60)
 health_guard = rate_limiter.guard("health", 60, 60)
+# Health probes reuse the gateway's connection pools
+health_monitor.attach(http_client=gateway.client, redis_client=rate_limiter.redis)
 
 
 @app.get("/")
@@ -757,16 +1069,69 @@ async def root():
     return {"service": "OsMEN Agent Gateway", "version": "1.0.0", "status": "running"}
 
 
+@app.get("/metrics/runtime")
+async def runtime_metrics(_: None = Depends(health_guard)):
+    """Event loop lag and executor utilisation."""
+    return {
+        "event_loop_lag": loop_monitor.stats(),
+        "completion": gateway.completion_stats(),
+        "cli": cli_runner.stats(),
+        "integrations": integration_executor.stats(),
+    }
+
+
 @app.get("/agents")
 async def list_agents(_: None = Depends(agents_guard)):
     """List available agents"""
     return await gateway.list_agents()
 
 
+def _client_id(http_request: Request) -> str:
+    """Identity used for fair queueing: X-Client-Id (e.g. an n8n workflow) or the IP."""
+    explicit = http_request.headers.get("x-client-id")
+    if explicit:
+        return explicit
+    return http_request.client.host if http_request.client else "anonymous"
+
+
+async def _sse_completion(first: str, chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    yield f"data: {json.dumps({'content': first})}\n\n"
+    try:
+        async for chunk in chunks:
+            yield f"data: {json.dumps({'content': chunk})}\n\n"
+    except Exception as exc:
+        # Headers are already sent; report the failure in-band
+        detail = exc.detail if isinstance(exc, HTTPException) else str(exc)
+        yield f"data: {json.dumps({'error': detail})}\n\n"
+    yield "data: [DONE]\n\n"
+
+
 @app.post("/completion", response_model=CompletionResponse)
-async def completion(request: CompletionRequest, _: None = Depends(completion_guard)):
-    """Generate completion using specified agent"""
-    return await gateway.completion(request)
+async def completion(
+    request: CompletionRequest,
+    http_request: Request,
+    _: None = Depends(completion_guard),
+):
+    """
+    Generate completion using specified agent.
+
+    With stream set (ollama, lmstudio) the text arrives as server-sent
+    events of {"content": ...} followed by [DONE].
+    """
+    client = _client_id(http_request)
+    if request.stream and request.agent.lower() in gateway.STREAMING_AGENTS:
+        chunks = gateway.stream_completion(request, client)
+        # Wait for the first token so connection errors still get a status code
+        try:
+            first = await chunks.__anext__()
+        except StopAsyncIteration:
+            first = ""
+        return StreamingResponse(
+            _sse_completion(first, chunks),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+    return await gateway.completion(request, client)
 
 
 def _set_external_workspace_for_request(
@@ -788,8 +1153,10 @@ async def calendar_today():
     try:
         from integrations.calendars.calendar_manager import CalendarManager
 
-        manager = CalendarManager()
-        events = manager.list_events(max_results=20)
+        manager = await integration_executor.shared("calendar_manager", CalendarManager)
+        events = await integration_executor.run_shared(
+            "calendar_manager", manager.list_events, max_results=20
+        )
         return {"events": events, "total": len(events)}
     except Exception as exc:
         return {"events": [], "total": 0, "error": str(exc)}
@@ -803,18 +1170,21 @@ async def tasks_today():
             PersonalAssistantAgent,
         )
 
-        agent = PersonalAssistantAgent()
-        tasks = agent.get_tasks(due_today=True)
+        agent = await integration_executor.shared(
+            "personal_assistant", PersonalAssistantAgent
+        )
+    except Exception as exc:
+        return {"tasks": [], "total": 0, "error": str(exc)}
+
+    try:
+        tasks = await integration_executor.run_shared(
+            "personal_assistant", agent.get_tasks, due_today=True
+        )
         return {"tasks": tasks, "total": len(tasks)}
     except TypeError:
         # Backward compatibility: agent.get_tasks signature may vary.
         try:
-            from agents.personal_assistant.personal_assistant_agent import (
-                PersonalAssistantAgent,
-            )
-
-            agent = PersonalAssistantAgent()
-            tasks = agent.get_tasks()
+            tasks = await integration_executor.run_shared("personal_assistant", agent.get_tasks)
             return {"tasks": tasks, "total": len(tasks)}
         except Exception as exc:
             return {"tasks": [], "total": 0, "error": str(exc)}
@@ -881,22 +1251,41 @@ async def tts_generate(request: TTSAudioRequest):
 
 @app.post("/api/workspace/map-updated")
 async def workspace_map_updated(request: WorkspaceMapUpdatedRequest):
-    """Reload workspace map from disk for the specified external workspace."""
+    """
+    Reload workspace map from disk for the specified external workspace.
+
+    With rescan set, files changed since the saved map are re-analyzed
+    first (unchanged files are not read) and the delta is returned.
+    """
     ws = _set_external_workspace_for_request(request.workspace_path)
 
     try:
+        from dataclasses import asdict
+
         from agents.workspace_scanner.workspace_scanner_agent import (
             WorkspaceScannerAgent,
         )
 
         scanner = WorkspaceScannerAgent(workspace_root=str(ws))
         workspace_map = scanner.load_map()
-        return {
+        response = {
             "success": True,
             "workspace": str(ws),
             "map_loaded": bool(workspace_map),
             "map_path": str(scanner.map_path),
         }
+        if request.rescan:
+
+            def rescan():
+                scanner.scan_workspace(incremental=True)
+                # A missing map file is written even when nothing changed
+                if not scanner.last_delta.is_empty or not scanner.map_path.exists():
+                    scanner.save_map()
+
+            await asyncio.to_thread(rescan)
+            response["map_loaded"] = True
+            response["delta"] = asdict(scanner.last_delta)
+        return response
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -909,10 +1298,8 @@ async def _health_response():
 
 @app.get("/health")
 async def health(_: None = Depends(health_guard)):
-    """Aggregate health endpoint for infrastructure services."""
-    summary = await health_monitor.summary()
-    status_code = 200 if summary["status"] == "healthy" else 503
-    return JSONResponse(summary, status_code=status_code)
+    """Aggregate health endpoint for infrastructure services (cached snapshot)."""
+    return await _health_response()
 
 
 @app.get("/healthz")
@@ -921,6 +1308,7 @@ async def healthz(_: None = Depends(health_guard)):
     return await health()
 
 
+@app.get("/health/{service_name}")
 @app.get("/healthz/{service_name}")
 async def service_health(service_name: str, _: None = Depends(health_guard)):
     """Return health information for an individual service."""
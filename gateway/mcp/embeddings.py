@@ -0,0 +1,302 @@
+"""
+Embedding Service for OsMEN MCP Server
+Coalesces concurrent embedding requests into provider batch calls
+
+Features:
+- Micro-batching: requests arriving within a short window share one
+  provider call (OpenAI ``input`` arrays, Ollama ``/api/embed``)
+- In-flight de-duplication of identical texts
+- LRU cache keyed on (model, text hash)
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingService:
+    """
+    Batched, cached embedding client for the MCP tool handlers.
+
+    Provider selection order:
+    - ``provider`` if set ("ollama" or "openai")
+    - OpenAI if an API key is configured
+    - Ollama if a URL is configured
+    """
+
+    def __init__(
+        self,
+        get_client: Callable[[], Awaitable[Any]],
+        provider: str = "",
+        ollama_url: str = "",
+        ollama_model: str = "",
+        openai_api_key: str = "",
+        openai_base_url: str = "https://api.openai.com/v1",
+        openai_model: str = "",
+        batch_window_ms: Optional[float] = None,
+        max_batch_size: Optional[int] = None,
+        cache_size: Optional[int] = None,
+    ):
+        self._get_client = get_client
+        self.provider = provider
+        self.ollama_url = ollama_url
+        self.ollama_model = ollama_model
+        self.openai_api_key = openai_api_key
+        self.openai_base_url = openai_base_url
+        self.openai_model = openai_model
+
+        self.batch_window = (
+            batch_window_ms
+            if batch_window_ms is not None
+            else float(os.getenv("MCP_EMBED_BATCH_WINDOW_MS", "5"))
+        ) / 1000
+        self.max_batch_size = max_batch_size or int(
+            os.getenv("MCP_EMBED_MAX_BATCH", "64")
+        )
+        self.cache_size = (
+            cache_size
+            if cache_size is not None
+            else int(os.getenv("MCP_EMBED_CACHE_SIZE", "2048"))
+        )
+
+        self._cache: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+        # Texts waiting for the next batch, and futures for every queued or
+        # in-flight text so identical concurrent requests share one slot
+        self._queue: List[Tuple[Tuple[str, str], str]] = []
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+
+        self._stats = {
+            "requests": 0,
+            "cache_hits": 0,
+            "coalesced": 0,
+            "provider_calls": 0,
+            "texts_embedded": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def embed(self, text: str) -> List[float]:
+        """Embed a single text, sharing a provider call with concurrent requests."""
+        return (await self.embed_many([text]))[0]
+
+    async def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """Embed several texts; results are returned in input order."""
+        provider, model = self._resolve_provider()
+        loop = asyncio.get_running_loop()
+
+        waiters: List[asyncio.Future] = []
+        for text in texts:
+            self._stats["requests"] += 1
+            key = (model, hashlib.sha256(text.encode("utf-8")).hexdigest())
+
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._stats["cache_hits"] += 1
+                future = loop.create_future()
+                future.set_result(cached)
+                waiters.append(future)
+                continue
+
+            future = self._inflight.get(key)
+            if future is not None:
+                self._stats["coalesced"] += 1
+            else:
+                future = self._inflight[key] = loop.create_future()
+                self._queue.append((key, text))
+            waiters.append(future)
+
+        if len(self._queue) >= self.max_batch_size:
+            self._flush(provider, model)
+        elif self._queue and self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                self.batch_window, self._flush, provider, model
+            )
+
+        # Shield so one cancelled caller does not cancel a shared future
+        results = await asyncio.gather(
+            *(asyncio.shield(f) for f in waiters), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return list(results)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache and batching statistics."""
+        return {
+            **self._stats,
+            "cache_entries": len(self._cache),
+            "pending": len(self._queue),
+        }
+
+    async def close(self):
+        """Wait for in-flight batches to settle."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._queue:
+            provider, model = self._resolve_provider()
+            self._flush(provider, model)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    # ------------------------------------------------------------------
+    # Batching
+    # ------------------------------------------------------------------
+
+    def _flush(self, provider: str, model: str):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        while self._queue:
+            batch = self._queue[: self.max_batch_size]
+            del self._queue[: self.max_batch_size]
+            task = asyncio.ensure_future(self._run_batch(provider, model, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(
+        self, provider: str, model: str, batch: List[Tuple[Tuple[str, str], str]]
+    ):
+        try:
+            self._stats["provider_calls"] += 1
+            embeddings = await self._call_provider(
+                provider, model, [text for _, text in batch]
+            )
+            if len(embeddings) != len(batch):
+                raise RuntimeError(
+                    f"Embedding provider returned {len(embeddings)} vectors for {len(batch)} inputs"
+                )
+        except Exception as e:
+            for key, _ in batch:
+                future = self._inflight.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            return
+
+        self._stats["texts_embedded"] += len(batch)
+        for (key, _), embedding in zip(batch, embeddings):
+            self._remember(key, embedding)
+            future = self._inflight.pop(key, None)
+            if future is not None and not future.done():
+                future.set_result(embedding)
+
+    def _remember(self, key: Tuple[str, str], embedding: List[float]):
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = embedding
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Providers
+    # ------------------------------------------------------------------
+
+    def _resolve_provider(self) -> Tuple[str, str]:
+        provider = self.provider
+        if not provider:
+            # Prefer OpenAI if configured; only auto-select Ollama if explicitly configured.
+            if self.openai_api_key:
+                provider = "openai"
+            elif self.ollama_url:
+                provider = "ollama"
+
+        if provider == "ollama":
+            if not self.ollama_model:
+                raise RuntimeError(
+                    "Ollama embedding provider selected but OLLAMA_EMBED_MODEL not configured"
+                )
+            return provider, f"ollama:{self.ollama_model}"
+
+        if provider == "openai":
+            if not self.openai_api_key:
+                raise RuntimeError(
+                    "OpenAI embedding provider selected but OPENAI_API_KEY not configured"
+                )
+            return provider, f"openai:{self.openai_model}"
+
+        raise RuntimeError(
+            "No embeddings provider configured. Set EMBED_PROVIDER (ollama/openai) and provider env vars."
+        )
+
+    async def _call_provider(
+        self, provider: str, model: str, texts: List[str]
+    ) -> List[List[float]]:
+        if provider == "ollama":
+            return await self._embed_ollama(texts)
+        return await self._embed_openai(texts)
+
+    async def _embed_openai(self, texts: List[str]) -> List[List[float]]:
+        client = await self._get_client()
+        resp = await client.post(
+            f"{self.openai_base_url.rstrip('/')}/embeddings",
+            headers={
+                "Authorization": f"Bearer {self.openai_api_key}",
+                "Content-Type": "application/json",
+            },
+            json={"model": self.openai_model, "input": texts},
+            timeout=60.0,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        items = data.get("data") if isinstance(data, dict) else None
+        if not isinstance(items, list) or len(items) != len(texts):
+            raise RuntimeError(f"OpenAI embeddings response missing embeddings: {data}")
+
+        items = sorted(items, key=lambda item: item.get("index", 0))
+        embeddings = [item.get("embedding") for item in items]
+        if not all(isinstance(e, list) and e for e in embeddings):
+            raise RuntimeError(f"OpenAI embeddings response missing embedding: {data}")
+        return embeddings
+
+    async def _embed_ollama(self, texts: List[str]) -> List[List[float]]:
+        client = await self._get_client()
+        base_url = (self.ollama_url or "http://localhost:11434").rstrip("/")
+
+        resp = await client.post(
+            f"{base_url}/api/embed",
+            json={"model": self.ollama_model, "input": texts},
+            timeout=60.0,
+        )
+        if resp.status_code == 404:
+            # Ollama releases before /api/embed only embed one prompt per call
+            return await asyncio.gather(
+                *(self._embed_ollama_legacy(client, base_url, text) for text in texts)
+            )
+        resp.raise_for_status()
+        data = resp.json()
+        embeddings = data.get("embeddings")
+        if not isinstance(embeddings, list) or not all(
+            isinstance(e, list) and e for e in embeddings
+        ):
+            raise RuntimeError(
+                f"Ollama embeddings response missing 'embeddings': {data}"
+            )
+        return embeddings
+
+    async def _embed_ollama_legacy(
+        self, client: Any, base_url: str, text: str
+    ) -> List[float]:
+        resp = await client.post(
+            f"{base_url}/api/embeddings",
+            json={"model": self.ollama_model, "prompt": text},
+            timeout=60.0,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        embedding = data.get("embedding")
+        if not isinstance(embedding, list) or not embedding:
+            raise RuntimeError(f"Ollama embeddings response missing 'embedding': {data}")
+        return embedding
@@ -42,6 +42,7 @@ from pydantic import BaseModel, Field
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from gateway.mcp.embeddings import EmbeddingService
 from gateway.mcp.tools import (
     ToolCategory,
     ToolDefinition,
@@ -163,6 +164,15 @@ class ToolHandlers:
             "OPENAI_EMBED_MODEL",
             "text-embedding-3-small",
         ).strip()
+        self.embeddings = EmbeddingService(
+            self.get_http_client,
+            provider=self.embed_provider,
+            ollama_url=self.ollama_url,
+            ollama_model=self.ollama_embed_model,
+            openai_api_key=self.openai_api_key,
+            openai_base_url=self.openai_base_url,
+            openai_model=self.openai_embed_model,
+        )
 
         # Paths
         self.obsidian_vault = os.getenv("OBSIDIAN_VAULT_PATH", "./obsidian-vault")
@@ -194,85 +204,20 @@ class ToolHandlers:
 
     async def close(self):
         """Close HTTP client"""
+        await self.embeddings.close()
         if self._http_client:
             await self._http_client.aclose()
 
     async def _embed_text(self, text: str) -> List[float]:
         """Generate an embedding vector for text using configured provider.
 
-        Provider selection order:
-        - EMBED_PROVIDER if set ("ollama" or "openai")
-        - Ollama if OLLAMA_URL is set
-        - OpenAI if OPENAI_API_KEY is set
+        Concurrent calls are coalesced into provider batch requests and
+        results are cached; see EmbeddingService.
 
         Raises:
             RuntimeError if no provider is configured or provider call fails.
         """
-        provider = self.embed_provider
-        if not provider:
-            # Prefer OpenAI if configured; only auto-select Ollama if explicitly configured.
-            if self.openai_api_key:
-                provider = "openai"
-            elif self.ollama_url:
-                provider = "ollama"
-
-        client = await self.get_http_client()
-
-        if provider == "ollama":
-            if not self.ollama_embed_model:
-                raise RuntimeError(
-                    "Ollama embedding provider selected but OLLAMA_EMBED_MODEL not configured"
-                )
-
-            base_url = self.ollama_url or "http://localhost:11434"
-            url = f"{base_url.rstrip('/')}/api/embeddings"
-            resp = await client.post(
-                url,
-                json={"model": self.ollama_embed_model, "prompt": text},
-                timeout=60.0,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            embedding = data.get("embedding")
-            if not isinstance(embedding, list) or not embedding:
-                raise RuntimeError(
-                    f"Ollama embeddings response missing 'embedding': {data}"
-                )
-            return embedding
-
-        if provider == "openai":
-            if not self.openai_api_key:
-                raise RuntimeError(
-                    "OpenAI embedding provider selected but OPENAI_API_KEY not configured"
-                )
-
-            url = f"{self.openai_base_url.rstrip('/')}/embeddings"
-            headers = {
-                "Authorization": f"Bearer {self.openai_api_key}",
-                "Content-Type": "application/json",
-            }
-            resp = await client.post(
-                url,
-                headers=headers,
-                json={"model": self.openai_embed_model, "input": text},
-                timeout=60.0,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            embedding = (
-                (data.get("data") or [{}])[0].get("embedding")
-                if isinstance(data, dict)
-                else None
-            )
-            if not isinstance(embedding, list) or not embedding:
-                raise RuntimeError(
-                    f"OpenAI embeddings response missing embedding: {data}"
-                )
-            return embedding
-
-        raise RuntimeError(
-            "No embeddings provider configured. Set EMBED_PROVIDER (ollama/openai) and provider env vars."
-        )
+        return await self.embeddings.embed(text)
 
     def _get_chroma(self):
         """Lazy-load ChromaDB HttpClient."""
@@ -624,6 +569,56 @@ class ToolHandlers:
             "content_preview": content[:100],
         }
 
+    @traced("tool.memory_store_batch")
+    async def memory_store_batch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Store many documents with batched embeddings and one ChromaDB add."""
+        collection_name = params.get("collection", "default_memory")
+
+        documents = params.get("documents")
+        if not isinstance(documents, list) or not documents:
+            return {"error": "Missing required field: documents"}
+
+        default_importance = float(params.get("importance", 0.5))
+        timestamp = datetime.now().isoformat()
+        ids, contents, metadatas = [], [], []
+        for index, doc in enumerate(documents):
+            if isinstance(doc, str):
+                doc = {"content": doc}
+            content = doc.get("content", "") if isinstance(doc, dict) else ""
+            if not content:
+                return {"error": f"Document {index} is missing required field: content"}
+            ids.append(doc.get("id") or os.urandom(16).hex())
+            contents.append(content)
+            metadatas.append(
+                {
+                    **(doc.get("metadata") or {}),
+                    "importance": float(doc.get("importance", default_importance)),
+                    "timestamp": timestamp,
+                }
+            )
+
+        embeddings = await self.embeddings.embed_many(contents)
+
+        chroma = self._get_chroma()
+        collection = await asyncio.to_thread(
+            chroma.get_or_create_collection, collection_name
+        )
+        await asyncio.to_thread(
+            collection.add,
+            ids=ids,
+            documents=contents,
+            metadatas=metadatas,
+            embeddings=embeddings,
+        )
+
+        return {
+            "status": "stored",
+            "ids": ids,
+            "count": len(ids),
+            "collection": collection_name,
+            "vector_size": len(embeddings[0]),
+        }
+
     @traced("tool.memory_recall")
     async def memory_recall(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Recall from ChromaDB vector memory using real embeddings."""
@@ -1529,6 +1524,7 @@ class MCPServer:
             "librarian_ingest": self.handlers.librarian_ingest,
             # Memory
             "memory_store": self.handlers.memory_store,
+            "memory_store_batch": self.handlers.memory_store_batch,
             "memory_recall": self.handlers.memory_recall,
             "memory_forget": self.handlers.memory_forget,
             "memory_collections": self.handlers.memory_collections,
@@ -1826,6 +1822,7 @@ def create_app() -> FastAPI:
             "uptime_seconds": (datetime.now() - mcp_server.start_time).total_seconds(),
             "tools_registered": len(mcp_server.registry.list()),
             "categories": len(ToolCategory),
+            "embeddings": mcp_server.handlers.embeddings.get_stats(),
         }
 
     return app
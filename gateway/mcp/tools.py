@@ -494,6 +494,45 @@ class ToolRegistry:
             )
         )
 
+        self.register(
+            ToolDefinition(
+                name="memory_store_batch",
+                description="Store many documents in vector memory with batched embeddings",
+                category=ToolCategory.MEMORY,
+                parameters={
+                    "documents": ParameterSchema(
+                        type="array",
+                        description="Documents to store: strings or {content, metadata, importance, id}",
+                        items={
+                            "type": "object",
+                            "properties": {
+                                "content": {"type": "string"},
+                                "metadata": {"type": "object"},
+                                "importance": {"type": "number"},
+                                "id": {"type": "string"},
+                            },
+                            "required": ["content"],
+                        },
+                        required=True,
+                    ),
+                    "collection": ParameterSchema(
+                        type="string",
+                        description="Memory collection name",
+                        default="default_memory",
+                    ),
+                    "importance": ParameterSchema(
+                        type="number",
+                        description="Default importance for documents without one",
+                        default=0.5,
+                        minimum=0,
+                        maximum=1,
+                    ),
+                },
+                handler="memory.store_batch",
+                tags=["memory", "vector", "batch"],
+            )
+        )
+
         self.register(
             ToolDefinition(
                 name="memory_recall",
@@ -72,6 +72,27 @@ class RateLimitStrategy(ABC):
     def reset(self, key: str):
         """Reset rate limit for a key."""
         pass
+    
+    def sweep(self, now: Optional[float] = None) -> int:
+        """
+        Drop state for keys whose limits have fully decayed.
+        
+        Only keys that would behave exactly like a never-seen key are
+        removed, so sweeping never changes a rate limit decision.
+        
+        Returns:
+            Number of keys removed
+        """
+        return 0
+    
+    def tracked_keys(self) -> int:
+        """Number of keys currently holding state."""
+        return 0
+
+
+def _window_limit(window_size: int, config: RateLimitConfig) -> int:
+    """Resolve the request limit for a window strategy."""
+    return int(config.requests_per_minute if window_size == 60 else config.requests_per_hour)
 
 
 class TokenBucketStrategy(RateLimitStrategy):
@@ -81,19 +102,25 @@ class TokenBucketStrategy(RateLimitStrategy):
     """
     
     def __init__(self):
-        # {key: (tokens, last_refill_time)}
-        self._buckets: Dict[str, Tuple[float, float]] = defaultdict(lambda: (0.0, 0.0))
+        # {key: (tokens, last_refill_time)}; a missing key is a full bucket
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        # {key: (requests_per_second, burst_size)} so sweep() knows when a bucket is full
+        self._rates: Dict[str, Tuple[float, int]] = {}
         # Lazy initialization of lock - avoid calling asyncio.get_event_loop() during init
         self._lock = None
     
     def check(self, key: str, config: RateLimitConfig) -> RateLimitResult:
         current_time = time.time()
-        tokens, last_refill = self._buckets[key]
+        bucket = self._buckets.get(key)
         
-        # Calculate tokens to add since last request
-        time_passed = current_time - last_refill if last_refill > 0 else 0
-        tokens_to_add = time_passed * config.requests_per_second
-        tokens = min(config.burst_size, tokens + tokens_to_add)
+        if bucket is None:
+            tokens = float(config.burst_size)
+        else:
+            # Calculate tokens to add since last request
+            tokens, last_refill = bucket
+            tokens_to_add = (current_time - last_refill) * config.requests_per_second
+            tokens = min(config.burst_size, tokens + tokens_to_add)
+        self._rates[key] = (config.requests_per_second, config.burst_size)
         
         if tokens >= 1:
             # Allow request, consume one token
@@ -120,14 +147,31 @@ class TokenBucketStrategy(RateLimitStrategy):
             )
     
     def reset(self, key: str):
-        if key in self._buckets:
+        self._buckets.pop(key, None)
+        self._rates.pop(key, None)
+    
+    def sweep(self, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        expired = []
+        for key, (tokens, last_refill) in self._buckets.items():
+            rate, burst_size = self._rates[key]
+            if rate <= 0 or tokens + (now - last_refill) * rate >= burst_size:
+                expired.append(key)
+        for key in expired:
             del self._buckets[key]
+            del self._rates[key]
+        return len(expired)
+    
+    def tracked_keys(self) -> int:
+        return len(self._buckets)
 
 
 class SlidingWindowStrategy(RateLimitStrategy):
     """
-    Sliding window rate limiting.
-    More accurate than fixed windows, prevents burst at window boundaries.
+    Sliding window log rate limiting.
+    Exact, but keeps one timestamp per request in the window, so memory and
+    per-check cost grow with the limit. Prefer SlidingWindowCounterStrategy
+    for large limits or many keys.
     """
     
     def __init__(self, window_size: int = 60):
@@ -142,7 +186,7 @@ class SlidingWindowStrategy(RateLimitStrategy):
         # Remove old requests
         self._requests[key] = [t for t in self._requests[key] if t > window_start]
         
-        limit = int(config.requests_per_minute if self.window_size == 60 else config.requests_per_hour)
+        limit = _window_limit(self.window_size, config)
         current_count = len(self._requests[key])
         
         if current_count < limit:
@@ -171,6 +215,112 @@ class SlidingWindowStrategy(RateLimitStrategy):
     def reset(self, key: str):
         if key in self._requests:
             del self._requests[key]
+    
+    def sweep(self, now: Optional[float] = None) -> int:
+        window_start = (time.time() if now is None else now) - self.window_size
+        expired = [
+            key for key, timestamps in self._requests.items()
+            if not timestamps or timestamps[-1] <= window_start
+        ]
+        for key in expired:
+            del self._requests[key]
+        return len(expired)
+    
+    def tracked_keys(self) -> int:
+        return len(self._requests)
+
+
+class _WindowCounter:
+    """Per-key state for SlidingWindowCounterStrategy."""
+    
+    __slots__ = ("window", "current", "previous")
+    
+    def __init__(self, window: int):
+        self.window = window
+        self.current = 0
+        self.previous = 0
+
+
+class SlidingWindowCounterStrategy(RateLimitStrategy):
+    """
+    Sliding window counter rate limiting.
+    
+    Approximates a sliding window by weighting the previous fixed window's
+    count by how much of it still overlaps the sliding window:
+    
+        estimate = previous * (1 - elapsed_fraction) + current
+    
+    Per-key state is two counters and a window index, so memory and check
+    cost are O(1) regardless of the limit, while still smoothing the bursts
+    that FixedWindowStrategy allows at window boundaries.
+    """
+    
+    def __init__(self, window_size: int = 60):
+        self.window_size = window_size
+        self._counters: Dict[str, _WindowCounter] = {}
+    
+    def check(self, key: str, config: RateLimitConfig) -> RateLimitResult:
+        current_time = time.time()
+        window = int(current_time // self.window_size)
+        
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = self._counters[key] = _WindowCounter(window)
+        elif counter.window != window:
+            # Roll forward; anything older than the previous window has no weight
+            counter.previous = counter.current if counter.window == window - 1 else 0
+            counter.current = 0
+            counter.window = window
+        
+        limit = _window_limit(self.window_size, config)
+        elapsed = (current_time - window * self.window_size) / self.window_size
+        estimated = counter.previous * (1 - elapsed) + counter.current
+        window_remaining = (1 - elapsed) * self.window_size
+        
+        if estimated < limit:
+            # Allow request
+            counter.current += 1
+            
+            return RateLimitResult(
+                allowed=True,
+                remaining=max(0, int(limit - estimated - 1)),
+                reset_at=datetime.utcnow() + timedelta(seconds=window_remaining),
+                limit=limit
+            )
+        
+        # Deny request; work out when the weighted estimate drops below the limit
+        if counter.current < limit and counter.previous > 0:
+            needed = 1 - (limit - counter.current) / counter.previous
+            retry_after = (needed - elapsed) * self.window_size
+        else:
+            # Wait for the next window, where this window's count becomes "previous"
+            needed = 1 - limit / counter.current if counter.current else 0
+            retry_after = window_remaining + max(0, needed) * self.window_size
+        retry_after = max(0, retry_after)
+        
+        return RateLimitResult(
+            allowed=False,
+            remaining=0,
+            reset_at=datetime.utcnow() + timedelta(seconds=retry_after),
+            retry_after=retry_after,
+            limit=limit
+        )
+    
+    def reset(self, key: str):
+        self._counters.pop(key, None)
+    
+    def sweep(self, now: Optional[float] = None) -> int:
+        window = int((time.time() if now is None else now) // self.window_size)
+        expired = [
+            key for key, counter in self._counters.items()
+            if counter.window < window - 1
+        ]
+        for key in expired:
+            del self._counters[key]
+        return len(expired)
+    
+    def tracked_keys(self) -> int:
+        return len(self._counters)
 
 
 class FixedWindowStrategy(RateLimitStrategy):
@@ -196,7 +346,7 @@ class FixedWindowStrategy(RateLimitStrategy):
             self._windows[key] = (0, window_start)
         
         count, _ = self._windows[key]
-        limit = int(config.requests_per_minute if self.window_size == 60 else config.requests_per_hour)
+        limit = _window_limit(self.window_size, config)
         
         if count < limit:
             # Allow request
@@ -223,6 +373,19 @@ class FixedWindowStrategy(RateLimitStrategy):
     def reset(self, key: str):
         if key in self._windows:
             del self._windows[key]
+    
+    def sweep(self, now: Optional[float] = None) -> int:
+        current_start = self._get_window_start(time.time() if now is None else now)
+        expired = [
+            key for key, (_, window_start) in self._windows.items()
+            if window_start < current_start
+        ]
+        for key in expired:
+            del self._windows[key]
+        return len(expired)
+    
+    def tracked_keys(self) -> int:
+        return len(self._windows)
 
 
 class RateLimiter:
@@ -246,19 +409,25 @@ class RateLimiter:
             for key, value in result.to_headers().items():
                 response.headers[key] = value
             return response
+    
+    Idle keys are expired by sweep(); call start_sweeper() from a running
+    event loop to do that periodically in the background.
     """
     
     def __init__(
         self,
         config: Optional[RateLimitConfig] = None,
-        strategies: Optional[Dict[str, RateLimitStrategy]] = None
+        strategies: Optional[Dict[str, RateLimitStrategy]] = None,
+        sweep_interval: float = 60.0
     ):
         self.config = config or RateLimitConfig()
+        self.sweep_interval = sweep_interval
+        self._sweeper_task: Optional[asyncio.Task] = None
         
         # Default strategies
         self.strategies = strategies or {
             "burst": TokenBucketStrategy(),
-            "minute": SlidingWindowStrategy(window_size=60),
+            "minute": SlidingWindowCounterStrategy(window_size=60),
             "hour": FixedWindowStrategy(window_size=3600)
         }
         
@@ -378,6 +547,53 @@ class RateLimiter:
         for strategy_name, strategy in self.strategies.items():
             strategy.reset(f"{key}:{strategy_name}")
     
+    def sweep(self, now: Optional[float] = None) -> int:
+        """
+        Expire idle keys from every strategy.
+        
+        Per-key statistics with no denials are dropped as well, since they
+        never contribute to top_denied.
+        
+        Returns:
+            Number of strategy keys removed
+        """
+        removed = sum(strategy.sweep(now) for strategy in self.strategies.values())
+        by_key = self._stats["by_key"]
+        for key in [k for k, v in by_key.items() if not v["denied"]]:
+            del by_key[key]
+        if removed:
+            logger.debug(f"Rate limiter sweep expired {removed} idle keys")
+        return removed
+    
+    def start_sweeper(self) -> Optional[asyncio.Task]:
+        """Start the background sweeper on the running loop (idempotent)."""
+        if self._sweeper_task and not self._sweeper_task.done():
+            return self._sweeper_task
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        self._sweeper_task = loop.create_task(self._sweep_loop())
+        return self._sweeper_task
+    
+    async def stop_sweeper(self):
+        """Cancel the background sweeper."""
+        task, self._sweeper_task = self._sweeper_task, None
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    
+    async def _sweep_loop(self):
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error(f"Rate limiter sweep failed: {e}")
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get rate limiting statistics."""
         return {
@@ -388,6 +604,10 @@ class RateLimiter:
                 self._stats["denied_requests"] / self._stats["total_requests"]
                 if self._stats["total_requests"] > 0 else 0
             ),
+            "tracked_keys": {
+                name: strategy.tracked_keys()
+                for name, strategy in self.strategies.items()
+            },
             "top_denied": sorted(
                 [(k, v["denied"]) for k, v in self._stats["by_key"].items()],
                 key=lambda x: x[1],
@@ -493,6 +713,7 @@ def create_rate_limit_middleware(config: Optional[RateLimitConfig] = None):
     limiter = get_rate_limiter(config)
     
     async def middleware(request, call_next):
+        limiter.start_sweeper()
         result = limiter.check(request)
         
         if not result.allowed:
@@ -1,14 +1,54 @@
+import math
 import os
 import time
-from collections import defaultdict, deque
-from typing import Optional
+from typing import Dict, List
 
 import redis.asyncio as redis
 from fastapi import HTTPException, Request
 
 
+# Sliding window counter in a single round-trip. State lives in one hash per
+# key ({w: window index, c: current count, p: previous count}) that expires
+# once both windows have passed. Uses the Redis clock so every gateway
+# instance agrees on window boundaries.
+SLIDING_WINDOW_LUA = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local idx = math.floor(now / window)
+
+local state = redis.call('HMGET', KEYS[1], 'w', 'c', 'p')
+local w = tonumber(state[1]) or idx
+local c = tonumber(state[2]) or 0
+local p = tonumber(state[3]) or 0
+if w ~= idx then
+    if w == idx - 1 then p = c else p = 0 end
+    c = 0
+end
+
+local elapsed = (now - idx * window) / window
+local allowed = 0
+local retry = 0
+if p * (1 - elapsed) + c < limit then
+    allowed = 1
+    c = c + 1
+elseif c < limit and p > 0 then
+    retry = ((1 - (limit - c) / p) - elapsed) * window
+else
+    retry = (1 - elapsed) * window + math.max(0, 1 - limit / c) * window
+end
+
+redis.call('HSET', KEYS[1], 'w', idx, 'c', c, 'p', p)
+redis.call('EXPIRE', KEYS[1], window * 2)
+return {allowed, math.ceil(retry)}
+"""
+
+
 class RateLimiter:
-    """Token bucket style rate limiter with Redis or in-memory fallback."""
+    """Sliding window counter rate limiter with Redis or in-memory fallback."""
+
+    LOCAL_SWEEP_INTERVAL = 60.0
 
     def __init__(self):
         self.redis = None
@@ -26,7 +66,10 @@ class RateLimiter:
             )
         except Exception:
             self.redis = None
-        self._local = defaultdict(deque)
+        self._script = self.redis.register_script(SLIDING_WINDOW_LUA) if self.redis else None
+        # {key: [window_size, window_index, current_count, previous_count]}
+        self._local: Dict[str, List[int]] = {}
+        self._next_sweep = 0.0
 
     def guard(self, scope: str, limit: int, window: int = 60):
         """Return a FastAPI dependency enforcing the provided limit."""
@@ -52,24 +95,41 @@ class RateLimiter:
             return False, window
         if self.redis:
             try:
-                current = await self.redis.incr(key)
-                if current == 1:
-                    await self.redis.expire(key, window)
-                if current > limit:
-                    ttl = await self.redis.ttl(key)
-                    return False, ttl if ttl and ttl > 0 else window
-                return True, 0
+                allowed, retry_after = await self._script(keys=[key], args=[limit, window])
+                return bool(allowed), int(retry_after)
             except Exception:
                 self.redis = None
         return self._allow_local(key, limit, window)
 
     def _allow_local(self, key: str, limit: int, window: int) -> tuple[bool, int]:
         now = time.monotonic()
-        bucket = self._local[key]
-        while bucket and now - bucket[0] > window:
-            bucket.popleft()
-        if len(bucket) >= limit:
-            retry = int(max(1, window - (now - bucket[0])))
-            return False, retry
-        bucket.append(now)
-        return True, 0
+        if now >= self._next_sweep:
+            self._sweep_local(now)
+        index = int(now // window)
+        state = self._local.get(key)
+        if state is None:
+            state = self._local[key] = [window, index, 0, 0]
+        elif state[1] != index:
+            state[3] = state[2] if state[1] == index - 1 else 0
+            state[2] = 0
+            state[1] = index
+        _, _, current, previous = state
+        elapsed = (now - index * window) / window
+        if previous * (1 - elapsed) + current < limit:
+            state[2] += 1
+            return True, 0
+        if current < limit and previous > 0:
+            retry = ((1 - (limit - current) / previous) - elapsed) * window
+        else:
+            retry = (1 - elapsed) * window + max(0, 1 - limit / current) * window
+        return False, max(1, math.ceil(retry))
+
+    def _sweep_local(self, now: float):
+        """Drop keys whose current and previous windows have both passed."""
+        expired = [
+            key for key, (window, index, _, _) in self._local.items()
+            if index < int(now // window) - 1
+        ]
+        for key in expired:
+            del self._local[key]
+        self._next_sweep = now + self.LOCAL_SWEEP_INTERVAL
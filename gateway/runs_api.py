@@ -15,7 +15,9 @@ Usage:
     # GET /api/runs/{run_id} - Get run details
     # DELETE /api/runs/{run_id} - Delete run
     # GET /api/runs/stats - Get statistics
+    # GET /api/runs/storage/metrics - Storage write-behind metrics
     # POST /api/runs/export - Export runs
+    # GET /api/runs/export/stream - Stream runs as NDJSON or CSV
 """
 
 import json
@@ -105,10 +107,11 @@ try:
     class RunListResponse(BaseModel):
         """Response for run list"""
         runs: List[RunSummary]
-        total: int
+        total: Optional[int] = None
         page: int
         per_page: int
-        pages: int
+        pages: Optional[int] = None
+        next_cursor: Optional[str] = None
     
     class RunStatsResponse(BaseModel):
         """Run statistics response"""
@@ -212,7 +215,11 @@ try:
         page: int = Query(1, ge=1, description="Page number"),
         per_page: int = Query(20, ge=1, le=100, description="Results per page"),
         sort: str = Query("created_at", description="Sort field"),
-        order: str = Query("desc", description="Sort order (asc/desc)")
+        order: str = Query("desc", description="Sort order (asc/desc)"),
+        cursor: Optional[str] = Query(
+            None,
+            description="Keyset cursor from next_cursor (empty string for the first page)"
+        )
     ):
         """
         List workflow runs with filtering and pagination.
@@ -222,6 +229,10 @@ try:
         - status (pending, running, completed, failed, cancelled)
         - user ID
         - date range
+        
+        Passing `cursor` switches to keyset pagination: pages stay equally
+        fast at any depth, `next_cursor` points at the following page and
+        `total`/`pages` are omitted.
         """
         storage = await get_run_storage()
         
@@ -230,6 +241,27 @@ try:
         until_dt = datetime.fromisoformat(until) if until else None
         status_enum = RunStatus(status) if status else None
         
+        if cursor is not None:
+            try:
+                runs, next_cursor = await storage.list_runs_page(
+                    workflow=workflow,
+                    status=status_enum,
+                    user_id=user_id,
+                    since=since_dt,
+                    until=until_dt,
+                    cursor=cursor or None,
+                    limit=per_page
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            
+            return RunListResponse(
+                runs=[_run_to_summary(r) for r in runs],
+                page=page,
+                per_page=per_page,
+                next_cursor=next_cursor
+            )
+        
         # Get runs
         offset = (page - 1) * per_page
         runs = await storage.list_runs(
@@ -313,6 +345,18 @@ try:
             recent_failures=recent_failures
         )
     
+    @router.get("/storage/metrics")
+    async def get_storage_metrics():
+        """
+        Get write-behind queue depth and flush latency for the run storage.
+        """
+        storage = await get_run_storage()
+        
+        if not hasattr(storage, "get_write_behind_stats"):
+            return {"enabled": False}
+        
+        return storage.get_write_behind_stats()
+    
     @router.get("/{run_id}", response_model=RunDetail)
     async def get_run(run_id: str):
         """
@@ -487,6 +531,92 @@ try:
                 headers={"Content-Disposition": "attachment; filename=runs_export.json"}
             )
     
+    @router.get("/export/stream")
+    async def export_runs_stream(
+        format: str = Query("ndjson", description="Export format (ndjson/csv)"),
+        workflow: Optional[str] = Query(None, description="Filter by workflow name"),
+        status: Optional[str] = Query(None, description="Filter by status"),
+        since: Optional[str] = Query(None, description="Filter runs since (ISO date)"),
+        until: Optional[str] = Query(None, description="Filter runs until (ISO date)")
+    ):
+        """
+        Stream runs as NDJSON or CSV.
+        
+        Pages through storage with keyset pagination so memory use stays
+        constant regardless of how much history is exported.
+        """
+        if format not in ("ndjson", "csv"):
+            raise HTTPException(status_code=400, detail="format must be ndjson or csv")
+        
+        storage = await get_run_storage()
+        
+        since_dt = datetime.fromisoformat(since) if since else None
+        until_dt = datetime.fromisoformat(until) if until else None
+        status_enum = RunStatus(status) if status else None
+        
+        runs = storage.iter_runs(
+            workflow=workflow,
+            status=status_enum,
+            since=since_dt,
+            until=until_dt
+        )
+        
+        if format == "csv":
+            import csv
+            import io
+            
+            async def generate():
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                writer.writerow([
+                    "id", "workflow_name", "status", "created_at", "started_at",
+                    "completed_at", "duration_ms", "error", "user_id"
+                ])
+                async for run in runs:
+                    summary = _run_to_summary(run)
+                    writer.writerow([
+                        summary.id,
+                        summary.workflow_name,
+                        summary.status,
+                        summary.created_at,
+                        summary.started_at or "",
+                        summary.completed_at or "",
+                        summary.duration_ms or "",
+                        summary.error or "",
+                        summary.user_id or ""
+                    ])
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+            
+            media_type = "text/csv"
+            filename = "runs_export.csv"
+        else:
+            async def generate():
+                async for r in runs:
+                    yield json.dumps({
+                        "id": r.id,
+                        "workflow_name": r.workflow_name,
+                        "status": r.status.value if isinstance(r.status, RunStatus) else r.status,
+                        "created_at": r.created_at.isoformat() if r.created_at else None,
+                        "started_at": r.started_at.isoformat() if r.started_at else None,
+                        "completed_at": r.completed_at.isoformat() if r.completed_at else None,
+                        "input_data": r.input_data,
+                        "output_data": r.output_data,
+                        "error": r.error,
+                        "metadata": r.metadata,
+                        "user_id": r.user_id
+                    }) + "\n"
+            
+            media_type = "application/x-ndjson"
+            filename = "runs_export.ndjson"
+        
+        return StreamingResponse(
+            generate(),
+            media_type=media_type,
+            headers={"Content-Disposition": f"attachment; filename={filename}"}
+        )
+    
     @router.get("/workflows/list")
     async def list_workflows():
         """
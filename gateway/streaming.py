@@ -10,17 +10,21 @@ Usage:
     
     # Client connection
     curl -N http://localhost:8085/stream/runs/{run_id}
+    
+    # Resume after a disconnect (browsers send Last-Event-ID automatically)
+    curl -N -H "Last-Event-ID: 42" http://localhost:8085/stream/runs/{run_id}
 """
 
 import asyncio
 import json
 import logging
+import time
 import uuid
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
-from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Set
+from typing import Any, AsyncGenerator, Callable, Deque, Dict, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
@@ -57,8 +61,9 @@ class SSEEvent:
             "sequence": self.sequence,
             "data": self.data
         }
-        # SSE format: event: <type>\ndata: <json>\n\n
+        # SSE format: id: <seq>\nevent: <type>\ndata: <json>\n\n
         lines = [
+            f"id: {self.sequence}",
             f"event: {self.event_type.value}",
             f"data: {json.dumps(event_data)}"
         ]
@@ -78,7 +83,39 @@ class RunState:
     total_steps: int = 0
     error: Optional[str] = None
     result: Optional[Dict[str, Any]] = None
-    events: List[SSEEvent] = field(default_factory=list)
+    # Ring buffer of recent events (heartbeats are not retained)
+    events: Deque[SSEEvent] = field(default_factory=deque)
+
+
+# Statuses after which a run emits no further events
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+
+class _Subscriber:
+    """
+    A client's bounded event queue.
+    
+    When the queue overflows the subscriber is flagged instead of growing;
+    the consumer then drops its backlog and catches up from the run's ring
+    buffer, coalescing whatever it missed.
+    """
+    
+    __slots__ = ("queue", "overflowed", "coalesced")
+    
+    def __init__(self, maxsize: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.overflowed = False
+        self.coalesced = 0
+    
+    def offer(self, event: SSEEvent):
+        if self.overflowed:
+            self.coalesced += 1
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            self.coalesced += 1
 
 
 class StreamingManager:
@@ -86,28 +123,49 @@ class StreamingManager:
     Manages SSE streaming connections and event broadcasting.
     
     Supports multiple concurrent clients per run with automatic cleanup.
+    Each run keeps a bounded ring buffer of events for Last-Event-ID
+    resume, subscriber queues are bounded, finished runs are evicted after
+    a TTL, and a single scheduler task sends heartbeats for all runs.
     """
     
-    def __init__(self, heartbeat_interval: float = 30.0):
+    def __init__(
+        self,
+        heartbeat_interval: float = 30.0,
+        max_events_per_run: int = 1000,
+        subscriber_queue_size: int = 256,
+        finished_run_ttl: float = 3600.0
+    ):
         """
         Initialize streaming manager.
         
         Args:
             heartbeat_interval: Seconds between heartbeat events
+            max_events_per_run: Ring buffer size for replay/resume
+            subscriber_queue_size: Per-client queue bound before coalescing
+            finished_run_ttl: Seconds to keep finished runs for late readers
         """
         self.heartbeat_interval = heartbeat_interval
+        self.max_events_per_run = max_events_per_run
+        self.subscriber_queue_size = subscriber_queue_size
+        self.finished_run_ttl = finished_run_ttl
         
         # Active run states
         self._runs: Dict[str, RunState] = {}
         
-        # Client queues per run: run_id -> set of asyncio.Queue
-        self._clients: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        # Client subscribers per run
+        self._clients: Dict[str, Set[_Subscriber]] = defaultdict(set)
         
         # Event sequence counters
         self._sequences: Dict[str, int] = defaultdict(int)
         
-        # Heartbeat tasks
-        self._heartbeat_tasks: Dict[str, asyncio.Task] = {}
+        # Finished runs: run_id -> monotonic finish time (insertion ordered)
+        self._finished: Dict[str, float] = {}
+        
+        # Shared heartbeat / eviction scheduler
+        self._scheduler_task: Optional[asyncio.Task] = None
+        
+        # Slow-consumer accounting
+        self._coalesced_events = 0
         
         # Event handlers for extensibility
         self._event_handlers: List[Callable[[SSEEvent], None]] = []
@@ -141,8 +199,10 @@ class StreamingManager:
             workflow_name=workflow_name,
             status="running",
             started_at=timestamp,
-            total_steps=total_steps
+            total_steps=total_steps,
+            events=deque(maxlen=self.max_events_per_run)
         )
+        self._evict_finished_runs()
         self._runs[run_id] = run_state
         
         # Emit start event
@@ -156,8 +216,8 @@ class StreamingManager:
             }
         )
         
-        # Start heartbeat for this run
-        self._start_heartbeat(run_id)
+        # Make sure the shared heartbeat scheduler is running
+        self._ensure_scheduler()
         
         logger.info(f"Started run {run_id} for workflow {workflow_name}")
         return run_id
@@ -264,6 +324,7 @@ class StreamingManager:
             self._runs[run_id].error = error
             if not recoverable:
                 self._runs[run_id].status = "failed"
+                self._mark_finished(run_id)
         
         await self._emit_event(
             EventType.RUN_ERROR,
@@ -375,8 +436,7 @@ class StreamingManager:
             }
         )
         
-        # Stop heartbeat
-        self._stop_heartbeat(run_id)
+        self._mark_finished(run_id)
         
         logger.info(f"Completed run {run_id} with status {status}")
     
@@ -399,45 +459,70 @@ class StreamingManager:
             {"reason": reason}
         )
         
-        self._stop_heartbeat(run_id)
+        self._mark_finished(run_id)
     
-    async def subscribe(self, run_id: str) -> AsyncGenerator[SSEEvent, None]:
+    async def subscribe(
+        self,
+        run_id: str,
+        last_event_id: Optional[int] = None
+    ) -> AsyncGenerator[SSEEvent, None]:
         """
         Subscribe to events for a run.
         
         Args:
             run_id: Run ID to subscribe to
+            last_event_id: Resume after this sequence number (Last-Event-ID)
             
         Yields:
             SSE events for the run
         """
-        queue: asyncio.Queue = asyncio.Queue()
-        self._clients[run_id].add(queue)
+        subscriber = _Subscriber(self.subscriber_queue_size)
+        self._clients[run_id].add(subscriber)
+        last_sent = last_event_id or 0
         
         try:
-            # Send historical events first
-            if run_id in self._runs:
-                for event in self._runs[run_id].events:
-                    yield event
+            # Send buffered events first
+            for event in self._replay(run_id, last_sent):
+                last_sent = event.sequence
+                yield event
             
             # Stream live events
-            while True:
-                event = await queue.get()
-                yield event
+            while not self._is_finished(run_id, last_sent):
+                if subscriber.overflowed:
+                    # Slow consumer: drop the backlog and catch up from the ring buffer
+                    while not subscriber.queue.empty():
+                        subscriber.queue.get_nowait()
+                    subscriber.overflowed = False
+                    for event in self._replay(run_id, last_sent):
+                        last_sent = event.sequence
+                        yield event
+                    continue
                 
-                # Check if run is complete
-                if event.event_type in [
-                    EventType.RUN_COMPLETE,
-                    EventType.RUN_CANCELLED,
-                    EventType.RUN_ERROR
-                ]:
-                    if run_id in self._runs and self._runs[run_id].status in ["completed", "failed", "cancelled"]:
-                        break
+                event = await subscriber.queue.get()
+                if event.sequence <= last_sent:
+                    continue
+                last_sent = event.sequence
+                yield event
         finally:
-            self._clients[run_id].discard(queue)
+            self._coalesced_events += subscriber.coalesced
+            self._clients[run_id].discard(subscriber)
             if not self._clients[run_id]:
                 del self._clients[run_id]
     
+    def _replay(self, run_id: str, after_sequence: int) -> List[SSEEvent]:
+        """Buffered events for a run newer than a sequence number"""
+        run_state = self._runs.get(run_id)
+        if not run_state:
+            return []
+        return [e for e in run_state.events if e.sequence > after_sequence]
+    
+    def _is_finished(self, run_id: str, last_sent: int) -> bool:
+        """Whether a subscriber has seen every event of a finished run"""
+        run_state = self._runs.get(run_id)
+        if run_state is None or run_state.status not in TERMINAL_STATUSES:
+            return False
+        return last_sent >= self._sequences.get(run_id, 0)
+    
     def get_run_state(self, run_id: str) -> Optional[RunState]:
         """Get current state of a run"""
         return self._runs.get(run_id)
@@ -467,16 +552,13 @@ class StreamingManager:
             sequence=self._sequences[run_id]
         )
         
-        # Store in run state
-        if run_id in self._runs:
+        # Store in the run's ring buffer
+        if run_id in self._runs and event_type != EventType.HEARTBEAT:
             self._runs[run_id].events.append(event)
         
-        # Broadcast to clients
-        for queue in self._clients.get(run_id, set()):
-            try:
-                await queue.put(event)
-            except Exception as e:
-                logger.warning(f"Failed to send event to client: {e}")
+        # Broadcast to clients (never blocks on slow consumers)
+        for subscriber in self._clients.get(run_id, set()):
+            subscriber.offer(event)
         
         # Call event handlers
         for handler in self._event_handlers:
@@ -485,26 +567,54 @@ class StreamingManager:
             except Exception as e:
                 logger.warning(f"Event handler error: {e}")
     
-    def _start_heartbeat(self, run_id: str):
-        """Start heartbeat task for a run"""
-        async def heartbeat_loop():
-            while run_id in self._runs and self._runs[run_id].status == "running":
-                await asyncio.sleep(self.heartbeat_interval)
-                if run_id in self._clients and self._clients[run_id]:
+    def _ensure_scheduler(self):
+        """Start the shared heartbeat scheduler if it is not running"""
+        if self._scheduler_task is None or self._scheduler_task.done():
+            self._scheduler_task = asyncio.create_task(self._scheduler_loop())
+    
+    async def _scheduler_loop(self):
+        """Send heartbeats for all running runs and evict expired ones"""
+        while self._runs:
+            await asyncio.sleep(self.heartbeat_interval)
+            for run_id in self.list_active_runs():
+                if self._clients.get(run_id):
                     await self._emit_event(
                         EventType.HEARTBEAT,
                         run_id,
                         {"status": "alive"}
                     )
-        
-        task = asyncio.create_task(heartbeat_loop())
-        self._heartbeat_tasks[run_id] = task
-    
-    def _stop_heartbeat(self, run_id: str):
-        """Stop heartbeat task for a run"""
-        if run_id in self._heartbeat_tasks:
-            self._heartbeat_tasks[run_id].cancel()
-            del self._heartbeat_tasks[run_id]
+            self._evict_finished_runs()
+        self._scheduler_task = None
+    
+    def _mark_finished(self, run_id: str):
+        """Record when a run finished so it can be evicted after the TTL"""
+        self._finished.pop(run_id, None)
+        self._finished[run_id] = time.monotonic()
+    
+    def _evict_finished_runs(self):
+        """Drop finished runs older than finished_run_ttl"""
+        cutoff = time.monotonic() - self.finished_run_ttl
+        while self._finished:
+            run_id, finished_at = next(iter(self._finished.items()))
+            if finished_at > cutoff:
+                break
+            del self._finished[run_id]
+            self._runs.pop(run_id, None)
+            self._sequences.pop(run_id, None)
+            logger.debug(f"Evicted finished run {run_id}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get streaming statistics"""
+        subscribers = [s for subs in self._clients.values() for s in subs]
+        return {
+            "runs": len(self._runs),
+            "active_runs": len(self.list_active_runs()),
+            "finished_runs": len(self._finished),
+            "buffered_events": sum(len(r.events) for r in self._runs.values()),
+            "subscribers": len(subscribers),
+            "max_subscriber_queue_depth": max((s.queue.qsize() for s in subscribers), default=0),
+            "coalesced_events": self._coalesced_events + sum(s.coalesced for s in subscribers)
+        }
     
     def _calculate_duration(self, run_state: RunState) -> int:
         """Calculate run duration in milliseconds"""
@@ -540,15 +650,24 @@ try:
     streaming_manager = StreamingManager()
     
     @app.get("/stream/runs/{run_id}")
-    async def stream_run(run_id: str, request: Request):
+    async def stream_run(
+        run_id: str,
+        request: Request,
+        last_event_id: Optional[int] = None
+    ):
         """
         Stream events for a specific run.
         
-        Returns SSE stream of run events.
+        Returns SSE stream of run events. Reconnecting clients resume after
+        the Last-Event-ID header (or last_event_id query parameter).
         """
+        header_id = request.headers.get("last-event-id")
+        if header_id and header_id.isdigit():
+            last_event_id = int(header_id)
+        
         async def event_generator():
             try:
-                async for event in streaming_manager.subscribe(run_id):
+                async for event in streaming_manager.subscribe(run_id, last_event_id):
                     if await request.is_disconnected():
                         break
                     yield event.to_sse_format()
@@ -573,6 +692,11 @@ try:
             "count": len(streaming_manager.list_active_runs())
         }
     
+    @app.get("/stats")
+    async def get_stats():
+        """Get streaming buffer and subscriber statistics"""
+        return streaming_manager.get_stats()
+    
     @app.get("/runs/{run_id}")
     async def get_run(run_id: str):
         """Get current state of a run"""
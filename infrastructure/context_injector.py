@@ -7,24 +7,53 @@ Implements pre-hooks (before agent execution) and post-hooks (logging outcomes).
 
 This module is the bridge between the Infrastructure Agent's knowledge and
 every agent's execution context.
+
+Assembled contexts are cached per (agent, task) and invalidated when the
+workspace map or the memories directory changes (watchdog events when
+installed, throttled stat checks otherwise). Recent memories come from an
+incrementally maintained index, budgets are counted in real tokens
+(tiktoken when installed) and audit records are written in batches from a
+background thread.
 """
 
 import asyncio
+import atexit
 import functools
+import hashlib
 import json
 import logging
+import math
 import os
+import re
 import sys
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from agents.infrastructure.infrastructure_agent import InfrastructureAgent
 
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+try:
+    import tiktoken
+
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -44,6 +73,11 @@ class InjectionConfig:
     memory_recency_hours: int = 24
     log_injections: bool = True
     audit_file: str = "logs/context_injections.jsonl"
+    cache_size: int = 256
+    cache_ttl_seconds: float = 60.0
+    change_poll_seconds: float = 2.0
+    audit_flush_seconds: float = 1.0
+    watch_changes: bool = True
 
 
 @dataclass
@@ -58,6 +92,206 @@ class InjectionRecord:
     duration_ms: float
     success: bool
     error: Optional[str] = None
+    cache_hit: bool = False
+
+
+# =============================================================================
+# Token Counting
+# =============================================================================
+
+_WORD_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding():
+    """cl100k_base encoding, or None when tiktoken (or its data) is unavailable."""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable, approximating tokens: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count tokens in text.
+
+    Uses tiktoken's cl100k_base when installed; otherwise approximates BPE
+    with one token per punctuation mark and per five characters of a word.
+    """
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return sum(math.ceil(len(piece) / 5) for piece in _WORD_PATTERN.findall(text))
+
+
+def count_context_tokens(context: Dict[str, Any]) -> int:
+    """Count tokens of the context sections (keys starting with _ excluded)."""
+    sections = {k: v for k, v in context.items() if not k.startswith("_")}
+    return count_tokens(json.dumps(sections, default=str))
+
+
+# =============================================================================
+# Recent Memories Index
+# =============================================================================
+
+
+class RecentMemoryIndex:
+    """
+    In-memory index of memory files in a directory.
+
+    Files are parsed once and re-read only when their mtime changes, either
+    through update()/remove() (filesystem events) or refresh() (a stat
+    sweep that parses nothing unless a file changed).
+    """
+
+    def __init__(self, memories_path: Path):
+        self.memories_path = memories_path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def refresh(self) -> bool:
+        """Bring the index in line with the directory. Returns True if anything changed."""
+        seen = set()
+        changed = False
+
+        if self.memories_path.exists():
+            for memory_file in self.memories_path.glob("*.json"):
+                seen.add(str(memory_file))
+                changed |= self.update(memory_file)
+
+        with self._lock:
+            removed = [path for path in self._entries if path not in seen]
+            for path in removed:
+                del self._entries[path]
+
+        return changed or bool(removed)
+
+    def update(self, memory_file: Path) -> bool:
+        """(Re)load one memory file if it changed. Returns True if the index changed."""
+        key = str(memory_file)
+        try:
+            mtime = memory_file.stat().st_mtime
+        except OSError:
+            return self.remove(memory_file)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry["mtime"] == mtime:
+            return False
+
+        try:
+            with open(memory_file, "r") as f:
+                memory_data = json.load(f)
+            if not isinstance(memory_data, dict):
+                logger.warning(f"Skipping memory {memory_file}: not a JSON object")
+                return self.remove(memory_file)
+        except Exception as e:
+            logger.warning(f"Failed to load memory {memory_file}: {e}")
+            return self.remove(memory_file)
+
+        with self._lock:
+            self._entries[key] = {
+                "id": memory_file.stem,
+                "mtime": mtime,
+                "agent": memory_data.get("agent"),
+                "content": memory_data.get("content", memory_data.get("summary", "")),
+                "timestamp": memory_data.get("timestamp", mtime),
+            }
+        return True
+
+    def remove(self, memory_file: Path) -> bool:
+        with self._lock:
+            return self._entries.pop(str(memory_file), None) is not None
+
+    def recent(self, agent_id: str, cutoff: float, limit: int = 5) -> List[Dict[str, Any]]:
+        """Memories modified after cutoff for this agent (or any agent), newest first."""
+        with self._lock:
+            entries = list(self._entries.values())
+
+        memories = [
+            {"id": e["id"], "content": e["content"], "timestamp": e["timestamp"]}
+            for e in entries
+            if e["mtime"] > cutoff and e["agent"] in (None, agent_id)
+        ]
+        memories.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
+        return memories[:limit]
+
+
+# =============================================================================
+# Batched Audit Writer
+# =============================================================================
+
+
+class AuditWriter:
+    """
+    Append JSON records to log files from a background thread.
+
+    write() only queues the record; the thread appends everything queued
+    for a file in one write every flush_interval seconds (sooner once
+    max_batch records are waiting). Pending records are flushed at exit.
+    """
+
+    def __init__(self, flush_interval: float = 1.0, max_batch: int = 500):
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.written = 0
+        self._pending: Dict[Path, List[Dict[str, Any]]] = {}
+        self._pending_count = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def write(self, path: Path, record: Dict[str, Any]):
+        """Queue a record to be appended to path."""
+        with self._lock:
+            self._pending.setdefault(path, []).append(record)
+            self._pending_count += 1
+            full = self._pending_count >= self.max_batch
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="context-audit-writer", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.close)
+        if full:
+            self._wake.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        """Write everything queued so far."""
+        with self._flush_lock:
+            with self._lock:
+                batches, self._pending = self._pending, {}
+                self._pending_count = 0
+
+            for path, records in batches.items():
+                try:
+                    lines = "".join(json.dumps(r, default=str) + "\n" for r in records)
+                    with open(path, "a") as f:
+                        f.write(lines)
+                    self.written += len(records)
+                except Exception as e:
+                    logger.warning(f"Failed to write audit log {path}: {e}")
+
+    def close(self):
+        """Stop the background thread after a final flush."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5.0)
+        self.flush()
 
 
 class ContextInjector:
@@ -69,6 +303,8 @@ class ContextInjector:
     - Post-hook: Log results and capture outcomes for learning
     - Memory integration: Include relevant recent memories
     - Audit logging: Track all injections for debugging
+    - Caching: Reuse assembled contexts until the workspace map or
+      memories change (or cache_ttl_seconds pass)
 
     Usage:
         injector = ContextInjector()
@@ -105,6 +341,32 @@ class ContextInjector:
         # Ensure audit directory exists
         audit_dir = self.base_path / Path(self.config.audit_file).parent
         audit_dir.mkdir(parents=True, exist_ok=True)
+        self.audit_writer = AuditWriter(flush_interval=self.config.audit_flush_seconds)
+
+        # Context cache: (agent_id, task fingerprint, memories) -> entry
+        self._cache: "OrderedDict[Tuple[str, str, bool], Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._generation = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.invalidations = 0
+
+        # Change tracking for the workspace map and memories directory
+        self._workspace_map_path = getattr(
+            self.infrastructure,
+            "_workspace_map_path",
+            self.base_path / "infrastructure" / "workspace_map.json",
+        )
+        self._workspace_map_mtime = self._stat_mtime(self._workspace_map_path)
+        self._workspace_summary: Optional[Dict[str, Any]] = None
+        self._workspace_summary_ready = False
+        self.memory_index = RecentMemoryIndex(self.base_path / "knowledge" / "memories")
+        self.memory_index.refresh()
+        self._last_poll = time.monotonic()
+        self._observer = None
+        self._watched: set = set()
+        if self.config.watch_changes:
+            self.start_watching()
 
         self._initialized = True
         logger.info("ContextInjector initialized (singleton)")
@@ -132,6 +394,11 @@ class ContextInjector:
                 audit_file=config_data.get(
                     "audit_file", "logs/context_injections.jsonl"
                 ),
+                cache_size=config_data.get("cache_size", 256),
+                cache_ttl_seconds=config_data.get("cache_ttl_seconds", 60.0),
+                change_poll_seconds=config_data.get("change_poll_seconds", 2.0),
+                audit_flush_seconds=config_data.get("audit_flush_seconds", 1.0),
+                watch_changes=config_data.get("watch_changes", True),
             )
 
         return InjectionConfig()
@@ -160,42 +427,42 @@ class ContextInjector:
         Returns:
             Dictionary with context to inject into agent prompt
         """
-        import time
-
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
-            # Get infrastructure context
-            context = self.infrastructure.generate_context_for_agent(
-                agent_id=agent_id,
-                task_description=task_description,
-                max_tokens=self.config.max_context_tokens,
-            )
-
-            # Optionally add recent memories
             should_include_memories = (
                 include_memories
                 if include_memories is not None
                 else self.config.include_recent_memories
             )
 
-            if should_include_memories:
-                memories = self._get_recent_memories(agent_id)
-                if memories:
-                    context["recent_memories"] = memories
+            self._poll_for_changes()
+            key = (
+                agent_id,
+                self._task_fingerprint(task_description),
+                bool(should_include_memories),
+            )
+            entry = self._cache_get(key)
+            cache_hit = entry is not None
 
-            # Add workspace map summary if available
-            workspace_summary = self._get_workspace_summary()
-            if workspace_summary:
-                context["workspace_map"] = workspace_summary
+            if not cache_hit:
+                generation = self._generation
+                context = self._build_context(
+                    agent_id, task_description, should_include_memories
+                )
+                entry = {
+                    "context": context,
+                    "tokens": count_context_tokens(context),
+                    "generation": generation,
+                    "created": time.monotonic(),
+                }
+                self._cache_put(key, entry)
 
-            # Add formatted prompt string
-            context["_formatted_prompt"] = self.infrastructure.format_context_as_prompt(
-                context
-            )
+            # Callers may add keys to their copy
+            context = dict(entry["context"])
 
             # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
             # Log injection
             if self.config.log_injections:
@@ -205,12 +472,14 @@ class ContextInjector:
                     context=context,
                     duration_ms=duration_ms,
                     success=True,
+                    context_tokens=entry["tokens"],
+                    cache_hit=cache_hit,
                 )
 
             return context
 
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             logger.error(f"Context injection failed for {agent_id}: {e}")
 
             if self.config.log_injections:
@@ -229,6 +498,193 @@ class ContextInjector:
                 "_error": str(e),
             }
 
+    def _build_context(
+        self, agent_id: str, task_description: Optional[str], include_memories: bool
+    ) -> Dict[str, Any]:
+        """Assemble a fresh context within max_context_tokens."""
+        # Get infrastructure context
+        context = self.infrastructure.generate_context_for_agent(
+            agent_id=agent_id,
+            task_description=task_description,
+            max_tokens=self.config.max_context_tokens,
+        )
+
+        # Optionally add recent memories
+        if include_memories:
+            memories = self._get_recent_memories(agent_id)
+            if memories:
+                context["recent_memories"] = memories
+
+        # Add workspace map summary if available
+        workspace_summary = self._get_workspace_summary()
+        if workspace_summary:
+            context["workspace_map"] = workspace_summary
+
+        context = self._fit_to_budget(context, self.config.max_context_tokens)
+
+        # Add formatted prompt string
+        context["_formatted_prompt"] = self.infrastructure.format_context_as_prompt(
+            context
+        )
+        return context
+
+    # Sections dropped first when over budget (memories go one at a time)
+    _TRIM_ORDER = [
+        "workspace_map",
+        "recent_memories",
+        "data_sources",
+        "available_pipelines",
+        "workspace_awareness",
+        "constraints",
+        "capabilities",
+    ]
+
+    def _fit_to_budget(self, context: Dict[str, Any], max_tokens: int) -> Dict[str, Any]:
+        """Drop the least important sections until the context fits max_tokens."""
+        context = dict(context)
+        for section in self._TRIM_ORDER:
+            if count_context_tokens(context) <= max_tokens:
+                break
+            if section == "recent_memories" and context.get(section):
+                memories = list(context[section])
+                while memories and count_context_tokens(context) > max_tokens:
+                    memories.pop()
+                    context[section] = memories
+                if memories:
+                    continue
+            context.pop(section, None)
+        return context
+
+    @staticmethod
+    def _task_fingerprint(task_description: Optional[str]) -> str:
+        """Fingerprint of a task description, ignoring case and whitespace."""
+        if not task_description:
+            return ""
+        normalized = " ".join(task_description.lower().split())
+        return hashlib.sha1(normalized.encode()).hexdigest()
+
+    # =========================================================================
+    # Context Cache and Invalidation
+    # =========================================================================
+
+    def _cache_get(self, key: Tuple[str, str, bool]) -> Optional[Dict[str, Any]]:
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and (
+                entry["generation"] != self._generation
+                or time.monotonic() - entry["created"] > self.config.cache_ttl_seconds
+            ):
+                del self._cache[key]
+                entry = None
+            if entry is None:
+                self.cache_misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return entry
+
+    def _cache_put(self, key: Tuple[str, str, bool], entry: Dict[str, Any]):
+        with self._cache_lock:
+            # Built from data that has since changed
+            if entry["generation"] != self._generation:
+                return
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.config.cache_size:
+                self._cache.popitem(last=False)
+
+    def invalidate(self):
+        """Drop all cached contexts."""
+        with self._cache_lock:
+            self._generation += 1
+            self._cache.clear()
+            self.invalidations += 1
+
+    def _on_workspace_map_changed(self):
+        self._workspace_map_mtime = self._stat_mtime(self._workspace_map_path)
+        self.infrastructure.reload_workspace_map()
+        self._workspace_summary_ready = False
+        self.invalidate()
+
+    def _on_memory_changed(self, path: Path):
+        if path.suffix != ".json":
+            return
+        if self.memory_index.update(path):
+            self.invalidate()
+
+    def _poll_for_changes(self):
+        """Stat the sources not covered by filesystem events, at most every change_poll_seconds."""
+        if self._watched >= {"workspace_map", "memories"}:
+            return
+        now = time.monotonic()
+        if now - self._last_poll < self.config.change_poll_seconds:
+            return
+        self._last_poll = now
+
+        if "workspace_map" not in self._watched:
+            if self._stat_mtime(self._workspace_map_path) != self._workspace_map_mtime:
+                self._on_workspace_map_changed()
+        if "memories" not in self._watched:
+            if self.memory_index.refresh():
+                self.invalidate()
+
+    @staticmethod
+    def _stat_mtime(path: Path) -> Optional[int]:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def start_watching(self):
+        """
+        Subscribe to filesystem events for the workspace map and memories
+        directory (requires watchdog). Directories that do not exist yet
+        are covered by polling instead.
+        """
+        if not WATCHDOG_AVAILABLE or self._observer is not None:
+            return
+
+        injector = self
+        memories_path = self.memory_index.memories_path
+
+        class ContextSourceHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.event_type in ("opened", "closed", "closed_no_write"):
+                    return
+                paths = [Path(event.src_path)]
+                if getattr(event, "dest_path", ""):
+                    paths.append(Path(event.dest_path))
+                for path in paths:
+                    if path == injector._workspace_map_path:
+                        injector._on_workspace_map_changed()
+                    elif path.parent == memories_path and not event.is_directory:
+                        injector._on_memory_changed(path)
+
+        observer = Observer()
+        handler = ContextSourceHandler()
+        try:
+            if self._workspace_map_path.parent.exists():
+                observer.schedule(handler, str(self._workspace_map_path.parent))
+                self._watched.add("workspace_map")
+            if memories_path.exists():
+                observer.schedule(handler, str(memories_path))
+                self._watched.add("memories")
+            observer.start()
+        except Exception as e:
+            logger.warning(f"Context source watcher unavailable, polling instead: {e}")
+            self._watched.clear()
+            return
+
+        self._observer = observer
+
+    def stop_watching(self):
+        """Stop filesystem events; changes are then picked up by polling."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5.0)
+            self._observer = None
+        self._watched.clear()
+
     def inject_context_to_messages(
         self,
         messages: List[Dict[str, str]],
@@ -266,48 +722,20 @@ class ContextInjector:
 
     def _get_recent_memories(self, agent_id: str) -> List[Dict[str, Any]]:
         """Get recent relevant memories for an agent."""
-        memories = []
-
-        # Check memories directory
-        memories_path = self.base_path / "knowledge" / "memories"
-        if not memories_path.exists():
-            return memories
-
-        # Load recent memory files
         cutoff = datetime.now().timestamp() - (self.config.memory_recency_hours * 3600)
 
-        for memory_file in memories_path.glob("*.json"):
-            try:
-                stat = memory_file.stat()
-                if stat.st_mtime > cutoff:
-                    with open(memory_file, "r") as f:
-                        memory_data = json.load(f)
-
-                    # Filter by relevance to agent if metadata available
-                    if "agent" in memory_data:
-                        if memory_data["agent"] != agent_id:
-                            continue
-
-                    memories.append(
-                        {
-                            "id": memory_file.stem,
-                            "content": memory_data.get(
-                                "content", memory_data.get("summary", "")
-                            ),
-                            "timestamp": memory_data.get("timestamp", stat.st_mtime),
-                        }
-                    )
-            except Exception as e:
-                logger.warning(f"Failed to load memory {memory_file}: {e}")
-
-        # Sort by timestamp, most recent first
-        memories.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
-
         # Limit to prevent context overflow
-        return memories[:5]
+        return self.memory_index.recent(agent_id, cutoff, limit=5)
 
     def _get_workspace_summary(self) -> Optional[Dict[str, Any]]:
-        """Get workspace map summary for context injection."""
+        """Get workspace map summary, computed once per workspace map version."""
+        if not self._workspace_summary_ready:
+            self._workspace_summary = self._summarize_workspace_map()
+            self._workspace_summary_ready = True
+        return self._workspace_summary
+
+    def _summarize_workspace_map(self) -> Optional[Dict[str, Any]]:
+        """Build the workspace map summary for context injection."""
         if (
             not hasattr(self.infrastructure, "workspace_map")
             or not self.infrastructure.workspace_map
@@ -347,10 +775,12 @@ class ContextInjector:
         duration_ms: float,
         success: bool,
         error: Optional[str] = None,
+        context_tokens: Optional[int] = None,
+        cache_hit: bool = False,
     ):
         """Log an injection for audit purposes."""
-        # Estimate tokens
-        context_tokens = len(json.dumps(context)) // 4
+        if context_tokens is None:
+            context_tokens = count_context_tokens(context)
 
         # Create record
         record = InjectionRecord(
@@ -362,6 +792,7 @@ class ContextInjector:
             duration_ms=duration_ms,
             success=success,
             error=error,
+            cache_hit=cache_hit,
         )
 
         # Store in memory
@@ -369,13 +800,8 @@ class ContextInjector:
         if len(self.injection_records) > 1000:
             self.injection_records = self.injection_records[-1000:]
 
-        # Write to audit file
-        audit_path = self.base_path / self.config.audit_file
-        try:
-            with open(audit_path, "a") as f:
-                f.write(json.dumps(asdict(record)) + "\n")
-        except Exception as e:
-            logger.warning(f"Failed to write audit log: {e}")
+        # Queue for the audit file
+        self.audit_writer.write(self.base_path / self.config.audit_file, asdict(record))
 
     def log_outcome(
         self,
@@ -407,13 +833,9 @@ class ContextInjector:
             "metadata": metadata or {},
         }
 
-        # Write to outcomes log
+        # Queue for the outcomes log
         outcomes_path = self.base_path / "logs" / "agent_outcomes.jsonl"
-        try:
-            with open(outcomes_path, "a") as f:
-                f.write(json.dumps(outcome_record) + "\n")
-        except Exception as e:
-            logger.warning(f"Failed to write outcome log: {e}")
+        self.audit_writer.write(outcomes_path, outcome_record)
 
     # =========================================================================
     # Decorator for Agent Methods
@@ -550,6 +972,21 @@ class ContextInjector:
             "avg_duration_ms": round(avg_duration, 2),
             "by_agent": by_agent,
             "recent_errors": [r.error for r in failed[-5:] if r.error],
+            "cache": self.get_cache_stats(),
+        }
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get context cache statistics."""
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "entries": len(self._cache),
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": round(self.cache_hits / lookups, 3) if lookups else 0,
+            "invalidations": self.invalidations,
+            "memories_indexed": len(self.memory_index),
+            "watching": sorted(self._watched),
+            "token_counter": "tiktoken" if _get_encoding() is not None else "approximate",
         }
 
     def get_status(self) -> Dict[str, Any]:
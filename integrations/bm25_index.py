@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Sparse BM25 Index for OsMEN
+
+Vectorized Okapi BM25 over a SciPy sparse term-frequency matrix.
+
+Features:
+- Scores every query in a batch with one sparse matrix product
+- argpartition top-k instead of sorting the whole corpus
+- Incremental add/update/remove without re-tokenizing the corpus
+- Persisted to a single .npz file and reloaded at startup
+
+Scores match rank_bm25.BM25Okapi for the same tokenization and parameters.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+    from scipy import sparse
+
+    SPARSE_BM25_AVAILABLE = True
+except ImportError:
+    SPARSE_BM25_AVAILABLE = False
+
+_TOKEN_RE = re.compile(r"\b\w+\b")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase and split on non-alphanumeric characters."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def content_hash(content: str) -> str:
+    """Fingerprint used to skip re-indexing unchanged documents."""
+    return hashlib.md5(content.encode()).hexdigest()
+
+
+class SparseBM25Index:
+    """
+    Okapi BM25 index backed by a CSR term-frequency matrix.
+
+    New documents are staged and merged into the matrix on the next query.
+    Removed documents are masked out and physically dropped once they make
+    up more than ``compact_ratio`` of the rows. Per-entry BM25 weights depend
+    on the average document length, so they are recomputed (vectorized, from
+    the stored frequencies) only when the corpus has changed.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(
+        self,
+        k1: float = 1.5,
+        b: float = 0.75,
+        epsilon: float = 0.25,
+        compact_ratio: float = 0.25,
+    ):
+        if not SPARSE_BM25_AVAILABLE:
+            raise ImportError("SparseBM25Index requires numpy and scipy")
+
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+        self.compact_ratio = compact_ratio
+
+        self._vocab: Dict[str, int] = {}
+        self._df = np.zeros(0, dtype=np.int64)
+
+        # Row-aligned document state
+        self._tf = sparse.csr_matrix((0, 0), dtype=np.float32)
+        self._doc_ids: List[str] = []
+        self._hashes: List[str] = []
+        self._doc_lens = np.zeros(0, dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._rows: Dict[str, int] = {}
+
+        # Staged rows not yet merged into _tf: (term columns, counts)
+        self._pending: List[Tuple["np.ndarray", "np.ndarray"]] = []
+        self._pending_ids: List[str] = []
+        self._pending_hashes: List[str] = []
+        self._pending_lens: List[int] = []
+        self._pending_alive: List[bool] = []
+
+        self._weights = None  # CSC matrix of BM25 term weights (without idf)
+        self._idf = None
+
+    # ------------------------------------------------------------------
+    # Corpus management
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._rows
+
+    def has(self, doc_id: str, digest: str) -> bool:
+        """True if doc_id is indexed with exactly this content hash."""
+        row = self._rows.get(doc_id)
+        if row is None:
+            return False
+        if row < len(self._hashes):
+            return self._hashes[row] == digest
+        return self._pending_hashes[row - len(self._hashes)] == digest
+
+    def add(self, doc_id: str, tokens: Sequence[str], digest: str = "") -> None:
+        """Add or replace a document."""
+        if doc_id in self._rows:
+            self.remove([doc_id])
+
+        counts: Dict[int, int] = {}
+        for token in tokens:
+            col = self._vocab.get(token)
+            if col is None:
+                col = self._vocab[token] = len(self._vocab)
+            counts[col] = counts.get(col, 0) + 1
+
+        cols = np.fromiter(counts.keys(), dtype=np.int32, count=len(counts))
+        freqs = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+        if len(self._vocab) > len(self._df):
+            self._df = np.concatenate(
+                [self._df, np.zeros(len(self._vocab) - len(self._df), dtype=np.int64)]
+            )
+        self._df[cols] += 1
+
+        self._rows[doc_id] = len(self._doc_ids) + len(self._pending_ids)
+        self._pending.append((cols, freqs))
+        self._pending_ids.append(doc_id)
+        self._pending_hashes.append(digest)
+        self._pending_lens.append(len(tokens))
+        self._pending_alive.append(True)
+        self._weights = None
+
+    def remove(self, doc_ids: Iterable[str]) -> int:
+        """Remove documents by id; returns how many were indexed."""
+        merged = len(self._doc_ids)
+        removed = 0
+        for doc_id in doc_ids:
+            row = self._rows.pop(doc_id, None)
+            if row is None:
+                continue
+            if row < merged:
+                start, end = self._tf.indptr[row], self._tf.indptr[row + 1]
+                self._df[self._tf.indices[start:end]] -= 1
+                self._alive[row] = False
+            else:
+                self._df[self._pending[row - merged][0]] -= 1
+                self._pending_alive[row - merged] = False
+            removed += 1
+
+        if removed:
+            self._weights = None
+            total = merged + len(self._pending)
+            if total - len(self._rows) > self.compact_ratio * total:
+                self._compact()
+        return removed
+
+    def _merge_pending(self) -> None:
+        if not self._pending:
+            return
+
+        n_terms = len(self._vocab)
+        indptr = np.zeros(len(self._pending) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(cols) for cols, _ in self._pending])
+        block = sparse.csr_matrix(
+            (
+                np.concatenate([freqs for _, freqs in self._pending]),
+                np.concatenate([cols for cols, _ in self._pending]),
+                indptr,
+            ),
+            shape=(len(self._pending), n_terms),
+            dtype=np.float32,
+        )
+        existing = self._tf
+        if existing.shape[1] != n_terms:
+            existing = sparse.csr_matrix(
+                (existing.data, existing.indices, existing.indptr),
+                shape=(existing.shape[0], n_terms),
+            )
+        self._tf = sparse.vstack([existing, block], format="csr")
+
+        self._doc_ids.extend(self._pending_ids)
+        self._hashes.extend(self._pending_hashes)
+        self._doc_lens = np.concatenate(
+            [self._doc_lens, np.asarray(self._pending_lens, dtype=np.float32)]
+        )
+        self._alive = np.concatenate(
+            [self._alive, np.asarray(self._pending_alive, dtype=bool)]
+        )
+
+        self._pending, self._pending_ids = [], []
+        self._pending_hashes, self._pending_lens, self._pending_alive = [], [], []
+
+    def _compact(self) -> None:
+        self._merge_pending()
+        keep = np.flatnonzero(self._alive)
+        self._tf = self._tf[keep]
+        self._doc_ids = [self._doc_ids[i] for i in keep]
+        self._hashes = [self._hashes[i] for i in keep]
+        self._doc_lens = self._doc_lens[keep]
+        self._alive = np.ones(len(keep), dtype=bool)
+        self._rows = {doc_id: row for row, doc_id in enumerate(self._doc_ids)}
+
+    def _prepare(self) -> None:
+        """Merge staged rows and recompute BM25 weights if the corpus changed."""
+        self._merge_pending()
+        if self._weights is not None:
+            return
+
+        n_docs = len(self._rows)
+        lens = np.where(self._alive, self._doc_lens, 0)
+        avgdl = lens.sum() / n_docs if n_docs else 0.0
+
+        tf = self._tf.tocoo()
+        if avgdl:
+            norm = self.k1 * (1 - self.b + self.b * self._doc_lens / avgdl)
+        else:
+            norm = np.full(len(self._doc_lens), self.k1, dtype=np.float32)
+        data = tf.data * (self.k1 + 1) / (tf.data + norm[tf.row])
+        data[~self._alive[tf.row]] = 0
+        self._weights = sparse.csc_matrix(
+            (data.astype(np.float32), (tf.row, tf.col)), shape=self._tf.shape
+        )
+
+        # BM25Okapi idf with negative values floored at epsilon * mean idf
+        df = self._df[: self._tf.shape[1]].astype(np.float64)
+        idf = np.log(n_docs - df + 0.5) - np.log(df + 0.5)
+        present = df > 0
+        average_idf = idf[present].mean() if present.any() else 0.0
+        idf[present & (idf < 0)] = self.epsilon * average_idf
+        self._idf = idf.astype(np.float32)
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+
+    def score_many(self, queries: Sequence[Sequence[str]]) -> "np.ndarray":
+        """
+        Score every row against a batch of tokenized queries.
+
+        Returns:
+            (n_rows, n_queries) array; removed rows score -inf
+        """
+        self._prepare()
+        n_rows = self._tf.shape[0]
+        scores = np.zeros((n_rows, len(queries)), dtype=np.float32)
+
+        columns: Dict[int, int] = {}
+        entries: List[Tuple[int, int]] = []
+        for q, tokens in enumerate(queries):
+            for token in tokens:
+                col = self._vocab.get(token)
+                if col is not None:
+                    entries.append((columns.setdefault(col, len(columns)), q))
+
+        if entries and n_rows:
+            cols = np.fromiter(columns.keys(), dtype=np.int64, count=len(columns))
+            # Query-term matrix; repeated query tokens count repeatedly, as in BM25Okapi
+            local, query_idx = np.asarray(entries).T
+            qmat = np.zeros((len(cols), len(queries)), dtype=np.float32)
+            np.add.at(qmat, (local, query_idx), self._idf[cols][local])
+            scores = np.asarray(self._weights[:, cols] @ qmat, dtype=np.float32)
+
+        scores[~self._alive] = -np.inf
+        return scores
+
+    def search_many(
+        self, queries: Sequence[Sequence[str]], k: int = 10
+    ) -> List[List[Tuple[str, float]]]:
+        """Top-k matching (doc_id, score) per tokenized query, best first."""
+        if not self._rows or k <= 0:
+            return [[] for _ in queries]
+
+        scores = self.score_many(queries)
+        k = min(k, len(self._rows))
+        results = []
+        for q in range(scores.shape[1]):
+            column = scores[:, q]
+            top = np.argpartition(-column, k - 1)[:k] if k < len(column) else np.arange(len(column))
+            top = top[np.argsort(-column[top], kind="stable")]
+            # Rows that match no query term (or were removed) are not hits
+            results.append(
+                [(self._doc_ids[i], float(column[i])) for i in top if column[i] > 0]
+            )
+        return results
+
+    def search(self, tokens: Sequence[str], k: int = 10) -> List[Tuple[str, float]]:
+        """Top-k (doc_id, score) for one tokenized query."""
+        return self.search_many([tokens], k)[0]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the index to a single .npz file (atomically)."""
+        self._merge_pending()
+        if len(self._alive) != len(self._rows):
+            self._compact()
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        vocab = sorted(self._vocab, key=self._vocab.get)
+        meta = {
+            "version": self.FORMAT_VERSION,
+            "k1": self.k1,
+            "b": self.b,
+            "epsilon": self.epsilon,
+            "vocab": vocab,
+            "doc_ids": self._doc_ids,
+            "hashes": self._hashes,
+        }
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(
+                f,
+                meta=np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8),
+                data=self._tf.data,
+                indices=self._tf.indices,
+                indptr=self._tf.indptr,
+                shape=np.asarray(self._tf.shape, dtype=np.int64),
+                doc_lens=self._doc_lens,
+                df=self._df,
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], **kwargs: Any) -> "SparseBM25Index":
+        """Load an index written by save()."""
+        with np.load(path) as data:
+            meta = json.loads(data["meta"].tobytes().decode())
+            if meta.get("version") != cls.FORMAT_VERSION:
+                raise ValueError(f"Unsupported BM25 index format: {meta.get('version')}")
+
+            index = cls(
+                k1=meta["k1"], b=meta["b"], epsilon=meta["epsilon"], **kwargs
+            )
+            index._tf = sparse.csr_matrix(
+                (data["data"], data["indices"], data["indptr"]),
+                shape=tuple(data["shape"]),
+            )
+            index._doc_lens = data["doc_lens"]
+            index._df = data["df"]
+
+        index._vocab = {term: col for col, term in enumerate(meta["vocab"])}
+        index._doc_ids = meta["doc_ids"]
+        index._hashes = meta["hashes"]
+        index._alive = np.ones(len(index._doc_ids), dtype=bool)
+        index._rows = {doc_id: row for row, doc_id in enumerate(index._doc_ids)}
+        return index
@@ -11,7 +11,7 @@ Provides multiple embedding backends with performance comparison:
 Features:
 - Automatic model selection based on use case
 - Batch processing for efficiency
-- Caching for repeated embeddings
+- Compact float32/float16 caching for repeated embeddings
 - ChromaDB integration
 """
 
@@ -19,7 +19,12 @@ import hashlib
 import json
 import logging
 import os
+import sqlite3
+import struct
+import threading
 import time
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
@@ -110,61 +115,235 @@ EMBEDDING_MODELS = {
 
 
 class EmbeddingCache:
-    """Simple file-based embedding cache"""
+    """
+    Compact persistent embedding cache.
+
+    Vectors are stored as packed float32 (or float16) blobs in a single
+    SQLite table keyed on the 16-byte md5 of "model:text", with a bounded
+    in-memory LRU in front of it. This replaces the previous layout of one
+    JSON file per embedding and an unbounded dict of Python float lists.
+    """
 
-    def __init__(self, cache_dir: Path = None):
+    DB_NAME = "embeddings.sqlite3"
+    DTYPES = {"float32": "f", "float16": "e"}
+    _SQL_CHUNK = 500
+
+    def __init__(
+        self,
+        cache_dir: Path = None,
+        max_memory_items: Optional[int] = None,
+        dtype: Optional[str] = None,
+    ):
         self.cache_dir = cache_dir or Path.home() / ".cache" / "osmen" / "embeddings"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self._memory_cache: Dict[str, List[float]] = {}
+        self.max_memory_items = (
+            max_memory_items
+            if max_memory_items is not None
+            else int(os.getenv("OSMEN_EMBED_CACHE_MEMORY_ITEMS", "10000"))
+        )
+        self.dtype = dtype or os.getenv("OSMEN_EMBED_CACHE_DTYPE", "float32")
+        if self.dtype not in self.DTYPES:
+            raise ValueError(
+                f"Unsupported cache dtype {self.dtype!r}; expected one of {list(self.DTYPES)}"
+            )
+
+        # LRU of packed float32 arrays (4 bytes per dimension instead of a
+        # Python float object per dimension)
+        self._memory_cache: "OrderedDict[bytes, array]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "writes": 0}
+
+        self.db_path = self.cache_dir / self.DB_NAME
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key BLOB PRIMARY KEY,
+                model TEXT NOT NULL,
+                dims INTEGER NOT NULL,
+                dtype TEXT NOT NULL,
+                vector BLOB NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
 
-    def _get_key(self, text: str, model: str) -> str:
+    def _get_key(self, text: str, model: str) -> bytes:
         """Generate cache key"""
         content = f"{model}:{text}"
-        return hashlib.md5(content.encode()).hexdigest()
+        return hashlib.md5(content.encode()).digest()
+
+    def _pack(self, embedding: List[float]) -> bytes:
+        if self.dtype == "float32":
+            return array("f", embedding).tobytes()
+        return struct.pack(f"<{len(embedding)}e", *embedding)
+
+    @classmethod
+    def _unpack(cls, dtype: str, blob: bytes) -> array:
+        if dtype == "float32":
+            vector = array("f")
+            vector.frombytes(blob)
+            return vector
+        return array("f", struct.unpack(f"<{len(blob) // 2}e", blob))
+
+    def _remember(self, key: bytes, vector: array) -> None:
+        if self.max_memory_items <= 0:
+            return
+        self._memory_cache[key] = vector
+        self._memory_cache.move_to_end(key)
+        while len(self._memory_cache) > self.max_memory_items:
+            self._memory_cache.popitem(last=False)
 
     def get(self, text: str, model: str) -> Optional[List[float]]:
         """Get cached embedding"""
-        key = self._get_key(text, model)
-
-        # Check memory cache
-        if key in self._memory_cache:
-            return self._memory_cache[key]
+        return self.get_many([text], model)[0]
+
+    def get_many(self, texts: List[str], model: str) -> List[Optional[List[float]]]:
+        """Get cached embeddings for several texts; misses are None."""
+        keys = [self._get_key(text, model) for text in texts]
+        results: List[Optional[List[float]]] = [None] * len(texts)
+
+        with self._lock:
+            missing: Dict[bytes, List[int]] = {}
+            for i, key in enumerate(keys):
+                vector = self._memory_cache.get(key)
+                if vector is not None:
+                    self._memory_cache.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    results[i] = vector.tolist()
+                else:
+                    missing.setdefault(key, []).append(i)
+
+            pending = list(missing)
+            for start in range(0, len(pending), self._SQL_CHUNK):
+                chunk = pending[start : start + self._SQL_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, dtype, vector FROM embeddings WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, dtype, blob in rows:
+                    vector = self._unpack(dtype, blob)
+                    self._remember(key, vector)
+                    embedding = vector.tolist()
+                    for i in missing.pop(key):
+                        self._stats["disk_hits"] += 1
+                        results[i] = embedding
+
+            self._stats["misses"] += sum(len(idx) for idx in missing.values())
+        return results
 
-        # Check file cache
-        cache_file = self.cache_dir / f"{key}.json"
-        if cache_file.exists():
+    def set(self, text: str, model: str, embedding: List[float]) -> None:
+        """Cache an embedding"""
+        self.set_many([text], model, [embedding])
+
+    def set_many(
+        self, texts: List[str], model: str, embeddings: List[List[float]]
+    ) -> None:
+        """Cache several embeddings in one transaction."""
+        rows = []
+        with self._lock:
+            for text, embedding in zip(texts, embeddings):
+                key = self._get_key(text, model)
+                blob = self._pack(embedding)
+                self._remember(key, self._unpack(self.dtype, blob))
+                rows.append((key, model, len(embedding), self.dtype, blob))
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO embeddings "
+                        "(key, model, dims, dtype, vector) VALUES (?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                self._stats["writes"] += len(rows)
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache write failed: {e}")
+
+    def migrate_json_files(self, remove: bool = True) -> int:
+        """
+        Import embeddings from the legacy one-JSON-file-per-vector layout.
+
+        With remove=True a JSON file is deleted only after the batch holding
+        its embedding has been committed.
+
+        Returns:
+            Number of embeddings imported
+        """
+        imported = 0
+        batch = []
+        batch_files = []
+        for cache_file in self.cache_dir.glob("*.json"):
             try:
                 with open(cache_file) as f:
                     data = json.load(f)
-                    self._memory_cache[key] = data["embedding"]
-                    return data["embedding"]
-            except:
-                pass
-
-        return None
-
-    def set(self, text: str, model: str, embedding: List[float]) -> None:
-        """Cache an embedding"""
-        key = self._get_key(text, model)
-        self._memory_cache[key] = embedding
-
-        # Also save to file
-        cache_file = self.cache_dir / f"{key}.json"
-        try:
-            with open(cache_file, "w") as f:
-                json.dump({"model": model, "embedding": embedding}, f)
-        except:
-            pass
+                key = bytes.fromhex(cache_file.stem)
+                embedding = data["embedding"]
+            except (OSError, ValueError, KeyError):
+                continue
+            batch.append(
+                (key, data.get("model", ""), len(embedding), self.dtype, self._pack(embedding))
+            )
+            batch_files.append(cache_file)
+            if len(batch) >= self._SQL_CHUNK:
+                imported += self._insert_rows(batch, batch_files if remove else [])
+                batch = []
+                batch_files = []
+        if batch:
+            imported += self._insert_rows(batch, batch_files if remove else [])
+        return imported
+
+    def _insert_rows(self, rows: List[tuple], migrated_files: List[Path] = ()) -> int:
+        """Insert rows in one transaction, then delete the files they came from."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings "
+                "(key, model, dims, dtype, vector) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+        for path in migrated_files:
+            path.unlink(missing_ok=True)
+        return len(rows)
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics: hit rate, entry counts and bytes on disk."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            hits = self._stats["memory_hits"] + self._stats["disk_hits"]
+            lookups = hits + self._stats["misses"]
+            bytes_on_disk = sum(
+                path.stat().st_size
+                for path in self.cache_dir.glob(f"{self.DB_NAME}*")
+                if path.is_file()
+            )
+            return {
+                **self._stats,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "entries": entries,
+                "memory_entries": len(self._memory_cache),
+                "bytes_on_disk": bytes_on_disk,
+                "dtype": self.dtype,
+            }
 
     def clear(self) -> int:
         """Clear all cached embeddings"""
-        count = 0
+        with self._lock:
+            with self._conn:
+                count = self._conn.execute("DELETE FROM embeddings").rowcount
+            self._conn.execute("VACUUM")
+            self._memory_cache.clear()
+        # Remove any leftovers from the legacy JSON layout
         for f in self.cache_dir.glob("*.json"):
             f.unlink()
             count += 1
-        self._memory_cache.clear()
         return count
 
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
+
 
 class EmbeddingProvider:
     """
@@ -238,40 +417,32 @@ class EmbeddingProvider:
         show_progress: bool = False,
     ) -> List[List[float]]:
         """Generate embeddings for multiple texts efficiently"""
-        if not self.model:
-            raise RuntimeError("Embedding model not available")
-
-        # Check cache for each text
-        results = [None] * len(texts)
-        uncached_indices = []
-        uncached_texts = []
-
+        # Check the cache for all texts in one lookup
         if self.cache:
-            for i, text in enumerate(texts):
-                cached = self.cache.get(text, self.model_config.model_id)
-                if cached:
-                    results[i] = cached
-                else:
-                    uncached_indices.append(i)
-                    uncached_texts.append(text)
+            results = self.cache.get_many(texts, self.model_config.model_id)
         else:
-            uncached_indices = list(range(len(texts)))
-            uncached_texts = texts
+            results = [None] * len(texts)
+        uncached_indices = [i for i, emb in enumerate(results) if emb is None]
 
         # Generate embeddings for uncached texts
-        if uncached_texts:
+        if uncached_indices:
+            if not self.model:
+                raise RuntimeError("Embedding model not available")
+
+            uncached_texts = [texts[i] for i in uncached_indices]
             embeddings = self.model.encode(
                 uncached_texts,
                 batch_size=batch_size,
                 show_progress_bar=show_progress,
                 convert_to_numpy=True,
-            )
+            ).tolist()
 
             for i, idx in enumerate(uncached_indices):
-                emb = embeddings[i].tolist()
-                results[idx] = emb
-                if self.cache:
-                    self.cache.set(texts[idx], self.model_config.model_id, emb)
+                results[idx] = embeddings[i]
+            if self.cache:
+                self.cache.set_many(
+                    uncached_texts, self.model_config.model_id, embeddings
+                )
 
         return results
 
@@ -398,6 +569,14 @@ def main():
     parser.add_argument(
         "--clear-cache", action="store_true", help="Clear embedding cache"
     )
+    parser.add_argument(
+        "--migrate-cache",
+        action="store_true",
+        help="Import legacy per-embedding JSON cache files",
+    )
+    parser.add_argument(
+        "--cache-stats", action="store_true", help="Show embedding cache statistics"
+    )
 
     args = parser.parse_args()
 
@@ -431,6 +610,14 @@ def main():
         count = cache.clear()
         print(f"Cleared {count} cached embeddings")
 
+    elif args.migrate_cache:
+        cache = EmbeddingCache()
+        count = cache.migrate_json_files()
+        print(f"Imported {count} cached embeddings")
+
+    elif args.cache_stats:
+        print(json.dumps(EmbeddingCache().stats(), indent=2))
+
     else:
         # Show available models
         print("Available Embedding Models:\n")
@@ -0,0 +1,582 @@
+#!/usr/bin/env python3
+"""
+Response Cache for LLM Providers
+
+Features:
+- Exact tier: responses keyed on a hash of the provider, the normalized
+  messages, the model and the sampling parameters
+- Optional semantic tier: the final message of a request is embedded and
+  compared with cached requests that share everything else (model,
+  parameters, earlier turns); a match above the threshold is a hit
+- SQLite (default) or Redis backends with TTL and size-based eviction
+- Requests with temperature > 0 bypass the cache unless opted in
+- Hit/miss metrics
+
+Providers are wrapped with `CachedProvider` in `integrations.llm_providers`;
+this module only deals in plain dicts so it has no provider dependencies.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis.asyncio as redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Message fields that affect a completion; anything else (ids, timestamps
+# added by callers) is left out of the key
+_MESSAGE_FIELDS = ("role", "content", "name", "tool_call_id", "tool_calls")
+
+# (key, unit-length embedding) pairs offered to the semantic tier
+Candidate = Tuple[str, array]
+
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha256(_canonical(value).encode()).hexdigest()
+
+
+def normalize_message(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep the fields that affect a completion; trim whitespace in text content."""
+    normalized = {}
+    for field in _MESSAGE_FIELDS:
+        value = message.get(field)
+        if value is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+        normalized[field] = value
+    return normalized
+
+
+def _message_text(message: Dict[str, Any]) -> str:
+    content = message.get("content", "")
+    if isinstance(content, str):
+        return content
+    # Multi-part content (e.g. Anthropic blocks): embed the text parts
+    return " ".join(
+        part.get("text", "") for part in content if isinstance(part, dict)
+    ).strip()
+
+
+def _unit(vector: Sequence[float]) -> array:
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return array("f", (x / norm for x in vector))
+
+
+# ============================================================================
+# Backends
+# ============================================================================
+
+
+class ResponseCacheBackend(ABC):
+    """
+    Storage for cached responses.
+
+    Entries carry a scope (everything in the request except the final
+    message) so the semantic tier only compares requests that could share
+    an answer.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached response for an exact key, or None."""
+
+    @abstractmethod
+    async def set(
+        self,
+        key: str,
+        scope: str,
+        response: Dict[str, Any],
+        embedding: Optional[array] = None,
+    ) -> None:
+        """Store a response, evicting expired and least recently used entries."""
+
+    @abstractmethod
+    async def candidates(self, scope: str, limit: int) -> List[Candidate]:
+        """Most recently used embedded entries in a scope."""
+
+    @abstractmethod
+    async def count(self) -> int:
+        """Number of live entries."""
+
+    @abstractmethod
+    async def clear(self) -> int:
+        """Remove all entries; returns how many were removed."""
+
+    async def close(self) -> None:
+        pass
+
+
+class SQLiteResponseCache(ResponseCacheBackend):
+    """
+    Single-table SQLite store. Lookups are a primary-key read. Expired rows
+    are filtered on read, and deleted with the size trim, which runs once
+    per `max_entries // 10` writes, so the table can overshoot
+    `max_entries` by up to 10% between trims. Queries run in a worker
+    thread to keep the event loop free.
+    """
+
+    DB_NAME = "llm_responses.sqlite3"
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl_seconds: float = 86400.0,
+        max_entries: int = 10000,
+    ):
+        super().__init__(ttl_seconds, max_entries)
+        if path is None:
+            cache_dir = Path.home() / ".cache" / "osmen"
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            path = cache_dir / self.DB_NAME
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self._writes_since_prune = 0
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                scope TEXT NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL,
+                embedding BLOB,
+                response TEXT NOT NULL
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS responses_scope ON responses(scope, accessed);
+            CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed);
+            """
+        )
+        self._conn.commit()
+
+    def _expiry(self, now: float) -> float:
+        return now - self.ttl_seconds
+
+    @property
+    def _prune_every(self) -> int:
+        return max(1, self.max_entries // 10)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._get, key)
+
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ? AND created > ?",
+                (key, self._expiry(now)),
+            ).fetchone()
+            if row is None:
+                return None
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+                )
+        return json.loads(row[0])
+
+    async def set(
+        self,
+        key: str,
+        scope: str,
+        response: Dict[str, Any],
+        embedding: Optional[array] = None,
+    ) -> None:
+        await asyncio.to_thread(self._set, key, scope, response, embedding)
+
+    def _set(
+        self,
+        key: str,
+        scope: str,
+        response: Dict[str, Any],
+        embedding: Optional[array],
+    ) -> None:
+        now = time.time()
+        blob = embedding.tobytes() if embedding is not None else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, scope, created, accessed, embedding, response) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, scope, now, now, blob, _canonical(response)),
+            )
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= self._prune_every:
+                self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        """Drop expired rows and trim to max_entries by last access (lock held)."""
+        self._conn.execute(
+            "DELETE FROM responses WHERE created <= ?", (self._expiry(now),)
+        )
+        self._conn.execute(
+            "DELETE FROM responses WHERE key IN ("
+            "SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+        self._writes_since_prune = 0
+
+    async def candidates(self, scope: str, limit: int) -> List[Candidate]:
+        return await asyncio.to_thread(self._candidates, scope, limit)
+
+    def _candidates(self, scope: str, limit: int) -> List[Candidate]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, embedding FROM responses "
+                "WHERE scope = ? AND created > ? AND embedding IS NOT NULL "
+                "ORDER BY accessed DESC LIMIT ?",
+                (scope, self._expiry(time.time()), limit),
+            ).fetchall()
+        results = []
+        for key, blob in rows:
+            vector = array("f")
+            vector.frombytes(blob)
+            results.append((key, vector))
+        return results
+
+    async def count(self) -> int:
+        return await asyncio.to_thread(self._count)
+
+    def _count(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM responses WHERE created > ?",
+                (self._expiry(time.time()),),
+            ).fetchone()[0]
+
+    async def clear(self) -> int:
+        return await asyncio.to_thread(self._clear)
+
+    def _clear(self) -> int:
+        with self._lock, self._conn:
+            self._writes_since_prune = 0
+            return self._conn.execute("DELETE FROM responses").rowcount
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RedisResponseCache(ResponseCacheBackend):
+    """
+    Redis store shared between processes. Entries expire through Redis
+    TTLs; a sorted set of keys by last access drives size-based eviction,
+    and one sorted set per scope lists candidates for the semantic tier.
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        prefix: str = "osmen:llm_cache",
+        ttl_seconds: float = 86400.0,
+        max_entries: int = 10000,
+    ):
+        super().__init__(ttl_seconds, max_entries)
+        if client is None:
+            if not REDIS_AVAILABLE:
+                raise ImportError("redis is required for the Redis response cache")
+            client = redis.Redis(
+                host=os.getenv("REDIS_HOST", "redis"),
+                port=int(os.getenv("REDIS_PORT", "6379")),
+                password=os.getenv("REDIS_PASSWORD") or None,
+                db=int(os.getenv("REDIS_CACHE_DB", "0")),
+            )
+        self.client = client
+        self.prefix = prefix
+
+    def _entry(self, key: str) -> str:
+        return f"{self.prefix}:entry:{key}"
+
+    def _scope(self, scope: str) -> str:
+        return f"{self.prefix}:scope:{scope}"
+
+    @property
+    def _lru(self) -> str:
+        return f"{self.prefix}:lru"
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = await self.client.get(self._entry(key))
+        if raw is None:
+            await self.client.zrem(self._lru, key)
+            return None
+        entry = json.loads(raw)
+        now = time.time()
+        pipe = self.client.pipeline()
+        pipe.zadd(self._lru, {key: now})
+        pipe.zadd(self._scope(entry["scope"]), {key: now})
+        await pipe.execute()
+        return entry["response"]
+
+    async def set(
+        self,
+        key: str,
+        scope: str,
+        response: Dict[str, Any],
+        embedding: Optional[array] = None,
+    ) -> None:
+        now = time.time()
+        entry = {
+            "scope": scope,
+            "response": response,
+            "embedding": embedding.tolist() if embedding is not None else None,
+        }
+        ttl = max(1, int(self.ttl_seconds))
+        pipe = self.client.pipeline()
+        pipe.set(self._entry(key), _canonical(entry), ex=ttl)
+        pipe.zadd(self._lru, {key: now})
+        pipe.zadd(self._scope(scope), {key: now})
+        pipe.expire(self._scope(scope), ttl)
+        pipe.zcard(self._lru)
+        size = (await pipe.execute())[-1]
+
+        if size > self.max_entries:
+            evicted = await self.client.zpopmin(self._lru, size - self.max_entries)
+            keys = [k.decode() if isinstance(k, bytes) else k for k, _ in evicted]
+            if keys:
+                await self.client.delete(*(self._entry(k) for k in keys))
+
+    async def candidates(self, scope: str, limit: int) -> List[Candidate]:
+        keys = await self.client.zrevrange(self._scope(scope), 0, limit - 1)
+        keys = [k.decode() if isinstance(k, bytes) else k for k in keys]
+        if not keys:
+            return []
+        raws = await self.client.mget([self._entry(k) for k in keys])
+        results, gone = [], []
+        for key, raw in zip(keys, raws):
+            if raw is None:
+                gone.append(key)
+                continue
+            embedding = json.loads(raw).get("embedding")
+            if embedding:
+                results.append((key, array("f", embedding)))
+        if gone:
+            await self.client.zrem(self._scope(scope), *gone)
+        return results
+
+    async def count(self) -> int:
+        return await self.client.zcard(self._lru)
+
+    async def clear(self) -> int:
+        removed = await self.client.zcard(self._lru)
+        names = [name async for name in self.client.scan_iter(match=f"{self.prefix}:*")]
+        if names:
+            await self.client.delete(*names)
+        return removed
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+# ============================================================================
+# Cache
+# ============================================================================
+
+
+class ResponseCache:
+    """
+    Exact and (optionally) semantic response cache.
+
+    Args:
+        backend: Storage backend (SQLite in the user cache dir by default)
+        embed: Function returning an embedding for a text; enables the
+            semantic tier (e.g. `EmbeddingProvider().embed`). Called in a
+            worker thread.
+        similarity_threshold: Cosine similarity needed for a semantic hit
+        semantic_candidates: Most recent entries per scope compared
+        cache_nondeterministic: Cache requests with temperature > 0 too
+    """
+
+    def __init__(
+        self,
+        backend: Optional[ResponseCacheBackend] = None,
+        embed: Optional[Callable[[str], Sequence[float]]] = None,
+        similarity_threshold: float = 0.95,
+        semantic_candidates: int = 200,
+        cache_nondeterministic: bool = False,
+    ):
+        self.backend = backend or SQLiteResponseCache()
+        self.embed = embed
+        self.similarity_threshold = similarity_threshold
+        self.semantic_candidates = semantic_candidates
+        self.cache_nondeterministic = cache_nondeterministic
+        self._stats = {
+            "exact_hits": 0,
+            "semantic_hits": 0,
+            "misses": 0,
+            "bypassed": 0,
+            "stores": 0,
+            "errors": 0,
+        }
+
+    @classmethod
+    def from_env(cls) -> Optional["ResponseCache"]:
+        """
+        Cache configured by OSMEN_LLM_CACHE (sqlite or redis), or None when
+        unset. Tuned with OSMEN_LLM_CACHE_TTL_SECONDS,
+        OSMEN_LLM_CACHE_MAX_ENTRIES, OSMEN_LLM_CACHE_PATH,
+        OSMEN_LLM_CACHE_SEMANTIC_MODEL / _THRESHOLD and
+        OSMEN_LLM_CACHE_NONDETERMINISTIC.
+        """
+        kind = os.getenv("OSMEN_LLM_CACHE", "").strip().lower()
+        if not kind or kind in ("0", "false", "off", "none"):
+            return None
+
+        ttl = float(os.getenv("OSMEN_LLM_CACHE_TTL_SECONDS", "86400"))
+        max_entries = int(os.getenv("OSMEN_LLM_CACHE_MAX_ENTRIES", "10000"))
+        if kind == "redis":
+            backend = RedisResponseCache(ttl_seconds=ttl, max_entries=max_entries)
+        elif kind == "sqlite":
+            path = os.getenv("OSMEN_LLM_CACHE_PATH")
+            backend = SQLiteResponseCache(
+                Path(path) if path else None, ttl_seconds=ttl, max_entries=max_entries
+            )
+        else:
+            raise ValueError(f"Unknown OSMEN_LLM_CACHE backend: {kind!r}")
+
+        embed = None
+        model = os.getenv("OSMEN_LLM_CACHE_SEMANTIC_MODEL")
+        if model:
+            from integrations.embedding_optimizer import EmbeddingProvider
+
+            embed = EmbeddingProvider(model).embed
+
+        return cls(
+            backend,
+            embed=embed,
+            similarity_threshold=float(
+                os.getenv("OSMEN_LLM_CACHE_SEMANTIC_THRESHOLD", "0.95")
+            ),
+            cache_nondeterministic=os.getenv(
+                "OSMEN_LLM_CACHE_NONDETERMINISTIC", ""
+            ).lower()
+            in ("1", "true", "yes"),
+        )
+
+    def should_cache(self, temperature: float, opt_in: Optional[bool] = None) -> bool:
+        """
+        Whether a request is cacheable. `opt_in` is the per-call override:
+        False always bypasses, True caches regardless of temperature.
+        """
+        if opt_in is not None:
+            return opt_in
+        return temperature <= 0 or self.cache_nondeterministic
+
+    def keys(
+        self,
+        method: str,
+        messages: List[Dict[str, Any]],
+        params: Dict[str, Any],
+    ) -> Tuple[str, str]:
+        """
+        (exact key, scope) for a request. The scope covers everything but
+        the final message, so semantic matches never cross models,
+        parameters or conversation history.
+        """
+        normalized = [normalize_message(m) for m in messages]
+        scope = _digest([method, params, normalized[:-1]])
+        return _digest([scope, normalized[-1:]]), scope
+
+    async def lookup(
+        self,
+        method: str,
+        messages: List[Dict[str, Any]],
+        params: Dict[str, Any],
+    ) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Cached response for a request (or None) and a context to pass to
+        `store` on a miss, so the key and embedding are computed once.
+        """
+        key, scope = self.keys(method, messages, params)
+        context: Dict[str, Any] = {"key": key, "scope": scope, "embedding": None}
+        try:
+            cached = await self.backend.get(key)
+            if cached is not None:
+                self._stats["exact_hits"] += 1
+                return cached, context
+
+            if self.embed is not None and messages:
+                text = _message_text(messages[-1])
+                if text:
+                    context["embedding"] = _unit(await asyncio.to_thread(self.embed, text))
+                    cached = await self._semantic_match(scope, context["embedding"])
+                    if cached is not None:
+                        self._stats["semantic_hits"] += 1
+                        return cached, context
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"Response cache lookup failed: {e}")
+
+        self._stats["misses"] += 1
+        return None, context
+
+    async def store(self, context: Dict[str, Any], response: Dict[str, Any]) -> None:
+        try:
+            await self.backend.set(
+                context["key"], context["scope"], response, context["embedding"]
+            )
+            self._stats["stores"] += 1
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"Response cache write failed: {e}")
+
+    def record_bypass(self) -> None:
+        self._stats["bypassed"] += 1
+
+    async def _semantic_match(self, scope: str, embedding: array) -> Optional[Dict[str, Any]]:
+        best_key, best_score = None, self.similarity_threshold
+        for key, vector in await self.backend.candidates(scope, self.semantic_candidates):
+            if len(vector) != len(embedding):
+                continue
+            score = sum(a * b for a, b in zip(embedding, vector))
+            if score >= best_score:
+                best_key, best_score = key, score
+        if best_key is None:
+            return None
+        return await self.backend.get(best_key)
+
+    async def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters, hit rate over cacheable requests and entry count."""
+        hits = self._stats["exact_hits"] + self._stats["semantic_hits"]
+        lookups = hits + self._stats["misses"]
+        try:
+            entries = await self.backend.count()
+        except Exception:
+            entries = None
+        return {
+            **self._stats,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "backend": type(self.backend).__name__,
+            "semantic": self.embed is not None,
+        }
+
+    async def clear(self) -> int:
+        return await self.backend.clear()
+
+    async def close(self) -> None:
+        await self.backend.close()
@@ -27,6 +27,14 @@ Usage:
     # Stream responses
     async for chunk in llm.stream([{"role": "user", "content": "Hello"}]):
         print(chunk, end="")
+
+    # Route through the ProviderRouter for failover, hedging and
+    # capability-aware provider selection; with a ResponseCache every
+    # provider's chat/generate results are cached
+    router = ProviderRouter(hedge=True, cache=ResponseCache())
+    await router.initialize()
+    response = await router.tool_call(messages=[...], tools=[...])
+    print(router.get_stats())
 """
 
 import asyncio
@@ -35,6 +43,7 @@ import os
 import sys
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -43,10 +52,14 @@ from typing import (
     Any,
     AsyncGenerator,
     Callable,
+    Deque,
     Dict,
+    Iterable,
     List,
     Literal,
     Optional,
+    Set,
+    Tuple,
     TypedDict,
     Union,
 )
@@ -57,6 +70,8 @@ from loguru import logger
 # Add parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+from integrations.llm_cache import ResponseCache
+
 
 # ============================================================================
 # Configuration
@@ -226,6 +241,7 @@ class LLMResponse:
     usage: Optional[Dict[str, int]] = None
     raw_response: Optional[Dict] = None
     latency_ms: float = 0.0
+    cached: bool = False
 
 
 # ============================================================================
@@ -274,6 +290,11 @@ class RateLimiter:
         self.last_refill = now
 
 
+def is_rate_limited(error: BaseException) -> bool:
+    """Whether a provider error is an HTTP 429 (providers raise "<name> API error <status>: ...")."""
+    return "API error 429" in str(error)
+
+
 # ============================================================================
 # Base Provider
 # ============================================================================
@@ -294,6 +315,9 @@ class LLMProvider(ABC):
         self.config = config
         self.rate_limiter = RateLimiter(config.rate_limit_rpm, config.rate_limit_tpm)
         self._session: Optional[aiohttp.ClientSession] = None
+        # The ProviderRouter turns this off: it fails over to another
+        # provider instead of backing off against a 429
+        self.retry_rate_limited = True
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session"""
@@ -367,6 +391,8 @@ class LLMProvider(ABC):
                 return await func(*args, **kwargs)
             except Exception as e:
                 last_error = e
+                if not self.retry_rate_limited and is_rate_limited(e):
+                    break
                 if attempt < self.config.retry_attempts - 1:
                     delay = self.config.retry_delay * (2**attempt)
                     logger.warning(
@@ -1279,11 +1305,255 @@ class OllamaProvider(LLMProvider):
                     continue
 
 
+# ============================================================================
+# Response Cache
+# ============================================================================
+
+
+def _response_to_dict(response: LLMResponse) -> Dict[str, Any]:
+    return {
+        "content": response.content,
+        "model": response.model,
+        "provider": response.provider.value,
+        "finish_reason": response.finish_reason,
+        "tool_calls": [
+            {"id": c.id, "name": c.name, "arguments": c.arguments}
+            for c in response.tool_calls or []
+        ]
+        or None,
+        "usage": response.usage,
+    }
+
+
+def _response_from_dict(data: Dict[str, Any]) -> LLMResponse:
+    return LLMResponse(
+        content=data["content"],
+        model=data["model"],
+        provider=ProviderType(data["provider"]),
+        finish_reason=data["finish_reason"],
+        tool_calls=[ToolCall(**c) for c in data["tool_calls"]]
+        if data.get("tool_calls")
+        else None,
+        usage=data.get("usage"),
+        cached=True,
+    )
+
+
+class CachedProvider(LLMProvider):
+    """
+    Wraps any provider with a ResponseCache for chat() and generate().
+
+    tool_call() and stream() pass straight through. Requests with a
+    temperature above zero bypass the cache unless the cache is configured
+    with cache_nondeterministic; pass cache=False to a call to skip the
+    cache or cache=True to force it. Hits come back with cached=True and
+    latency_ms set to the lookup time. Other attributes (MODELS,
+    check_available, ...) are those of the wrapped provider.
+    """
+
+    def __init__(self, provider: LLMProvider, cache: ResponseCache):
+        # No super().__init__(): rate limiting and sessions belong to the
+        # wrapped provider
+        self.provider = provider
+        self.cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "provider":
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+
+    @property
+    def config(self) -> LLMConfig:
+        return self.provider.config
+
+    @property
+    def retry_rate_limited(self) -> bool:
+        return self.provider.retry_rate_limited
+
+    @retry_rate_limited.setter
+    def retry_rate_limited(self, value: bool):
+        self.provider.retry_rate_limited = value
+
+    async def close(self):
+        await self.provider.close()
+
+    async def generate(self, prompt: str, **kwargs) -> LLMResponse:
+        return await self._cached(
+            "generate",
+            [{"role": "user", "content": prompt}],
+            kwargs,
+            lambda kw: self.provider.generate(prompt, **kw),
+        )
+
+    async def chat(
+        self, messages: List[Union[Message, Dict[str, Any]]], **kwargs
+    ) -> LLMResponse:
+        return await self._cached(
+            "chat",
+            self._normalize_messages(messages),
+            kwargs,
+            lambda kw: self.provider.chat(messages, **kw),
+        )
+
+    async def tool_call(
+        self,
+        messages: List[Union[Message, Dict[str, Any]]],
+        tools: List[Union[ToolDefinition, Dict[str, Any]]],
+        **kwargs,
+    ) -> LLMResponse:
+        kwargs.pop("cache", None)
+        return await self.provider.tool_call(messages, tools, **kwargs)
+
+    async def stream(
+        self, messages: List[Union[Message, Dict[str, Any]]], **kwargs
+    ) -> AsyncGenerator[str, None]:
+        kwargs.pop("cache", None)
+        async for chunk in self.provider.stream(messages, **kwargs):
+            yield chunk
+
+    def _cache_params(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Effective request parameters, with provider defaults filled in."""
+        return {
+            **kwargs,
+            "provider": self.config.provider.value,
+            "model": kwargs.get("model", self.config.model),
+            "temperature": kwargs.get("temperature", self.config.temperature),
+            "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
+            "json_mode": bool(self.config.json_mode or kwargs.get("json_mode")),
+        }
+
+    async def _cached(
+        self,
+        method: str,
+        messages: List[Dict[str, Any]],
+        kwargs: Dict[str, Any],
+        call: Callable[[Dict[str, Any]], Any],
+    ) -> LLMResponse:
+        opt_in = kwargs.pop("cache", None)
+        temperature = kwargs.get("temperature", self.config.temperature)
+        if not self.cache.should_cache(temperature, opt_in):
+            self.cache.record_bypass()
+            return await call(kwargs)
+
+        start = time.perf_counter()
+        cached, context = await self.cache.lookup(
+            method, messages, self._cache_params(kwargs)
+        )
+        if cached is not None:
+            response = _response_from_dict(cached)
+            response.latency_ms = (time.perf_counter() - start) * 1000
+            return response
+
+        response = await call(kwargs)
+        # Empty answers are usually transient failures; don't pin them
+        if response.content or response.tool_calls:
+            await self.cache.store(context, _response_to_dict(response))
+        return response
+
+
 # ============================================================================
 # Provider Factory
 # ============================================================================
 
 
+class ProviderRoutingError(Exception):
+    """Raised when no provider could serve a routed request."""
+
+    def __init__(self, message: str, errors: Optional[Dict[str, str]] = None):
+        super().__init__(message)
+        self.errors = errors or {}
+
+
+@dataclass
+class ProviderStats:
+    """
+    Rolling statistics for one provider.
+
+    Latency percentiles are over the last `window` successful calls and the
+    error rate over the last `window` outcomes.
+    """
+
+    window: int = 100
+    latencies_ms: Deque[float] = field(default_factory=deque)
+    outcomes: Deque[bool] = field(default_factory=deque)
+    requests: int = 0
+    failures: int = 0
+    rate_limited: int = 0
+    consecutive_failures: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    cooldown_until: float = 0.0
+    last_error: Optional[str] = None
+
+    def __post_init__(self):
+        self.latencies_ms = deque(self.latencies_ms, maxlen=self.window)
+        self.outcomes = deque(self.outcomes, maxlen=self.window)
+
+    def record_success(self, latency_ms: float):
+        self.requests += 1
+        self.latencies_ms.append(latency_ms)
+        self.outcomes.append(True)
+        self.consecutive_failures = 0
+
+    def record_failure(self, error: BaseException):
+        self.requests += 1
+        self.failures += 1
+        self.outcomes.append(False)
+        self.consecutive_failures += 1
+        self.last_error = str(error)[:200]
+        if is_rate_limited(error):
+            self.rate_limited += 1
+
+    @property
+    def samples(self) -> int:
+        return len(self.latencies_ms)
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Latency percentile (0-100) in ms, or None without samples."""
+        if not self.latencies_ms:
+            return None
+        ordered = sorted(self.latencies_ms)
+        index = min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def expected_latency_ms(self, min_samples: int) -> float:
+        """
+        Median latency inflated by the error rate (a failed attempt costs
+        a retry elsewhere). Providers with fewer than `min_samples`
+        successes score 0 so they are tried and measured.
+        """
+        if self.samples < min_samples:
+            return 0.0
+        return self.percentile(50) * (1 + 4 * self.error_rate)
+
+    def cooling_down(self, now: Optional[float] = None) -> bool:
+        return self.cooldown_until > (time.monotonic() if now is None else now)
+
+    def to_dict(self) -> Dict[str, Any]:
+        p50, p95 = self.percentile(50), self.percentile(95)
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "rate_limited": self.rate_limited,
+            "error_rate": round(self.error_rate, 4),
+            "p50_ms": round(p50, 1) if p50 is not None else None,
+            "p95_ms": round(p95, 1) if p95 is not None else None,
+            "samples": self.samples,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "cooldown_remaining_s": round(
+                max(0.0, self.cooldown_until - time.monotonic()), 1
+            ),
+            "last_error": self.last_error,
+        }
+
+
 class ProviderRouter:
     """
     Routes requests to appropriate LLM provider.
@@ -1291,12 +1561,50 @@ class ProviderRouter:
     Features:
     - Automatic fallback: local → cloud
     - Provider selection based on capability
-    - Load balancing (future)
+    - Rolling per-provider latency and error statistics; providers are
+      ranked by expected latency, and ones that keep failing (or return
+      429) are benched for a cooldown
+    - Failover to the next capable provider when a call fails
+    - Optional hedged requests: if the first provider has not answered
+      after its p95 latency, the next one is started and the first
+      response wins
+    - Optional response cache: registered providers are wrapped in a
+      CachedProvider sharing one ResponseCache
     """
 
-    def __init__(self, config: LLMConfig = None):
+    def __init__(
+        self,
+        config: LLMConfig = None,
+        hedge: bool = False,
+        hedge_delay: float = 2.0,
+        stats_window: int = 100,
+        min_samples: int = 5,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 30.0,
+        cache: Optional[ResponseCache] = None,
+    ):
+        """
+        Args:
+            config: Base configuration
+            hedge: Hedge routed requests by default
+            hedge_delay: Seconds before hedging until a provider has
+                `min_samples` latency samples (then its p95 is used)
+            stats_window: Calls kept in each provider's rolling statistics
+            min_samples: Samples needed before latency affects ranking
+            failure_threshold: Consecutive failures that bench a provider
+            cooldown_seconds: How long a benched provider is skipped
+            cache: Response cache for chat/generate calls
+        """
         self.config = config or LLMConfig()
+        self.hedge = hedge
+        self.hedge_delay = hedge_delay
+        self.stats_window = stats_window
+        self.min_samples = min_samples
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.cache = cache
         self._providers: Dict[ProviderType, LLMProvider] = {}
+        self._stats: Dict[ProviderType, ProviderStats] = {}
         self._default_provider: Optional[ProviderType] = None
 
     async def initialize(self):
@@ -1307,8 +1615,7 @@ class ProviderRouter:
             ollama_config = LLMConfig(provider=ProviderType.OLLAMA)
             ollama = OllamaProvider(ollama_config)
             if await ollama.check_available():
-                self._providers[ProviderType.OLLAMA] = ollama
-                self._default_provider = ProviderType.OLLAMA
+                self.register(ProviderType.OLLAMA, ollama)
                 logger.info("Ollama provider initialized (local-first)")
             else:
                 await ollama.close()
@@ -1324,9 +1631,7 @@ class ProviderRouter:
         try:
             openai_config = LLMConfig(provider=ProviderType.OPENAI)
             if openai_config.api_key:
-                self._providers[ProviderType.OPENAI] = OpenAIProvider(openai_config)
-                if self._default_provider is None:
-                    self._default_provider = ProviderType.OPENAI
+                self.register(ProviderType.OPENAI, OpenAIProvider(openai_config))
                 logger.info("OpenAI provider initialized")
         except Exception as e:
             logger.debug(f"OpenAI not available: {e}")
@@ -1335,11 +1640,9 @@ class ProviderRouter:
         try:
             anthropic_config = LLMConfig(provider=ProviderType.ANTHROPIC)
             if anthropic_config.api_key:
-                self._providers[ProviderType.ANTHROPIC] = AnthropicProvider(
-                    anthropic_config
+                self.register(
+                    ProviderType.ANTHROPIC, AnthropicProvider(anthropic_config)
                 )
-                if self._default_provider is None:
-                    self._default_provider = ProviderType.ANTHROPIC
                 logger.info("Anthropic provider initialized")
         except Exception as e:
             logger.debug(f"Anthropic not available: {e}")
@@ -1347,22 +1650,284 @@ class ProviderRouter:
         if not self._providers:
             logger.warning("No LLM providers available!")
 
+    def register(self, provider_type: ProviderType, provider: LLMProvider):
+        """Add a provider; registration order is the preference order on ties."""
+        if self.cache is not None and not isinstance(provider, CachedProvider):
+            provider = CachedProvider(provider, self.cache)
+        self._providers[provider_type] = provider
+        self._stats.setdefault(provider_type, ProviderStats(window=self.stats_window))
+        provider.retry_rate_limited = False
+        if self._default_provider is None:
+            self._default_provider = provider_type
+
     def get_provider(self, provider_type: ProviderType = None) -> Optional[LLMProvider]:
-        """Get a specific provider or the default"""
+        """Get a specific provider or the currently best-ranked one"""
         if provider_type:
             return self._providers.get(provider_type)
-        if self._default_provider:
-            return self._providers.get(self._default_provider)
+        ranked = self.ranked()
+        if ranked:
+            return self._providers[ranked[0]]
         return None
 
     def list_providers(self) -> List[ProviderType]:
         """List available providers"""
         return list(self._providers.keys())
 
+    def provider_capabilities(self, provider_type: ProviderType) -> Set[ModelCapability]:
+        """
+        Capabilities of a provider's configured model. Models missing from
+        the provider's model table are assumed to support everything.
+        """
+        provider = self._providers[provider_type]
+        table = getattr(provider, "MODELS", None) or getattr(
+            provider, "RECOMMENDED_MODELS", {}
+        )
+        info = table.get(provider.config.model)
+        if info is None:
+            return set(ModelCapability)
+        return set(info["capabilities"])
+
+    def ranked(
+        self,
+        required: Iterable[ModelCapability] = (),
+        preferred: Iterable[ModelCapability] = (),
+    ) -> List[ProviderType]:
+        """
+        Providers in the order requests should try them.
+
+        Providers lacking a `required` capability are excluded; those
+        lacking a `preferred` one are kept as a last resort (e.g. Ollama
+        emulates tool calls with prompting). Within each group healthy
+        providers come before benched ones, then lower expected latency,
+        then registration order.
+        """
+        required, preferred = set(required), set(preferred)
+        now = time.monotonic()
+        order = list(self._providers)
+
+        def key(provider_type: ProviderType) -> Tuple[bool, bool, float, int]:
+            stats = self._stats[provider_type]
+            return (
+                not preferred <= self.provider_capabilities(provider_type),
+                stats.cooling_down(now),
+                stats.expected_latency_ms(self.min_samples),
+                order.index(provider_type),
+            )
+
+        capable = [
+            p for p in order if required <= self.provider_capabilities(p)
+        ]
+        return sorted(capable, key=key)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Rolling statistics and capabilities per provider, for tuning."""
+        return {
+            provider_type.value: {
+                **self._stats[provider_type].to_dict(),
+                "model": provider.config.model,
+                "capabilities": sorted(
+                    c.value for c in self.provider_capabilities(provider_type)
+                ),
+            }
+            for provider_type, provider in self._providers.items()
+        }
+
+    # ------------------------------------------------------------------
+    # Routed calls
+    # ------------------------------------------------------------------
+
+    async def chat(
+        self,
+        messages: List[Union[Message, Dict[str, Any]]],
+        capabilities: Iterable[ModelCapability] = (),
+        hedge: Optional[bool] = None,
+        **kwargs,
+    ) -> LLMResponse:
+        """Chat completion on the best available provider, with failover."""
+        preferred = {ModelCapability.CHAT}
+        if kwargs.get("json_mode"):
+            preferred.add(ModelCapability.JSON_MODE)
+        return await self._route("chat", (messages,), kwargs, capabilities, preferred, hedge)
+
+    async def generate(
+        self,
+        prompt: str,
+        capabilities: Iterable[ModelCapability] = (),
+        hedge: Optional[bool] = None,
+        **kwargs,
+    ) -> LLMResponse:
+        """Text generation on the best available provider, with failover."""
+        return await self._route("generate", (prompt,), kwargs, capabilities, (), hedge)
+
+    async def tool_call(
+        self,
+        messages: List[Union[Message, Dict[str, Any]]],
+        tools: List[Union[ToolDefinition, Dict[str, Any]]],
+        capabilities: Iterable[ModelCapability] = (),
+        hedge: Optional[bool] = None,
+        **kwargs,
+    ) -> LLMResponse:
+        """Tool calling, preferring providers with native tool use."""
+        return await self._route(
+            "tool_call",
+            (messages, tools),
+            kwargs,
+            capabilities,
+            {ModelCapability.TOOL_USE},
+            hedge,
+        )
+
+    async def stream(
+        self,
+        messages: List[Union[Message, Dict[str, Any]]],
+        capabilities: Iterable[ModelCapability] = (),
+        **kwargs,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Streaming chat. Fails over only until the first chunk arrives;
+        latency is recorded as time to first chunk. Not hedged.
+        """
+        candidates = self._candidates(capabilities, {ModelCapability.STREAMING})
+        errors: Dict[str, str] = {}
+        for provider_type in candidates:
+            stats = self._stats[provider_type]
+            start = time.perf_counter()
+            started = False
+            try:
+                async for chunk in self._providers[provider_type].stream(messages, **kwargs):
+                    if not started:
+                        started = True
+                        stats.record_success((time.perf_counter() - start) * 1000)
+                    yield chunk
+                return
+            except Exception as e:
+                if started:
+                    raise
+                self._record_failure(provider_type, e)
+                errors[provider_type.value] = str(e)
+                logger.warning(f"{provider_type.value} stream failed, failing over: {e}")
+        raise ProviderRoutingError("All providers failed to stream", errors)
+
+    def _candidates(
+        self, required: Iterable[ModelCapability], preferred: Iterable[ModelCapability]
+    ) -> List[ProviderType]:
+        candidates = self.ranked(required, preferred)
+        if not candidates:
+            needed = sorted(c.value for c in set(required))
+            raise ProviderRoutingError(
+                f"No available provider supports {needed}. "
+                f"Available: {[p.value for p in self._providers]}"
+            )
+        return candidates
+
+    async def _route(
+        self,
+        method: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        required: Iterable[ModelCapability],
+        preferred: Iterable[ModelCapability],
+        hedge: Optional[bool],
+    ) -> LLMResponse:
+        candidates = self._candidates(required, preferred)
+        hedge = self.hedge if hedge is None else hedge
+        errors: Dict[str, str] = {}
+
+        i = 0
+        while i < len(candidates):
+            group = candidates[i : i + 2] if hedge else candidates[i : i + 1]
+            try:
+                if len(group) == 2:
+                    return await self._hedged(group[0], group[1], method, args, kwargs)
+                return await self._call(group[0], method, args, kwargs)
+            except Exception as e:
+                errors["/".join(p.value for p in group)] = str(e)
+                logger.warning(
+                    f"{'/'.join(p.value for p in group)} {method} failed, failing over: {e}"
+                )
+            i += len(group)
+
+        raise ProviderRoutingError(f"All providers failed for {method}", errors)
+
+    async def _call(
+        self,
+        provider_type: ProviderType,
+        method: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> LLMResponse:
+        start = time.perf_counter()
+        try:
+            response = await getattr(self._providers[provider_type], method)(*args, **kwargs)
+        except asyncio.CancelledError:
+            # A losing hedge: neither a success nor a provider failure
+            raise
+        except Exception as e:
+            self._record_failure(provider_type, e)
+            raise
+        # Cache hits say nothing about the provider's latency
+        if not response.cached:
+            self._stats[provider_type].record_success((time.perf_counter() - start) * 1000)
+        return response
+
+    async def _hedged(
+        self,
+        primary: ProviderType,
+        backup: ProviderType,
+        method: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> LLMResponse:
+        """Start the backup if the primary is slower than its p95; first success wins."""
+        first = asyncio.ensure_future(self._call(primary, method, args, kwargs))
+        done, _ = await asyncio.wait({first}, timeout=self._hedge_delay(primary))
+        if done:
+            if first.exception() is None:
+                return first.result()
+            # Failed fast: plain failover to the backup
+            return await self._call(backup, method, args, kwargs)
+
+        self._stats[primary].hedges += 1
+        second = asyncio.ensure_future(self._call(backup, method, args, kwargs))
+        pending = {first, second}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is second:
+                            self._stats[primary].hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+        raise error
+
+    def _hedge_delay(self, provider_type: ProviderType) -> float:
+        stats = self._stats[provider_type]
+        if stats.samples < self.min_samples:
+            return self.hedge_delay
+        return stats.percentile(95) / 1000
+
+    def _record_failure(self, provider_type: ProviderType, error: BaseException):
+        stats = self._stats[provider_type]
+        stats.record_failure(error)
+        if is_rate_limited(error) or stats.consecutive_failures >= self.failure_threshold:
+            stats.cooldown_until = time.monotonic() + self.cooldown_seconds
+            logger.warning(
+                f"{provider_type.value} benched for {self.cooldown_seconds}s: {error}"
+            )
+
     async def close(self):
         """Close all providers"""
         for provider in self._providers.values():
             await provider.close()
+        if self.cache is not None:
+            await self.cache.close()
 
 
 # ============================================================================
@@ -1388,7 +1953,8 @@ async def get_llm_provider(provider: Union[str, ProviderType] = None) -> LLMProv
     global _router_instance
 
     if _router_instance is None:
-        _router_instance = ProviderRouter()
+        # OSMEN_LLM_CACHE=sqlite|redis enables the response cache
+        _router_instance = ProviderRouter(cache=ResponseCache.from_env())
         await _router_instance.initialize()
 
     if provider is None:
@@ -1408,24 +1974,28 @@ async def get_llm_provider(provider: Union[str, ProviderType] = None) -> LLMProv
     return llm
 
 
-def create_llm_provider(config: LLMConfig) -> LLMProvider:
+def create_llm_provider(
+    config: LLMConfig, cache: Optional[ResponseCache] = None
+) -> LLMProvider:
     """
     Create an LLM provider with specific configuration.
 
     Args:
         config: LLMConfig instance
+        cache: Optional response cache to wrap the provider with
 
     Returns:
         LLMProvider instance
     """
     if config.provider == ProviderType.OPENAI:
-        return OpenAIProvider(config)
+        provider = OpenAIProvider(config)
     elif config.provider == ProviderType.ANTHROPIC:
-        return AnthropicProvider(config)
+        provider = AnthropicProvider(config)
     elif config.provider == ProviderType.OLLAMA:
-        return OllamaProvider(config)
+        provider = OllamaProvider(config)
     else:
         raise ValueError(f"Unknown provider: {config.provider}")
+    return CachedProvider(provider, cache) if cache is not None else provider
 
 
 # ============================================================================
@@ -25,17 +25,22 @@ Architecture:
 └─────────────────────────────────────────────────────────────────┘
 """
 
+import asyncio
 import hashlib
+import heapq
 import json
 import logging
 import os
+import re
 import sqlite3
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import chromadb
 from chromadb.config import Settings
@@ -218,11 +223,194 @@ class MemoryItem:
         }
 
 
+# =============================================================================
+# Working Memory (in-process)
+# =============================================================================
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> List[str]:
+    """Lowercase word tokens used by the working-memory index."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class _WorkingEntry:
+    """Working-memory slot: the item plus its indexed tokens."""
+
+    __slots__ = ("item", "tokens", "content_lower")
+
+    def __init__(self, item: MemoryItem):
+        self.item = item
+        self.content_lower = item.content.lower()
+        self.tokens = frozenset(_tokenize(self.content_lower))
+
+
+class WorkingMemory:
+    """
+    In-process working memory with a token inverted index.
+
+    Entries are kept in least-recently-used order (an OrderedDict), so
+    eviction is O(1), and search intersects posting sets instead of
+    scanning every item's content.
+    """
+
+    def __init__(self):
+        self._entries: "OrderedDict[str, _WorkingEntry]" = OrderedDict()
+        self._index: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[MemoryItem]:
+        return (entry.item for entry in self._entries.values())
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._entries
+
+    def add(self, item: MemoryItem):
+        """Add or replace an item as the most recently used entry."""
+        self.remove(item.id)
+        entry = _WorkingEntry(item)
+        self._entries[item.id] = entry
+        for token in entry.tokens:
+            self._index.setdefault(token, set()).add(item.id)
+
+    def get(self, memory_id: str) -> Optional[MemoryItem]:
+        entry = self._entries.get(memory_id)
+        return entry.item if entry else None
+
+    def remove(self, memory_id: str) -> Optional[MemoryItem]:
+        entry = self._entries.pop(memory_id, None)
+        if entry is None:
+            return None
+        for token in entry.tokens:
+            postings = self._index.get(token)
+            if postings is not None:
+                postings.discard(memory_id)
+                if not postings:
+                    del self._index[token]
+        return entry.item
+
+    def pop_lru(self) -> Optional[MemoryItem]:
+        """Remove and return the least recently used item."""
+        if not self._entries:
+            return None
+        return self.remove(next(iter(self._entries)))
+
+    def evict_least_used(self, count: int) -> List[MemoryItem]:
+        """Remove the ``count`` items with the lowest (access_count, accessed_at)."""
+        if count <= 0:
+            return []
+        victims = heapq.nsmallest(
+            count,
+            self._entries.values(),
+            key=lambda e: (e.item.access_count, e.item.accessed_at),
+        )
+        return [self.remove(entry.item.id) for entry in victims]
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[MemoryItem]:
+        """
+        Find items containing every query token, touching their access stats.
+
+        Results are ranked by exact phrase match, then access count, then
+        recency.
+        """
+        tokens = set(_tokenize(query))
+        if not tokens:
+            return []
+
+        postings = sorted(
+            (self._index.get(token, set()) for token in tokens), key=len
+        )
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates &= posting
+        if not candidates:
+            return []
+
+        query_lower = query.lower()
+        now = time.time()
+        ranked = []
+        for memory_id in candidates:
+            entry = self._entries[memory_id]
+            entry.item.accessed_at = now
+            entry.item.access_count += 1
+            self._entries.move_to_end(memory_id)
+            ranked.append(entry)
+
+        ranked.sort(
+            key=lambda e: (
+                query_lower in e.content_lower,
+                e.item.access_count,
+                e.item.accessed_at,
+            ),
+            reverse=True,
+        )
+        items = [entry.item for entry in ranked]
+        return items[:limit] if limit is not None else items
+
+
 # =============================================================================
 # Short-Term Memory (SQLite)
 # =============================================================================
 
 
+class SQLiteConnectionManager:
+    """
+    Per-thread persistent SQLite connections with tuned pragmas.
+
+    Each thread reuses one connection for the lifetime of the manager, so
+    sqlite3's per-connection statement cache is reused across calls instead
+    of being rebuilt by a fresh ``sqlite3.connect`` on every operation.
+    """
+
+    PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64000,  # ~64MB page cache
+        "mmap_size": 268435456,  # 256MB memory-mapped I/O
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    }
+
+    def __init__(self, db_path: Union[str, Path], cached_statements: int = 256):
+        self.db_path = str(db_path)
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path, cached_statements=self.cached_statements
+            )
+            conn.row_factory = sqlite3.Row
+            for pragma, value in self.PRAGMAS.items():
+                conn.execute(f"PRAGMA {pragma}={value}")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self):
+        """Close every connection opened by this manager."""
+        with self._lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.ProgrammingError:
+                    # Connections can only be closed from their own thread
+                    pass
+            self._connections.clear()
+        self._local = threading.local()
+
+
 class ShortTermMemory:
     """
     SQLite-based short-term memory store.
@@ -232,16 +420,43 @@ class ShortTermMemory:
     - Recent queries and responses
     - Active tasks and working memory
     - Quick keyword lookups
+
+    Connections are pooled per thread (WAL mode, tuned pragmas) via
+    SQLiteConnectionManager; use store_many for bulk inserts.
+    """
+
+    _INSERT_MEMORY = """
+        INSERT OR REPLACE INTO memories
+        (id, content, tier, created_at, accessed_at, access_count,
+         source, context, c7_intent, c7_domain, c7_emotion,
+         c7_temporal, c7_spatial, c7_relational, c7_abstract,
+         reasoning_steps, bridges)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    _INSERT_FTS = """
+        INSERT OR REPLACE INTO memories_fts
+        (id, content, c7_domain, c7_abstract)
+        VALUES (?, ?, ?, ?)
     """
 
     def __init__(self, db_path: str):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connections = SQLiteConnectionManager(self.db_path)
         self._init_database()
 
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Persistent connection for the calling thread."""
+        return self._connections.connection()
+
+    def close(self):
+        """Close pooled connections."""
+        self._connections.close()
+
     def _init_database(self):
         """Initialize SQLite schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.conn as conn:
             cursor = conn.cursor()
 
             # Main memories table
@@ -305,77 +520,71 @@ class ShortTermMemory:
             """
             )
 
-            conn.commit()
+    @staticmethod
+    def _item_rows(item: MemoryItem) -> Tuple[tuple, tuple]:
+        """Build the memories and memories_fts parameter rows for an item."""
+        memory_row = (
+            item.id,
+            item.content,
+            item.tier.value,
+            item.created_at,
+            item.accessed_at,
+            item.access_count,
+            item.source,
+            json.dumps(item.context),
+            item.intent,
+            item.domain,
+            item.emotion,
+            item.temporal,
+            item.spatial,
+            item.relational,
+            item.abstract,
+            json.dumps(item.reasoning_steps),
+            json.dumps(item.bridges),
+        )
+        fts_row = (item.id, item.content, item.domain, item.abstract)
+        return memory_row, fts_row
 
     def store(self, item: MemoryItem) -> str:
         """Store a memory item."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO memories
-                (id, content, tier, created_at, accessed_at, access_count,
-                 source, context, c7_intent, c7_domain, c7_emotion,
-                 c7_temporal, c7_spatial, c7_relational, c7_abstract,
-                 reasoning_steps, bridges)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    item.id,
-                    item.content,
-                    item.tier.value,
-                    item.created_at,
-                    item.accessed_at,
-                    item.access_count,
-                    item.source,
-                    json.dumps(item.context),
-                    item.intent,
-                    item.domain,
-                    item.emotion,
-                    item.temporal,
-                    item.spatial,
-                    item.relational,
-                    item.abstract,
-                    json.dumps(item.reasoning_steps),
-                    json.dumps(item.bridges),
-                ),
-            )
+        memory_row, fts_row = self._item_rows(item)
 
+        with self.conn as conn:
+            conn.execute(self._INSERT_MEMORY, memory_row)
             # Update FTS index
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO memories_fts
-                (id, content, c7_domain, c7_abstract)
-                VALUES (?, ?, ?, ?)
-            """,
-                (item.id, item.content, item.domain, item.abstract),
-            )
-
-            conn.commit()
+            conn.execute(self._INSERT_FTS, fts_row)
 
         logger.debug(f"Stored short-term memory: {item.id}")
         return item.id
 
+    def store_many(self, items: List[MemoryItem]) -> List[str]:
+        """Store many memory items in a single transaction."""
+        if not items:
+            return []
+
+        rows = [self._item_rows(item) for item in items]
+
+        with self.conn as conn:
+            conn.executemany(self._INSERT_MEMORY, [row[0] for row in rows])
+            conn.executemany(self._INSERT_FTS, [row[1] for row in rows])
+
+        logger.debug(f"Stored {len(items)} short-term memories")
+        return [item.id for item in items]
+
     def retrieve(self, memory_id: str) -> Optional[MemoryItem]:
         """Retrieve a memory by ID and update access stats."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            cursor.execute(
+        with self.conn as conn:
+            row = conn.execute(
                 """
                 SELECT * FROM memories WHERE id = ?
             """,
                 (memory_id,),
-            )
-
-            row = cursor.fetchone()
+            ).fetchone()
             if not row:
                 return None
 
             # Update access stats
-            cursor.execute(
+            conn.execute(
                 """
                 UPDATE memories
                 SET accessed_at = ?, access_count = access_count + 1
@@ -383,7 +592,6 @@ class ShortTermMemory:
             """,
                 (time.time(), memory_id),
             )
-            conn.commit()
 
             return self._row_to_item(dict(row))
 
@@ -391,102 +599,83 @@ class ShortTermMemory:
         self, query: str, limit: int = 10, tier: Optional[MemoryTier] = None
     ) -> List[MemoryItem]:
         """Full-text search with optional tier filter."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+        # Escape FTS special characters and wrap in quotes for phrase search
+        # SQLite FTS5 treats certain words (AND, OR, NOT, NEAR, IN) as operators
+        escaped_query = '"' + query.replace('"', '""') + '"'
 
-            # Escape FTS special characters and wrap in quotes for phrase search
-            # SQLite FTS5 treats certain words (AND, OR, NOT, NEAR, IN) as operators
-            escaped_query = '"' + query.replace('"', '""') + '"'
-
-            # FTS search
-            if tier:
-                cursor.execute(
-                    """
-                    SELECT m.* FROM memories m
-                    JOIN memories_fts fts ON m.id = fts.id
-                    WHERE memories_fts MATCH ? AND m.tier = ?
-                    ORDER BY rank
-                    LIMIT ?
-                """,
-                    (escaped_query, tier.value, limit),
-                )
-            else:
-                cursor.execute(
-                    """
-                    SELECT m.* FROM memories m
-                    JOIN memories_fts fts ON m.id = fts.id
-                    WHERE memories_fts MATCH ?
-                    ORDER BY rank
-                    LIMIT ?
-                """,
-                    (escaped_query, limit),
-                )
+        # FTS search
+        if tier:
+            rows = self.conn.execute(
+                """
+                SELECT m.* FROM memories m
+                JOIN memories_fts fts ON m.id = fts.id
+                WHERE memories_fts MATCH ? AND m.tier = ?
+                ORDER BY rank
+                LIMIT ?
+            """,
+                (escaped_query, tier.value, limit),
+            ).fetchall()
+        else:
+            rows = self.conn.execute(
+                """
+                SELECT m.* FROM memories m
+                JOIN memories_fts fts ON m.id = fts.id
+                WHERE memories_fts MATCH ?
+                ORDER BY rank
+                LIMIT ?
+            """,
+                (escaped_query, limit),
+            ).fetchall()
 
-            rows = cursor.fetchall()
-            return [self._row_to_item(dict(row)) for row in rows]
+        return [self._row_to_item(dict(row)) for row in rows]
 
     def get_recent(
         self, source: Optional[str] = None, limit: int = 20
     ) -> List[MemoryItem]:
         """Get recent memories, optionally filtered by source."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            if source:
-                cursor.execute(
-                    """
-                    SELECT * FROM memories
-                    WHERE source = ?
-                    ORDER BY accessed_at DESC
-                    LIMIT ?
-                """,
-                    (source, limit),
-                )
-            else:
-                cursor.execute(
-                    """
-                    SELECT * FROM memories
-                    ORDER BY accessed_at DESC
-                    LIMIT ?
-                """,
-                    (limit,),
-                )
+        if source:
+            rows = self.conn.execute(
+                """
+                SELECT * FROM memories
+                WHERE source = ?
+                ORDER BY accessed_at DESC
+                LIMIT ?
+            """,
+                (source, limit),
+            ).fetchall()
+        else:
+            rows = self.conn.execute(
+                """
+                SELECT * FROM memories
+                ORDER BY accessed_at DESC
+                LIMIT ?
+            """,
+                (limit,),
+            ).fetchall()
 
-            rows = cursor.fetchall()
-            return [self._row_to_item(dict(row)) for row in rows]
+        return [self._row_to_item(dict(row)) for row in rows]
 
     def get_stale(self, ttl_hours: int = 24) -> List[MemoryItem]:
         """Get memories older than TTL for promotion consideration."""
         cutoff = time.time() - (ttl_hours * 3600)
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                SELECT * FROM memories
-                WHERE tier = 'short' AND accessed_at < ?
-                ORDER BY access_count DESC
-            """,
-                (cutoff,),
-            )
+        rows = self.conn.execute(
+            """
+            SELECT * FROM memories
+            WHERE tier = 'short' AND accessed_at < ?
+            ORDER BY access_count DESC
+        """,
+            (cutoff,),
+        ).fetchall()
 
-            rows = cursor.fetchall()
-            return [self._row_to_item(dict(row)) for row in rows]
+        return [self._row_to_item(dict(row)) for row in rows]
 
     def delete(self, memory_id: str) -> bool:
         """Delete a memory item."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            cursor.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
-            cursor.execute("DELETE FROM memories_fts WHERE id = ?", (memory_id,))
-
+        with self.conn as conn:
+            cursor = conn.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
             deleted = cursor.rowcount > 0
-            conn.commit()
+            conn.execute("DELETE FROM memories_fts WHERE id = ?", (memory_id,))
             return deleted
 
     def _row_to_item(self, row: Dict) -> MemoryItem:
@@ -620,25 +809,9 @@ class LongTermMemory:
         - factcheck: High-precision exact match bias
         """
         try:
-            results = self.collection.query(
-                query_texts=[query_text],
-                n_results=n_results,
-                where=where,
-                include=["documents", "metadatas", "distances"],
-            )
-
-            items = []
-            for i, doc_id in enumerate(results["ids"][0]):
-                item = {
-                    "id": doc_id,
-                    "content": results["documents"][0][i],
-                    "metadata": results["metadatas"][0][i],
-                    "distance": (
-                        results["distances"][0][i] if results.get("distances") else None
-                    ),
-                    "retrieval_mode": mode,
-                }
-                items.append(item)
+            items = self._query_many([query_text], n_results, where=where)[0]
+            for item in items:
+                item["retrieval_mode"] = mode
 
             # Include bridge connections if requested
             if include_bridges:
@@ -659,85 +832,121 @@ class LongTermMemory:
         1. Focus vector (direct query)
         2. Shadow vector (context/implications)
         3. Weave results for synchronicity
+
+        Focus and shadow are issued as one multi-query Chroma call so both
+        texts are embedded in a single batch.
         """
         try:
-            # Focus query (direct)
-            focus_query = f"Precise answer to: {query_text}"
-            focus_results = self.collection.query(
-                query_texts=[focus_query], n_results=n_results
+            focus, shadow = self._query_many(
+                [self._focus_query(query_text), self._shadow_query(query_text)],
+                n_results * 2,  # Shadow gets more for diversity
             )
+            return self._weave(focus[:n_results], shadow, n_results)
+        except Exception as e:
+            logger.error(f"Lateral query failed: {e}")
+            return []
 
-            # Shadow query (lateral/abstract)
-            shadow_query = f"Broader themes, implications, and abstract connections to: {query_text}"
-            shadow_results = self.collection.query(
-                query_texts=[shadow_query],
-                n_results=n_results * 2,  # Get more for diversity
-            )
+    def query_foundation_and_lateral(
+        self, query_text: str, n_results: int = 5
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Run the foundation, focus and shadow queries as one Chroma call.
 
-            # Weave results (interleave focus and shadow)
-            woven = []
-            seen_ids = set()
-
-            focus_iter = iter(
-                zip(
-                    focus_results["ids"][0],
-                    focus_results["documents"][0],
-                    focus_results.get(
-                        "metadatas", [[{}] * len(focus_results["ids"][0])]
-                    )[0],
-                )
+        Returns:
+            Tuple of (foundation results with bridges, woven lateral results)
+        """
+        try:
+            foundation, focus, shadow = self._query_many(
+                [
+                    query_text,
+                    self._focus_query(query_text),
+                    self._shadow_query(query_text),
+                ],
+                n_results * 2,
             )
-            shadow_iter = iter(
-                zip(
-                    shadow_results["ids"][0],
-                    shadow_results["documents"][0],
-                    shadow_results.get(
-                        "metadatas", [[{}] * len(shadow_results["ids"][0])]
-                    )[0],
-                )
+        except Exception as e:
+            logger.error(f"Combined query failed: {e}")
+            return [], []
+
+        foundation = foundation[:n_results]
+        for item in foundation:
+            item["retrieval_mode"] = "foundation"
+
+        return (
+            self._expand_bridges(foundation),
+            self._weave(focus[:n_results], shadow, n_results),
+        )
+
+    @staticmethod
+    def _focus_query(query_text: str) -> str:
+        return f"Precise answer to: {query_text}"
+
+    @staticmethod
+    def _shadow_query(query_text: str) -> str:
+        return f"Broader themes, implications, and abstract connections to: {query_text}"
+
+    def _query_many(
+        self, query_texts: List[str], n_results: int, where: Optional[Dict] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Query several texts in one call, returning result dicts per query."""
+        results = self.collection.query(
+            query_texts=query_texts,
+            n_results=n_results,
+            where=where,
+            include=["documents", "metadatas", "distances"],
+        )
+
+        per_query = []
+        for q, ids in enumerate(results["ids"]):
+            metadatas = (results.get("metadatas") or [None] * len(query_texts))[q]
+            distances = (results.get("distances") or [None] * len(query_texts))[q]
+            per_query.append(
+                [
+                    {
+                        "id": doc_id,
+                        "content": results["documents"][q][i],
+                        "metadata": metadatas[i] if metadatas else {},
+                        "distance": distances[i] if distances else None,
+                    }
+                    for i, doc_id in enumerate(ids)
+                ]
             )
+        return per_query
 
-            while len(woven) < n_results:
-                # Add 2 focus results
-                for _ in range(2):
-                    try:
-                        doc_id, content, meta = next(focus_iter)
-                        if doc_id not in seen_ids:
-                            woven.append(
-                                {
-                                    "id": doc_id,
-                                    "content": content,
-                                    "metadata": meta,
-                                    "retrieval_layer": "focus",
-                                }
-                            )
-                            seen_ids.add(doc_id)
-                    except StopIteration:
-                        break
-
-                # Add 1 shadow result (for diversity)
-                try:
-                    doc_id, content, meta = next(shadow_iter)
-                    if doc_id not in seen_ids:
-                        woven.append(
-                            {
-                                "id": doc_id,
-                                "content": content,
-                                "metadata": meta,
-                                "retrieval_layer": "shadow_context",
-                            }
-                        )
-                        seen_ids.add(doc_id)
-                except StopIteration:
-                    pass
+    @staticmethod
+    def _weave(
+        focus: List[Dict[str, Any]], shadow: List[Dict[str, Any]], n_results: int
+    ) -> List[Dict[str, Any]]:
+        """Interleave focus and shadow results (2:1) without duplicates."""
+        woven = []
+        seen_ids = set()
+        focus_iter = iter(focus)
+        shadow_iter = iter(shadow)
 
-                if len(woven) >= n_results:
-                    break
+        def take(source, layer) -> bool:
+            for item in source:
+                if item["id"] not in seen_ids:
+                    woven.append(
+                        {
+                            "id": item["id"],
+                            "content": item["content"],
+                            "metadata": item["metadata"],
+                            "retrieval_layer": layer,
+                        }
+                    )
+                    seen_ids.add(item["id"])
+                return True
+            return False
 
-            return woven[:n_results]
-        except Exception as e:
-            logger.error(f"Lateral query failed: {e}")
-            return []
+        while len(woven) < n_results:
+            # Add 2 focus results, then 1 shadow result (for diversity)
+            progressed = take(focus_iter, "focus")
+            progressed = take(focus_iter, "focus") or progressed
+            progressed = take(shadow_iter, "shadow_context") or progressed
+            if not progressed:
+                break
+
+        return woven[:n_results]
 
     def _expand_bridges(self, items: List[Dict]) -> List[Dict]:
         """Expand bridge connections to include related items."""
@@ -817,7 +1026,7 @@ class HybridMemory:
         self.long_term = LongTermMemory(self.config)
 
         # Working memory (in-memory for immediate context)
-        self.working_memory: List[MemoryItem] = []
+        self.working_memory = WorkingMemory()
 
         logger.info("HybridMemory initialized")
 
@@ -899,29 +1108,127 @@ class HybridMemory:
         Returns:
             List of matching MemoryItems
         """
-        results = []
-
         # 1. Check working memory first (fastest)
         working_matches = self._search_working_memory(query)
-        results.extend(working_matches)
 
+        short_matches: List[MemoryItem] = []
+        long_matches: List[Dict[str, Any]] = []
         if search_all_tiers:
             # 2. Search short-term (SQLite FTS)
             short_matches = self.short_term.search(query, limit=n_results)
-            results.extend(short_matches)
 
             # 3. Search long-term (ChromaDB)
-            if mode == "lateral":
-                long_matches = self.long_term.query_lateral(query, n_results)
-            else:
-                long_matches = self.long_term.query(query, n_results, mode=mode)
+            long_matches = self._query_long_term(query, n_results, mode)
+
+        return self._merge_tiers(
+            working_matches, short_matches, long_matches, n_results
+        )
+
+    def recall_with_reasoning(
+        self, query: str, n_results: int = 5
+    ) -> Tuple[List[MemoryItem], List[str]]:
+        """
+        Recall with sequential reasoning trace.
+
+        The working-memory and SQLite lookups are shared between the
+        foundation and lateral passes, and the three Chroma queries are
+        issued as a single multi-query call.
+
+        Returns:
+            Tuple of (results, reasoning_steps)
+        """
+        working = self._search_working_memory(query)
+        short = self.short_term.search(query, limit=n_results)
+        foundation_long, lateral_long = self.long_term.query_foundation_and_lateral(
+            query, n_results
+        )
+        return self._reason_over_tiers(
+            query, n_results, working, short, foundation_long, lateral_long
+        )
+
+    async def arecall(
+        self,
+        query: str,
+        n_results: int = 5,
+        search_all_tiers: bool = True,
+        mode: str = "foundation",
+    ) -> Tuple[List[MemoryItem], Dict[str, float]]:
+        """
+        Async recall that queries the SQLite and ChromaDB tiers concurrently.
+
+        Returns:
+            Tuple of (results, per-tier timings in milliseconds)
+        """
+        timings: Dict[str, float] = {}
+        start = time.perf_counter()
+
+        working = self._timed(timings, "working", self._search_working_memory, query)
+        short: List[MemoryItem] = []
+        long: List[Dict[str, Any]] = []
+        if search_all_tiers:
+            short, long = await asyncio.gather(
+                self._timed_thread(
+                    timings, "short_term", self.short_term.search, query, n_results
+                ),
+                self._timed_thread(
+                    timings, "long_term", self._query_long_term, query, n_results, mode
+                ),
+            )
+
+        results = self._merge_tiers(working, short, long, n_results)
+        timings["total"] = (time.perf_counter() - start) * 1000
+        return results, timings
+
+    async def arecall_with_reasoning(
+        self, query: str, n_results: int = 5
+    ) -> Tuple[List[MemoryItem], List[str], Dict[str, float]]:
+        """
+        Async recall_with_reasoning with concurrent tier lookups.
+
+        Returns:
+            Tuple of (results, reasoning_steps, per-tier timings in milliseconds)
+        """
+        timings: Dict[str, float] = {}
+        start = time.perf_counter()
 
-            # Convert long-term results to MemoryItems
-            for match in long_matches:
-                item = self._dict_to_memory_item(match)
-                results.append(item)
+        working = self._timed(timings, "working", self._search_working_memory, query)
+        short, (foundation_long, lateral_long) = await asyncio.gather(
+            self._timed_thread(
+                timings, "short_term", self.short_term.search, query, n_results
+            ),
+            self._timed_thread(
+                timings,
+                "long_term",
+                self.long_term.query_foundation_and_lateral,
+                query,
+                n_results,
+            ),
+        )
+
+        results, reasoning_steps = self._reason_over_tiers(
+            query, n_results, working, short, foundation_long, lateral_long
+        )
+        timings["total"] = (time.perf_counter() - start) * 1000
+        return results, reasoning_steps, timings
+
+    def _query_long_term(
+        self, query: str, n_results: int, mode: str
+    ) -> List[Dict[str, Any]]:
+        if mode == "lateral":
+            return self.long_term.query_lateral(query, n_results)
+        return self.long_term.query(query, n_results, mode=mode)
+
+    def _merge_tiers(
+        self,
+        working: List[MemoryItem],
+        short: List[MemoryItem],
+        long: List[Dict[str, Any]],
+        n_results: int,
+    ) -> List[MemoryItem]:
+        """Merge tier results in priority order, deduplicated by ID."""
+        # Convert long-term results to MemoryItems
+        results = working + short + [self._dict_to_memory_item(m) for m in long]
 
-        # Deduplicate by ID
         seen_ids = set()
         unique_results = []
         for item in results:
@@ -931,15 +1238,16 @@ class HybridMemory:
 
         return unique_results[: n_results * 2]  # Allow extra for diversity
 
-    def recall_with_reasoning(
-        self, query: str, n_results: int = 5
+    def _reason_over_tiers(
+        self,
+        query: str,
+        n_results: int,
+        working: List[MemoryItem],
+        short: List[MemoryItem],
+        foundation_long: List[Dict[str, Any]],
+        lateral_long: List[Dict[str, Any]],
     ) -> Tuple[List[MemoryItem], List[str]]:
-        """
-        Recall with sequential reasoning trace.
-
-        Returns:
-            Tuple of (results, reasoning_steps)
-        """
+        """Build the foundation/lateral reasoning trace from tier results."""
         reasoning_steps = []
 
         # Step 1: Decompose query
@@ -947,12 +1255,12 @@ class HybridMemory:
 
         # Step 2: Foundation search
         reasoning_steps.append("Searching foundation knowledge...")
-        foundation = self.recall(query, n_results, mode="foundation")
+        foundation = self._merge_tiers(working, short, foundation_long, n_results)
         reasoning_steps.append(f"Found {len(foundation)} foundation matches")
 
         # Step 3: Lateral expansion
         reasoning_steps.append("Exploring lateral connections...")
-        lateral = self.recall(query, n_results, mode="lateral")
+        lateral = self._merge_tiers(working, short, lateral_long, n_results)
         reasoning_steps.append(f"Found {len(lateral)} lateral connections")
 
         # Step 4: Merge and deduplicate
@@ -970,6 +1278,20 @@ class HybridMemory:
 
         return unique[: n_results * 2], reasoning_steps
 
+    @staticmethod
+    def _timed(timings: Dict[str, float], tier: str, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        timings[tier] = (time.perf_counter() - start) * 1000
+        return result
+
+    @staticmethod
+    async def _timed_thread(timings: Dict[str, float], tier: str, func, *args):
+        start = time.perf_counter()
+        result = await asyncio.to_thread(func, *args)
+        timings[tier] = (time.perf_counter() - start) * 1000
+        return result
+
     def promote(self, memory_id: str) -> bool:
         """
         Promote memory from short-term to long-term.
@@ -1027,39 +1349,28 @@ class HybridMemory:
         if len(self.working_memory) > self.config.working_memory_size:
             excess = len(self.working_memory) - self.config.working_memory_size
             # Remove oldest, least accessed
-            self.working_memory.sort(key=lambda x: (x.access_count, x.accessed_at))
-            for item in self.working_memory[:excess]:
-                # Move to short-term instead of deleting
-                self.short_term.store(item)
-                stats["working_trimmed"] += 1
-            self.working_memory = self.working_memory[excess:]
+            trimmed = self.working_memory.evict_least_used(excess)
+            # Move to short-term instead of deleting
+            self.short_term.store_many(trimmed)
+            stats["working_trimmed"] += len(trimmed)
 
         logger.info(f"Maintenance complete: {stats}")
         return stats
 
     def _add_to_working_memory(self, item: MemoryItem):
         """Add item to working memory with size management."""
-        self.working_memory.append(item)
+        self.working_memory.add(item)
 
         # Trim if over limit
         if len(self.working_memory) > self.config.working_memory_size:
-            # Move oldest to short-term
-            oldest = self.working_memory.pop(0)
+            # Move least recently used to short-term
+            oldest = self.working_memory.pop_lru()
             oldest.tier = MemoryTier.SHORT_TERM
             self.short_term.store(oldest)
 
     def _search_working_memory(self, query: str) -> List[MemoryItem]:
-        """Simple keyword search in working memory."""
-        query_lower = query.lower()
-        matches = []
-
-        for item in self.working_memory:
-            if query_lower in item.content.lower():
-                item.accessed_at = time.time()
-                item.access_count += 1
-                matches.append(item)
-
-        return matches
+        """Indexed keyword search in working memory."""
+        return self.working_memory.search(query)
 
     def _dict_to_memory_item(self, data: Dict) -> MemoryItem:
         """Convert query result dict to MemoryItem."""
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+MinHash/LSH Near-Duplicate Detection for OsMEN
+
+Features:
+- Word-shingle MinHash signatures, stable across processes so they can be
+  computed once at ingest time and stored in chunk metadata
+- LSH banding for sub-quadratic candidate lookup
+- One filter usable at query time (RAG result dedup) and at ingest time
+  (dropping near-duplicate chunks before they are written to ChromaDB)
+"""
+
+import base64
+import functools
+import logging
+import random
+import struct
+import zlib
+from collections import defaultdict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+from integrations.bm25_index import tokenize
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Metadata key used to store encoded signatures on chunks
+METADATA_KEY = "minhash"
+
+# Largest prime below 2**32; keeps (a * h + b) inside uint64
+_PRIME = 4294967291
+
+Signature = Tuple[int, ...]
+
+
+@functools.lru_cache(maxsize=None)
+def _permutations(num_perm: int, seed: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Hash coefficients, shared by every MinHasher with the same settings."""
+    rng = random.Random(seed)
+    a = tuple(rng.randrange(1, _PRIME) for _ in range(num_perm))
+    b = tuple(rng.randrange(0, _PRIME) for _ in range(num_perm))
+    return a, b
+
+
+class MinHasher:
+    """Computes MinHash signatures over word shingles."""
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 3, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self._a, self._b = _permutations(num_perm, seed)
+        if NUMPY_AVAILABLE:
+            self._a_np = np.asarray(self._a, dtype=np.uint64)
+            self._b_np = np.asarray(self._b, dtype=np.uint64)
+
+    def shingles(self, text: str) -> Set[str]:
+        """Distinct word n-grams; short texts fall back to their tokens."""
+        tokens = tokenize(text)
+        n = self.shingle_size
+        if len(tokens) < n:
+            return {" ".join(tokens)} if tokens else set()
+        return {" ".join(tokens[i : i + n]) for i in range(len(tokens) - n + 1)}
+
+    def signature(self, text: str) -> Signature:
+        """MinHash signature of text (all-max for empty text)."""
+        hashes = [zlib.crc32(s.encode()) for s in self.shingles(text)]
+        if not hashes:
+            return (_PRIME,) * self.num_perm
+
+        if NUMPY_AVAILABLE:
+            h = np.asarray(hashes, dtype=np.uint64)[:, None]
+            values = (h * self._a_np + self._b_np) % np.uint64(_PRIME)
+            return tuple(int(v) for v in values.min(axis=0))
+
+        return tuple(
+            min((a * h + b) % _PRIME for h in hashes)
+            for a, b in zip(self._a, self._b)
+        )
+
+    @staticmethod
+    def similarity(a: Signature, b: Signature) -> float:
+        """Estimated Jaccard similarity of the underlying shingle sets."""
+        if not a or len(a) != len(b):
+            return 0.0
+        return sum(x == y for x, y in zip(a, b)) / len(a)
+
+    @staticmethod
+    def encode(signature: Signature) -> str:
+        """Compact string form suitable for ChromaDB metadata."""
+        return base64.b64encode(struct.pack(f"<{len(signature)}I", *signature)).decode()
+
+    @staticmethod
+    def decode(encoded: str) -> Signature:
+        raw = base64.b64decode(encoded)
+        return struct.unpack(f"<{len(raw) // 4}I", raw)
+
+
+def _choose_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """
+    Pick (bands, rows) with bands * rows == num_perm whose LSH threshold
+    (1/bands) ** (1/rows) is closest to, without exceeding, the target, so
+    true duplicates are rarely missed; candidates are verified afterwards.
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if (1 / bands) ** (1 / rows) <= threshold:
+            best = (bands, rows)
+    return best
+
+
+class LSHIndex:
+    """Banded LSH index over MinHash signatures."""
+
+    def __init__(self, num_perm: int = 64, threshold: float = 0.9):
+        self.bands, self.rows = _choose_bands(num_perm, threshold)
+        self._buckets: Dict[Tuple[int, Signature], List[Hashable]] = defaultdict(list)
+        self._signatures: Dict[Hashable, Signature] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_keys(self, signature: Signature):
+        for band in range(self.bands):
+            start = band * self.rows
+            yield band, signature[start : start + self.rows]
+
+    def insert(self, key: Hashable, signature: Signature) -> None:
+        self._signatures[key] = signature
+        for band_key in self._band_keys(signature):
+            self._buckets[band_key].append(key)
+
+    def candidates(self, signature: Signature) -> Set[Hashable]:
+        found: Set[Hashable] = set()
+        for band_key in self._band_keys(signature):
+            bucket = self._buckets.get(band_key)
+            if bucket:
+                found.update(bucket)
+        return found
+
+    def signature(self, key: Hashable) -> Optional[Signature]:
+        return self._signatures.get(key)
+
+
+class NearDuplicateFilter:
+    """
+    Greedy near-duplicate filter: an item is dropped when its estimated
+    Jaccard similarity to an already-kept item exceeds the threshold.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        num_perm: int = 64,
+        shingle_size: int = 3,
+    ):
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm=num_perm, shingle_size=shingle_size)
+        self.index = LSHIndex(num_perm=num_perm, threshold=threshold)
+
+    def signature_for(
+        self, text: str, metadata: Optional[Dict[str, Any]] = None
+    ) -> Signature:
+        """Use the precomputed signature from metadata when it is compatible."""
+        encoded = (metadata or {}).get(METADATA_KEY)
+        if isinstance(encoded, str):
+            try:
+                signature = MinHasher.decode(encoded)
+                if len(signature) == self.hasher.num_perm:
+                    return signature
+            except (ValueError, struct.error):
+                pass
+        return self.hasher.signature(text)
+
+    def find_duplicate(self, signature: Signature) -> Optional[Hashable]:
+        """Key of a kept item this signature duplicates, if any."""
+        for key in self.index.candidates(signature):
+            if MinHasher.similarity(signature, self.index.signature(key)) > self.threshold:
+                return key
+        return None
+
+    def add(self, key: Hashable, signature: Signature) -> bool:
+        """Keep the item unless it duplicates one already kept."""
+        if self.find_duplicate(signature) is not None:
+            return False
+        self.index.insert(key, signature)
+        return True
+
+    def filter(
+        self,
+        items: Sequence[Any],
+        text_fn: Callable[[Any], str],
+        metadata_fn: Optional[Callable[[Any], Optional[Dict[str, Any]]]] = None,
+    ) -> List[Any]:
+        """Order-preserving filter over items (first occurrence wins)."""
+        kept = []
+        for item in items:
+            metadata = metadata_fn(item) if metadata_fn else None
+            signature = self.signature_for(text_fn(item), metadata)
+            if self.add(len(self.index), signature):
+                kept.append(item)
+        return kept
+
+    def dedupe_chunks(
+        self,
+        chunks: List[Dict[str, Any]],
+        text_key: str = "text",
+        metadata_key: str = "metadata",
+    ) -> List[Dict[str, Any]]:
+        """
+        Ingest-time pass: store each chunk's signature in its metadata and
+        drop chunks that duplicate one seen earlier by this filter.
+        """
+        kept = []
+        for chunk in chunks:
+            metadata = chunk.setdefault(metadata_key, {})
+            signature = self.signature_for(chunk.get(text_key, ""), metadata)
+            metadata[METADATA_KEY] = MinHasher.encode(signature)
+            if self.add(chunk.get("id", len(self.index)), signature):
+                kept.append(chunk)
+        if len(kept) < len(chunks):
+            logger.debug(f"Dropped {len(chunks) - len(kept)} near-duplicate chunks")
+        return kept
@@ -18,11 +18,18 @@ import json
 import logging
 import os
 import re
+import sqlite3
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Union
 
+from integrations.minhash_dedup import NearDuplicateFilter
+from integrations.obsidian_indexer import VaultIndexer
+from integrations.obsidian_search_index import VaultSearchIndex
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -79,12 +86,18 @@ class ObsidianConfig:
     auto_sync: bool = True
     sync_interval: int = 300  # 5 minutes
     watch_changes: bool = True
+    debounce_seconds: float = 1.0  # Quiet period before watched changes are synced
+    max_batch_delay_seconds: float = 10.0  # Upper bound on delay under constant activity
 
     # Content settings
     chunk_size: int = 1000
     chunk_overlap: int = 200
     include_frontmatter: bool = True
 
+    # Indexing settings (parse/embed worker threads, texts per embed call)
+    index_workers: int = 4
+    embed_batch_size: int = 64
+
     # Exclude patterns
     exclude_patterns: List[str] = field(
         default_factory=lambda: [
@@ -110,6 +123,8 @@ class ObsidianConfig:
             embedding_model=os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2"),
             auto_sync=os.getenv("OBSIDIAN_AUTO_SYNC", "true").lower() == "true",
             watch_changes=os.getenv("OBSIDIAN_WATCH", "true").lower() == "true",
+            index_workers=int(os.getenv("OBSIDIAN_INDEX_WORKERS", "4")),
+            embed_batch_size=int(os.getenv("OBSIDIAN_EMBED_BATCH_SIZE", "64")),
         )
 
 
@@ -169,6 +184,15 @@ class EnhancedObsidianIntegration:
         self._chroma_client = None
         self._collections: Dict[str, Any] = {}
         self._watcher = None
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
+        # Paths reported by watcher events, waiting for the debounce
+        self._pending_lock = threading.Lock()
+        self._pending_paths: set = set()
+        self._first_event = 0.0
+        self._last_event = 0.0
+        self._indexer: Optional[VaultIndexer] = None
+        self._search_index: Optional[VaultSearchIndex] = None
         self._note_cache: Dict[str, ObsidianNote] = {}
         self._backlinks_cache: Dict[str, List[str]] = {}
 
@@ -192,6 +216,60 @@ class EnhancedObsidianIntegration:
                 logger.error(f"Failed to connect to ChromaDB: {e}")
         return self._chroma_client
 
+    @property
+    def indexer(self) -> Optional[VaultIndexer]:
+        """Lazy-load the incremental vault indexer (state lives in the vault)"""
+        if self._indexer is None and self.vault_exists:
+            self._indexer = VaultIndexer(
+                self,
+                embed_fn=self._default_embed_fn(),
+                workers=self.config.index_workers,
+                embed_batch_size=self.config.embed_batch_size,
+            )
+        return self._indexer
+
+    @property
+    def search_index(self) -> Optional[VaultSearchIndex]:
+        """
+        Lazy-load the full-text and link index. It is refreshed against the
+        vault once on first use and kept current by note operations and the
+        file watcher afterwards.
+        """
+        if self._search_index is None and self.vault_exists:
+            try:
+                self._search_index = VaultSearchIndex(self)
+                stats = self._search_index.refresh()
+                logger.info(f"Search index ready: {stats}")
+            except sqlite3.Error as e:
+                logger.warning(f"Search index unavailable, scanning files instead: {e}")
+                self._search_index = None
+        return self._search_index
+
+    def _reindex(self, note_path: str) -> None:
+        """Update the search index for one note (created, edited or removed)"""
+        self._reindex_paths([note_path])
+
+    def _reindex_paths(self, note_paths: List[str]) -> None:
+        """Update the search index for a batch of notes"""
+        if self._search_index is not None:
+            try:
+                self._search_index.update_paths(note_paths)
+            except sqlite3.Error as e:
+                logger.error(f"Failed to index {', '.join(note_paths)}: {e}")
+
+    @staticmethod
+    def _default_embed_fn():
+        """The embedding function Chroma collections use when none is given"""
+        if not CHROMA_AVAILABLE:
+            return None
+        try:
+            from chromadb.utils import embedding_functions
+
+            return embedding_functions.DefaultEmbeddingFunction()
+        except Exception as e:
+            logger.warning(f"Default embedding function unavailable: {e}")
+            return None
+
     def get_collection(self, name: str):
         """Get or create a ChromaDB collection"""
         if name not in self._collections and self.chroma_client:
@@ -367,6 +445,8 @@ class EnhancedObsidianIntegration:
         with open(full_path, "w", encoding="utf-8") as f:
             f.write("\n".join(note_content))
 
+        self._reindex(str(full_path.relative_to(self.config.vault_path)))
+
         # Trigger sync
         if self.config.auto_sync:
             asyncio.create_task(
@@ -415,6 +495,8 @@ class EnhancedObsidianIntegration:
             with open(full_path, "w", encoding="utf-8") as f:
                 f.write("\n".join(note_content))
 
+        self._reindex(note_path)
+
         # Trigger sync
         if self.config.auto_sync:
             asyncio.create_task(self._sync_note(note_path))
@@ -437,15 +519,16 @@ class EnhancedObsidianIntegration:
         trash_path = trash_dir / full_path.name
 
         full_path.rename(trash_path)
+        self._reindex(note_path)
 
-        # Remove from ChromaDB
+        # Remove from ChromaDB and the index state
         if self.chroma_client:
             collection = self.get_collection(self.config.main_collection)
-            if collection:
+            if collection and self.indexer:
                 try:
-                    collection.delete(where={"path": note_path})
-                except:
-                    pass
+                    self.indexer.sync_paths(collection, [note_path])
+                except Exception as e:
+                    logger.error(f"Failed to unindex {note_path}: {e}")
 
         return {
             "success": True,
@@ -460,6 +543,10 @@ class EnhancedObsidianIntegration:
         if not self.vault_exists:
             return []
 
+        index = self.search_index
+        if index is not None:
+            return index.search(query, case_sensitive)
+
         results = []
         flags = 0 if case_sensitive else re.IGNORECASE
 
@@ -659,6 +746,11 @@ class EnhancedObsidianIntegration:
 
     def build_backlinks(self) -> Dict[str, List[str]]:
         """Build complete backlinks index"""
+        index = self.search_index
+        if index is not None:
+            self._backlinks_cache = index.backlinks()
+            return self._backlinks_cache
+
         backlinks = {}
 
         for md_file in self.config.vault_path.rglob("*.md"):
@@ -684,16 +776,24 @@ class EnhancedObsidianIntegration:
 
     def get_backlinks(self, note_path: str) -> List[Dict]:
         """Get all notes linking to this note"""
-        if not self._backlinks_cache:
-            self.build_backlinks()
-
         note_title = Path(note_path).stem
-        linking_notes = self._backlinks_cache.get(note_title, [])
+        index = self.search_index
+        if index is not None:
+            linking_notes = index.backlinks_for(note_title)
+        else:
+            if not self._backlinks_cache:
+                self.build_backlinks()
+            linking_notes = self._backlinks_cache.get(note_title, [])
 
         return [{"title": title, "path": f"{title}.md"} for title in linking_notes]
 
     def export_graph(self) -> Dict[str, Any]:
         """Export knowledge graph for visualization"""
+        index = self.search_index
+        if index is not None:
+            nodes, edges = index.graph()
+            return self._graph_result(nodes, edges)
+
         if not self._backlinks_cache:
             self.build_backlinks()
 
@@ -725,6 +825,10 @@ class EnhancedObsidianIntegration:
             except:
                 continue
 
+        return self._graph_result(nodes, edges)
+
+    @staticmethod
+    def _graph_result(nodes: List[Dict], edges: List[Dict]) -> Dict[str, Any]:
         return {
             "nodes": nodes,
             "edges": edges,
@@ -800,7 +904,13 @@ class EnhancedObsidianIntegration:
     # ==================== SYNC ====================
 
     async def sync_to_chroma(self, force: bool = False) -> Dict[str, Any]:
-        """Sync entire vault to ChromaDB"""
+        """
+        Incrementally sync the vault to ChromaDB.
+
+        Only notes whose stat changed are read, only chunks whose text
+        changed are embedded, and writes are batched across notes. The
+        result includes per-stage timings.
+        """
         if not CHROMA_AVAILABLE or not self.chroma_client:
             return {"error": "ChromaDB not available"}
 
@@ -808,82 +918,22 @@ class EnhancedObsidianIntegration:
         if not collection:
             return {"error": "Failed to get collection"}
 
-        stats = {
-            "total": 0,
-            "synced": 0,
-            "skipped": 0,
-            "failed": 0,
-            "chunks": 0,
-        }
-
-        # Load sync state
-        state_file = self.config.vault_path / ".osmen_sync_state.json"
-        sync_state = {}
-        if not force and state_file.exists():
-            try:
-                with open(state_file) as f:
-                    sync_state = json.load(f)
-            except:
-                pass
-
-        new_state = {}
-
-        for md_file in self.config.vault_path.rglob("*.md"):
-            if self._should_exclude(md_file):
-                continue
-
-            stats["total"] += 1
-            rel_path = str(md_file.relative_to(self.config.vault_path))
-            mtime = str(md_file.stat().st_mtime)
-
-            # Skip unchanged
-            if not force and sync_state.get(rel_path) == mtime:
-                stats["skipped"] += 1
-                new_state[rel_path] = mtime
-                continue
-
-            # Read and chunk note
-            note = self.read_note(rel_path)
-            if not note:
-                stats["failed"] += 1
-                continue
-
-            try:
-                chunks = self._chunk_content(note)
-
-                # Delete old chunks
-                try:
-                    collection.delete(where={"path": rel_path})
-                except:
-                    pass
-
-                # Add new chunks
-                if chunks:
-                    collection.add(
-                        ids=[c["id"] for c in chunks],
-                        documents=[c["text"] for c in chunks],
-                        metadatas=[c["metadata"] for c in chunks],
-                    )
-                    stats["chunks"] += len(chunks)
-
-                stats["synced"] += 1
-                new_state[rel_path] = mtime
-            except Exception as e:
-                logger.error(f"Failed to sync {rel_path}: {e}")
-                stats["failed"] += 1
-
-        # Save state
-        with open(state_file, "w") as f:
-            json.dump(new_state, f, indent=2)
+        if not self.indexer:
+            return {"error": "Vault not found"}
 
-        stats["status"] = "success"
+        stats = await asyncio.to_thread(self.indexer.sync, collection, force)
         stats["timestamp"] = datetime.now().isoformat()
         return stats
 
     async def _sync_note(self, note_path: str) -> None:
         """Sync a single note to ChromaDB"""
-        note = self.read_note(note_path)
-        if not note or not self.chroma_client:
+        await asyncio.to_thread(self._sync_note_blocking, note_path)
+
+    def _sync_note_blocking(self, note_path: str) -> None:
+        self._sync_paths_blocking([note_path])
+
+    def _sync_paths_blocking(self, note_paths: List[str]) -> None:
+        if not self.chroma_client or not self.indexer:
             return
 
         collection = self.get_collection(self.config.main_collection)
@@ -891,21 +941,10 @@ class EnhancedObsidianIntegration:
             return
 
         try:
-            # Delete old
-            collection.delete(where={"path": note_path})
-
-            # Add new
-            chunks = self._chunk_content(note)
-            if chunks:
-                collection.add(
-                    ids=[c["id"] for c in chunks],
-                    documents=[c["text"] for c in chunks],
-                    metadatas=[c["metadata"] for c in chunks],
-                )
-
-            logger.debug(f"Synced: {note_path}")
+            self.indexer.sync_paths(collection, note_paths)
+            logger.debug(f"Synced: {', '.join(note_paths)}")
         except Exception as e:
-            logger.error(f"Failed to sync {note_path}: {e}")
+            logger.error(f"Failed to sync {', '.join(note_paths)}: {e}")
 
     # ==================== FILE WATCHER ====================
 
@@ -917,40 +956,52 @@ class EnhancedObsidianIntegration:
         if self._watcher:
             return True
 
+        # Build (or refresh) the search index before events start arriving
+        self.search_index
+
         class VaultEventHandler(FileSystemEventHandler):
             def __init__(self, integration):
                 self.integration = integration
 
+            def _rel_path(self, src_path: str) -> Optional[str]:
+                if not src_path.endswith(".md"):
+                    return None
+                try:
+                    return str(
+                        Path(src_path).relative_to(self.integration.config.vault_path)
+                    )
+                except ValueError:
+                    return None
+
+            def _changed(self, rel_path: str):
+                # Handlers run on watchdog's thread; the worker thread
+                # indexes and syncs the coalesced paths
+                self.integration._queue_path(rel_path)
+
             def on_modified(self, event):
-                if event.is_directory or not event.src_path.endswith(".md"):
-                    return
-                rel_path = Path(event.src_path).relative_to(
-                    self.integration.config.vault_path
-                )
-                if self.integration.config.auto_sync:
-                    asyncio.create_task(self.integration._sync_note(str(rel_path)))
+                rel_path = None if event.is_directory else self._rel_path(event.src_path)
+                if rel_path:
+                    self._changed(rel_path)
 
             def on_created(self, event):
-                if not event.is_directory and event.src_path.endswith(".md"):
-                    self.on_modified(event)
+                self.on_modified(event)
 
             def on_deleted(self, event):
-                if event.is_directory or not event.src_path.endswith(".md"):
+                # The note is gone, so syncing it removes its chunks
+                self.on_modified(event)
+
+            def on_moved(self, event):
+                if event.is_directory:
                     return
-                # Remove from ChromaDB
-                rel_path = str(
-                    Path(event.src_path).relative_to(self.integration.config.vault_path)
-                )
-                collection = self.integration.get_collection(
-                    self.integration.config.main_collection
-                )
-                if collection:
-                    try:
-                        collection.delete(where={"path": rel_path})
-                    except:
-                        pass
+                for path in (event.src_path, event.dest_path):
+                    rel_path = self._rel_path(path)
+                    if rel_path:
+                        self._changed(rel_path)
 
         handler = VaultEventHandler(self)
+        self._watch_stop.clear()
+        self._watch_thread = threading.Thread(target=self._watch_loop, daemon=True)
+        self._watch_thread.start()
         self._watcher = Observer()
         self._watcher.schedule(handler, str(self.config.vault_path), recursive=True)
         self._watcher.start()
@@ -958,13 +1009,64 @@ class EnhancedObsidianIntegration:
         return True
 
     def stop_watcher(self) -> None:
-        """Stop file system watcher"""
+        """Stop file system watcher, syncing changes still waiting for the debounce"""
         if self._watcher:
             self._watcher.stop()
             self._watcher.join()
             self._watcher = None
+            self._watch_stop.set()
+            self._watch_thread.join()
+            self._watch_thread = None
             logger.info("Stopped watching vault")
 
+    def _queue_path(self, rel_path: str) -> None:
+        """Record a path reported by a watcher event (called on watchdog's thread)"""
+        now = time.monotonic()
+        with self._pending_lock:
+            if not self._pending_paths:
+                self._first_event = now
+            self._last_event = now
+            self._pending_paths.add(rel_path)
+
+    def _take_pending(self, now: Optional[float] = None) -> Optional[List[str]]:
+        """
+        Hand over the coalesced paths once the vault has been quiet for
+        debounce_seconds, or once the oldest event is max_batch_delay_seconds
+        old. Returns None when nothing is ready.
+        """
+        now = time.monotonic() if now is None else now
+        with self._pending_lock:
+            if not self._pending_paths:
+                return None
+            quiet = now - self._last_event >= self.config.debounce_seconds
+            overdue = now - self._first_event >= self.config.max_batch_delay_seconds
+            if not (quiet or overdue):
+                return None
+            paths = sorted(self._pending_paths)
+            self._pending_paths = set()
+            return paths
+
+    def _process_paths(self, rel_paths: List[str]) -> None:
+        # Index first: it is local and keeps search results current
+        try:
+            self._reindex_paths(rel_paths)
+            if self.config.auto_sync:
+                self._sync_paths_blocking(rel_paths)
+        except Exception as e:
+            logger.error(f"Watcher error: {e}")
+
+    def _watch_loop(self) -> None:
+        """Worker thread: index and sync debounced batches of watcher events"""
+        tick = max(0.05, min(self.config.debounce_seconds / 2, 1.0))
+        while not self._watch_stop.wait(tick):
+            paths = self._take_pending()
+            if paths:
+                self._process_paths(paths)
+
+        paths = self._take_pending(now=float("inf"))
+        if paths:
+            self._process_paths(paths)
+
     # ==================== HELPERS ====================
 
     def _should_exclude(self, path: Path) -> bool:
@@ -1069,7 +1171,7 @@ class EnhancedObsidianIntegration:
                     "metadata": {**note.metadata, "chunk": 0},
                 }
             )
-            return chunks
+            return NearDuplicateFilter().dedupe_chunks(chunks)
 
         start = 0
         chunk_idx = 0
@@ -1097,7 +1199,9 @@ class EnhancedObsidianIntegration:
 
             start = end - overlap if end < len(text) else len(text)
 
-        return chunks
+        # Store MinHash signatures for query-time dedup and drop repeated
+        # sections (templates, pasted blocks) within the note
+        return NearDuplicateFilter().dedupe_chunks(chunks)
 
     def _get_template(self, template_name: str) -> Optional[str]:
         """Get template content by name"""
@@ -1130,6 +1234,12 @@ async def main():
     parser.add_argument("--watch", action="store_true", help="Start file watcher")
     parser.add_argument("--graph", action="store_true", help="Export graph")
     parser.add_argument("--stats", action="store_true", help="Show stats")
+    parser.add_argument(
+        "--rebuild-index", action="store_true", help="Rebuild the search/link index"
+    )
+    parser.add_argument(
+        "--check-index", action="store_true", help="Check the search/link index"
+    )
 
     args = parser.parse_args()
 
@@ -1153,6 +1263,13 @@ async def main():
         graph = integration.export_graph()
         print(json.dumps(graph, indent=2))
 
+    elif args.rebuild_index or args.check_index:
+        # Opened directly: the search_index property refreshes on first use,
+        # which would hide the inconsistencies a check is meant to find
+        index = VaultSearchIndex(integration)
+        result = index.rebuild() if args.rebuild_index else index.check()
+        print(json.dumps(result, indent=2))
+
     elif args.watch:
         if integration.start_watcher():
             print("Watching for changes... Press Ctrl+C to stop")
@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+"""
+Incremental Obsidian Vault Indexer for OsMEN
+
+Features:
+- Content-addressed chunk ids: unchanged chunks of an edited note keep
+  their stored embeddings; only new chunk text is embedded
+- Vault state (note stats and chunk ids) in SQLite instead of a JSON
+  mtime map
+- Chroma adds, metadata updates and deletes batched across notes
+- Parallel note parsing and a worker pool for embedding
+- Per-stage timings in every sync report
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+EmbedFn = Callable[[List[str]], Sequence[Sequence[float]]]
+
+# (mtime_ns, size) as returned by stat; cheap change detection before reading
+FileStat = Tuple[int, int]
+
+
+def chunk_id(path: str, text: str) -> str:
+    """
+    Stable id for a chunk: the note path plus the chunk text, so editing one
+    section of a note leaves the ids (and embeddings) of the others intact.
+    """
+    path_key = hashlib.sha1(path.encode("utf-8")).hexdigest()[:10]
+    text_key = hashlib.sha1(text.encode("utf-8")).hexdigest()[:20]
+    return f"{path_key}_{text_key}"
+
+
+def scan_vault(
+    vault_path: Path, should_exclude: Callable[[Path], bool]
+) -> Iterator[Tuple[str, FileStat]]:
+    """
+    Yield (relative path, stat) for every markdown note, walking with
+    scandir and pruning excluded folders instead of filtering after rglob.
+    """
+    pending = [vault_path]
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError as e:
+            logger.warning(f"Cannot scan {directory}: {e}")
+            continue
+        for entry in entries:
+            path = Path(entry.path)
+            if entry.is_dir(follow_symlinks=False):
+                if not should_exclude(path):
+                    pending.append(path)
+            elif entry.name.endswith(".md") and not should_exclude(path):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                yield str(path.relative_to(vault_path)), (stat.st_mtime_ns, stat.st_size)
+
+
+def _batches(items: List[Any], size: int) -> Iterator[List[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class VaultIndexer:
+    """
+    Keeps a Chroma collection in sync with an Obsidian vault.
+
+    Parsing and chunking reuse the owning EnhancedObsidianIntegration
+    (read_note, _chunk_content, _should_exclude); this class decides what
+    changed and writes only the difference.
+    """
+
+    DB_NAME = ".osmen_index.sqlite3"
+    LEGACY_STATE = ".osmen_sync_state.json"
+    # Chroma rejects batches above its max_batch_size (~5k by default)
+    WRITE_BATCH = 1000
+    _SQL_CHUNK = 500
+
+    def __init__(
+        self,
+        integration: Any,
+        embed_fn: Optional[EmbedFn] = None,
+        workers: int = 4,
+        embed_batch_size: int = 64,
+        db_path: Optional[Path] = None,
+    ):
+        self.integration = integration
+        self.vault_path = Path(integration.config.vault_path)
+        self.embed_fn = embed_fn
+        self.workers = max(1, workers)
+        self.embed_batch_size = max(1, embed_batch_size)
+        self.db_path = db_path or self.vault_path / self.DB_NAME
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS notes (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                content_hash TEXT NOT NULL
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS chunks (
+                id TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                chunk INTEGER NOT NULL
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS chunks_path ON chunks(path);
+            """
+        )
+        self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def sync(self, collection: Any, force: bool = False) -> Dict[str, Any]:
+        """Sync the whole vault; notes missing from disk are removed."""
+        with self._lock:
+            start = time.perf_counter()
+            files = dict(self._scan())
+            known = self._known_notes()
+            scan_time = time.perf_counter() - start
+            return self._sync(
+                collection,
+                files,
+                known,
+                force,
+                {"scan": scan_time},
+                legacy_paths=self._legacy_paths(known),
+            )
+
+    def sync_paths(
+        self, collection: Any, paths: List[str], force: bool = False
+    ) -> Dict[str, Any]:
+        """Sync specific notes (created, edited, moved away or deleted)."""
+        with self._lock:
+            start = time.perf_counter()
+            files: Dict[str, FileStat] = {}
+            for rel_path in paths:
+                full_path = self.vault_path / rel_path
+                if self.integration._should_exclude(full_path):
+                    continue
+                try:
+                    stat = full_path.stat()
+                except OSError:
+                    continue
+                files[rel_path] = (stat.st_mtime_ns, stat.st_size)
+            known = self._known_notes(paths)
+            scan_time = time.perf_counter() - start
+            return self._sync(collection, files, known, force, {"scan": scan_time})
+
+    def stats(self) -> Dict[str, Any]:
+        """Return index size information."""
+        with self._lock:
+            notes = self._conn.execute("SELECT COUNT(*) FROM notes").fetchone()[0]
+            chunks = self._conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+        return {"notes": notes, "chunks": chunks, "db_path": str(self.db_path)}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Sync pipeline
+    # ------------------------------------------------------------------
+
+    def _sync(
+        self,
+        collection: Any,
+        files: Dict[str, FileStat],
+        known: Dict[str, Tuple[int, int, str]],
+        force: bool,
+        timings: Dict[str, float],
+        legacy_paths: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        stats = {
+            "total": len(files),
+            "synced": 0,
+            "skipped": 0,
+            "unchanged": 0,
+            "removed": 0,
+            "failed": 0,
+            "chunks": 0,
+            "embedded": 0,
+            "reused": 0,
+            "deleted_chunks": 0,
+        }
+
+        changed = [
+            path
+            for path, file_stat in files.items()
+            if force or path not in known or known[path][:2] != file_stat
+        ]
+        removed = [path for path in known if path not in files]
+        stats["skipped"] = len(files) - len(changed)
+        stats["removed"] = len(removed)
+
+        stored = self._stored_chunks(changed + removed)
+        to_update: List[Dict] = []
+        to_delete: List[str] = []
+        note_rows: List[Tuple[str, int, int, str]] = []
+        chunk_rows: List[Tuple[str, str, int]] = []
+        replaced_paths: List[str] = []
+
+        try:
+            # Chunks written under the old "<content hash>_<n>" ids share
+            # paths with the new ones, so they must go before any adds
+            start = time.perf_counter()
+            for batch in _batches(legacy_paths or [], self._SQL_CHUNK):
+                collection.delete(where={"path": {"$in": batch}})
+            timings["legacy"] = time.perf_counter() - start
+
+            with _AddPipeline(
+                collection, self.embed_fn, self.workers, self.embed_batch_size, self.WRITE_BATCH
+            ) as pipeline:
+                # Parse, diff and hand new chunks to the embedding pool as
+                # notes arrive, so embedding starts with the first note
+                start = time.perf_counter()
+                for path, (note, chunks) in zip(changed, self._parse_all(changed)):
+                    if note is None:
+                        stats["failed"] += 1
+                        continue
+                    mtime_ns, size = files[path]
+                    # Hash the raw file so frontmatter-only edits refresh metadata
+                    raw_hash = hashlib.md5(note.raw_content.encode("utf-8")).hexdigest()
+                    note_rows.append((path, mtime_ns, size, raw_hash))
+
+                    # Touched but identical file: only the stat changes
+                    if not force and path in known and known[path][2] == raw_hash:
+                        stats["unchanged"] += 1
+                        continue
+
+                    old_ids = stored.get(path, set())
+                    new_ids: Set[str] = set()
+                    for chunk in chunks:
+                        cid = chunk_id(path, chunk["text"])
+                        if cid in new_ids:
+                            continue
+                        new_ids.add(cid)
+                        chunk["id"] = cid
+                        chunk_rows.append((cid, path, chunk["metadata"].get("chunk", 0)))
+                        if cid in old_ids and not force:
+                            to_update.append(chunk)
+                        else:
+                            pipeline.add(chunk)
+
+                    to_delete.extend(old_ids - new_ids)
+                    replaced_paths.append(path)
+                    stats["synced"] += 1
+                    stats["chunks"] += len(new_ids)
+                    pipeline.poll()
+                timings["parse"] = time.perf_counter() - start - pipeline.timings["write"]
+
+                for path in removed:
+                    to_delete.extend(stored.get(path, ()))
+
+                start = time.perf_counter()
+                for batch in _batches(to_delete, self.WRITE_BATCH):
+                    collection.delete(ids=batch)
+                timings["delete"] = time.perf_counter() - start
+
+                # Kept chunks only need fresh note metadata (modified, tags, index)
+                start = time.perf_counter()
+                for batch in _batches(to_update, self.WRITE_BATCH):
+                    collection.update(
+                        ids=[c["id"] for c in batch],
+                        metadatas=[c["metadata"] for c in batch],
+                    )
+                timings["update"] = time.perf_counter() - start
+
+                pipeline.finish()
+            timings.update(pipeline.timings)
+        except Exception as e:
+            logger.error(f"Vault sync failed, state not saved: {e}")
+            stats["status"] = "error"
+            stats["error"] = str(e)
+            stats["timings"] = self._round(timings)
+            return stats
+
+        start = time.perf_counter()
+        self._save_state(note_rows, chunk_rows, replaced_paths, removed)
+        timings["state"] = time.perf_counter() - start
+
+        stats["embedded"] = pipeline.count
+        stats["reused"] = len(to_update)
+        stats["deleted_chunks"] = len(to_delete)
+        stats["status"] = "success"
+        stats["timings"] = self._round(timings)
+        return stats
+
+    def _parse_all(self, paths: List[str]) -> Iterator[Tuple[Any, List[Dict]]]:
+        """Read and chunk notes in order, in parallel when there are several."""
+        if len(paths) > 1 and self.workers > 1:
+            with ThreadPoolExecutor(self.workers) as pool:
+                yield from pool.map(self._parse, paths)
+        else:
+            for path in paths:
+                yield self._parse(path)
+
+    def _parse(self, rel_path: str) -> Tuple[Any, List[Dict]]:
+        try:
+            note = self.integration.read_note(rel_path)
+            if note is None:
+                return None, []
+            return note, self.integration._chunk_content(note)
+        except Exception as e:
+            logger.error(f"Failed to parse {rel_path}: {e}")
+            return None, []
+
+    # ------------------------------------------------------------------
+    # Vault scan and state
+    # ------------------------------------------------------------------
+
+    def _scan(self) -> Iterator[Tuple[str, FileStat]]:
+        return scan_vault(self.vault_path, self.integration._should_exclude)
+
+    def _known_notes(
+        self, paths: Optional[List[str]] = None
+    ) -> Dict[str, Tuple[int, int, str]]:
+        query = "SELECT path, mtime_ns, size, content_hash FROM notes"
+        if paths is None:
+            rows = self._conn.execute(query).fetchall()
+        else:
+            rows = []
+            for batch in _batches(paths, self._SQL_CHUNK):
+                marks = ",".join("?" * len(batch))
+                rows.extend(
+                    self._conn.execute(f"{query} WHERE path IN ({marks})", batch)
+                )
+        return {path: (mtime_ns, size, content_hash) for path, mtime_ns, size, content_hash in rows}
+
+    def _stored_chunks(self, paths: List[str]) -> Dict[str, Set[str]]:
+        stored: Dict[str, Set[str]] = {}
+        for batch in _batches(paths, self._SQL_CHUNK):
+            marks = ",".join("?" * len(batch))
+            for cid, path in self._conn.execute(
+                f"SELECT id, path FROM chunks WHERE path IN ({marks})", batch
+            ):
+                stored.setdefault(path, set()).add(cid)
+        return stored
+
+    def _save_state(
+        self,
+        note_rows: List[Tuple[str, int, int, str]],
+        chunk_rows: List[Tuple[str, str, int]],
+        replaced_paths: List[str],
+        removed: List[str],
+    ) -> None:
+        with self._conn:
+            for batch in _batches(replaced_paths + removed, self._SQL_CHUNK):
+                marks = ",".join("?" * len(batch))
+                self._conn.execute(f"DELETE FROM chunks WHERE path IN ({marks})", batch)
+            for batch in _batches(removed, self._SQL_CHUNK):
+                marks = ",".join("?" * len(batch))
+                self._conn.execute(f"DELETE FROM notes WHERE path IN ({marks})", batch)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO notes (path, mtime_ns, size, content_hash) "
+                "VALUES (?, ?, ?, ?)",
+                note_rows,
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO chunks (id, path, chunk) VALUES (?, ?, ?)",
+                chunk_rows,
+            )
+
+    def _legacy_paths(self, known: Dict[str, Any]) -> Optional[List[str]]:
+        """
+        Paths synced by the old JSON-state sync, on the first run only. The
+        file itself is left alone: other vault watchers share its name.
+        """
+        legacy_file = self.vault_path / self.LEGACY_STATE
+        if known or not legacy_file.exists():
+            return None
+        try:
+            with open(legacy_file) as f:
+                legacy = json.load(f)
+        except (OSError, ValueError):
+            return []
+        return list(legacy)
+
+    @staticmethod
+    def _round(timings: Dict[str, float]) -> Dict[str, float]:
+        return {stage: round(seconds, 4) for stage, seconds in timings.items()}
+
+
+class _AddPipeline:
+    """
+    Embeds new chunks in a worker pool while the caller keeps parsing, and
+    writes finished batches from the caller's thread (Chroma clients are
+    not shared across threads). Without an embedding function, chunks are
+    written in large batches and the collection embeds them.
+    """
+
+    def __init__(
+        self,
+        collection: Any,
+        embed_fn: Optional[EmbedFn],
+        workers: int,
+        embed_batch_size: int,
+        write_batch: int,
+    ):
+        self.collection = collection
+        self.embed_fn = embed_fn
+        self.batch_size = embed_batch_size if embed_fn else write_batch
+        self.count = 0
+        # embed: seconds inside embed_fn summed over workers; write: seconds
+        # in upserts; drain: waiting for embeddings once everything else is done
+        self.timings = {"embed": 0.0, "write": 0.0, "drain": 0.0}
+        self._pending: List[Dict] = []
+        self._futures: "deque[Future]" = deque()
+        self._pool = ThreadPoolExecutor(workers) if embed_fn else None
+        self._timing_lock = threading.Lock()
+
+    def __enter__(self) -> "_AddPipeline":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def add(self, chunk: Dict) -> None:
+        self._pending.append(chunk)
+        self.count += 1
+        if len(self._pending) >= self.batch_size:
+            self._submit()
+
+    def poll(self) -> None:
+        """Write batches whose embeddings are ready, without blocking."""
+        while self._futures and self._futures[0].done():
+            self._write(*self._futures.popleft().result())
+
+    def finish(self) -> None:
+        """Submit the last partial batch and write everything outstanding."""
+        self._submit()
+        start = time.perf_counter()
+        written = self.timings["write"]
+        while self._futures:
+            self._write(*self._futures.popleft().result())
+        self.timings["drain"] = (
+            time.perf_counter() - start - (self.timings["write"] - written)
+        )
+
+    def _submit(self) -> None:
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        if self._pool is None:
+            self._write(batch, None)
+        else:
+            self._futures.append(self._pool.submit(self._embed, batch))
+
+    def _embed(self, batch: List[Dict]) -> Tuple[List[Dict], List[List[float]]]:
+        start = time.perf_counter()
+        vectors = self.embed_fn([c["text"] for c in batch])
+        if len(vectors) != len(batch):
+            raise RuntimeError(
+                f"Embedding function returned {len(vectors)} vectors for {len(batch)} chunks"
+            )
+        embeddings = [[float(x) for x in vector] for vector in vectors]
+        with self._timing_lock:
+            self.timings["embed"] += time.perf_counter() - start
+        return batch, embeddings
+
+    def _write(self, batch: List[Dict], embeddings: Optional[List[List[float]]]) -> None:
+        start = time.perf_counter()
+        kwargs = {"embeddings": embeddings} if embeddings is not None else {}
+        self.collection.upsert(
+            ids=[c["id"] for c in batch],
+            documents=[c["text"] for c in batch],
+            metadatas=[c["metadata"] for c in batch],
+            **kwargs,
+        )
+        self.timings["write"] += time.perf_counter() - start
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Persistent Full-Text and Link Index for Obsidian Vaults
+
+Features:
+- SQLite FTS5 (trigram tokenizer) over raw note text, so substring
+  searches are index lookups instead of a read of every file
+- Wikilink table backing backlinks and graph export
+- Incremental maintenance: stat-based refresh plus per-path updates from
+  the vault watcher and note operations
+- Rebuild and consistency check
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from integrations.obsidian_indexer import FileStat, scan_vault
+
+logger = logging.getLogger(__name__)
+
+# The trigram tokenizer cannot match patterns shorter than this
+_TRIGRAM = 3
+
+
+def required_literal(pattern: str) -> str:
+    """
+    Longest literal substring every match of a regex must contain, or ""
+    when that cannot be determined cheaply (alternation, inline flags).
+    Case is not considered; the trigram index is case-insensitive anyway.
+    """
+    if "|" in pattern or pattern.startswith("(?"):
+        return ""
+
+    runs: List[str] = []
+    current: List[str] = []
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            # Escapes (classes like \w or escaped literals) end the run
+            runs.append("".join(current))
+            current = []
+            i += 2
+            continue
+        if ch == "[":
+            runs.append("".join(current))
+            current = []
+            i += 1
+            if i < len(pattern) and pattern[i] == "^":
+                i += 1
+            if i < len(pattern) and pattern[i] == "]":
+                i += 1
+            while i < len(pattern) and pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+            i += 1
+            continue
+        if ch in "*?{":
+            # The quantified character may be absent
+            if current:
+                current.pop()
+            runs.append("".join(current))
+            current = []
+            if ch == "{":
+                close = pattern.find("}", i)
+                i = close if close != -1 else len(pattern)
+        elif ch in "()":
+            depth += 1 if ch == "(" else -1
+            runs.append("".join(current))
+            current = []
+        elif ch in ".^$+" or depth > 0:
+            runs.append("".join(current))
+            current = []
+        else:
+            current.append(ch)
+        i += 1
+    runs.append("".join(current))
+    return max(runs, key=len)
+
+
+class VaultSearchIndex:
+    """
+    Text and link index for an Obsidian vault.
+
+    Shares the vault's index database file with VaultIndexer; parsing
+    helpers (exclusion rules, wikilink extraction, previews) come from the
+    owning EnhancedObsidianIntegration so results match the file-scan
+    implementation.
+    """
+
+    DB_NAME = ".osmen_index.sqlite3"
+    _SQL_CHUNK = 500
+
+    def __init__(self, integration: Any, db_path: Optional[Path] = None):
+        self.integration = integration
+        self.vault_path = Path(integration.config.vault_path)
+        self.db_path = db_path or self.vault_path / self.DB_NAME
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS search_notes (
+                id INTEGER PRIMARY KEY,
+                path TEXT NOT NULL UNIQUE,
+                title TEXT NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+                content, tokenize='trigram'
+            );
+            CREATE TABLE IF NOT EXISTS links (
+                source_id INTEGER NOT NULL,
+                source_title TEXT NOT NULL,
+                target TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS links_target ON links(target);
+            CREATE INDEX IF NOT EXISTS links_source ON links(source_id);
+            """
+        )
+        self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> Dict[str, Any]:
+        """Index new and changed notes and drop deleted ones (stat-based)."""
+        with self._lock:
+            start = time.perf_counter()
+            on_disk = dict(self._scan())
+            indexed = self._indexed()
+            changed = [
+                path
+                for path, file_stat in on_disk.items()
+                if indexed.get(path, (None, None, None))[1:] != file_stat
+            ]
+            removed = [path for path in indexed if path not in on_disk]
+            self._apply(changed, removed, on_disk)
+            return {
+                "notes": len(on_disk),
+                "updated": len(changed),
+                "removed": len(removed),
+                "seconds": round(time.perf_counter() - start, 4),
+            }
+
+    def rebuild(self) -> Dict[str, Any]:
+        """Drop everything and index the vault from scratch."""
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM links")
+                self._conn.execute("DELETE FROM search_fts")
+                self._conn.execute("DELETE FROM search_notes")
+            return self.refresh()
+
+    def update_paths(self, paths: List[str]) -> None:
+        """Re-index specific notes; paths that no longer exist are removed."""
+        with self._lock:
+            on_disk: Dict[str, FileStat] = {}
+            for rel_path in paths:
+                full_path = self.vault_path / rel_path
+                if not rel_path.endswith(".md") or self.integration._should_exclude(full_path):
+                    continue
+                try:
+                    stat = full_path.stat()
+                except OSError:
+                    continue
+                on_disk[rel_path] = (stat.st_mtime_ns, stat.st_size)
+            removed = [path for path in paths if path not in on_disk]
+            self._apply(list(on_disk), removed, on_disk)
+
+    def remove_paths(self, paths: List[str]) -> None:
+        with self._lock:
+            self._apply([], paths, {})
+
+    def check(self) -> Dict[str, Any]:
+        """
+        Compare the index with the vault without modifying either.
+
+        Returns missing (on disk, not indexed), stale (indexed with an old
+        stat), orphaned (indexed, gone from disk) paths and whether the
+        FTS index passes SQLite's integrity check.
+        """
+        with self._lock:
+            on_disk = dict(self._scan())
+            indexed = self._indexed()
+            try:
+                self._conn.execute(
+                    "INSERT INTO search_fts(search_fts, rank) VALUES('integrity-check', 1)"
+                )
+                fts_ok = True
+            except sqlite3.DatabaseError as e:
+                logger.error(f"FTS integrity check failed: {e}")
+                fts_ok = False
+            fts_rows = self._conn.execute("SELECT COUNT(*) FROM search_fts").fetchone()[0]
+
+        missing = sorted(path for path in on_disk if path not in indexed)
+        orphaned = sorted(path for path in indexed if path not in on_disk)
+        stale = sorted(
+            path
+            for path, file_stat in on_disk.items()
+            if path in indexed and indexed[path][1:] != file_stat
+        )
+        return {
+            "consistent": fts_ok
+            and fts_rows == len(indexed)
+            and not (missing or orphaned or stale),
+            "indexed": len(indexed),
+            "on_disk": len(on_disk),
+            "missing": missing,
+            "stale": stale,
+            "orphaned": orphaned,
+            "fts_ok": fts_ok and fts_rows == len(indexed),
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def search(self, query: str, case_sensitive: bool = False) -> List[Dict]:
+        """
+        Regex search with the same results as scanning the files.
+
+        Patterns containing a literal of three or more characters are
+        narrowed with the trigram index first; other patterns scan the
+        stored text, which still avoids touching the filesystem.
+        """
+        flags = 0 if case_sensitive else re.IGNORECASE
+        try:
+            pattern = re.compile(query, flags)
+        except re.error as e:
+            logger.warning(f"Invalid search pattern {query!r}: {e}")
+            return []
+
+        with self._lock:
+            literal = required_literal(query)
+            if len(literal) >= _TRIGRAM:
+                phrase = '"' + literal.replace('"', '""') + '"'
+                rows = self._conn.execute(
+                    "SELECT n.title, n.path, f.content FROM search_fts f "
+                    "JOIN search_notes n ON n.id = f.rowid WHERE search_fts MATCH ?",
+                    (phrase,),
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT n.title, n.path, f.content FROM search_fts f "
+                    "JOIN search_notes n ON n.id = f.rowid"
+                ).fetchall()
+
+        results = []
+        for title, path, content in rows:
+            matches = list(pattern.finditer(content))
+            if matches:
+                results.append(
+                    {
+                        "title": title,
+                        "path": path,
+                        "match_count": len(matches),
+                        "preview": self.integration._get_match_preview(content, matches[0]),
+                    }
+                )
+        return sorted(results, key=lambda x: x["match_count"], reverse=True)
+
+    def backlinks(self) -> Dict[str, List[str]]:
+        """Map of link target to the titles of notes linking to it."""
+        backlinks: Dict[str, List[str]] = {}
+        with self._lock:
+            rows = self._conn.execute("SELECT target, source_title FROM links").fetchall()
+        for target, title in rows:
+            backlinks.setdefault(target, []).append(title)
+        return backlinks
+
+    def backlinks_for(self, title: str) -> List[str]:
+        """Titles of notes linking to one target."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT source_title FROM links WHERE target = ?", (title,)
+            ).fetchall()
+        return [title for (title,) in rows]
+
+    def graph(self) -> Tuple[List[Dict], List[Dict]]:
+        """Nodes (with backlink counts) and edges of the link graph."""
+        with self._lock:
+            nodes = [
+                {"id": title, "label": title, "path": path, "backlinks": count}
+                for path, title, count in self._conn.execute(
+                    "SELECT n.path, n.title, COALESCE(c.count, 0) FROM search_notes n "
+                    "LEFT JOIN (SELECT target, COUNT(*) AS count FROM links GROUP BY target) c "
+                    "ON c.target = n.title"
+                )
+            ]
+            edges = [
+                {"source": title, "target": target}
+                for title, target in self._conn.execute(
+                    "SELECT source_title, target FROM links"
+                )
+            ]
+        return nodes, edges
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _apply(
+        self,
+        changed: List[str],
+        removed: List[str],
+        on_disk: Dict[str, FileStat],
+    ) -> None:
+        documents = []
+        for rel_path in changed:
+            try:
+                with open(self.vault_path / rel_path, "r", encoding="utf-8") as f:
+                    documents.append((rel_path, f.read()))
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"Cannot index {rel_path}: {e}")
+                removed.append(rel_path)
+
+        with self._conn:
+            self._delete(removed + [path for path, _ in documents])
+            for rel_path, content in documents:
+                mtime_ns, size = on_disk[rel_path]
+                title = Path(rel_path).stem
+                cursor = self._conn.execute(
+                    "INSERT INTO search_notes (path, title, mtime_ns, size) VALUES (?, ?, ?, ?)",
+                    (rel_path, title, mtime_ns, size),
+                )
+                note_id = cursor.lastrowid
+                self._conn.execute(
+                    "INSERT INTO search_fts (rowid, content) VALUES (?, ?)",
+                    (note_id, content),
+                )
+                self._conn.executemany(
+                    "INSERT INTO links (source_id, source_title, target) VALUES (?, ?, ?)",
+                    [
+                        (note_id, title, link)
+                        for link in self.integration._extract_links(content)
+                    ],
+                )
+
+    def _delete(self, paths: List[str]) -> None:
+        for start in range(0, len(paths), self._SQL_CHUNK):
+            batch = paths[start : start + self._SQL_CHUNK]
+            marks = ",".join("?" * len(batch))
+            ids = [
+                (note_id,)
+                for (note_id,) in self._conn.execute(
+                    f"SELECT id FROM search_notes WHERE path IN ({marks})", batch
+                )
+            ]
+            self._conn.executemany("DELETE FROM links WHERE source_id = ?", ids)
+            self._conn.executemany("DELETE FROM search_fts WHERE rowid = ?", ids)
+            self._conn.executemany("DELETE FROM search_notes WHERE id = ?", ids)
+
+    def _indexed(self) -> Dict[str, Tuple[int, int, int]]:
+        return {
+            path: (note_id, mtime_ns, size)
+            for note_id, path, mtime_ns, size in self._conn.execute(
+                "SELECT id, path, mtime_ns, size FROM search_notes"
+            )
+        }
+
+    def _scan(self) -> Iterator[Tuple[str, FileStat]]:
+        return scan_vault(self.vault_path, self.integration._should_exclude)
@@ -18,7 +18,7 @@ This leads to faster, less resource-intensive RAG solutions by:
 """
 
 import numpy as np
-from typing import List, Dict, Any, Tuple, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 from loguru import logger
 
@@ -281,239 +281,573 @@ class QuantumInspiredRetrieval:
     def quantum_compress(self, dense_vector: np.ndarray) -> DocumentVector:
         """
         Compress document vector using quantum-inspired techniques.
-        
+
         Techniques:
         1. Sparse representation: Keep only top-k dimensions
         2. Phase encoding: Store relative importance
         3. Entanglement: Correlate related dimensions
-        
+
         Args:
             dense_vector: Full-dimensional embedding
-            
+
         Returns:
-            Compressed DocumentVector
+            Compressed DocumentVector (values of the unit-normalized vector)
         """
+        dense_vector = _normalize(np.asarray(dense_vector, dtype=np.float32))
+
         # Calculate sparsity threshold
-        k = int(len(dense_vector) * self.sparse_ratio)
-        
+        k = max(1, int(len(dense_vector) * self.sparse_ratio))
+
         # Get top-k indices by absolute value
-        top_indices = np.argsort(np.abs(dense_vector))[-k:]
-        
+        top_indices = np.argpartition(np.abs(dense_vector), -k)[-k:]
+
         # Create sparse representation
         sparse_vector = {
             int(idx): float(dense_vector[idx])
             for idx in top_indices
         }
-        
+
         # Calculate phase (relative importance within sparse set)
         if self.enable_phase:
-            values = np.array([dense_vector[idx] for idx in top_indices])
+            values = dense_vector[top_indices]
             phase = values / (np.max(np.abs(values)) + 1e-10)
         else:
             phase = None
-        
+
         return DocumentVector(
             id=f"doc_{id(dense_vector)}",
             dense_vector=None,  # Don't store dense to save memory
             sparse_vector=sparse_vector,
             phase=phase
         )
-    
-    def interference_score(
+
+    def interference_scores(
         self,
         query_state: QueryState,
-        document: DocumentVector
-    ) -> float:
+        similarities: np.ndarray
+    ) -> np.ndarray:
         """
-        Calculate relevance using quantum-inspired interference.
-        
+        Vectorized interference over a whole corpus.
+
         Multiple interpretation paths can interfere:
         - Constructive: Multiple interpretations agree → higher score
         - Destructive: Interpretations conflict → lower score
-        
+
         Args:
             query_state: Query in superposition
-            document: Document vector
-            
+            similarities: (n_interpretations, n_documents) cosine similarities
+
         Returns:
-            Interference-based relevance score
+            (n_documents,) interference-based relevance scores in [0, 1]
         """
-        scores = []
-        weights = []
-        
-        for interpretation, prob in zip(query_state.interpretations, query_state.probabilities):
-            # Calculate base similarity score
-            # Use interpretation characteristics to modulate scoring
-            focus = interpretation.get('focus', 'general')
-            specificity = interpretation.get('specificity', 'medium')
-            weight = interpretation.get('weight', 1.0 / len(query_state.interpretations))
-            
-            # Simulate embedding similarity based on interpretation type
-            # In production, this would use actual embedding vectors
-            if focus == 'literal':
-                base_score = 0.8  # High confidence for literal matches
-            elif focus == 'anaphoric':
-                base_score = 0.6  # Medium confidence, needs context
-            elif focus == 'technical':
-                base_score = 0.7  # Good for specific domains
-            elif focus == 'expansive':
-                base_score = 0.5  # Lower precision, broader coverage
-            else:
-                base_score = 0.6  # Default
-            
-            # Modulate by specificity
-            if specificity == 'high':
-                base_score *= 1.1
-            elif specificity == 'low':
-                base_score *= 0.9
-            
-            # Apply probability weight
-            weighted_score = base_score * prob * weight
-            scores.append(weighted_score)
-            weights.append(weight)
-        
-        # Calculate interference effects
-        # Similar scores → constructive interference (amplification)
-        # Different scores → destructive interference (cancellation)
-        
-        mean_score = np.mean(scores)
-        std_score = np.std(scores)
-        
+        n = len(query_state.interpretations)
+        factors = np.array([
+            _interpretation_prior(interpretation) * prob * interpretation.get('weight', 1.0 / n)
+            for interpretation, prob in zip(query_state.interpretations, query_state.probabilities)
+        ], dtype=np.float32)
+
+        scores = similarities * factors[:, None]
+        mean_score = scores.mean(axis=0)
+        std_score = scores.std(axis=0)
+
         # Interference factor:
         # - Low variance (std) = similar interpretations = constructive = amplify
         # - High variance = conflicting interpretations = destructive = dampen
-        
-        # Normalize std to [0, 1] range
         max_possible_std = mean_score / 2  # Heuristic
-        normalized_std = min(std_score / max_possible_std, 1.0) if max_possible_std > 0 else 0
-        
-        # Constructive interference factor (inverse of normalized std)
-        interference_factor = 1.0 + (1.0 - normalized_std) * 0.5  # Boost up to 1.5x
-        
-        # Apply interference
-        final_score = mean_score * interference_factor
-        
-        # Clip to valid range
-        final_score = np.clip(final_score, 0.0, 1.0)
-        
-        return float(final_score)
-    
+        positive = max_possible_std > 0
+        normalized_std = np.zeros_like(mean_score)
+        normalized_std[positive] = np.minimum(std_score[positive] / max_possible_std[positive], 1.0)
+
+        # Constructive interference factor (inverse of normalized std), up to 1.5x
+        interference_factor = 1.0 + (1.0 - normalized_std) * 0.5
+
+        return np.clip(mean_score * interference_factor, 0.0, 1.0)
+
+    def interference_score(
+        self,
+        query_state: QueryState,
+        document: DocumentVector,
+        query_embedding: np.ndarray
+    ) -> float:
+        """
+        Calculate relevance of a single document using interference.
+
+        Args:
+            query_state: Query in superposition
+            document: Compressed document vector
+            query_embedding: One query vector, or one row per interpretation
+
+        Returns:
+            Interference-based relevance score
+        """
+        queries, inverse = _query_vectors(query_embedding, len(query_state.interpretations))
+        indices = np.fromiter(document.sparse_vector or {}, dtype=np.int64)
+        values = np.fromiter((document.sparse_vector or {}).values(), dtype=np.float32)
+        similarities = (queries[:, indices] @ values)[inverse]
+        return float(self.interference_scores(query_state, similarities[:, None])[0])
+
+    def score_matrix(
+        self,
+        query_state: QueryState,
+        matrix: "QuantizedSparseMatrix",
+        query_embedding: np.ndarray
+    ) -> np.ndarray:
+        """
+        Score every row of a compressed matrix against the query state.
+
+        Each distinct interpretation vector costs one pass over the matrix;
+        interpretations sharing a vector share the pass.
+        """
+        queries, inverse = _query_vectors(query_embedding, len(query_state.interpretations))
+        return self.interference_scores(query_state, matrix.scores(queries)[inverse])
+
+    def prior_scores(self, query_state: QueryState, n_documents: int) -> np.ndarray:
+        """
+        Content-independent scores used when no query embedding is available.
+
+        Every document gets the interference of the interpretation priors,
+        as if it matched each interpretation perfectly.
+        """
+        logger.warning("No query embedding; scoring by interpretation priors only")
+        similarities = np.ones((len(query_state.interpretations), n_documents), dtype=np.float32)
+        return self.interference_scores(query_state, similarities)
+
     def retrieve(
         self,
         query: str,
         documents: List[DocumentVector],
         top_k: int = 5,
-        context: Dict[str, Any] = None
+        context: Dict[str, Any] = None,
+        query_embedding: Optional[np.ndarray] = None
     ) -> List[Tuple[DocumentVector, float, Dict[str, Any]]]:
         """
         Quantum-inspired retrieval with ambiguity awareness.
-        
+
         Process:
         1. Create query superposition state
         2. Score documents using interference
         3. Return top-k with interpretation metadata
-        
+
+        Ad-hoc document lists are packed into a matrix per call; use
+        OptimizedRAG to keep the compressed matrix between queries.
+
         Args:
             query: Search query
             documents: Document corpus
             top_k: Number of results
             context: Optional context for disambiguation
-            
+            query_embedding: Query vector (or one row per interpretation);
+                without it documents are scored by interpretation priors
+                alone and keep their input order
+
         Returns:
             List of (document, score, interpretation) tuples
         """
+        if not documents:
+            return []
+
         # Create query state
         query_state = self.create_query_state(query, context)
-        
+
         logger.info(
             f"Query state created: {len(query_state.interpretations)} interpretations"
         )
-        
-        # Score all documents
-        scored_docs = []
-        for doc in documents:
-            score = self.interference_score(query_state, doc)
-            
-            # If context provided, collapse to specific interpretation
-            if context:
-                interpretation = query_state.collapse(context)
+
+        if query_embedding is None:
+            # Scores are all equal, so keep the input order
+            scores = self.prior_scores(query_state, len(documents))
+            rows = range(min(top_k, len(documents)))
+        else:
+            dim = np.atleast_2d(query_embedding).shape[1]
+            matrix = QuantizedSparseMatrix.from_documents(documents, dim)
+            scores = self.score_matrix(query_state, matrix, query_embedding)
+            rows = _top_k(scores, top_k)
+        interpretation = self.resolve_interpretation(query_state, context)
+
+        return [
+            (documents[i], float(scores[i]), interpretation)
+            for i in rows
+        ]
+
+    def resolve_interpretation(
+        self,
+        query_state: QueryState,
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Collapse with context, or take the most probable interpretation."""
+        if context:
+            return query_state.collapse(context)
+        max_idx = np.argmax(query_state.probabilities)
+        return query_state.interpretations[max_idx]
+
+
+def _interpretation_prior(interpretation: Dict[str, Any]) -> float:
+    """Confidence prior for an interpretation, by focus and specificity."""
+    focus = interpretation.get('focus', 'general')
+    specificity = interpretation.get('specificity', 'medium')
+
+    if focus == 'literal':
+        prior = 0.8  # High confidence for literal matches
+    elif focus == 'anaphoric':
+        prior = 0.6  # Medium confidence, needs context
+    elif focus == 'technical':
+        prior = 0.7  # Good for specific domains
+    elif focus == 'expansive':
+        prior = 0.5  # Lower precision, broader coverage
+    else:
+        prior = 0.6  # Default
+
+    # Modulate by specificity
+    if specificity == 'high':
+        prior *= 1.1
+    elif specificity == 'low':
+        prior *= 0.9
+
+    return prior
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize along the last axis (zero vectors stay zero)."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms > 0, norms, 1.0)
+
+
+def _query_vectors(
+    query_embedding: np.ndarray,
+    n_interpretations: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Normalized distinct query vectors plus, per interpretation, the row
+    that scores it.
+    """
+    queries = np.atleast_2d(np.asarray(query_embedding, dtype=np.float32))
+    if len(queries) == 1:
+        inverse = np.zeros(n_interpretations, dtype=np.intp)
+    elif len(queries) == n_interpretations:
+        queries, inverse = np.unique(queries, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+    else:
+        raise ValueError(
+            f"Expected 1 or {n_interpretations} query vectors, got {len(queries)}"
+        )
+    return _normalize(queries), inverse
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first."""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(scores):
+        candidates = np.argpartition(scores, -k)[-k:]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+
+class QuantizedSparseMatrix:
+    """
+    Contiguous, scalar-quantized store for quantum_compress output.
+
+    Each row keeps the top-k dimensions of a unit-normalized embedding as
+    int8 codes (the phase scaled to [-127, 127]) plus one float32 scale,
+    so a row costs about 3 * k + 4 bytes instead of 4 * dim. With the
+    default sparse_ratio=1.0 the index array is dropped and rows are plain
+    int8 quantized vectors scored with a matrix product.
+
+    Sparse rows lose most of the recall (about 0.2 recall@10 at 10% on
+    clustered corpora); only score them through a reranking caller.
+    """
+
+    # Rows scored per block; bounds the temporary gather buffer
+    CHUNK_ROWS = 16384
+
+    def __init__(self, dim: int, sparse_ratio: float = 1.0):
+        self.dim = dim
+        self.k = max(1, min(dim, int(dim * sparse_ratio)))
+        self.dense = self.k == dim
+        self._index_dtype = np.uint16 if dim <= np.iinfo(np.uint16).max + 1 else np.uint32
+        self._indices = None if self.dense else np.empty((0, self.k), dtype=self._index_dtype)
+        self._codes = np.empty((0, self.k), dtype=np.int8)
+        self._scales = np.empty(0, dtype=np.float32)
+        self._size = 0
+
+    @classmethod
+    def from_documents(
+        cls,
+        documents: List[DocumentVector],
+        dim: int
+    ) -> "QuantizedSparseMatrix":
+        """Pack DocumentVector sparse values into an int8 matrix."""
+        matrix = cls(dim, sparse_ratio=1.0)
+        dense = np.zeros((len(documents), dim), dtype=np.float32)
+        for row, doc in enumerate(documents):
+            if doc.sparse_vector:
+                dense[row, list(doc.sparse_vector)] = list(doc.sparse_vector.values())
+        matrix.add(dense)
+        return matrix
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the matrix buffers, including spare capacity."""
+        total = self._codes.nbytes + self._scales.nbytes
+        if self._indices is not None:
+            total += self._indices.nbytes
+        return total
+
+    def add(self, vectors: np.ndarray) -> range:
+        """
+        Compress and append embeddings.
+
+        Args:
+            vectors: (n, dim) or (dim,) embeddings
+
+        Returns:
+            Row numbers assigned to the new vectors
+        """
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        if vectors.shape[1] != self.dim:
+            raise ValueError(f"Expected {self.dim}d embeddings, got {vectors.shape[1]}d")
+        vectors = _normalize(vectors)
+
+        if self.dense:
+            indices, values = None, vectors
+        else:
+            indices = np.argpartition(np.abs(vectors), -self.k, axis=1)[:, -self.k:]
+            indices.sort(axis=1)  # Ascending indices keep the query gather cache-friendly
+            values = np.take_along_axis(vectors, indices, axis=1)
+
+        scales = np.abs(values).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        codes = np.rint(values / scales[:, None]).astype(np.int8)
+
+        start, stop = self._size, self._size + len(vectors)
+        self._reserve(stop)
+        self._codes[start:stop] = codes
+        self._scales[start:stop] = scales
+        if indices is not None:
+            self._indices[start:stop] = indices
+        self._size = stop
+        return range(start, stop)
+
+    def scores(self, queries: np.ndarray) -> np.ndarray:
+        """
+        Approximate dot products of unit query vectors with every row.
+
+        Args:
+            queries: (m, dim) or (dim,) query vectors
+
+        Returns:
+            (m, n_rows) float32 similarities
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        out = np.empty((len(queries), self._size), dtype=np.float32)
+
+        for start in range(0, self._size, self.CHUNK_ROWS):
+            stop = min(start + self.CHUNK_ROWS, self._size)
+            codes = self._codes[start:stop].astype(np.float32)
+            if self.dense:
+                block = queries @ codes.T
             else:
-                # Use most probable interpretation
-                max_idx = np.argmax(query_state.probabilities)
-                interpretation = query_state.interpretations[max_idx]
-            
-            scored_docs.append((doc, score, interpretation))
-        
-        # Sort by score
-        scored_docs.sort(key=lambda x: x[1], reverse=True)
-        
-        # Return top-k
-        return scored_docs[:top_k]
+                indices = self._indices[start:stop]
+                block = np.stack([
+                    np.einsum('ck,ck->c', query[indices], codes)
+                    for query in queries
+                ])
+            out[:, start:stop] = block * self._scales[start:stop]
+
+        return out
+
+    def _reserve(self, rows: int):
+        capacity = len(self._scales)
+        if rows <= capacity:
+            return
+        capacity = max(rows, capacity * 2)
+
+        codes = np.empty((capacity, self.k), dtype=np.int8)
+        codes[:self._size] = self._codes[:self._size]
+        self._codes = codes
+
+        scales = np.empty(capacity, dtype=np.float32)
+        scales[:self._size] = self._scales[:self._size]
+        self._scales = scales
+
+        if self._indices is not None:
+            indices = np.empty((capacity, self.k), dtype=self._index_dtype)
+            indices[:self._size] = self._indices[:self._size]
+            self._indices = indices
 
 
 class OptimizedRAG:
     """
     Optimized RAG (Retrieval-Augmented Generation) using quantum-inspired techniques.
-    
+
     Optimizations:
-    1. Compressed embeddings (384d instead of 1536d) → 75% memory reduction
-    2. Sparse representations → 90% storage reduction
-    3. Ambiguity-aware retrieval → Better relevance
-    4. Probabilistic scoring → Faster than dense comparisons
+    1. int8 scalar quantization in one contiguous matrix → 75% less memory
+       than float32, no per-document objects
+    2. Batched matrix scoring per distinct interpretation vector, top-k via argpartition
+    3. Optional sparse top-k dimensions (quantum_compress) as a fast first
+       pass, with the candidates reranked against the full vectors
+    4. Ambiguity-aware retrieval → Better relevance
     """
-    
-    def __init__(self, embedding_dim: int = 384):
-        self.retrieval = QuantumInspiredRetrieval(embedding_dim=embedding_dim)
-        self.documents = []
-        
+
+    def __init__(
+        self,
+        embedding_dim: int = 384,
+        sparse_ratio: float = 1.0,
+        embed_fn: Optional[Callable[[List[str]], Sequence[Sequence[float]]]] = None,
+        rerank_factor: int = 100
+    ):
+        """
+        Args:
+            embedding_dim: Expected embedding dimension (the matrix adopts the
+                dimension of the first embeddings added)
+            sparse_ratio: Fraction of dimensions kept per document; the
+                default 1.0 keeps full int8 vectors
+            embed_fn: Optional batch embedder used to embed interpretation
+                texts when query() is called without query_embedding
+            rerank_factor: With sparse_ratio < 1.0, the sparse matrix picks
+                top_k * rerank_factor candidates that are rescored exactly
+                against float32 copies of the embeddings
+        """
+        self.retrieval = QuantumInspiredRetrieval(
+            embedding_dim=embedding_dim,
+            sparse_ratio=sparse_ratio
+        )
+        self.embed_fn = embed_fn
+        self.rerank_factor = max(1, rerank_factor)
+        self.matrix: Optional[QuantizedSparseMatrix] = None
+        self.vectors: Optional[np.ndarray] = None  # Rerank copies, sparse mode only
+        self.texts: List[str] = []
+
         logger.info(f"Optimized RAG initialized with {embedding_dim}d embeddings")
-    
-    def add_document(self, text: str, embedding: np.ndarray):
-        """Add document to corpus"""
-        compressed = self.retrieval.quantum_compress(embedding)
-        compressed.metadata = {'text': text}
-        self.documents.append(compressed)
-    
+
+    def add_document(self, text: str, embedding: np.ndarray) -> str:
+        """Add document to corpus; returns its id"""
+        return self.add_documents([text], np.atleast_2d(embedding))[0]
+
+    def add_documents(self, texts: List[str], embeddings: np.ndarray) -> List[str]:
+        """Add documents in one batch; returns their ids"""
+        embeddings = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+        if len(texts) != len(embeddings):
+            raise ValueError(f"Got {len(texts)} texts for {len(embeddings)} embeddings")
+        if self.matrix is None:
+            self.matrix = QuantizedSparseMatrix(
+                embeddings.shape[1],
+                sparse_ratio=self.retrieval.sparse_ratio
+            )
+        rows = self.matrix.add(embeddings)
+        if not self.matrix.dense:
+            self._store_vectors(rows, embeddings)
+        self.texts.extend(texts)
+        return [f"doc_{row}" for row in rows]
+
+    def _store_vectors(self, rows: range, embeddings: np.ndarray):
+        if self.vectors is None:
+            self.vectors = np.empty((0, self.matrix.dim), dtype=np.float32)
+        if rows.stop > len(self.vectors):
+            grown = np.empty((max(rows.stop, 2 * len(self.vectors)), self.matrix.dim), dtype=np.float32)
+            grown[:rows.start] = self.vectors[:rows.start]
+            self.vectors = grown
+        self.vectors[rows.start:rows.stop] = _normalize(embeddings)
+
     def query(
         self,
         query: str,
         top_k: int = 5,
-        context: Dict[str, Any] = None
+        context: Dict[str, Any] = None,
+        query_embedding: Optional[np.ndarray] = None
     ) -> List[Dict[str, Any]]:
         """
         Query the RAG system.
-        
+
+        Args:
+            query: Query text
+            top_k: Number of results
+            context: Optional context for disambiguation
+            query_embedding: Query vector, or one row per interpretation;
+                computed with embed_fn when omitted. Without either,
+                documents are scored by interpretation priors alone.
+
         Returns:
             List of results with text, score, and interpretation
         """
-        results = self.retrieval.retrieve(query, self.documents, top_k, context)
-        
+        if self.matrix is None or len(self.matrix) == 0:
+            return []
+
+        query_state = self.retrieval.create_query_state(query, context)
+        if query_embedding is None and self.embed_fn is not None:
+            query_embedding = self._embed_interpretations(query_state)
+
+        if query_embedding is None:
+            scores = self.retrieval.prior_scores(query_state, len(self.matrix))
+            rows = np.arange(min(top_k, len(self.matrix)))
+        elif self.matrix.dense:
+            scores = self.retrieval.score_matrix(query_state, self.matrix, query_embedding)
+            rows = _top_k(scores, top_k)
+        else:
+            scores, rows = self._rerank(query_state, query_embedding, top_k)
+        interpretation = self.retrieval.resolve_interpretation(query_state, context)
+
         return [
             {
-                'text': doc.metadata.get('text', ''),
-                'score': score,
-                'interpretation': interp,
-                'id': doc.id
+                'text': self.texts[row],
+                'score': float(score),
+                'interpretation': interpretation,
+                'id': f"doc_{row}"
             }
-            for doc, score, interp in results
+            for row, score in zip(rows, scores[rows])
         ]
-    
+
+    def _rerank(
+        self,
+        query_state: QueryState,
+        query_embedding: np.ndarray,
+        top_k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Sparse first pass, then exact scores for the best candidates."""
+        scores = self.retrieval.score_matrix(query_state, self.matrix, query_embedding)
+        candidates = _top_k(scores, top_k * self.rerank_factor)
+
+        queries, inverse = _query_vectors(query_embedding, len(query_state.interpretations))
+        similarities = (queries @ self.vectors[candidates].T)[inverse]
+        scores[candidates] = self.retrieval.interference_scores(query_state, similarities)
+        return scores, candidates[_top_k(scores[candidates], top_k)]
+
+    def _embed_interpretations(self, query_state: QueryState) -> np.ndarray:
+        texts = [interpretation['text'] for interpretation in query_state.interpretations]
+        unique = list(dict.fromkeys(texts))
+        vectors = np.asarray(self.embed_fn(unique), dtype=np.float32)
+        return vectors[[unique.index(text) for text in texts]]
+
     def get_stats(self) -> Dict[str, Any]:
         """Get system statistics"""
-        total_docs = len(self.documents)
-        
-        # Calculate average sparsity
-        avg_sparse_size = np.mean([
-            len(doc.sparse_vector) if doc.sparse_vector else 0
-            for doc in self.documents
-        ])
-        
+        total_docs = len(self.texts)
+        if not total_docs:
+            return {
+                'total_documents': 0,
+                'embedding_dim': self.retrieval.embedding_dim,
+                'avg_sparse_dimensions': 0,
+                'sparsity': 0,
+                'matrix_bytes': 0,
+                'rerank_bytes': 0,
+                'memory_savings': "N/A"
+            }
+
+        dense_bytes = total_docs * self.matrix.dim * 4
+        rerank_bytes = self.vectors.nbytes if self.vectors is not None else 0
+        total_bytes = self.matrix.nbytes + rerank_bytes
         return {
             'total_documents': total_docs,
-            'embedding_dim': self.retrieval.embedding_dim,
-            'avg_sparse_dimensions': avg_sparse_size,
-            'sparsity': 1 - (avg_sparse_size / self.retrieval.embedding_dim) if total_docs > 0 else 0,
-            'memory_savings': f"{(1 - avg_sparse_size / 1536) * 100:.1f}%" if total_docs > 0 else "N/A"
+            'embedding_dim': self.matrix.dim,
+            'avg_sparse_dimensions': self.matrix.k,
+            'sparsity': 1 - self.matrix.k / self.matrix.dim,
+            'matrix_bytes': self.matrix.nbytes,
+            'rerank_bytes': rerank_bytes,
+            'memory_savings': f"{(1 - total_bytes / dense_bytes) * 100:.1f}% vs dense float32"
         }
 
 
@@ -539,10 +873,8 @@ if __name__ == "__main__":
     
     # Simulate adding documents
     print("Adding sample documents...")
-    for i in range(5):
-        # Simulated embedding
-        embedding = np.random.randn(1536)  # Standard dimension
-        rag.add_document(f"Sample document {i}", embedding)
+    embeddings = np.random.randn(5, 1536).astype(np.float32)  # Standard dimension
+    rag.add_documents([f"Sample document {i}" for i in range(5)], embeddings)
     
     stats = rag.get_stats()
     print(f"\nSystem Statistics:")
@@ -552,6 +884,12 @@ if __name__ == "__main__":
     print(f"  Sparsity: {stats['sparsity']:.1%}")
     print(f"  Memory savings: {stats['memory_savings']}")
     print()
+
+    # Query with a noisy copy of document 3's embedding
+    query_embedding = embeddings[3] + 0.1 * np.random.randn(1536).astype(np.float32)
+    top = rag.query("Sample document", top_k=1, query_embedding=query_embedding)[0]
+    print(f"Top match: {top['text']} (score {top['score']:.3f})")
+    print()
     
     # Example query
     print("Example query with ambiguity detection:")
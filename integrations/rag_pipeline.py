@@ -7,17 +7,20 @@ Features:
 - Cross-encoder re-ranking
 - Query expansion with LLM
 - Hybrid scoring
-- Result deduplication
+- MinHash/LSH result deduplication
 - Context windowing
 
 Use with Librarian, Obsidian, and Knowledge agents for improved retrieval.
 """
 
 import hashlib
+import json
 import logging
+import os
 import re
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -36,7 +39,21 @@ try:
     BM25_AVAILABLE = True
 except ImportError:
     BM25_AVAILABLE = False
-    logger.warning("rank_bm25 not available. Install: pip install rank-bm25")
+
+from integrations.bm25_index import (
+    SPARSE_BM25_AVAILABLE,
+    SparseBM25Index,
+    content_hash,
+    tokenize,
+)
+from integrations.minhash_dedup import NearDuplicateFilter
+
+if SPARSE_BM25_AVAILABLE:
+    import numpy as np
+elif not BM25_AVAILABLE:
+    logger.warning(
+        "No BM25 backend available. Install: pip install numpy scipy (or rank-bm25)"
+    )
 
 
 @dataclass
@@ -52,6 +69,9 @@ class RAGConfig:
     bm25_weight: float = 0.2
     rerank_weight: float = 0.2
 
+    # BM25 index persisted between runs (None keeps it in memory only)
+    bm25_index_path: Optional[str] = None
+
     # Re-ranking
     rerank_model: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
     use_reranking: bool = True
@@ -61,7 +81,7 @@ class RAGConfig:
     expansion_model: str = None  # LLM model for expansion
 
     # Deduplication
-    dedupe_threshold: float = 0.9  # Similarity threshold for dedup
+    dedupe_threshold: float = 0.9  # Estimated shingle Jaccard threshold for dedup
 
     # Context
     context_window: int = 3  # Sentences around match
@@ -82,49 +102,176 @@ class RetrievalResult:
     source: str = ""
 
 
+def _document_id(doc: Dict[str, Any]) -> str:
+    """Stable id for a document without an explicit one."""
+    return doc.get("id") or hashlib.md5(doc.get("content", "").encode()).hexdigest()[:12]
+
+
 class BM25Retriever:
-    """BM25 keyword-based retriever"""
+    """
+    BM25 keyword-based retriever.
+
+    Uses SparseBM25Index (NumPy/SciPy) when available, which supports
+    incremental updates, batched multi-query scoring and persistence.
+    Falls back to rank_bm25, rebuilding its index lazily after changes.
+
+    The content and metadata of indexed documents are kept in `documents`
+    and persisted next to the index, so hits can be returned after a
+    restart without re-indexing.
+    """
 
-    def __init__(self):
+    def __init__(self, index_path: Optional[str] = None):
+        self.index_path = Path(index_path) if index_path else None
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._sparse: Optional[SparseBM25Index] = None
+        if SPARSE_BM25_AVAILABLE:
+            self._sparse = self._load_index() or SparseBM25Index()
+            if len(self._sparse):
+                self.documents = self._load_documents()
+
+        # rank_bm25 fallback state
         self._index = None
-        self._documents = []
-        self._doc_ids = []
+        self._tokenized: Dict[str, List[str]] = {}
 
-    def index(self, documents: List[Dict[str, Any]]) -> None:
-        """Index documents for BM25 search"""
-        if not BM25_AVAILABLE:
-            return
+    @property
+    def available(self) -> bool:
+        return SPARSE_BM25_AVAILABLE or BM25_AVAILABLE
 
-        self._documents = documents
-        self._doc_ids = [d.get("id", str(i)) for i, d in enumerate(documents)]
+    def __len__(self) -> int:
+        return len(self._sparse) if self._sparse is not None else len(self._tokenized)
 
-        # Tokenize documents
-        tokenized = [self._tokenize(d.get("content", "")) for d in documents]
-        self._index = BM25Okapi(tokenized)
+    def _load_index(self) -> Optional[SparseBM25Index]:
+        if not (self.index_path and self.index_path.exists()):
+            return None
+        try:
+            index = SparseBM25Index.load(self.index_path)
+            logger.info(f"Loaded BM25 index with {len(index)} documents from {self.index_path}")
+            return index
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable BM25 index {self.index_path}: {e}")
+            return None
+
+    @property
+    def documents_path(self) -> Optional[Path]:
+        """Document store written next to the index (bm25.npz -> bm25.docs.json)"""
+        if not self.index_path:
+            return None
+        return self.index_path.with_name(self.index_path.stem + ".docs.json")
+
+    def _load_documents(self) -> Dict[str, Dict[str, Any]]:
+        path = self.documents_path
+        if not (path and path.exists()):
+            return {}
+        try:
+            with open(path) as f:
+                documents = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable BM25 document store {path}: {e}")
+            return {}
+        return {doc_id: doc for doc_id, doc in documents.items() if doc_id in self._sparse}
 
-        logger.info(f"Indexed {len(documents)} documents for BM25")
+    def index(self, documents: List[Dict[str, Any]]) -> None:
+        """Replace the indexed corpus with documents"""
+        if self._sparse is not None:
+            self._sparse = SparseBM25Index()
+        self._tokenized.clear()
+        self._index = None
+        self.documents = {}
+        self._dirty = True
+        self.add(documents)
 
-    def search(self, query: str, k: int = 10) -> List[Tuple[str, float]]:
-        """Search with BM25"""
-        if not self._index or not BM25_AVAILABLE:
-            return []
+    def add(self, documents: Iterable[Dict[str, Any]]) -> int:
+        """
+        Add or update documents. Unchanged documents (same id and content)
+        are skipped without re-tokenizing.
 
-        tokens = self._tokenize(query)
-        scores = self._index.get_scores(tokens)
+        Returns:
+            Number of documents (re)indexed
+        """
+        if not self.available:
+            return 0
 
-        # Get top-k
-        top_indices = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[
-            :k
-        ]
+        changed = 0
+        for doc in documents:
+            doc_id = _document_id(doc)
+            content = doc.get("content", "")
+            payload = {"content": content, "metadata": doc.get("metadata", {})}
+            if self.documents.get(doc_id) != payload:
+                self.documents[doc_id] = payload
+                self._dirty = True
+            if self._sparse is not None:
+                digest = content_hash(content)
+                if self._sparse.has(doc_id, digest):
+                    continue
+                self._sparse.add(doc_id, tokenize(content), digest)
+            else:
+                self._tokenized[doc_id] = tokenize(content)
+                self._index = None
+            changed += 1
+            self._dirty = True
+
+        if changed:
+            logger.info(f"Indexed {changed} documents for BM25 ({len(self)} total)")
+        return changed
+
+    def remove(self, doc_ids: Iterable[str]) -> int:
+        """Remove documents from the index"""
+        doc_ids = list(doc_ids)
+        for doc_id in doc_ids:
+            self.documents.pop(doc_id, None)
+        if self._sparse is not None:
+            removed = self._sparse.remove(doc_ids)
+        else:
+            removed = sum(
+                1 for doc_id in doc_ids if self._tokenized.pop(doc_id, None) is not None
+            )
+            if removed:
+                self._index = None
+        if removed:
+            self._dirty = True
+        return removed
+
+    def save(self) -> None:
+        """Persist the sparse index and document store if anything changed"""
+        if not (self._dirty and self._sparse is not None and self.index_path):
+            return
+        self._sparse.save(self.index_path)
 
-        return [(self._doc_ids[i], scores[i]) for i in top_indices]
+        path = self.documents_path
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.documents, f, default=str)
+        os.replace(tmp_path, path)
+        self._dirty = False
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[str, float]]:
+        """Search with BM25"""
+        return self.search_many([query], k)[0]
+
+    def search_many(self, queries: List[str], k: int = 10) -> List[List[Tuple[str, float]]]:
+        """Search several queries at once; one result list per query"""
+        tokenized = [tokenize(q) for q in queries]
+        if self._sparse is not None:
+            return self._sparse.search_many(tokenized, k)
+
+        if not (BM25_AVAILABLE and self._tokenized):
+            return [[] for _ in queries]
+        if self._index is None:
+            self._doc_ids = list(self._tokenized)
+            self._index = BM25Okapi(list(self._tokenized.values()))
+
+        results = []
+        for tokens in tokenized:
+            scores = self._index.get_scores(tokens)
+            top = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:k]
+            results.append([(self._doc_ids[i], scores[i]) for i in top if scores[i] > 0])
+        return results
 
     @staticmethod
     def _tokenize(text: str) -> List[str]:
         """Simple tokenization"""
-        # Lowercase and split on non-alphanumeric
-        tokens = re.findall(r"\b\w+\b", text.lower())
-        return tokens
+        return tokenize(text)
 
 
 class CrossEncoderReranker:
@@ -237,7 +384,7 @@ class EnhancedRAGPipeline:
         self.search_fn = search_fn  # Semantic search function
 
         # Components
-        self.bm25 = BM25Retriever()
+        self.bm25 = BM25Retriever(self.config.bm25_index_path)
         self.reranker = (
             CrossEncoderReranker(self.config.rerank_model)
             if self.config.use_reranking
@@ -247,18 +394,37 @@ class EnhancedRAGPipeline:
             QueryExpander(llm_fn) if self.config.use_query_expansion else None
         )
 
-        # Document store for BM25
-        self._documents: Dict[str, Dict] = {}
+    @property
+    def _documents(self) -> Dict[str, Dict[str, Any]]:
+        """Document store for BM25 hits (restored with a persisted index)"""
+        return self.bm25.documents
 
-    def index_documents(self, documents: List[Dict[str, Any]]) -> None:
-        """Index documents for BM25 search"""
-        for doc in documents:
-            doc_id = doc.get(
-                "id", hashlib.md5(doc.get("content", "").encode()).hexdigest()[:12]
-            )
-            self._documents[doc_id] = doc
+    def index_documents(self, documents: List[Dict[str, Any]], persist: bool = True) -> None:
+        """
+        Index documents for BM25 search.
+
+        Documents are upserted: previously indexed documents are kept, and
+        unchanged ones are not re-tokenized (including those restored from
+        a persisted index).
+
+        Persisting rewrites the whole index and document store, so send
+        large batches, or pass persist=False for each batch and call
+        save() once at the end.
+        """
+        self.bm25.add(documents)
+        if persist:
+            self.save()
 
-        self.bm25.index(documents)
+    def remove_documents(self, doc_ids: List[str], persist: bool = True) -> int:
+        """Remove documents from the BM25 index and document store"""
+        removed = self.bm25.remove(doc_ids)
+        if persist:
+            self.save()
+        return removed
+
+    def save(self) -> None:
+        """Persist the BM25 index and document store (no-op if unchanged)"""
+        self.bm25.save()
 
     def retrieve(
         self,
@@ -334,12 +500,11 @@ class EnhancedRAGPipeline:
     def _bm25_search(self, queries: List[str], initial_k: int) -> Dict[str, float]:
         """Stage 3: Execute BM25 search if available."""
         bm25_scores: Dict[str, float] = {}
-        if BM25_AVAILABLE and self._documents:
-            for q in queries:
-                for doc_id, score in self.bm25.search(q, initial_k):
-                    if doc_id in bm25_scores:
-                        bm25_scores[doc_id] = max(bm25_scores[doc_id], score)
-                    else:
+        if self.bm25.available and len(self.bm25):
+            # All expanded queries are scored in one batch
+            for hits in self.bm25.search_many(queries, initial_k):
+                for doc_id, score in hits:
+                    if score > bm25_scores.get(doc_id, float("-inf")):
                         bm25_scores[doc_id] = score
         return bm25_scores
 
@@ -350,41 +515,73 @@ class EnhancedRAGPipeline:
         initial_k: int,
     ) -> List[RetrievalResult]:
         """Stage 4: Combine semantic and BM25 scores."""
-        results_map: Dict[str, RetrievalResult] = {}
-
-        # Add semantic results
+        # Best semantic hit per id, then the union with BM25 hits
+        semantic_best: Dict[str, RetrievalResult] = {}
         for r in semantic_results:
-            if r.id not in results_map:
-                results_map[r.id] = r
-            else:
-                if r.semantic_score > results_map[r.id].semantic_score:
-                    results_map[r.id].semantic_score = r.semantic_score
-
-        # Add BM25 scores
-        for doc_id, score in bm25_scores.items():
-            if doc_id in results_map:
-                results_map[doc_id].bm25_score = score
-            elif doc_id in self._documents:
+            best = semantic_best.get(r.id)
+            if best is None:
+                semantic_best[r.id] = r
+            elif r.semantic_score > best.semantic_score:
+                best.semantic_score = r.semantic_score
+
+        ids = list(semantic_best)
+        ids.extend(
+            doc_id
+            for doc_id in bm25_scores
+            if doc_id not in semantic_best and doc_id in self._documents
+        )
+        if not ids:
+            return []
+
+        semantic = [semantic_best[i].semantic_score if i in semantic_best else 0.0 for i in ids]
+        bm25 = [bm25_scores.get(i, 0.0) for i in ids]
+        top = self._top_hybrid(semantic, bm25, initial_k)
+
+        # Only materialize results that survive the cut
+        results = []
+        for idx, score in top:
+            doc_id = ids[idx]
+            result = semantic_best.get(doc_id)
+            if result is None:
                 doc = self._documents[doc_id]
-                results_map[doc_id] = RetrievalResult(
+                result = RetrievalResult(
                     id=doc_id,
                     content=doc.get("content", ""),
                     metadata=doc.get("metadata", {}),
-                    bm25_score=score,
                     source="bm25",
                 )
-
-        # Calculate hybrid scores
-        results = list(results_map.values())
-        max_semantic = max((r.semantic_score for r in results), default=1) or 1
-        max_bm25 = max((r.bm25_score for r in results), default=1) or 1
-
-        for r in results:
-            r.score = self.config.semantic_weight * (
-                r.semantic_score / max_semantic
-            ) + self.config.bm25_weight * (r.bm25_score / max_bm25)
-
-        return sorted(results, key=lambda x: x.score, reverse=True)[:initial_k]
+            result.bm25_score = bm25[idx]
+            result.score = score
+            results.append(result)
+        return results
+
+    def _top_hybrid(
+        self, semantic: List[float], bm25: List[float], k: int
+    ) -> List[Tuple[int, float]]:
+        """Weighted, max-normalized hybrid scores; top-k (index, score) pairs."""
+        if k <= 0:
+            return []
+        if SPARSE_BM25_AVAILABLE:
+            sem = np.asarray(semantic, dtype=np.float64)
+            kw = np.asarray(bm25, dtype=np.float64)
+            scores = self.config.semantic_weight * (sem / (sem.max() or 1)) + (
+                self.config.bm25_weight * (kw / (kw.max() or 1))
+            )
+            if k < len(scores):
+                top = np.argpartition(-scores, k - 1)[:k]
+            else:
+                top = np.arange(len(scores))
+            top = top[np.argsort(-scores[top], kind="stable")]
+            return [(int(i), float(scores[i])) for i in top]
+
+        max_semantic = max(semantic) or 1
+        max_bm25 = max(bm25) or 1
+        scores = [
+            self.config.semantic_weight * (s / max_semantic)
+            + self.config.bm25_weight * (b / max_bm25)
+            for s, b in zip(semantic, bm25)
+        ]
+        return sorted(enumerate(scores), key=lambda x: x[1], reverse=True)[:k]
 
     def _apply_reranking(
         self, query: str, results: List[RetrievalResult]
@@ -407,28 +604,18 @@ class EnhancedRAGPipeline:
         return sorted(results, key=lambda x: x.score, reverse=True)
 
     def _deduplicate(self, results: List[RetrievalResult]) -> List[RetrievalResult]:
-        """Remove near-duplicate results"""
+        """
+        Remove near-duplicate results.
+
+        Uses MinHash signatures (precomputed in chunk metadata at ingest
+        time when available) with LSH candidate lookup, so only likely
+        duplicates are compared.
+        """
         if not results:
             return results
 
-        unique = [results[0]]
-
-        for r in results[1:]:
-            is_dup = False
-            for u in unique:
-                # Simple overlap check
-                r_words = set(r.content.lower().split())
-                u_words = set(u.content.lower().split())
-                overlap = len(r_words & u_words) / max(len(r_words | u_words), 1)
-
-                if overlap > self.config.dedupe_threshold:
-                    is_dup = True
-                    break
-
-            if not is_dup:
-                unique.append(r)
-
-        return unique
+        dedupe = NearDuplicateFilter(threshold=self.config.dedupe_threshold)
+        return dedupe.filter(results, lambda r: r.content, lambda r: r.metadata)
 
     def _extract_context(self, content: str, query: str) -> str:
         """Extract relevant context around query matches"""
@@ -550,7 +737,8 @@ def main():
     else:
         print("Enhanced RAG Pipeline")
         print("=" * 40)
-        print(f"BM25 available: {BM25_AVAILABLE}")
+        print(f"BM25 available: {SPARSE_BM25_AVAILABLE or BM25_AVAILABLE}")
+        print(f"Sparse BM25 engine: {SPARSE_BM25_AVAILABLE}")
         print(f"Cross-encoder available: {CROSS_ENCODER_AVAILABLE}")
         print()
         print("Usage: python rag_pipeline.py --query 'your search query'")
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark the compressed OptimizedRAG matrix against dense float32 search.
+
+Builds a clustered synthetic corpus (embeddings are rarely isotropic) and
+compares, for each sparse_ratio, recall@k of the int8 QuantizedSparseMatrix
+against exact dense float32 cosine search, plus memory and query latency.
+Sparse ratios are also measured with OptimizedRAG's exact rerank of
+k * rerank_factor candidates.
+
+Usage:
+    python scripts/benchmarks/bench_quantum_retrieval.py --sizes 10000 100000 1000000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from integrations.quantum_retrieval import QuantizedSparseMatrix, _normalize, _top_k
+
+BUILD_CHUNK = 50000
+
+
+def make_corpus(n: int, dim: int, clusters: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    corpus = np.empty((n, dim), dtype=np.float32)
+    for start in range(0, n, BUILD_CHUNK):
+        stop = min(start + BUILD_CHUNK, n)
+        labels = rng.integers(0, clusters, stop - start)
+        noise = rng.standard_normal((stop - start, dim), dtype=np.float32)
+        corpus[start:stop] = _normalize(centers[labels] + noise)
+    return corpus
+
+
+def make_queries(corpus: np.ndarray, count: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed + 1)
+    picks = rng.integers(0, len(corpus), count)
+    noise = 0.5 * rng.standard_normal((count, corpus.shape[1]), dtype=np.float32)
+    return _normalize(corpus[picks] + noise / np.sqrt(corpus.shape[1]))
+
+
+def dense_top_k(corpus: np.ndarray, queries: np.ndarray, k: int):
+    start = time.perf_counter()
+    results = [_top_k(corpus @ query, k) for query in queries]
+    return results, (time.perf_counter() - start) / len(queries)
+
+
+def recall_at_k(found, truth, k: int) -> float:
+    return float(np.mean([
+        len(set(hit.tolist()) & set(exact.tolist())) / k
+        for hit, exact in zip(found, truth)
+    ]))
+
+
+def bench_size(n: int, dim: int, k: int, ratios, query_count: int, seed: int, rerank_factor: int):
+    corpus = make_corpus(n, dim, clusters=max(16, n // 1000), seed=seed)
+    queries = make_queries(corpus, query_count, seed)
+    truth, dense_ms = dense_top_k(corpus, queries, k)
+
+    rows = [("dense float32", corpus.nbytes, dense_ms * 1000, 1.0)]
+    for ratio in ratios:
+        matrix = QuantizedSparseMatrix(dim, sparse_ratio=ratio)
+        for start in range(0, n, BUILD_CHUNK):
+            matrix.add(corpus[start:start + BUILD_CHUNK])
+
+        start = time.perf_counter()
+        found = [_top_k(matrix.scores(query)[0], k) for query in queries]
+        query_ms = (time.perf_counter() - start) / len(queries) * 1000
+
+        label = "int8 dense" if matrix.dense else f"int8 top {ratio:.0%}"
+        rows.append((label, matrix.nbytes, query_ms, recall_at_k(found, truth, k)))
+
+        if not matrix.dense:
+            start = time.perf_counter()
+            found = []
+            for query in queries:
+                candidates = _top_k(matrix.scores(query)[0], k * rerank_factor)
+                found.append(candidates[_top_k(corpus[candidates] @ query, k)])
+            query_ms = (time.perf_counter() - start) / len(queries) * 1000
+            rows.append((
+                f"{label} +rerank", matrix.nbytes + corpus.nbytes, query_ms,
+                recall_at_k(found, truth, k)
+            ))
+        del matrix
+
+    print(f"\n{n:,} documents x {dim}d, recall@{k} over {query_count} queries")
+    print(f"{'store':<24}{'memory MB':>12}{'query ms':>11}{'recall':>9}")
+    for label, nbytes, query_ms, recall in rows:
+        print(f"{label:<24}{nbytes / 1e6:>12.1f}{query_ms:>11.2f}{recall:>9.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--ratios", type=float, nargs="+", default=[0.1, 0.25, 1.0])
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--rerank-factor", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    for n in args.sizes:
+        bench_size(n, args.dim, args.k, args.ratios, args.queries, args.seed, args.rerank_factor)
+
+
+if __name__ == "__main__":
+    main()
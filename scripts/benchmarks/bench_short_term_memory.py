@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark ShortTermMemory SQLite throughput.
+
+Compares the legacy access pattern (a fresh sqlite3.connect with default
+journaling per operation) against the pooled WAL connection layer and the
+store_many bulk API.
+
+Usage:
+    python scripts/benchmarks/bench_short_term_memory.py --items 2000
+"""
+
+import argparse
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from integrations.memory.hybrid_memory import MemoryItem, MemoryTier, ShortTermMemory
+
+
+def make_items(count: int, prefix: str):
+    now = time.time()
+    return [
+        MemoryItem(
+            id=f"{prefix}-{i}",
+            content=f"benchmark memory {i} about topic {i % 50}",
+            tier=MemoryTier.SHORT_TERM,
+            created_at=now,
+            accessed_at=now,
+            source="benchmark",
+            domain="bench",
+        )
+        for i in range(count)
+    ]
+
+
+def ops_per_sec(count: int, seconds: float) -> float:
+    return count / seconds if seconds > 0 else float("inf")
+
+
+def bench_legacy(db_path: Path, items) -> dict:
+    """Replay the pre-pooling pattern: one connection per operation."""
+    stm = ShortTermMemory(str(db_path))
+    stm.conn.execute("PRAGMA journal_mode=DELETE")
+    stm.close()
+
+    results = {}
+    start = time.perf_counter()
+    for item in items:
+        memory_row, fts_row = ShortTermMemory._item_rows(item)
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(ShortTermMemory._INSERT_MEMORY, memory_row)
+            conn.execute(ShortTermMemory._INSERT_FTS, fts_row)
+            conn.commit()
+    results["store"] = ops_per_sec(len(items), time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for item in items:
+        with sqlite3.connect(db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            conn.execute("SELECT * FROM memories WHERE id = ?", (item.id,)).fetchone()
+            conn.execute(
+                "UPDATE memories SET accessed_at = ?, access_count = access_count + 1 "
+                "WHERE id = ?",
+                (time.time(), item.id),
+            )
+            conn.commit()
+    results["retrieve"] = ops_per_sec(len(items), time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for i in range(len(items)):
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "SELECT m.* FROM memories m JOIN memories_fts fts ON m.id = fts.id "
+                "WHERE memories_fts MATCH ? ORDER BY rank LIMIT 10",
+                (f'"topic {i % 50}"',),
+            ).fetchall()
+    results["search"] = ops_per_sec(len(items), time.perf_counter() - start)
+    return results
+
+
+def bench_pooled(db_path: Path, items, bulk_items) -> dict:
+    stm = ShortTermMemory(str(db_path))
+    results = {}
+
+    start = time.perf_counter()
+    for item in items:
+        stm.store(item)
+    results["store"] = ops_per_sec(len(items), time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for item in items:
+        stm.retrieve(item.id)
+    results["retrieve"] = ops_per_sec(len(items), time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for i in range(len(items)):
+        stm.search(f"topic {i % 50}", limit=10)
+    results["search"] = ops_per_sec(len(items), time.perf_counter() - start)
+
+    start = time.perf_counter()
+    stm.store_many(bulk_items)
+    results["store_many"] = ops_per_sec(len(bulk_items), time.perf_counter() - start)
+
+    stm.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--items", type=int, default=2000, help="Operations per phase")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = bench_legacy(Path(tmp) / "legacy.db", make_items(args.items, "legacy"))
+        pooled = bench_pooled(
+            Path(tmp) / "pooled.db",
+            make_items(args.items, "pooled"),
+            make_items(args.items, "bulk"),
+        )
+
+    print(f"{'operation':<12} {'legacy ops/s':>14} {'pooled ops/s':>14} {'speedup':>9}")
+    for op in ("store", "retrieve", "search"):
+        print(
+            f"{op:<12} {legacy[op]:>14,.0f} {pooled[op]:>14,.0f} "
+            f"{pooled[op] / legacy[op]:>8.1f}x"
+        )
+    print(
+        f"{'store_many':<12} {'-':>14} {pooled['store_many']:>14,.0f} "
+        f"{pooled['store_many'] / legacy['store']:>8.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
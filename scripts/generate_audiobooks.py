@@ -6,7 +6,11 @@ Converts EPUB/PDF to 64kbps M4B audiobooks using Kokoro TTS
 Features:
 - Extracts text from EPUB/PDF
 - Splits into chapters
-- Generates speech with Kokoro TTS (54 voices)
+- Generates speech with Kokoro TTS (54 voices), chunks synthesized across
+  a process pool on CPU
+- Per-chunk audio cache keyed on (text, voice, speed), so interrupted or
+  re-run books resume without re-synthesizing
+- Audio streamed to disk chunk by chunk; chapter markers from sample counts
 - Combines into M4B with chapter markers
 - Targets 64kbps AAC for small file size
 """
@@ -17,10 +21,12 @@ import os
 import re
 import subprocess
 import tempfile
+import wave
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # Text extraction
 try:
@@ -43,13 +49,12 @@ except ImportError:
 
 # TTS
 try:
-    import soundfile as sf
     import torch
 
     HAS_TORCH = True
 except ImportError:
     HAS_TORCH = False
-    print("⚠️ torch/soundfile not installed - TTS disabled")
+    print("⚠️ torch not installed - TTS disabled")
 
 
 @dataclass
@@ -60,6 +65,7 @@ class Chapter:
     title: str
     text: str
     audio_path: Optional[Path] = None
+    samples: int = 0  # Length of the synthesized audio
 
 
 @dataclass
@@ -71,6 +77,10 @@ class AudiobookConfig:
     bitrate: str = "64k"
     sample_rate: int = 24000
     output_format: str = "m4b"
+    workers: Optional[int] = None  # Synthesis processes on CPU (default: up to 4)
+    chunk_chars: int = 1000
+    cache_dir: Optional[Path] = None  # Default: ~/.cache/osmen/audiobook_chunks
+    max_chapter_chars: Optional[int] = None  # None synthesizes whole chapters
 
 
 class TextExtractor:
@@ -173,8 +183,11 @@ class KokoroTTS:
         "bm_george": "British Male - George (classic)",
     }
 
-    def __init__(self, voice: str = "af_heart", device: str = None):
+    SAMPLE_RATE = 24000
+
+    def __init__(self, voice: str = "af_heart", device: str = None, speed: float = 1.0):
         self.voice = voice
+        self.speed = speed
         self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
         self.model = None
         self._loaded = False
@@ -195,39 +208,49 @@ class KokoroTTS:
             self.model = None
 
     def synthesize(self, text: str, output_path: Path) -> bool:
-        """Synthesize text to audio file."""
+        """Synthesize text to a WAV file, writing each chunk as it is generated."""
         self._load_model()
 
         if not self.model:
             print("❌ TTS model not available")
             return False
 
-        try:
-            # Split long text into chunks (Kokoro has limits)
-            chunks = self._split_text(text, max_chars=1000)
-            audio_segments = []
+        # Split long text into chunks (Kokoro has limits)
+        with open_wav(output_path) as wav:
+            for chunk in self._split_text(text, max_chars=1000):
+                pcm = self.synthesize_pcm(chunk)
+                if pcm is None:
+                    return False
+                wav.writeframes(pcm)
+        return True
+
+    def synthesize_pcm(self, text: str) -> Optional[bytes]:
+        """Synthesize one chunk to 16-bit mono PCM at SAMPLE_RATE."""
+        self._load_model()
 
-            for i, chunk in enumerate(chunks):
-                generator = self.model(chunk, voice=self.voice)
-                for _, _, audio in generator:
-                    audio_segments.append(audio)
+        if not self.model:
+            print("❌ TTS model not available")
+            return None
 
-            # Concatenate
+        try:
             import numpy as np
 
-            full_audio = (
-                np.concatenate(audio_segments) if audio_segments else np.array([])
-            )
-
-            # Save
-            sf.write(str(output_path), full_audio, 24000)
-            return True
+            segments = []
+            for _, _, audio in self.model(text, voice=self.voice, speed=self.speed):
+                if hasattr(audio, "cpu"):
+                    audio = audio.cpu().numpy()
+                segments.append(np.asarray(audio, dtype=np.float32))
+            if not segments:
+                return b""
+            audio = np.clip(np.concatenate(segments), -1.0, 1.0)
+            return (audio * 32767).astype("<i2").tobytes()
 
         except Exception as e:
             print(f"❌ TTS synthesis failed: {e}")
-            return False
+            return None
 
-    def _split_text(self, text: str, max_chars: int = 1000) -> List[str]:
+    @staticmethod
+    def _split_text(text: str, max_chars: int = 1000) -> List[str]:
         """Split text into speakable chunks."""
         # Split on sentence boundaries
         sentences = re.split(r"(?<=[.!?])\s+", text)
@@ -249,12 +272,87 @@ class KokoroTTS:
         return chunks
 
 
+def open_wav(path: Path, sample_rate: int = KokoroTTS.SAMPLE_RATE) -> wave.Wave_write:
+    """Open a 16-bit mono WAV for incremental writes."""
+    wav = wave.open(str(path), "wb")
+    wav.setnchannels(1)
+    wav.setsampwidth(2)
+    wav.setframerate(sample_rate)
+    return wav
+
+
+class ChunkCache:
+    """
+    Synthesized audio per text chunk, as raw 16-bit PCM files named by a
+    hash of (voice, speed, text). Files are written atomically, so an
+    interrupted run never leaves a truncated chunk behind.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(
+            cache_dir or Path.home() / ".cache" / "osmen" / "audiobook_chunks"
+        )
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(text: str, voice: str, speed: float) -> str:
+        return hashlib.sha256(f"{voice}:{speed}:{text}".encode()).hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pcm"
+
+    def has(self, key: str) -> bool:
+        return self.path(key).exists()
+
+    def put(self, key: str, pcm: bytes) -> Path:
+        path = self.path(key)
+        path.parent.mkdir(exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(pcm)
+        os.replace(tmp_path, path)
+        return path
+
+
+# Per-process state for synthesis workers
+_worker_tts: Optional[KokoroTTS] = None
+_worker_cache: Optional[ChunkCache] = None
+
+
+def _init_worker(voice: str, speed: float, cache_dir: Path, threads: int):
+    global _worker_tts, _worker_cache
+    # Split the CPU between workers instead of every model using all cores
+    torch.set_num_threads(threads)
+    _worker_tts = KokoroTTS(voice=voice, device="cpu", speed=speed)
+    _worker_cache = ChunkCache(cache_dir)
+
+
+def _render_chunk(tts: KokoroTTS, cache: ChunkCache, key: str, text: str) -> bool:
+    """Synthesize a chunk into the cache; False if synthesis failed."""
+    pcm = tts.synthesize_pcm(text)
+    if pcm is None:
+        return False
+    cache.put(key, pcm)
+    return True
+
+
+def _render_chunk_in_worker(key: str, text: str) -> bool:
+    return _render_chunk(_worker_tts, _worker_cache, key, text)
+
+
 class AudiobookGenerator:
     """Generate M4B audiobooks from text."""
 
+    # Each synthesis process loads its own Kokoro model
+    MAX_DEFAULT_WORKERS = 4
+
     def __init__(self, config: AudiobookConfig = None):
         self.config = config or AudiobookConfig()
-        self.tts = KokoroTTS(voice=self.config.voice) if HAS_TORCH else None
+        self.tts = (
+            KokoroTTS(voice=self.config.voice, speed=self.config.speed)
+            if HAS_TORCH
+            else None
+        )
+        self.cache = ChunkCache(self.config.cache_dir)
 
     def generate(
         self, input_file: Path, output_dir: Path, metadata: Dict = None
@@ -286,34 +384,20 @@ class AudiobookGenerator:
             print("❌ No chapters extracted")
             return None
 
-        # Create temp directory for chapter audio
         with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            chapter_files = []
+            # Raw PCM: a RIFF WAV cannot hold more than 4 GiB (~24.8 h)
+            book_audio = Path(temp_dir) / "book.pcm"
 
-            # Generate audio for each chapter
             print(f"\n🎤 Synthesizing with voice: {self.config.voice}")
-            for chapter in chapters:
-                print(f"   Chapter {chapter.number}: {chapter.title[:40]}...", end=" ")
-
-                audio_path = temp_path / f"chapter_{chapter.number:03d}.wav"
-
-                if self.tts and self.tts.synthesize(chapter.text[:10000], audio_path):
-                    chapter.audio_path = audio_path
-                    chapter_files.append(audio_path)
-                    print("✅")
-                else:
-                    print("⚠️ skipped")
-
-            if not chapter_files:
+            if not self.synthesize_book(chapters, book_audio):
                 print("❌ No audio generated")
                 return None
 
             # Combine into M4B
             print(f"\n📀 Creating M4B ({self.config.bitrate})...")
             success = self._create_m4b(
-                chapter_files,
-                chapters,
+                book_audio,
+                [chapter for chapter in chapters if chapter.samples],
                 output_file,
                 metadata or {"title": input_file.stem},
             )
@@ -326,26 +410,122 @@ class AudiobookGenerator:
                 print("❌ M4B creation failed")
                 return None
 
+    def synthesize_book(self, chapters: List[Chapter], output_path: Path) -> int:
+        """
+        Synthesize chapters into one raw 16-bit mono PCM file at
+        SAMPLE_RATE and set each chapter's sample count.
+
+        Chunks missing from the cache are rendered ahead on a process pool
+        while finished chapters are streamed to the file in order, one chunk
+        at a time. Raw PCM has no size header, so long books are not bound
+        by the 4 GiB limit of a WAV file. A chapter with a failed chunk is
+        skipped; its other chunks stay cached for the next run.
+
+        Returns:
+            Number of chapters written
+        """
+        if self.tts is None:
+            print("❌ TTS not available")
+            return 0
+
+        voice, speed = self.config.voice, self.config.speed
+        plan: List[List[Tuple[str, str]]] = []
+        pending: Dict[str, str] = {}
+        for chapter in chapters:
+            chapter.samples = 0
+            text = chapter.text
+            if self.config.max_chapter_chars:
+                text = text[: self.config.max_chapter_chars]
+            chunks = [
+                (ChunkCache.key(chunk, voice, speed), chunk)
+                for chunk in KokoroTTS._split_text(text, self.config.chunk_chars)
+                if chunk.strip()
+            ]
+            plan.append(chunks)
+            for key, chunk in chunks:
+                if key not in pending and not self.cache.has(key):
+                    pending[key] = chunk
+
+        unique = len({key for chunks in plan for key, _ in chunks})
+        workers = self._worker_count(len(pending))
+        print(
+            f"   {unique} chunks, {unique - len(pending)} cached, "
+            f"{workers} worker{'s' if workers != 1 else ''}"
+        )
+
+        executor = None
+        futures: Dict[str, Future] = {}
+        if workers > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(
+                    voice,
+                    speed,
+                    self.cache.cache_dir,
+                    max(1, (os.cpu_count() or 1) // workers),
+                ),
+            )
+            futures = {
+                key: executor.submit(_render_chunk_in_worker, key, text)
+                for key, text in pending.items()
+            }
+        rendered: Dict[str, bool] = {}
+
+        def ready(key: str) -> bool:
+            if key not in rendered:
+                if key in futures:
+                    try:
+                        rendered[key] = futures[key].result()
+                    except Exception as e:
+                        print(f"❌ TTS worker failed: {e}")
+                        rendered[key] = False
+                elif key in pending:
+                    rendered[key] = _render_chunk(self.tts, self.cache, key, pending[key])
+                else:
+                    rendered[key] = True
+            return rendered[key]
+
+        written = 0
+        try:
+            with open(output_path, "wb") as audio:
+                for chapter, chunks in zip(chapters, plan):
+                    print(f"   Chapter {chapter.number}: {chapter.title[:40]}...", end=" ")
+                    if not chunks or not all(ready(key) for key, _ in chunks):
+                        print("⚠️ skipped")
+                        continue
+                    for key, _ in chunks:
+                        pcm = self.cache.path(key).read_bytes()
+                        audio.write(pcm)
+                        chapter.samples += len(pcm) // 2
+                    written += 1
+                    print("✅")
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+        return written
+
+    def _worker_count(self, pending: int) -> int:
+        """Synthesis processes to use: one model on the GPU, a pool on CPU."""
+        if pending <= 1 or self.tts.device != "cpu":
+            return 1
+        workers = self.config.workers or min(
+            self.MAX_DEFAULT_WORKERS, os.cpu_count() or 1
+        )
+        return max(1, min(workers, pending))
+
     def _create_m4b(
         self,
-        chapter_files: List[Path],
+        audio_path: Path,
         chapters: List[Chapter],
         output_path: Path,
         metadata: Dict,
     ) -> bool:
-        """Combine chapter audio into M4B with metadata."""
+        """Encode the book's raw PCM audio to M4B with chapter metadata."""
 
         try:
-            # First, create a file list for concatenation
-            temp_dir = chapter_files[0].parent
-            concat_list = temp_dir / "concat.txt"
-
-            with open(concat_list, "w") as f:
-                for audio_file in chapter_files:
-                    f.write(f"file '{audio_file}'\n")
-
             # Create chapter metadata file
-            chapter_meta = temp_dir / "chapters.txt"
+            chapter_meta = audio_path.parent / "chapters.txt"
             with open(chapter_meta, "w") as f:
                 f.write(";FFMETADATA1\n")
                 f.write(f"title={metadata.get('title', 'Audiobook')}\n")
@@ -353,41 +533,28 @@ class AudiobookGenerator:
                 f.write(f"album={metadata.get('title', 'Audiobook')}\n")
                 f.write(f"genre=Audiobook\n")
 
-                # Chapter markers (simplified - would need actual timestamps)
-                timestamp = 0
+                # Chapter markers in samples, so they are exact
+                start = 0
                 for chapter in chapters:
                     f.write(f"\n[CHAPTER]\n")
-                    f.write(f"TIMEBASE=1/1000\n")
-                    f.write(f"START={timestamp * 1000}\n")
-                    timestamp += 300  # Estimate 5 min per chapter
-                    f.write(f"END={timestamp * 1000}\n")
+                    f.write(f"TIMEBASE=1/{KokoroTTS.SAMPLE_RATE}\n")
+                    f.write(f"START={start}\n")
+                    start += chapter.samples
+                    f.write(f"END={start}\n")
                     f.write(f"title={chapter.title}\n")
 
-            # Combine with FFmpeg
-            temp_combined = temp_dir / "combined.wav"
-
-            # Concatenate WAV files
-            cmd_concat = [
-                "ffmpeg",
-                "-y",
-                "-f",
-                "concat",
-                "-safe",
-                "0",
-                "-i",
-                str(concat_list),
-                "-c",
-                "copy",
-                str(temp_combined),
-            ]
-            subprocess.run(cmd_concat, capture_output=True, check=True)
-
             # Convert to M4B (AAC in M4A container)
             cmd_m4b = [
                 "ffmpeg",
                 "-y",
+                "-f",
+                "s16le",
+                "-ar",
+                str(KokoroTTS.SAMPLE_RATE),
+                "-ac",
+                "1",
                 "-i",
-                str(temp_combined),
+                str(audio_path),
                 "-i",
                 str(chapter_meta),
                 "-map",
@@ -11,10 +11,15 @@ Uses the Librarian agent infrastructure for:
 
 import hashlib
 import json
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from integrations.minhash_dedup import NearDuplicateFilter
+
 try:
     import chromadb
     from chromadb.config import Settings
@@ -80,33 +85,41 @@ class CourseEmbeddings:
         print(f"✅ Connected to collection: {self.collection_name}")
         print(f"   Current documents: {self.collection.count()}")
 
+        # Near-duplicate chunks (repeated boilerplate, overlapping chapter
+        # extracts) are dropped across everything ingested in this session
+        self.dedupe = NearDuplicateFilter()
+
     def add_document(self, content: str, source: str, metadata: Dict = None) -> int:
         """Add a document to the collection."""
 
-        chunks = chunk_text(content)
-        ids = []
-        documents = []
-        metadatas = []
-
-        for i, chunk in enumerate(chunks):
-            doc_id = generate_doc_id(chunk, source, i)
+        texts = chunk_text(content)
+        chunks = []
 
+        for i, chunk in enumerate(texts):
             meta = {
                 "source": source,
                 "course": self.course_code,
                 "chunk_index": i,
-                "total_chunks": len(chunks),
+                "total_chunks": len(texts),
                 "timestamp": datetime.now().isoformat(),
             }
             if metadata:
                 meta.update(metadata)
 
-            ids.append(doc_id)
-            documents.append(chunk)
-            metadatas.append(meta)
+            chunks.append(
+                {"id": generate_doc_id(chunk, source, i), "text": chunk, "metadata": meta}
+            )
+
+        chunks = self.dedupe.dedupe_chunks(chunks)
+        if not chunks:
+            return 0
 
         # Add to collection
-        self.collection.add(ids=ids, documents=documents, metadatas=metadatas)
+        self.collection.add(
+            ids=[c["id"] for c in chunks],
+            documents=[c["text"] for c in chunks],
+            metadatas=[c["metadata"] for c in chunks],
+        )
 
         return len(chunks)
 
@@ -422,6 +422,24 @@ class TestStreamingIntegration:
         state = manager.get_run_state(run_id)
         assert state.status == "failed"
         assert state.error == "Test error"
+    
+    @pytest.mark.asyncio
+    async def test_streaming_ring_buffer_and_resume(self):
+        """Test bounded event buffer and Last-Event-ID resume"""
+        from gateway.streaming import StreamingManager
+        
+        manager = StreamingManager(max_events_per_run=5)
+        run_id = await manager.start_run("test_workflow")
+        
+        for i in range(10):
+            await manager.emit_step(run_id, f"step{i}")
+        await manager.complete_run(run_id, {"result": "success"})
+        
+        state = manager.get_run_state(run_id)
+        assert len(state.events) == 5
+        
+        resumed = [event.sequence async for event in manager.subscribe(run_id, last_event_id=9)]
+        assert resumed == [10, 11, 12]
 
 
 class TestRunStorage:
@@ -511,6 +529,130 @@ class TestRunStorage:
         assert stats["failed"] == 2
         assert stats["success_rate"] == 80.0
 
+    @pytest.mark.asyncio
+    async def test_run_storage_retention(self):
+        """Test LRU eviction drops runs and their indexed children"""
+        from database.run_storage import InMemoryRunStorage
+        
+        storage = InMemoryRunStorage(max_runs=3)
+        
+        run_ids = []
+        for i in range(3):
+            run_id = await storage.create_run("test_workflow")
+            await storage.add_step(run_id, "step1")
+            await storage.add_tool_call(run_id, "tool", {})
+            run_ids.append(run_id)
+        
+        # Touch the oldest run so the second one becomes least recently used
+        await storage.get_run(run_ids[0])
+        await storage.create_run("test_workflow")
+        
+        assert await storage.get_run(run_ids[1]) is None
+        assert len((await storage.get_run(run_ids[0])).steps) == 1
+        assert len(await storage.list_runs()) == 3
+        assert (await storage.get_run_stats())["total_runs"] == 3
+        assert len(storage._steps) == 2
+        assert len(storage._tool_calls) == 2
+
+        # Late events for an evicted run are not indexed
+        await storage.add_step(run_ids[1], "late")
+        await storage.add_tool_call(run_ids[1], "tool", {})
+        await storage.create_approval(run_ids[1], "deploy", {})
+        assert run_ids[1] not in storage._run_steps
+        assert run_ids[1] not in storage._run_tool_calls
+        assert run_ids[1] not in storage._run_approvals
+        assert len(storage._steps) == 2 and len(storage._approvals) == 0
+
+    @pytest.mark.asyncio
+    async def test_write_behind_retries_failed_batches(self):
+        """Test a failed batch stays buffered and is rewritten in order"""
+        from contextlib import asynccontextmanager
+
+        from database.run_storage import PostgresRunStorage
+
+        written = []
+        failures = {"left": 2}
+
+        class FakeConnection:
+            @asynccontextmanager
+            async def transaction(self):
+                yield
+
+            async def executemany(self, query, rows):
+                if failures["left"]:
+                    failures["left"] -= 1
+                    raise ConnectionError("database unavailable")
+                written.extend(rows)
+
+        class FakePool:
+            @asynccontextmanager
+            async def acquire(self):
+                yield FakeConnection()
+
+            async def close(self):
+                pass
+
+        storage = PostgresRunStorage(
+            write_behind=True, batch_size=2, flush_interval=0.001, max_retries=3
+        )
+        storage._pool = FakePool()
+        storage._step_counters["run"] = 0
+
+        step_ids = [await storage.add_step("run", f"step{i}") for i in range(3)]
+        await storage.close(timeout=1.0)
+
+        assert [row[0] for row in written] == step_ids
+        stats = storage.get_write_behind_stats()
+        assert stats["events_failed"] == 0 and stats["batch_retries"] == 2
+        assert stats["events_flushed"] == 3 and stats["queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_write_behind_drops_batch_after_retries(self):
+        """Test events are only counted as failed once retries run out"""
+        from database.run_storage import PostgresRunStorage
+
+        storage = PostgresRunStorage(write_behind=True, batch_size=5, max_retries=1)
+
+        async def broken_pool():
+            raise ConnectionError("database unavailable")
+
+        storage._get_pool = broken_pool
+        storage._step_counters["run"] = 0
+        await storage.add_step("run", "step")
+        if storage._flush_task:
+            storage._flush_task.cancel()
+
+        with pytest.raises(ConnectionError):
+            await storage.flush()
+        assert storage.get_write_behind_stats()["queue_depth"] == 1
+        with pytest.raises(ConnectionError):
+            await storage.flush()
+        stats = storage.get_write_behind_stats()
+        assert stats["events_failed"] == 1 and stats["queue_depth"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_run_storage_keyset_pagination(self):
+        """Test cursor pages and iter_runs cover every run exactly once"""
+        from database.run_storage import InMemoryRunStorage
+        
+        storage = InMemoryRunStorage()
+        for i in range(7):
+            await storage.create_run(f"workflow_{i % 2}")
+        
+        expected = [r.id for r in await storage.list_runs()]
+        
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = await storage.list_runs_page(cursor=cursor, limit=3)
+            seen.extend(r.id for r in page)
+            if cursor is None:
+                break
+        
+        assert seen == expected
+        streamed = [r.id async for r in storage.iter_runs(workflow="workflow_0", page_size=2)]
+        assert len(streamed) == 4
+
 
 class TestWebSocketIntegration:
     """E2E tests for WebSocket integration"""
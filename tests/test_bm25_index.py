@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test suite for the sparse BM25 engine and RAG pipeline keyword stage
+Tests score parity with rank_bm25, incremental updates and persistence
+"""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from integrations.bm25_index import SparseBM25Index, tokenize
+from integrations.rag_pipeline import EnhancedRAGPipeline, RAGConfig
+
+
+# BM25Okapi idf is zero or negative for terms in half the corpus or more, so
+# small fixtures are padded with unrelated documents
+FILLER = [{"id": f"filler{i}", "content": f"filler text {i}"} for i in range(6)]
+
+
+def make_corpus(n=200, seed=7):
+    rng = random.Random(seed)
+    words = [f"term{i}" for i in range(120)]
+    return [" ".join(rng.choices(words, k=rng.randint(3, 40))) for _ in range(n)]
+
+
+class TestSparseBM25Index:
+    def test_scores_match_rank_bm25(self):
+        rank_bm25 = pytest.importorskip("rank_bm25")
+        corpus = [tokenize(doc) for doc in make_corpus()]
+        reference = rank_bm25.BM25Okapi(corpus)
+
+        index = SparseBM25Index()
+        for i, tokens in enumerate(corpus):
+            index.add(str(i), tokens)
+
+        queries = [["term1", "term2", "term2"], ["term119", "unknown"], []]
+        scores = index.score_many(queries)
+        for q, query in enumerate(queries):
+            np.testing.assert_allclose(scores[:, q], reference.get_scores(query), atol=1e-4)
+
+    def test_search_many_returns_top_k_in_order(self):
+        index = SparseBM25Index()
+        index.add("a", tokenize("apple banana apple"))
+        index.add("b", tokenize("banana cherry"))
+        index.add("c", tokenize("cherry date elderberry"))
+
+        apple, cherry = index.search_many([["apple"], ["cherry"]], k=2)
+        assert [doc_id for doc_id, _ in apple][0] == "a"
+        assert {doc_id for doc_id, _ in cherry} == {"b", "c"}
+        assert cherry[0][1] >= cherry[1][1]
+
+    def test_incremental_remove_and_update(self):
+        index = SparseBM25Index(compact_ratio=0.9)
+        for doc in FILLER:
+            index.add(doc["id"], tokenize(doc["content"]))
+        index.add("a", tokenize("alpha beta"), "h1")
+        index.add("b", tokenize("beta gamma"), "h2")
+        assert index.has("a", "h1") and not index.has("a", "other")
+
+        assert index.search(["alpha"], k=5)[0][0] == "a"
+        assert index.remove(["a", "missing"]) == 1
+        assert index.search(["alpha"], k=5) == []
+
+        index.add("b", tokenize("delta"), "h3")
+        assert [doc_id for doc_id, _ in index.search(["delta"], k=5)] == ["b"]
+        assert index.search(["gamma"], k=5) == []
+        assert len(index) == len(FILLER) + 1
+
+    def test_save_and_load(self, tmp_path):
+        index = SparseBM25Index()
+        for i, doc in enumerate(make_corpus(50)):
+            index.add(f"doc{i}", tokenize(doc), f"hash{i}")
+        index.remove(["doc3"])
+        path = tmp_path / "bm25.npz"
+        index.save(path)
+
+        loaded = SparseBM25Index.load(path)
+        assert len(loaded) == 49
+        assert loaded.has("doc4", "hash4")
+        assert loaded.search(["term5", "term9"], k=5) == index.search(["term5", "term9"], k=5)
+
+
+class TestRAGPipelineBM25:
+    def test_index_documents_upserts_and_persists(self, tmp_path):
+        config = RAGConfig(use_reranking=False, bm25_index_path=str(tmp_path / "bm25.npz"))
+        pipeline = EnhancedRAGPipeline(config=config)
+        pipeline.index_documents(FILLER + [
+            {"id": "1", "content": "python sparse matrices"},
+            {"id": "2", "content": "obsidian vault notes"},
+        ])
+        pipeline.index_documents([{"id": "3", "content": "python notes"}])
+
+        results = pipeline.retrieve("python", k=5)
+        assert {r.id for r in results} == {"1", "3"}
+
+        # A new pipeline restores the index; unchanged documents are not re-indexed
+        restored = EnhancedRAGPipeline(config=config)
+        assert len(restored.bm25) == len(FILLER) + 3
+        assert restored.bm25.add([{"id": "1", "content": "python sparse matrices"}]) == 0
+
+        pipeline.remove_documents(["1"])
+        assert [r.id for r in pipeline.retrieve("python", k=5)] == ["3"]
+
+    def test_restart_serves_hits_from_persisted_documents(self, tmp_path):
+        config = RAGConfig(use_reranking=False, bm25_index_path=str(tmp_path / "bm25.npz"))
+        EnhancedRAGPipeline(config=config).index_documents(FILLER + [
+            {"id": "1", "content": "python sparse matrices", "metadata": {"source": "a.md"}},
+            {"id": "2", "content": "obsidian vault notes"},
+        ])
+        assert (tmp_path / "bm25.docs.json").exists()
+
+        # After a restart nothing has to be re-passed to get BM25 hits
+        restored = EnhancedRAGPipeline(config=config)
+        results = restored.retrieve("python", k=5)
+        assert [r.id for r in results] == ["1"]
+        assert results[0].metadata == {"source": "a.md"}
+
+        # Indexing something new keeps the documents that were not re-passed
+        restored.index_documents([{"id": "3", "content": "python notes"}])
+        assert {r.id for r in restored.retrieve("python", k=5)} == {"1", "3"}
+        restored.remove_documents(["1"])
+        assert [r.id for r in EnhancedRAGPipeline(config=config).retrieve("python", k=5)] == ["3"]
+
+    def test_batches_persist_once_on_save(self, tmp_path):
+        config = RAGConfig(use_reranking=False, bm25_index_path=str(tmp_path / "bm25.npz"))
+        pipeline = EnhancedRAGPipeline(config=config)
+        pipeline.index_documents(FILLER, persist=False)
+        pipeline.index_documents([{"id": "1", "content": "python notes"}], persist=False)
+        assert not (tmp_path / "bm25.npz").exists()
+
+        pipeline.save()
+        restored = EnhancedRAGPipeline(config=config)
+        assert [r.id for r in restored.retrieve("python", k=5)] == ["1"]
+
+    def test_hybrid_scoring_combines_sources(self):
+        def search_fn(query, k):
+            return [{"id": "sem", "content": "semantic only", "score": 0.9}]
+
+        pipeline = EnhancedRAGPipeline(
+            config=RAGConfig(use_reranking=False, initial_k=2), search_fn=search_fn
+        )
+        pipeline.index_documents(FILLER + [{"id": "kw", "content": "keyword keyword match"}])
+        results = pipeline.retrieve("keyword", k=5)
+        assert [r.id for r in results] == ["sem", "kw"]
+        assert results[0].score == pytest.approx(0.6)
+        assert results[1].score == pytest.approx(0.2)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Test suite for completion request coalescing
+Tests shared in-flight calls, round-robin fair queueing per backend and
+the gateway's /completion wiring
+"""
+
+import asyncio
+import importlib.util
+
+import pytest
+
+from gateway.coalescing import FairLimiter, RequestCoalescer, request_key
+
+GATEWAY_DEPS = all(
+    importlib.util.find_spec(module)
+    for module in ("fastapi", "httpx", "asyncpg", "redis", "tenacity")
+)
+
+
+class TestRequestCoalescer:
+    def test_identical_requests_share_one_call(self):
+        coalescer = RequestCoalescer()
+        calls = []
+
+        async def upstream():
+            calls.append(1)
+            await asyncio.sleep(0.02)
+            return "answer"
+
+        async def run():
+            key = request_key({"prompt": "hi", "temperature": 0})
+            return await asyncio.gather(*(coalescer.run(key, upstream) for _ in range(10)))
+
+        assert asyncio.run(run()) == ["answer"] * 10
+        assert len(calls) == 1
+        assert coalescer.stats() == {"in_flight": 0, "leaders": 1, "coalesced": 9}
+
+    def test_errors_are_shared_and_not_cached(self):
+        coalescer = RequestCoalescer()
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            await asyncio.sleep(0.01)
+            if len(attempts) == 1:
+                raise RuntimeError("backend down")
+            return "ok"
+
+        async def run():
+            first = await asyncio.gather(
+                coalescer.run("k", flaky), coalescer.run("k", flaky), return_exceptions=True
+            )
+            return first, await coalescer.run("k", flaky)
+
+        first, second = asyncio.run(run())
+        assert all(isinstance(result, RuntimeError) for result in first)
+        assert second == "ok" and len(attempts) == 2
+
+    def test_cancelled_caller_does_not_cancel_shared_call(self):
+        coalescer = RequestCoalescer()
+
+        async def upstream():
+            await asyncio.sleep(0.03)
+            return "done"
+
+        async def run():
+            impatient = asyncio.create_task(coalescer.run("k", upstream))
+            patient = asyncio.create_task(coalescer.run("k", upstream))
+            await asyncio.sleep(0.01)
+            impatient.cancel()
+            return await patient
+
+        assert asyncio.run(run()) == "done"
+
+    def test_key_ignores_field_order(self):
+        assert request_key({"a": 1, "b": 2}) == request_key({"b": 2, "a": 1})
+        assert request_key({"a": 1}) != request_key({"a": 2})
+
+
+class TestFairLimiter:
+    def test_slots_go_round_robin_across_clients(self):
+        limiter = FairLimiter(1)
+        order = []
+
+        async def job(client, name):
+            async with limiter.slot(client):
+                order.append(name)
+                await asyncio.sleep(0.001)
+
+        async def run():
+            # A burst from one workflow, then a single request from another
+            tasks = [asyncio.create_task(job("bulk", f"bulk{i}")) for i in range(4)]
+            await asyncio.sleep(0)
+            tasks.append(asyncio.create_task(job("solo", "solo")))
+            await asyncio.gather(*tasks)
+
+        asyncio.run(run())
+        assert order[:3] == ["bulk0", "bulk1", "solo"]
+        assert limiter.stats() == {"limit": 1, "active": 0, "queued": 0, "waiting_clients": 0}
+
+    def test_concurrency_is_capped(self):
+        limiter = FairLimiter(2)
+        peak = 0
+
+        async def job(client):
+            nonlocal peak
+            async with limiter.slot(client):
+                peak = max(peak, limiter.active)
+                await asyncio.sleep(0.005)
+
+        async def run():
+            await asyncio.gather(*(job(f"c{i % 3}") for i in range(9)))
+
+        asyncio.run(run())
+        assert peak == 2 and limiter.active == 0
+
+    def test_cancelled_waiter_frees_its_place(self):
+        limiter = FairLimiter(1)
+
+        async def hold(event):
+            async with limiter.slot("a"):
+                await event.wait()
+
+        async def run():
+            event = asyncio.Event()
+            holder = asyncio.create_task(hold(event))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(hold(asyncio.Event()))
+            await asyncio.sleep(0)
+            assert limiter.queued == 1
+            waiter.cancel()
+            await asyncio.sleep(0)
+            event.set()
+            await holder
+            async with limiter.slot("b"):
+                return limiter.stats()
+
+        stats = asyncio.run(run())
+        assert stats["active"] == 1 and stats["queued"] == 0
+
+
+@pytest.mark.skipif(not GATEWAY_DEPS, reason="gateway dependencies not installed")
+def test_gateway_coalesces_identical_completions(monkeypatch):
+    from gateway.gateway import AgentGateway, CompletionRequest, CompletionResponse
+
+    gateway = AgentGateway()
+    calls = []
+
+    async def fake_ollama(request):
+        calls.append(request.prompt)
+        await asyncio.sleep(0.02)
+        return CompletionResponse(agent="ollama", model="m", content=request.prompt.upper())
+
+    monkeypatch.setattr(gateway, "_ollama_completion", fake_ollama)
+
+    async def run():
+        same = CompletionRequest(agent="ollama", prompt="hello")
+        other = CompletionRequest(agent="ollama", prompt="world")
+        return await asyncio.gather(
+            gateway.completion(same, "a"),
+            gateway.completion(same, "b"),
+            gateway.completion(other, "a"),
+        )
+
+    results = asyncio.run(run())
+    assert [r.content for r in results] == ["HELLO", "HELLO", "WORLD"]
+    assert sorted(calls) == ["hello", "world"]
+    stats = gateway.completion_stats()
+    assert stats["coalescing"]["coalesced"] == 1
+    assert stats["backends"]["ollama"]["limit"] == AgentGateway.BACKEND_CONCURRENCY["ollama"]
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Context Injector's caching
+Tests cached contexts, invalidation on workspace map and memory changes,
+token budgeting and the batched audit writer
+"""
+
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+from agents.infrastructure import infrastructure_agent
+from infrastructure import context_injector
+from infrastructure.context_injector import (
+    AuditWriter,
+    ContextInjector,
+    count_context_tokens,
+    count_tokens,
+)
+
+REPO_INFRASTRUCTURE = Path(__file__).parent.parent / "infrastructure"
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Temporary workspace with the repo's registries and no policies."""
+    for name in ("nodes", "tools", "graph"):
+        shutil.copytree(REPO_INFRASTRUCTURE / name, tmp_path / "infrastructure" / name)
+    (tmp_path / "knowledge" / "memories").mkdir(parents=True)
+    write_map(tmp_path, total_files=10)
+
+    monkeypatch.setattr(
+        infrastructure_agent, "__file__", str(tmp_path / "agents" / "infrastructure" / "agent.py")
+    )
+    monkeypatch.setattr(
+        context_injector, "__file__", str(tmp_path / "infrastructure" / "context_injector.py")
+    )
+    monkeypatch.setattr(ContextInjector, "_instance", None)
+    return tmp_path
+
+
+@pytest.fixture
+def injector(workspace):
+    injector = ContextInjector()
+    injector.config.change_poll_seconds = 0
+    calls = []
+    generate = injector.infrastructure.generate_context_for_agent
+
+    def counting_generate(**kwargs):
+        calls.append(kwargs["agent_id"])
+        return generate(**kwargs)
+
+    injector.infrastructure.generate_context_for_agent = counting_generate
+    injector.builds = calls
+    yield injector
+    injector.stop_watching()
+    injector.audit_writer.close()
+
+
+def write_map(root, **fields):
+    path = root / "infrastructure" / "workspace_map.json"
+    previous = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(json.dumps({"capabilities": {"search": ["a.py"]}, **fields}))
+    # Make sure the change is visible to mtime checks on coarse filesystems
+    os.utime(path, ns=(previous + 10**9, previous + 10**9))
+
+
+def write_memory(root, name, mtime=None, **data):
+    path = root / "knowledge" / "memories" / f"{name}.json"
+    path.write_text(json.dumps(data))
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+class TestContextCache:
+    def test_repeated_injection_is_served_from_cache(self, injector):
+        first = injector.inject_context("librarian", "Find research papers")
+        start = time.perf_counter()
+        second = injector.inject_context("librarian", "  find RESEARCH papers ")
+        elapsed = time.perf_counter() - start
+
+        assert second == first and second is not first
+        assert injector.builds == ["librarian"]
+        assert elapsed < 0.005
+        assert injector.injection_records[-1].cache_hit
+
+        injector.inject_context("librarian", "Something else")
+        injector.inject_context("librarian", "Find research papers", include_memories=False)
+        assert len(injector.builds) == 3
+        assert injector.get_cache_stats()["hits"] == 1
+
+    def test_entries_expire_after_ttl(self, injector):
+        injector.inject_context("librarian")
+        injector.config.cache_ttl_seconds = 0
+        time.sleep(0.001)
+        injector.inject_context("librarian")
+        assert len(injector.builds) == 2
+
+    def test_workspace_map_change_invalidates(self, injector, workspace):
+        assert injector.inject_context("librarian")["workspace_map"]["total_files"] == 10
+
+        write_map(workspace, total_files=42)
+        context = injector.inject_context("librarian")
+
+        assert context["workspace_map"]["total_files"] == 42
+        assert len(injector.builds) == 2
+
+
+class TestRecentMemories:
+    def test_memory_changes_are_picked_up_incrementally(self, injector, workspace, monkeypatch):
+        assert "recent_memories" not in injector.inject_context("librarian")
+
+        write_memory(workspace, "note", content="first", timestamp=2)
+        write_memory(workspace, "other", content="not mine", agent="daily_brief", timestamp=3)
+        memories = injector.inject_context("librarian")["recent_memories"]
+        assert [m["content"] for m in memories] == ["first"]
+
+        # Unchanged files are not parsed again
+        opened = []
+        real_open = open
+        monkeypatch.setattr(
+            "builtins.open", lambda path, *a, **k: opened.append(path) or real_open(path, *a, **k)
+        )
+        path = write_memory(workspace, "note", content="second", timestamp=2)
+        os.utime(path, (time.time() + 5, time.time() + 5))
+        memories = injector.inject_context("librarian")["recent_memories"]
+        assert [m["content"] for m in memories] == ["second"]
+        assert [Path(p).name for p in opened if str(p).endswith(".json")] == ["note.json"]
+
+        path.unlink()
+        assert "recent_memories" not in injector.inject_context("librarian")
+
+    def test_old_memories_are_excluded(self, injector, workspace):
+        write_memory(workspace, "stale", mtime=time.time() - 48 * 3600, content="old")
+        write_memory(workspace, "fresh", content="new")
+        injector.memory_index.refresh()
+        assert [m["id"] for m in injector._get_recent_memories("librarian")] == ["fresh"]
+
+    def test_malformed_memories_are_skipped(self, workspace):
+        memories = workspace / "knowledge" / "memories"
+        (memories / "broken.json").write_text("{not json")
+        (memories / "listed.json").write_text(json.dumps([1, 2]))
+        write_memory(workspace, "fine", content="ok")
+
+        # One bad file must not stop the injector from being built
+        injector = ContextInjector()
+        try:
+            assert [m["id"] for m in injector._get_recent_memories("librarian")] == ["fine"]
+        finally:
+            injector.stop_watching()
+            injector.audit_writer.close()
+
+
+class TestTokenBudget:
+    def test_context_is_trimmed_to_budget(self, injector, workspace):
+        for i in range(5):
+            write_memory(workspace, f"m{i}", content="word " * 40, timestamp=i)
+        injector.config.max_context_tokens = 100000
+        full = injector.inject_context("librarian")
+        full_tokens = count_context_tokens(full)
+        assert len(full["recent_memories"]) == 5
+
+        budget = full_tokens - 60
+        injector.config.max_context_tokens = budget
+        injector.invalidate()
+        trimmed = injector.inject_context("librarian")
+
+        assert count_context_tokens(trimmed) <= budget
+        assert "workspace_map" not in trimmed
+        assert "capabilities" in trimmed
+        assert injector.injection_records[-1].context_tokens == count_context_tokens(trimmed)
+
+    def test_count_tokens_is_not_a_character_ratio(self):
+        assert count_tokens("") == 0
+        assert count_tokens("hello world") == 2
+        assert 0 < count_tokens("{}[],:") <= 6
+
+
+def test_audit_writer_batches_records(tmp_path):
+    writer = AuditWriter(flush_interval=60)
+    path = tmp_path / "audit.jsonl"
+    for i in range(3):
+        writer.write(path, {"n": i})
+    assert not path.exists()
+
+    writer.flush()
+    assert [json.loads(line)["n"] for line in path.read_text().splitlines()] == [0, 1, 2]
+
+    writer.write(path, {"n": 3})
+    writer.close()
+    assert len(path.read_text().splitlines()) == 4 and writer.written == 4
+
+
+def test_injection_audit_reaches_disk(injector, workspace):
+    injector.inject_context("librarian", "Audit me")
+    injector.log_outcome("librarian", "Audit me", "completed", True)
+    injector.audit_writer.flush()
+
+    audit = (workspace / "logs" / "context_injections.jsonl").read_text().splitlines()
+    assert json.loads(audit[-1])["task_description"] == "Audit me"
+    assert (workspace / "logs" / "agent_outcomes.jsonl").exists()
+
+
+def test_filesystem_events_replace_polling(workspace, monkeypatch):
+    class FakeObserver:
+        def __init__(self):
+            self.handlers = []
+
+        def schedule(self, handler, path):
+            self.handlers.append((handler, path))
+
+        def start(self):
+            pass
+
+        def stop(self):
+            pass
+
+        def join(self, timeout=None):
+            pass
+
+    class Event:
+        def __init__(self, path, event_type="modified"):
+            self.src_path, self.event_type, self.is_directory = str(path), event_type, False
+
+    monkeypatch.setattr(context_injector, "WATCHDOG_AVAILABLE", True)
+    monkeypatch.setattr(context_injector, "Observer", FakeObserver, raising=False)
+    monkeypatch.setattr(context_injector, "FileSystemEventHandler", object, raising=False)
+    injector = ContextInjector()
+    injector.config.change_poll_seconds = 0
+    assert injector.get_cache_stats()["watching"] == ["memories", "workspace_map"]
+    handler = injector._observer.handlers[0][0]
+
+    injector.inject_context("librarian")
+    # Without an event the change is not noticed: no stat calls per injection
+    path = write_memory(workspace, "note", content="hello")
+    assert "recent_memories" not in injector.inject_context("librarian")
+
+    handler.on_any_event(Event(path, "created"))
+    assert injector.inject_context("librarian")["recent_memories"][0]["content"] == "hello"
+
+    write_map(workspace, total_files=7)
+    handler.on_any_event(Event(workspace / "infrastructure" / "workspace_map.json"))
+    assert injector.inject_context("librarian")["workspace_map"]["total_files"] == 7
+
+    injector.stop_watching()
+    injector.audit_writer.close()
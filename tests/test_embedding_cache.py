@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test suite for the compact embedding cache
+Tests float32/float16 storage, batched lookups, LRU bounds and migration
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from integrations.embedding_optimizer import EmbeddingCache, EmbeddingProvider
+
+MODEL = "all-MiniLM-L6-v2"
+
+
+def vec(seed: float, dims: int = 8):
+    return [seed + i * 0.25 for i in range(dims)]
+
+
+class BrokenConnection:
+    """sqlite3 connection whose bulk inserts fail (disk full, locked, ...)"""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self.conn.__enter__()
+
+    def __exit__(self, *exc):
+        return self.conn.__exit__(*exc)
+
+    def executemany(self, *args):
+        raise sqlite3.OperationalError("database or disk is full")
+
+
+class TestEmbeddingCache:
+    def test_round_trip_float32(self, tmp_path):
+        cache = EmbeddingCache(cache_dir=tmp_path)
+        cache.set("hello", MODEL, vec(1.0))
+        assert cache.get("hello", MODEL) == vec(1.0)
+        assert cache.get("hello", "other-model") is None
+
+        # A new instance reads the vector back from disk
+        reopened = EmbeddingCache(cache_dir=tmp_path)
+        assert reopened.get("hello", MODEL) == vec(1.0)
+        assert reopened.stats()["disk_hits"] == 1
+        assert not list(tmp_path.glob("*.json"))
+
+    def test_float16_is_smaller_and_close(self, tmp_path):
+        cache = EmbeddingCache(cache_dir=tmp_path, dtype="float16")
+        embedding = [0.1, -0.5, 0.333, 2.0]
+        cache.set("x", MODEL, embedding)
+        restored = EmbeddingCache(cache_dir=tmp_path, max_memory_items=0).get("x", MODEL)
+        assert restored == pytest.approx(embedding, abs=1e-3)
+
+    def test_get_many_and_stats(self, tmp_path):
+        cache = EmbeddingCache(cache_dir=tmp_path, max_memory_items=2)
+        texts = [f"text {i}" for i in range(5)]
+        cache.set_many(texts, MODEL, [vec(float(i)) for i in range(5)])
+        assert cache.stats()["memory_entries"] == 2
+
+        results = cache.get_many(texts + ["missing", "text 0"], MODEL)
+        assert results[:5] == [vec(float(i)) for i in range(5)]
+        assert results[5] is None
+        assert results[6] == vec(0.0)
+
+        stats = cache.stats()
+        assert stats["entries"] == 5
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(6 / 7)
+        assert stats["bytes_on_disk"] > 0
+
+    def test_migrate_legacy_json_and_clear(self, tmp_path):
+        legacy = EmbeddingCache(cache_dir=tmp_path)
+        key = legacy._get_key("legacy text", MODEL).hex()
+        (tmp_path / f"{key}.json").write_text(
+            json.dumps({"model": MODEL, "embedding": vec(3.0)})
+        )
+
+        assert legacy.migrate_json_files() == 1
+        assert not list(tmp_path.glob("*.json"))
+        assert legacy.get("legacy text", MODEL) == vec(3.0)
+
+        assert legacy.clear() == 1
+        assert legacy.get("legacy text", MODEL) is None
+
+    def test_failed_migration_keeps_legacy_files(self, tmp_path, monkeypatch):
+        legacy = EmbeddingCache(cache_dir=tmp_path)
+        for i in range(3):
+            key = legacy._get_key(f"text {i}", MODEL).hex()
+            (tmp_path / f"{key}.json").write_text(
+                json.dumps({"model": MODEL, "embedding": vec(float(i))})
+            )
+        monkeypatch.setattr(EmbeddingCache, "_SQL_CHUNK", 2)
+        monkeypatch.setattr(legacy, "_conn", BrokenConnection(legacy._conn))
+
+        with pytest.raises(sqlite3.OperationalError):
+            legacy.migrate_json_files()
+        assert len(list(tmp_path.glob("*.json"))) == 3
+
+        monkeypatch.setattr(legacy, "_conn", legacy._conn.conn)
+        assert legacy.migrate_json_files() == 3
+        assert not list(tmp_path.glob("*.json"))
+
+    def test_embed_batch_skips_model_when_fully_cached(self, tmp_path):
+        provider = EmbeddingProvider(use_cache=False)
+        provider.cache = EmbeddingCache(cache_dir=tmp_path)
+        provider.cache.set_many(["a", "b"], provider.model_config.model_id, [vec(1.0), vec(2.0)])
+        provider._model = None
+
+        assert provider.embed_batch(["b", "a"]) == [vec(2.0), vec(1.0)]
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Test suite for the gateway's bounded executors
+Tests async CLI subprocesses, the integration thread pool with shared
+instances, and event loop lag measurement
+"""
+
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from gateway.executors import CLIRunner, EventLoopLagMonitor, IntegrationExecutor
+
+
+def python(code):
+    return [sys.executable, "-c", code]
+
+
+class TestCLIRunner:
+    def test_matches_subprocess_run(self):
+        runner = CLIRunner()
+        result = asyncio.run(
+            runner.run(
+                python("import os, sys; print(os.environ['MARK']); sys.exit(3)"),
+                timeout=10,
+                env={"MARK": "hello", "PATH": ""},
+            )
+        )
+        assert isinstance(result, subprocess.CompletedProcess)
+        assert (result.returncode, result.stdout.strip()) == (3, "hello")
+        assert runner.stats()["completed"] == 1
+
+    def test_runner_is_reusable_across_event_loops(self):
+        runner = CLIRunner(max_concurrency=1)
+
+        async def run():
+            # Two calls contend for the one slot, binding it to this loop
+            calls = [runner.run(python("print(1)"), timeout=10) for _ in range(2)]
+            return [r.returncode for r in await asyncio.gather(*calls)]
+
+        assert asyncio.run(run()) == [0, 0]
+        assert asyncio.run(run()) == [0, 0]
+
+    def test_timeout_kills_and_missing_executable_raises(self):
+        runner = CLIRunner()
+        start = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired):
+            asyncio.run(runner.run(python("import time; time.sleep(30)"), timeout=0.2))
+        assert time.monotonic() - start < 5
+        assert runner.stats()["timeouts"] == 1 and runner.running == 0
+
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(runner.run(["definitely-not-a-real-cli"], timeout=1))
+
+    def test_slow_commands_do_not_block_the_loop(self):
+        runner = CLIRunner(max_concurrency=2)
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def run():
+            task = asyncio.create_task(ticker())
+            calls = [runner.run(python("import time; time.sleep(0.3)"), timeout=10) for _ in range(3)]
+            peak = 0
+
+            async def watch():
+                nonlocal peak
+                while True:
+                    peak = max(peak, runner.running)
+                    await asyncio.sleep(0.01)
+
+            watcher = asyncio.create_task(watch())
+            await asyncio.gather(*calls)
+            task.cancel()
+            watcher.cancel()
+            return peak
+
+        peak = asyncio.run(run())
+        assert peak == 2
+        gaps = [b - a for a, b in zip(ticks, ticks[1:])]
+        assert len(ticks) > 20 and max(gaps) < 0.25
+
+
+class TestIntegrationExecutor:
+    def test_shared_instance_is_built_once_off_the_loop(self):
+        executor = IntegrationExecutor(max_workers=2)
+        built = []
+
+        class Slow:
+            def __init__(self):
+                built.append(threading.current_thread().name)
+                time.sleep(0.05)
+
+        async def run():
+            return await asyncio.gather(*(executor.shared("slow", Slow) for _ in range(5)))
+
+        instances = asyncio.run(run())
+        assert len(built) == 1 and built[0].startswith("gateway-integration")
+        assert all(instance is instances[0] for instance in instances)
+        assert executor.stats()["shared_instances"] == ["slow"]
+        executor.shutdown()
+
+    def test_shared_instance_calls_are_serialized_on_its_thread(self):
+        executor = IntegrationExecutor(max_workers=4)
+        active, peak, threads = [0], [0], set()
+
+        class Client:
+            def __init__(self):
+                threads.add(threading.current_thread().name)
+
+            def call(self, i):
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+                threads.add(threading.current_thread().name)
+                time.sleep(0.02)
+                active[0] -= 1
+                return i
+
+        async def run():
+            client = await executor.shared("client", Client)
+            calls = [executor.run_shared("client", client.call, i) for i in range(5)]
+            # Other pool work is not queued behind the shared instance
+            other = executor.run(lambda: threading.current_thread().name)
+            *results, other_thread = await asyncio.gather(*calls, other)
+            return results, other_thread
+
+        results, other_thread = asyncio.run(run())
+        assert results == [0, 1, 2, 3, 4]
+        assert peak[0] == 1
+        assert len(threads) == 1 and threads.pop().startswith("gateway-integration-client")
+        assert not other_thread.startswith("gateway-integration-client")
+        executor.shutdown()
+
+    def test_failed_construction_is_retried(self):
+        executor = IntegrationExecutor(max_workers=1)
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("not configured")
+            return "ready"
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(executor.shared("flaky", flaky))
+        assert asyncio.run(executor.shared("flaky", flaky)) == "ready"
+        assert asyncio.run(executor.run(lambda x, y=0: x + y, 1, y=2)) == 3
+        executor.shutdown()
+
+    def test_usable_again_after_shutdown(self):
+        executor = IntegrationExecutor(max_workers=1)
+        first = asyncio.run(executor.shared("client", object))
+        executor.shutdown()
+
+        # A second app lifespan in the same process gets fresh pools
+        second = asyncio.run(executor.shared("client", object))
+        assert second is not first
+        assert asyncio.run(executor.run_shared("client", lambda: 42)) == 42
+        assert asyncio.run(executor.run(lambda: 7)) == 7
+        executor.shutdown()
+
+
+def test_lag_monitor_sees_a_blocked_loop():
+    monitor = EventLoopLagMonitor(interval=0.01, warn_after=0.05)
+
+    async def run():
+        monitor.start()
+        await asyncio.sleep(0.05)
+        time.sleep(0.15)  # Blocks the loop
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+    asyncio.run(run())
+    stats = monitor.stats()
+    assert stats["slow_ticks"] >= 1
+    assert stats["max_ms"] >= 100
+    assert stats["p50_ms"] < 50
+    assert not monitor.running
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Test suite for the gateway's service health monitor
+Tests cached snapshots, shared refreshes, the background schedule and
+reuse of pooled clients
+"""
+
+import asyncio
+
+import pytest
+
+for module in ("fastapi", "httpx", "asyncpg", "redis", "tenacity"):
+    pytest.importorskip(module)
+
+from gateway.gateway import LatencyHistogram, ServiceHealthMonitor
+
+
+class FakeHTTPClient:
+    is_closed = False
+
+    def __init__(self):
+        self.urls = []
+
+    async def get(self, url, **kwargs):
+        self.urls.append(url)
+        return FakeResponse()
+
+
+class FakeResponse:
+    status_code = 200
+
+    def json(self):
+        return {"status": "ok"}
+
+
+class FakeRedis:
+    def __init__(self):
+        self.pings = 0
+
+    async def ping(self):
+        self.pings += 1
+        return True
+
+
+@pytest.fixture
+def monitor(monkeypatch):
+    monitor = ServiceHealthMonitor()
+    monitor.calls = {name: 0 for name in monitor.SERVICES}
+
+    def fake_check(name, delay=0.0, ok=True):
+        async def check():
+            monitor.calls[name] += 1
+            await asyncio.sleep(delay)
+            return ok, f"{name} fine" if ok else f"{name} down"
+
+        return check
+
+    monitor.fake_check = fake_check
+    for name in monitor.SERVICES:
+        monkeypatch.setattr(monitor, f"check_{name}", fake_check(name))
+    return monitor
+
+
+class TestSnapshots:
+    def test_endpoints_are_served_from_one_snapshot(self, monitor):
+        async def run():
+            first = await monitor.summary()
+            second = await monitor.summary()
+            service = await monitor.service_status("Redis")
+            return first, second, service
+
+        first, second, service = asyncio.run(run())
+        assert all(count == 1 for count in monitor.calls.values())
+        assert first["status"] == "healthy" and first["stale"] is False
+        assert second["timestamp"] == first["timestamp"]
+        assert "latency_ms" in first["services"]["postgres"]
+
+        assert service["service"] == "redis" and service["ok"]
+        assert service["latency_histogram"]["count"] == 1
+        assert asyncio.run(monitor.service_status("mystery")) is None
+
+    def test_concurrent_callers_share_one_probe_run(self, monitor, monkeypatch):
+        monkeypatch.setattr(monitor, "check_postgres", monitor.fake_check("postgres", 0.05))
+
+        async def run():
+            return await asyncio.gather(*(monitor.summary() for _ in range(20)))
+
+        results = asyncio.run(run())
+        assert monitor.calls["postgres"] == 1
+        assert len({r["timestamp"] for r in results}) == 1
+
+    def test_old_snapshot_is_refreshed_or_flagged(self, monitor, monkeypatch):
+        monkeypatch.setattr(monitor, "check_n8n", monitor.fake_check("n8n", ok=False))
+
+        async def run():
+            await monitor.summary()
+            monitor._snapshot_at -= monitor.interval + 1
+            # Without the scheduler an old snapshot is refreshed on demand
+            refreshed = await monitor.summary()
+            # With it, an old snapshot is served but flagged
+            monitor._scheduler = asyncio.get_running_loop().create_future()
+            monitor._snapshot_at -= monitor.stale_after + 1
+            stale = await monitor.summary()
+            monitor._scheduler.cancel()
+            return refreshed, stale
+
+        refreshed, stale = asyncio.run(run())
+        assert monitor.calls["n8n"] == 2
+        assert refreshed["status"] == "degraded" and not refreshed["stale"]
+        assert stale["stale"] and stale["age_seconds"] > monitor.stale_after
+
+    def test_hung_probe_times_out(self, monitor, monkeypatch):
+        monitor.probe_timeout = 0.01
+        monkeypatch.setattr(monitor, "check_langflow", monitor.fake_check("langflow", 5))
+        services = asyncio.run(monitor.collect())
+        assert services["langflow"] == {
+            "ok": False,
+            "detail": "Timed out after 0.01s",
+            "latency_ms": services["langflow"]["latency_ms"],
+        }
+
+
+def test_background_schedule_refreshes_and_stops(monitor):
+    monitor.interval = 0.01
+
+    async def run():
+        monitor.start()
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+        return dict(monitor.calls)
+
+    calls = asyncio.run(run())
+    assert calls["redis"] >= 3
+    assert not monitor.running
+
+
+def test_probes_reuse_attached_clients():
+    monitor = ServiceHealthMonitor()
+    http, redis_client = FakeHTTPClient(), FakeRedis()
+    monitor.attach(http_client=http, redis_client=redis_client)
+
+    async def run():
+        for _ in range(3):
+            await monitor.check_redis()
+            await monitor.check_langflow()
+        await monitor.stop()
+
+    asyncio.run(run())
+    assert redis_client.pings == 3
+    assert http.urls == [monitor.langflow_url] * 3
+    # Shared clients belong to the gateway and are left open
+    assert monitor._http_client is http and monitor._owned == []
+
+
+def test_latency_histogram_is_cumulative():
+    histogram = LatencyHistogram()
+    for latency in (0.5, 3, 7, 20000):
+        histogram.observe(latency)
+    data = histogram.to_dict()
+    assert data["count"] == 4
+    assert data["buckets"]["1"] == 1
+    assert data["buckets"]["10"] == 3
+    assert data["buckets"]["5000"] == 3
+    assert data["buckets"]["+Inf"] == 4
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test suite for the audiobook generator
+Tests chunk caching, streamed chapter audio and sample-accurate chapter markers
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from generate_audiobooks import (
+    AudiobookConfig,
+    AudiobookGenerator,
+    Chapter,
+    ChunkCache,
+    KokoroTTS,
+)
+
+
+class FakeTTS:
+    """One sample per character; chunks containing `fail` cannot be spoken"""
+
+    device = "cpu"
+
+    def __init__(self, fail=None):
+        self.fail = fail
+        self.calls = []
+
+    def synthesize_pcm(self, text):
+        self.calls.append(text)
+        if self.fail and self.fail in text:
+            return None
+        return b"\x01\x00" * len(text)
+
+
+def sentences(word, count):
+    return " ".join(f"{word} sentence number {i}." for i in range(count))
+
+
+@pytest.fixture
+def chapters():
+    # Long enough that the old 10,000 character cap would have truncated it
+    return [
+        Chapter(number=1, title="Opening", text=sentences("alpha", 600)),
+        Chapter(number=2, title="Middle", text=sentences("beta", 40)),
+        Chapter(number=3, title="Closing", text=sentences("gamma", 40)),
+    ]
+
+
+def make_generator(tmp_path, tts):
+    generator = AudiobookGenerator(
+        AudiobookConfig(workers=1, cache_dir=tmp_path / "chunks")
+    )
+    generator.tts = tts
+    return generator
+
+
+def chunk_chars(text, chunk_chars=1000):
+    return sum(len(chunk) for chunk in KokoroTTS._split_text(text, chunk_chars))
+
+
+class TestSynthesizeBook:
+    def test_streams_full_chapters_and_counts_samples(self, tmp_path, chapters):
+        generator = make_generator(tmp_path, FakeTTS())
+        book = tmp_path / "book.pcm"
+        assert generator.synthesize_book(chapters, book) == 3
+
+        assert len(chapters[0].text) > 10000
+        for chapter in chapters:
+            assert chapter.samples == chunk_chars(chapter.text)
+        # Headerless 16-bit PCM, so no 4 GiB WAV limit
+        assert book.stat().st_size == 2 * sum(c.samples for c in chapters)
+
+    def test_rerun_is_served_from_chunk_cache(self, tmp_path, chapters):
+        make_generator(tmp_path, FakeTTS()).synthesize_book(chapters, tmp_path / "a.pcm")
+
+        tts = FakeTTS()
+        rerun = make_generator(tmp_path, tts)
+        assert rerun.synthesize_book(chapters, tmp_path / "b.pcm") == 3
+        assert tts.calls == []
+        assert (tmp_path / "a.pcm").read_bytes() == (tmp_path / "b.pcm").read_bytes()
+
+        # A different voice is a different cache entry
+        assert ChunkCache.key("text", "af_heart", 1.0) != ChunkCache.key("text", "am_adam", 1.0)
+
+    def test_failed_chunk_skips_chapter_and_resumes(self, tmp_path, chapters):
+        first = FakeTTS(fail="beta sentence number 39")
+        generator = make_generator(tmp_path, first)
+        assert generator.synthesize_book(chapters, tmp_path / "a.pcm") == 2
+        assert chapters[1].samples == 0
+
+        tts = FakeTTS()
+        assert make_generator(tmp_path, tts).synthesize_book(chapters, tmp_path / "b.pcm") == 3
+        # Only the chunk that failed is synthesized again
+        assert len(tts.calls) == 1 and "beta sentence number 39" in tts.calls[0]
+
+
+def test_chapter_markers_use_sample_counts(tmp_path, monkeypatch):
+    import generate_audiobooks
+
+    commands = []
+    monkeypatch.setattr(
+        generate_audiobooks.subprocess, "run", lambda cmd, **k: commands.append(cmd)
+    )
+    generator = make_generator(tmp_path, FakeTTS())
+    chapters = [
+        Chapter(number=1, title="One", text="", samples=48000),
+        Chapter(number=2, title="Two", text="", samples=36000),
+    ]
+    audio = tmp_path / "book.pcm"
+    generator._create_m4b(audio, chapters, tmp_path / "out.m4b", {"title": "Book"})
+
+    # ffmpeg is told the raw PCM format before the input
+    cmd = commands[0]
+    assert cmd[cmd.index(str(audio)) - 7:cmd.index(str(audio))] == [
+        "-f", "s16le", "-ar", "24000", "-ac", "1", "-i",
+    ]
+
+    meta = (tmp_path / "chapters.txt").read_text()
+    assert "TIMEBASE=1/24000\nSTART=0\nEND=48000\ntitle=One" in meta
+    assert "START=48000\nEND=84000\ntitle=Two" in meta
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Health Monitor Agent's sweeps
+Tests concurrent time-boxed probes, adaptive jittered schedules and
+change-only registry writes
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from agents.health_monitor import health_monitor_agent
+from agents.health_monitor.health_monitor_agent import (
+    HealthCheckResult,
+    HealthMonitorAgent,
+    HealthStatus,
+)
+
+
+@pytest.fixture
+def agent(tmp_path, monkeypatch):
+    """Agent rooted in a temporary workspace with a small registry."""
+    nodes_dir = tmp_path / "infrastructure" / "nodes"
+    nodes_dir.mkdir(parents=True)
+    nodes = {
+        f"node{i}": {"name": f"Node {i}", "type": "service", "port": 9000 + i, "status": "unknown"}
+        for i in range(6)
+    }
+    (nodes_dir / "registry.json").write_text(json.dumps({"nodes": nodes}))
+    monkeypatch.setattr(
+        health_monitor_agent, "__file__", str(tmp_path / "agents" / "health_monitor" / "agent.py")
+    )
+    agent = HealthMonitorAgent()
+    agent.config["schedule_jitter_percent"] = 0
+    return agent
+
+
+def fake_probe(agent, delays=None, statuses=None):
+    """Replace the network probe; records how many probes run at once."""
+    agent.active = agent.peak = agent.probes = 0
+
+    async def probe(node_id, node_config, result):
+        agent.active += 1
+        agent.probes += 1
+        agent.peak = max(agent.peak, agent.active)
+        try:
+            await asyncio.sleep((delays or {}).get(node_id, 0.01))
+        finally:
+            agent.active -= 1
+        result.status = (statuses or {}).get(node_id, HealthStatus.HEALTHY)
+        return result
+
+    agent._probe_node = probe
+
+
+def registry(agent):
+    path = agent.infrastructure_path / "nodes" / "registry.json"
+    return json.loads(path.read_text())
+
+
+class TestConcurrentSweep:
+    def test_probes_run_concurrently_within_the_limit(self, agent):
+        agent.config["max_concurrent_checks"] = 3
+        fake_probe(agent, delays={node_id: 0.05 for node_id in agent.nodes})
+
+        start = time.monotonic()
+        results = asyncio.run(agent.check_all_nodes())
+        elapsed = time.monotonic() - start
+
+        assert len(results) == 6 and agent.peak == 3
+        assert elapsed < 0.25  # Two waves, not six sequential probes
+
+    def test_hung_probe_is_timed_out(self, agent):
+        agent.config["check_timeout_seconds"] = 0.05
+        fake_probe(agent, delays={"node2": 10})
+
+        results = asyncio.run(agent.check_all_nodes())
+
+        assert results["node2"].status == HealthStatus.UNHEALTHY
+        assert "timed out" in results["node2"].error_message
+        assert agent.error_counts["node2"] == 1
+        assert results["node1"].status == HealthStatus.HEALTHY
+
+
+class TestSchedule:
+    def result(self, status):
+        return HealthCheckResult(node_id="node0", node_name="Node 0", status=status)
+
+    def test_healthy_nodes_back_off_and_failing_nodes_are_probed_sooner(self, agent):
+        agent.config.update(
+            heartbeat_interval_seconds=30,
+            max_check_interval_seconds=100,
+            failing_check_interval_seconds=5,
+        )
+        healthy = self.result(HealthStatus.HEALTHY)
+        delays = [agent._schedule_next_check("node0", healthy) for _ in range(4)]
+        assert delays == pytest.approx([30, 60, 100, 100])
+
+        assert agent._schedule_next_check("node0", self.result(HealthStatus.UNHEALTHY)) == pytest.approx(5)
+        assert agent._schedule_next_check("node0", healthy) == pytest.approx(30)
+        assert agent._schedule_next_check("node0", self.result(HealthStatus.DEGRADED)) == pytest.approx(30)
+
+    def test_jitter_spreads_nodes(self, agent):
+        agent.config["schedule_jitter_percent"] = 20
+        healthy = self.result(HealthStatus.HEALTHY)
+        delays = {agent._schedule_next_check(f"node{i}", healthy) for i in range(6)}
+        assert len(delays) == 6
+        assert all(24 <= delay <= 36 for delay in delays)
+
+    def test_only_due_nodes_are_checked(self, agent):
+        fake_probe(agent)
+        asyncio.run(agent.check_all_nodes())
+        agent.next_check_at["node3"] = 0.0
+
+        results = asyncio.run(agent.check_due_nodes())
+
+        assert list(results) == ["node3"]
+        assert 1.0 <= agent._seconds_until_next_check() <= 30
+
+
+class TestRegistryWrites:
+    def test_unchanged_statuses_are_not_rewritten(self, agent):
+        path = agent.infrastructure_path / "nodes" / "registry.json"
+        fake_probe(agent, statuses={"node4": HealthStatus.UNHEALTHY})
+
+        asyncio.run(agent.check_all_nodes())
+        first = registry(agent)
+        assert first["nodes"]["node4"]["status"] == "unhealthy"
+        assert first["nodes"]["node0"]["status"] == "healthy"
+        written_at = path.stat().st_mtime_ns
+
+        asyncio.run(agent.check_all_nodes())
+        assert path.stat().st_mtime_ns == written_at
+
+        fake_probe(agent)
+        asyncio.run(agent.check_all_nodes())
+        second = registry(agent)
+        assert second["nodes"]["node4"]["status"] == "healthy"
+        # Only the node that changed got a new timestamp
+        assert second["nodes"]["node0"] == first["nodes"]["node0"]
+        assert not list(path.parent.glob("*.tmp"))
+
+    def test_periodic_refresh_updates_every_node(self, agent):
+        fake_probe(agent)
+        asyncio.run(agent.check_all_nodes())
+        before = registry(agent)
+        # Unchanged statuses: newer check times stay in memory only
+        asyncio.run(agent.check_all_nodes())
+        assert registry(agent) == before
+
+        agent.config["registry_refresh_seconds"] = 0
+        asyncio.run(agent._check_nodes(["node1"]))
+        after = registry(agent)
+
+        for node_id in agent.nodes:
+            last_check = agent.health_state[node_id].last_check
+            assert after["nodes"][node_id]["last_health_check"] == last_check
+            assert last_check != before["nodes"][node_id]["last_health_check"]
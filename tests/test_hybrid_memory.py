@@ -160,6 +160,142 @@ class TestMemoryItem:
         assert restored.content == item.content
 
 
+class TestShortTermMemory:
+    """Test SQLite short-term memory with pooled connections"""
+
+    def _make_item(self, memory_id, content):
+        from integrations.memory.hybrid_memory import MemoryItem, MemoryTier
+
+        now = time.time()
+        return MemoryItem(
+            id=memory_id,
+            content=content,
+            tier=MemoryTier.SHORT_TERM,
+            created_at=now,
+            accessed_at=now,
+            source="test",
+        )
+
+    def test_connection_reused_with_wal(self, tmp_path):
+        """Test the same thread reuses one WAL-mode connection"""
+        from integrations.memory.hybrid_memory import ShortTermMemory
+
+        stm = ShortTermMemory(str(tmp_path / "short_term.db"))
+
+        assert stm.conn is stm.conn
+        mode = stm.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode.lower() == "wal"
+        stm.close()
+
+    def test_store_many_and_search(self, tmp_path):
+        """Test bulk insert populates both memories and the FTS index"""
+        from integrations.memory.hybrid_memory import ShortTermMemory
+
+        stm = ShortTermMemory(str(tmp_path / "short_term.db"))
+        items = [self._make_item(f"m{i}", f"note {i} about gardening") for i in range(20)]
+
+        ids = stm.store_many(items)
+
+        assert ids == [item.id for item in items]
+        assert len(stm.search("gardening", limit=50)) == 20
+        assert stm.retrieve("m3").content == "note 3 about gardening"
+        assert stm.delete("m3") is True
+        assert stm.retrieve("m3") is None
+        stm.close()
+
+
+class TestWorkingMemory:
+    """Test the indexed working-memory store"""
+
+    def _make_item(self, memory_id, content):
+        from integrations.memory.hybrid_memory import MemoryItem, MemoryTier
+
+        now = time.time()
+        return MemoryItem(
+            id=memory_id,
+            content=content,
+            tier=MemoryTier.WORKING,
+            created_at=now,
+            accessed_at=now,
+        )
+
+    def test_search_requires_all_tokens_and_ranks_phrase_first(self):
+        """Test token intersection and phrase-match ranking"""
+        from integrations.memory.hybrid_memory import WorkingMemory
+
+        wm = WorkingMemory()
+        wm.add(self._make_item("a", "deploy the gateway service"))
+        wm.add(self._make_item("b", "gateway logs show the deploy failed"))
+        wm.add(self._make_item("c", "unrelated note"))
+
+        results = wm.search("Deploy the gateway")
+
+        assert [item.id for item in results] == ["a", "b"]
+        assert [item.id for item in wm.search("gateway failed")] == ["b"]
+        assert wm.get("a").access_count == 1
+
+    def test_lru_eviction_and_removal_updates_index(self):
+        """Test LRU order follows access and removal clears postings"""
+        from integrations.memory.hybrid_memory import WorkingMemory
+
+        wm = WorkingMemory()
+        for i in range(3):
+            wm.add(self._make_item(f"m{i}", f"item number {i}"))
+
+        wm.search("0")  # touch m0 so m1 becomes least recently used
+        assert wm.pop_lru().id == "m1"
+
+        wm.remove("m2")
+        assert wm.search("2") == []
+        assert len(wm) == 1
+
+
+class TestHybridRecall:
+    """Test batched and concurrent recall across tiers"""
+
+    def _make_memory(self, tmp_path):
+        from integrations.memory.hybrid_memory import HybridMemory, MemoryConfig
+
+        memory = HybridMemory(MemoryConfig(sqlite_path=str(tmp_path / "stm.db")))
+
+        def fake_query(query_texts, n_results, where=None, include=None):
+            return {
+                "ids": [[f"doc{q}-{i}" for i in range(n_results)] for q in range(len(query_texts))],
+                "documents": [[f"text {q}-{i}" for i in range(n_results)] for q in range(len(query_texts))],
+                "metadatas": [[{"tier": "long"}] * n_results for _ in query_texts],
+                "distances": [[0.1 * i for i in range(n_results)] for _ in query_texts],
+            }
+
+        memory.long_term._collection = MagicMock()
+        memory.long_term._collection.query.side_effect = fake_query
+        return memory
+
+    def test_recall_with_reasoning_single_chroma_call(self, tmp_path):
+        """Test foundation, focus and shadow share one multi-query call"""
+        memory = self._make_memory(tmp_path)
+        memory.remember("gardening notes for spring")
+
+        results, steps = memory.recall_with_reasoning("gardening", n_results=3)
+
+        assert memory.long_term._collection.query.call_count == 1
+        call = memory.long_term._collection.query.call_args
+        assert len(call.kwargs["query_texts"]) == 3
+        assert results[0].content == "gardening notes for spring"
+        assert steps[-1].startswith("Final result")
+
+    def test_arecall_returns_tier_timings(self, tmp_path):
+        """Test async recall fans out and reports per-tier timing"""
+        import asyncio
+
+        memory = self._make_memory(tmp_path)
+        memory.remember("gardening notes for spring")
+
+        results, timings = asyncio.run(memory.arecall("gardening", n_results=3))
+
+        assert {"working", "short_term", "long_term", "total"} <= set(timings)
+        assert len(results) == 4
+
+
 class TestThoughtStep:
     """Test Sequential Reasoning ThoughtStep"""
 
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Test suite for the LLM response cache
+Tests exact and semantic lookups, eviction, temperature bypass and the
+provider wrapper
+"""
+
+import asyncio
+
+import pytest
+
+from integrations.llm_cache import ResponseCache, SQLiteResponseCache
+
+PARAMS = {"model": "llama3.2", "temperature": 0.0}
+RESPONSE = {"content": "Paris", "model": "llama3.2", "provider": "ollama"}
+
+
+def ask(text, system="Be brief."):
+    return [{"role": "system", "content": system}, {"role": "user", "content": text}]
+
+
+def fake_embed(text):
+    """Bag-of-letters embedding: good enough to tell rephrasings apart"""
+    vector = [0.0] * 26
+    for ch in text.lower():
+        if ch.isalpha():
+            vector[ord(ch) - ord("a")] += 1
+    return vector
+
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = SQLiteResponseCache(tmp_path / "responses.sqlite3")
+    yield backend
+    asyncio.run(backend.close())
+
+
+def roundtrip(cache, messages, params=PARAMS):
+    async def run():
+        cached, context = await cache.lookup("chat", messages, params)
+        if cached is None:
+            await cache.store(context, RESPONSE)
+        return cached
+
+    return asyncio.run(run())
+
+
+class TestResponseCache:
+    def test_exact_hits_ignore_whitespace_and_extra_fields(self, backend):
+        cache = ResponseCache(backend)
+        assert roundtrip(cache, ask("Capital of France?")) is None
+
+        messages = ask("  Capital of France?\n")
+        messages[1]["id"] = "msg-42"
+        assert roundtrip(cache, messages) == RESPONSE
+
+        # Model, parameters and history are part of the key
+        assert roundtrip(cache, ask("Capital of France?"), {**PARAMS, "model": "mistral"}) is None
+        assert roundtrip(cache, ask("Capital of France?", system="Be verbose.")) is None
+
+        stats = asyncio.run(cache.stats())
+        assert stats["exact_hits"] == 1 and stats["misses"] == 3
+        assert stats["entries"] == 3
+
+    def test_semantic_tier_matches_rephrasings_within_scope(self, backend):
+        cache = ResponseCache(backend, embed=fake_embed, similarity_threshold=0.9)
+        roundtrip(cache, ask("What is the capital of France?"))
+
+        assert roundtrip(cache, ask("what is the capital of france")) == RESPONSE
+        assert roundtrip(cache, ask("List three prime numbers")) is None
+        # Same question, different conversation: never shared
+        assert roundtrip(cache, ask("What is the capital of France?", system="Answer in French.")) is None
+        assert asyncio.run(cache.stats())["semantic_hits"] == 1
+
+    def test_ttl_and_size_eviction(self, tmp_path):
+        backend = SQLiteResponseCache(tmp_path / "r.sqlite3", max_entries=2)
+        cache = ResponseCache(backend)
+        for question in ("one", "two"):
+            roundtrip(cache, ask(question))
+        roundtrip(cache, ask("one"))  # refreshes "one"
+        roundtrip(cache, ask("three"))
+        assert asyncio.run(backend.count()) == 2
+        assert roundtrip(cache, ask("two")) is None
+        assert roundtrip(cache, ask("three")) == RESPONSE
+
+        backend.ttl_seconds = 0
+        assert roundtrip(cache, ask("three")) is None
+        asyncio.run(backend.close())
+
+    def test_size_trim_is_amortized_across_writes(self, tmp_path):
+        backend = SQLiteResponseCache(tmp_path / "r.sqlite3", max_entries=30)
+
+        async def fill(start, stop):
+            for i in range(start, stop):
+                await backend.set(f"key-{i}", "scope", RESPONSE)
+
+        # Trims run every max_entries // 10 = 3 writes
+        asyncio.run(fill(0, 31))
+        assert asyncio.run(backend.count()) == 31
+        asyncio.run(fill(31, 33))
+        assert asyncio.run(backend.count()) == 30
+        assert asyncio.run(backend.get("key-2")) is None
+        assert asyncio.run(backend.get("key-32")) == RESPONSE
+        asyncio.run(backend.close())
+
+    def test_temperature_bypass_and_overrides(self, backend):
+        cache = ResponseCache(backend)
+        assert cache.should_cache(0.0)
+        assert not cache.should_cache(0.7)
+        assert cache.should_cache(0.7, opt_in=True)
+        assert not cache.should_cache(0.0, opt_in=False)
+        assert ResponseCache(backend, cache_nondeterministic=True).should_cache(0.7)
+
+    def test_backend_errors_degrade_to_misses(self, backend):
+        cache = ResponseCache(backend)
+        asyncio.run(backend.close())
+        assert roundtrip(cache, ask("anything")) is None
+        stats = asyncio.run(cache.stats())
+        assert stats["misses"] == 1 and stats["errors"] == 2
+
+
+def test_redis_backend_roundtrip():
+    fakeredis = pytest.importorskip("fakeredis")
+    from integrations.llm_cache import RedisResponseCache
+
+    backend = RedisResponseCache(fakeredis.FakeAsyncRedis(), max_entries=2)
+    cache = ResponseCache(backend, embed=fake_embed, similarity_threshold=0.9)
+    for question in ("one", "two", "three"):
+        roundtrip(cache, ask(question))
+    assert asyncio.run(backend.count()) == 2
+    assert roundtrip(cache, ask("one")) is None
+    assert roundtrip(cache, ask("Three")) == RESPONSE
+
+
+class TestCachedProvider:
+    @pytest.fixture
+    def llm(self):
+        pytest.importorskip("aiohttp")
+        pytest.importorskip("loguru")
+        from integrations import llm_providers
+
+        return llm_providers
+
+    def make_provider(self, llm, backend, temperature=0.0, **cache_kwargs):
+        class CountingProvider(llm.LLMProvider):
+            def __init__(self):
+                super().__init__(
+                    llm.LLMConfig(provider=llm.ProviderType.OLLAMA, temperature=temperature)
+                )
+                self.calls = 0
+
+            async def generate(self, prompt, **kwargs):
+                return await self.chat([{"role": "user", "content": prompt}], **kwargs)
+
+            async def chat(self, messages, **kwargs):
+                assert "cache" not in kwargs
+                self.calls += 1
+                return llm.LLMResponse(
+                    content=f"answer {self.calls}",
+                    model=kwargs.get("model", self.config.model),
+                    provider=llm.ProviderType.OLLAMA,
+                    finish_reason="stop",
+                    usage={"total_tokens": 5},
+                )
+
+            async def tool_call(self, messages, tools, **kwargs):
+                raise NotImplementedError
+
+            async def stream(self, messages, **kwargs):
+                yield "chunk"
+
+        inner = CountingProvider()
+        cache = ResponseCache(backend, **cache_kwargs)
+        return inner, llm.CachedProvider(inner, cache)
+
+    def test_hits_skip_the_provider(self, llm, backend):
+        inner, provider = self.make_provider(llm, backend)
+        first = asyncio.run(provider.chat(ask("hello")))
+        second = asyncio.run(provider.chat(ask("hello")))
+        assert inner.calls == 1
+        assert second.cached and not first.cached
+        assert (second.content, second.usage) == (first.content, first.usage)
+
+        # generate and chat are cached separately; per-call opt-out works
+        asyncio.run(provider.generate("hello"))
+        asyncio.run(provider.chat(ask("hello"), cache=False))
+        assert inner.calls == 3
+
+    def test_nonzero_temperature_bypasses_unless_opted_in(self, llm, backend):
+        inner, provider = self.make_provider(llm, backend, temperature=0.7)
+        for _ in range(2):
+            asyncio.run(provider.chat(ask("poem")))
+        assert inner.calls == 2
+        assert asyncio.run(provider.cache.stats())["bypassed"] == 2
+
+        for _ in range(2):
+            asyncio.run(provider.chat(ask("poem"), cache=True))
+        assert inner.calls == 3
+
+    def test_router_wraps_providers_and_ignores_hit_latency(self, llm, backend):
+        inner, _ = self.make_provider(llm, backend)
+        router = llm.ProviderRouter(cache=ResponseCache(backend))
+        router.register(llm.ProviderType.OLLAMA, inner)
+        assert not inner.retry_rate_limited
+
+        for _ in range(3):
+            asyncio.run(router.chat(ask("hello")))
+        assert inner.calls == 1
+        assert router.get_stats()["ollama"]["requests"] == 1
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test suite for the MCP server embedding service
+Tests request coalescing, batching and caching
+"""
+
+import asyncio
+
+import pytest
+
+from gateway.mcp.embeddings import EmbeddingService
+
+
+class FakeResponse:
+    def __init__(self, data, status_code=200):
+        self._data = data
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def json(self):
+        return self._data
+
+
+class FakeClient:
+    """Records provider calls and embeds text as [len(text), index]."""
+
+    def __init__(self, ollama_batch=True):
+        self.calls = []
+        self.ollama_batch = ollama_batch
+
+    async def post(self, url, json=None, headers=None, timeout=None):
+        self.calls.append((url, json))
+        await asyncio.sleep(0)
+        if url.endswith("/embeddings") and "input" in json:
+            data = [
+                {"index": i, "embedding": [float(len(t)), float(i)]}
+                for i, t in enumerate(json["input"])
+            ]
+            # OpenAI does not guarantee ordering; index is authoritative
+            return FakeResponse({"data": list(reversed(data))})
+        if url.endswith("/api/embed"):
+            if not self.ollama_batch:
+                return FakeResponse({}, status_code=404)
+            return FakeResponse(
+                {"embeddings": [[float(len(t)), 0.0] for t in json["input"]]}
+            )
+        if url.endswith("/api/embeddings"):
+            return FakeResponse({"embedding": [float(len(json["prompt"])), 0.0]})
+        return FakeResponse({}, status_code=500)
+
+
+def make_service(client, **kwargs):
+    async def get_client():
+        return client
+
+    defaults = dict(
+        provider="openai",
+        openai_api_key="test",
+        openai_model="text-embedding-3-small",
+        ollama_model="nomic-embed-text",
+        batch_window_ms=5,
+    )
+    defaults.update(kwargs)
+    return EmbeddingService(get_client, **defaults)
+
+
+class TestEmbeddingService:
+    def test_concurrent_requests_share_one_batch(self):
+        client = FakeClient()
+        service = make_service(client)
+
+        async def run():
+            return await asyncio.gather(*(service.embed(f"text {i:03}") for i in range(10)))
+
+        results = asyncio.run(run())
+        assert len(client.calls) == 1
+        assert len(client.calls[0][1]["input"]) == 10
+        assert [r[1] for r in results] == [float(i) for i in range(10)]
+
+    def test_cache_and_inflight_dedup(self):
+        client = FakeClient()
+        service = make_service(client)
+
+        async def run():
+            await asyncio.gather(service.embed("same"), service.embed("same"))
+            await service.embed("same")
+
+        asyncio.run(run())
+        stats = service.get_stats()
+        assert len(client.calls) == 1
+        assert client.calls[0][1]["input"] == ["same"]
+        assert stats["coalesced"] == 1
+        assert stats["cache_hits"] == 1
+
+    def test_max_batch_size_splits_calls(self):
+        client = FakeClient()
+        service = make_service(client, max_batch_size=4)
+
+        results = asyncio.run(service.embed_many([f"doc {i}" for i in range(10)]))
+        assert len(results) == 10
+        assert [len(call[1]["input"]) for call in client.calls] == [4, 4, 2]
+
+    def test_cache_is_bounded(self):
+        client = FakeClient()
+        service = make_service(client, cache_size=3)
+        asyncio.run(service.embed_many(["a", "b", "c", "d"]))
+        assert service.get_stats()["cache_entries"] == 3
+
+    @pytest.mark.parametrize("batch_endpoint", [True, False])
+    def test_ollama_batch_and_legacy_fallback(self, batch_endpoint):
+        client = FakeClient(ollama_batch=batch_endpoint)
+        service = make_service(client, provider="ollama", ollama_url="http://ollama:11434")
+
+        results = asyncio.run(service.embed_many(["one", "three"]))
+        assert results == [[3.0, 0.0], [5.0, 0.0]]
+        urls = [call[0] for call in client.calls]
+        assert urls[0] == "http://ollama:11434/api/embed"
+        assert len(urls) == (1 if batch_endpoint else 3)
+
+    def test_provider_errors_propagate(self):
+        service = make_service(FakeClient(), provider="ollama", ollama_model="")
+        with pytest.raises(RuntimeError):
+            asyncio.run(service.embed("x"))
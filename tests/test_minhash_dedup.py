@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test suite for MinHash/LSH near-duplicate detection
+Tests signatures, the LSH filter, ingest-time chunk dedup and RAG dedup
+"""
+
+from integrations.minhash_dedup import (
+    METADATA_KEY,
+    LSHIndex,
+    MinHasher,
+    NearDuplicateFilter,
+)
+from integrations.rag_pipeline import EnhancedRAGPipeline, RAGConfig, RetrievalResult
+
+BASE = (
+    "Dynamic programming solves problems by combining solutions to overlapping "
+    "subproblems and storing intermediate results in a table so each subproblem "
+    "is computed only once, which turns exponential recursions into polynomial time"
+)
+
+
+class TestMinHasher:
+    def test_signatures_are_stable_and_encodable(self):
+        a = MinHasher().signature(BASE)
+        assert a == MinHasher().signature(BASE)
+        assert len(a) == 64
+        assert MinHasher.decode(MinHasher.encode(a)) == a
+
+    def test_similarity_tracks_jaccard(self):
+        hasher = MinHasher(num_perm=128)
+        near = BASE.replace("polynomial time", "polynomial running time")
+        assert hasher.similarity(hasher.signature(BASE), hasher.signature(near)) > 0.7
+        unrelated = hasher.signature("Obsidian vaults store markdown notes with wiki links")
+        assert hasher.similarity(hasher.signature(BASE), unrelated) < 0.1
+
+    def test_lsh_band_selection(self):
+        index = LSHIndex(num_perm=64, threshold=0.9)
+        assert index.bands * index.rows == 64
+        assert (1 / index.bands) ** (1 / index.rows) <= 0.9
+
+
+class TestNearDuplicateFilter:
+    def test_filter_keeps_first_occurrence(self):
+        texts = [BASE, "Completely different text about calendars and syllabi", BASE + " ."]
+        kept = NearDuplicateFilter(threshold=0.9).filter(texts, lambda t: t)
+        assert kept == texts[:2]
+
+    def test_dedupe_chunks_annotates_metadata(self):
+        dedupe = NearDuplicateFilter()
+        chunks = [
+            {"id": "a", "text": BASE, "metadata": {"path": "a.md"}},
+            {"id": "b", "text": BASE, "metadata": {"path": "b.md"}},
+            {"id": "c", "text": "Unrelated chunk about the gateway", "metadata": {}},
+        ]
+        kept = dedupe.dedupe_chunks(chunks)
+        assert [c["id"] for c in kept] == ["a", "c"]
+        assert all(METADATA_KEY in c["metadata"] for c in kept)
+
+        # Later batches are checked against what this filter already kept
+        assert dedupe.dedupe_chunks([{"id": "d", "text": BASE}]) == []
+
+    def test_precomputed_signature_is_used(self):
+        dedupe = NearDuplicateFilter()
+        encoded = MinHasher.encode(MinHasher().signature(BASE))
+        assert dedupe.signature_for("ignored text", {METADATA_KEY: encoded}) == MinHasher.decode(encoded)
+
+
+class TestRAGDeduplicate:
+    def test_pipeline_drops_near_duplicates(self):
+        pipeline = EnhancedRAGPipeline(config=RAGConfig(use_reranking=False))
+        results = [
+            RetrievalResult(id="1", content=BASE),
+            RetrievalResult(id="2", content="A note about spaced repetition and flashcards"),
+            RetrievalResult(id="3", content=BASE.upper()),
+        ]
+        assert [r.id for r in pipeline._deduplicate(results)] == ["1", "2"]
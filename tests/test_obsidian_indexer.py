@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Test suite for the incremental Obsidian vault indexer
+Tests chunk reuse on edits, batched writes, removals and legacy cleanup
+"""
+
+import json
+import os
+
+import pytest
+
+from integrations.obsidian_enhanced import EnhancedObsidianIntegration, ObsidianConfig
+from integrations.obsidian_indexer import VaultIndexer, chunk_id
+
+
+class FakeCollection:
+    """Records Chroma calls and keeps ids in memory"""
+
+    def __init__(self):
+        self.items = {}
+        self.calls = []
+
+    def upsert(self, ids, documents, metadatas, embeddings=None):
+        self.calls.append(("upsert", len(ids)))
+        for i, cid in enumerate(ids):
+            self.items[cid] = {"document": documents[i], "metadata": metadatas[i]}
+
+    def update(self, ids, metadatas):
+        self.calls.append(("update", len(ids)))
+        for cid, metadata in zip(ids, metadatas):
+            self.items[cid]["metadata"] = metadata
+
+    def delete(self, ids=None, where=None):
+        self.calls.append(("delete", len(ids) if ids else where))
+        for cid in ids or []:
+            self.items.pop(cid, None)
+
+
+class CountingEmbedder:
+    def __init__(self):
+        self.texts = []
+
+    def __call__(self, texts):
+        self.texts.extend(texts)
+        return [[float(len(t)), 1.0] for t in texts]
+
+
+def paragraphs(prefix, count):
+    return "\n\n".join(
+        f"{prefix} paragraph {i} " + " ".join(f"word{i}_{j}" for j in range(40))
+        for i in range(count)
+    )
+
+
+def write_note(vault, rel_path, body, bump=0):
+    path = vault / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\ntags: [test]\n---\n{body}", encoding="utf-8")
+    if bump:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump))
+
+
+@pytest.fixture
+def vault(tmp_path):
+    write_note(tmp_path, "alpha.md", paragraphs("alpha", 6))
+    write_note(tmp_path, "notes/beta.md", paragraphs("beta", 3))
+    write_note(tmp_path, ".obsidian/ignored.md", "ignored")
+    return tmp_path
+
+
+@pytest.fixture
+def indexer(vault):
+    integration = EnhancedObsidianIntegration(ObsidianConfig(vault_path=vault))
+    embedder = CountingEmbedder()
+    indexer = VaultIndexer(integration, embed_fn=embedder, workers=2, embed_batch_size=4)
+    indexer.embedder = embedder
+    yield indexer
+    indexer.close()
+
+
+class TestVaultIndexer:
+    def test_initial_sync_indexes_all_chunks(self, indexer):
+        collection = FakeCollection()
+        stats = indexer.sync(collection)
+
+        assert stats["status"] == "success"
+        assert stats["total"] == 2
+        assert stats["synced"] == 2
+        assert stats["embedded"] == len(collection.items) == len(indexer.embedder.texts)
+        assert {"scan", "parse", "embed", "write", "state"} <= set(stats["timings"])
+        assert indexer.stats()["notes"] == 2
+
+    def test_unchanged_vault_is_skipped(self, indexer):
+        collection = FakeCollection()
+        indexer.sync(collection)
+        collection.calls.clear()
+
+        stats = indexer.sync(collection)
+        assert stats["skipped"] == 2
+        assert stats["embedded"] == 0
+        assert not [c for c in collection.calls if c[0] == "upsert"]
+
+    def test_edit_reembeds_only_changed_chunks(self, indexer, vault):
+        collection = FakeCollection()
+        indexer.sync(collection)
+        before = len(indexer.embedder.texts)
+
+        body = paragraphs("alpha", 6).replace("alpha paragraph 2", "alpha paragraph TWO")
+        write_note(vault, "alpha.md", body, bump=10**9)
+        stats = indexer.sync(collection)
+
+        assert stats["synced"] == 1
+        assert 0 < stats["embedded"] < stats["chunks"]
+        assert stats["reused"] > 0
+        assert len(indexer.embedder.texts) - before == stats["embedded"]
+        assert any("TWO" in item["document"] for item in collection.items.values())
+        assert not any(
+            "alpha paragraph 2 " in item["document"] for item in collection.items.values()
+        )
+
+    def test_touch_without_change_reads_but_does_not_write(self, indexer, vault):
+        collection = FakeCollection()
+        indexer.sync(collection)
+        collection.calls.clear()
+
+        write_note(vault, "notes/beta.md", paragraphs("beta", 3), bump=10**9)
+        stats = indexer.sync(collection)
+        assert stats["unchanged"] == 1
+        assert collection.calls == []
+
+    def test_removed_note_deletes_chunks(self, indexer, vault):
+        collection = FakeCollection()
+        indexer.sync(collection)
+        (vault / "notes" / "beta.md").unlink()
+
+        stats = indexer.sync(collection)
+        assert stats["removed"] == 1
+        assert all(item["metadata"]["path"] != "notes/beta.md" for item in collection.items.values())
+        assert indexer.stats()["notes"] == 1
+
+    def test_sync_paths_handles_single_note(self, indexer, vault):
+        collection = FakeCollection()
+        stats = indexer.sync_paths(collection, ["alpha.md"])
+        assert stats["synced"] == 1
+        assert {item["metadata"]["path"] for item in collection.items.values()} == {"alpha.md"}
+
+    def test_failed_write_keeps_previous_state(self, indexer):
+        class Broken(FakeCollection):
+            def upsert(self, *args, **kwargs):
+                raise RuntimeError("chroma down")
+
+        stats = indexer.sync(Broken())
+        assert stats["status"] == "error"
+        assert indexer.stats()["notes"] == 0
+
+    def test_legacy_chunks_removed_on_first_sync(self, indexer, vault):
+        (vault / VaultIndexer.LEGACY_STATE).write_text(json.dumps({"alpha.md": "1.0"}))
+        collection = FakeCollection()
+        indexer.sync(collection)
+
+        assert ("delete", {"path": {"$in": ["alpha.md"]}}) in collection.calls
+
+        # Only the first sync cleans up
+        collection.calls.clear()
+        write_note(vault, "alpha.md", "changed", bump=10**9)
+        indexer.sync(collection)
+        assert not [c for c in collection.calls if isinstance(c[1], dict)]
+
+
+def test_chunk_id_is_content_addressed():
+    assert chunk_id("a.md", "text") == chunk_id("a.md", "text")
+    assert chunk_id("a.md", "text") != chunk_id("b.md", "text")
+    assert chunk_id("a.md", "text") != chunk_id("a.md", "other")
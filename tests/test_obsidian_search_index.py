@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Obsidian full-text and link index
+Tests parity with file scanning, incremental updates, rebuild and check
+"""
+
+import os
+
+import pytest
+
+from integrations.obsidian_enhanced import EnhancedObsidianIntegration, ObsidianConfig
+from integrations.obsidian_search_index import VaultSearchIndex, required_literal
+
+NOTES = {
+    "Alpha.md": "Alpha links to [[Beta]] and [[Gamma|the gamma note]].\nKeyword here.",
+    "Beta.md": "Beta mentions keyword twice: keyword. Links [[Alpha]].",
+    "folder/Gamma.md": "---\ntags: [x]\n---\nGamma links [[Beta]] and [[Beta]].",
+    ".obsidian/Hidden.md": "keyword [[Alpha]]",
+}
+
+
+def write(vault, rel_path, text, bump=0):
+    path = vault / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    if bump:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump))
+
+
+@pytest.fixture
+def vault(tmp_path):
+    for rel_path, text in NOTES.items():
+        write(tmp_path, rel_path, text)
+    return tmp_path
+
+
+def make_integration(vault):
+    return EnhancedObsidianIntegration(ObsidianConfig(vault_path=vault, auto_sync=False))
+
+
+@pytest.fixture
+def scan_results(vault, monkeypatch):
+    """Results of the pre-index file-scan implementations, for parity checks"""
+    integration = make_integration(vault)
+    monkeypatch.setattr(EnhancedObsidianIntegration, "search_index", property(lambda self: None))
+    results = {
+        "search": integration.search_text("keyword"),
+        "regex": integration.search_text(r"link\w*"),
+        "backlinks": integration.build_backlinks(),
+        "graph": integration.export_graph(),
+    }
+    monkeypatch.undo()
+    return results
+
+
+class TestIndexParity:
+    def test_search_matches_file_scan(self, vault, scan_results):
+        integration = make_integration(vault)
+        assert integration.search_text("keyword") == scan_results["search"]
+        assert sorted(
+            (r["path"], r["match_count"]) for r in integration.search_text(r"link\w*")
+        ) == sorted((r["path"], r["match_count"]) for r in scan_results["regex"])
+
+    def test_backlinks_match_file_scan(self, vault, scan_results):
+        integration = make_integration(vault)
+        backlinks = integration.build_backlinks()
+        assert {k: sorted(v) for k, v in backlinks.items()} == {
+            k: sorted(v) for k, v in scan_results["backlinks"].items()
+        }
+        assert sorted(b["title"] for b in integration.get_backlinks("Beta.md")) == [
+            "Alpha",
+            "Gamma",
+            "Gamma",
+        ]
+
+    def test_graph_matches_file_scan(self, vault, scan_results):
+        graph = make_integration(vault).export_graph()
+
+        def key(node):
+            return node["path"]
+
+        assert sorted(graph["nodes"], key=key) == sorted(scan_results["graph"]["nodes"], key=key)
+        assert graph["stats"] == scan_results["graph"]["stats"]
+
+
+class TestIndexMaintenance:
+    def test_note_operations_update_index(self, vault):
+        integration = make_integration(vault)
+        assert integration.search_text("zebra") == []
+
+        integration.create_note("Zebra", "zebra stripes [[Alpha]]")
+        assert [r["title"] for r in integration.search_text("zebra")] == ["Zebra"]
+        assert "Zebra" in [b["title"] for b in integration.get_backlinks("Alpha.md")]
+
+        integration.delete_note("Zebra.md")
+        assert integration.search_text("zebra") == []
+
+    def test_refresh_picks_up_external_edits(self, vault):
+        index = VaultSearchIndex(make_integration(vault))
+        assert index.refresh()["updated"] == 3
+        assert index.refresh()["updated"] == 0
+
+        write(vault, "Beta.md", "rewritten", bump=10**9)
+        (vault / "Alpha.md").unlink()
+        stats = index.refresh()
+        assert stats["updated"] == 1 and stats["removed"] == 1
+        assert index.search("keyword") == []
+
+    def test_short_and_regex_patterns_fall_back_to_stored_text(self, vault):
+        index = VaultSearchIndex(make_integration(vault))
+        index.refresh()
+        assert {r["title"] for r in index.search("[[")} == set()  # invalid regex
+        assert {r["title"] for r in index.search(r"\[\[Beta")} == {"Alpha", "Gamma"}
+        assert {r["title"] for r in index.search("ga")} == {"Alpha", "Gamma"}
+
+    def test_check_reports_drift_and_rebuild_fixes_it(self, vault):
+        integration = make_integration(vault)
+        index = VaultSearchIndex(integration)
+        index.refresh()
+        assert index.check()["consistent"]
+
+        write(vault, "New.md", "new note")
+        write(vault, "Beta.md", "changed", bump=10**9)
+        (vault / "folder" / "Gamma.md").unlink()
+        report = index.check()
+        assert not report["consistent"]
+        assert report["missing"] == ["New.md"]
+        assert report["stale"] == ["Beta.md"]
+        assert report["orphaned"] == [os.path.join("folder", "Gamma.md")]
+
+        index.rebuild()
+        assert index.check()["consistent"]
+
+
+class TestWatcherDebounce:
+    def test_events_coalesce_until_quiet_or_overdue(self, vault):
+        integration = make_integration(vault)
+        integration._queue_path("Beta.md")
+        integration._queue_path("Alpha.md")
+        integration._queue_path("Beta.md")
+        last = integration._last_event
+
+        assert integration._take_pending(now=last + 0.5) is None
+        assert integration._take_pending(now=last + 1.0) == ["Alpha.md", "Beta.md"]
+        assert integration._take_pending(now=last + 5.0) is None
+
+        # Constant activity still flushes after max_batch_delay_seconds
+        integration._queue_path("Alpha.md")
+        integration._last_event = integration._first_event + 9.9
+        assert integration._take_pending(now=integration._first_event + 10.0) == ["Alpha.md"]
+
+    def test_worker_indexes_pending_paths_on_stop(self, vault):
+        integration = make_integration(vault)
+        assert integration.search_index is not None
+        write(vault, "New.md", "fresh keyword")
+        integration._queue_path("New.md")
+        integration._queue_path("New.md")
+
+        # The loop exits at once and drains what the debounce still holds
+        integration._watch_stop.set()
+        integration._watch_loop()
+        assert integration._take_pending(now=float("inf")) is None
+        assert "New.md" in [r["path"] for r in integration.search_text("fresh")]
+
+
+@pytest.mark.parametrize(
+    "pattern, literal",
+    [
+        ("plain text", "plain text"),
+        (r"needl\w+", "needl"),
+        (r"\[\[Beta", "Beta"),
+        ("abc?de", "ab"),
+        ("x{2,3}yyy", "yyy"),
+        ("[abc]def", "def"),
+        ("(foo)?barbaz", "barbaz"),
+        ("a|bcd", ""),
+    ],
+)
+def test_required_literal(pattern, literal):
+    assert required_literal(pattern) == literal
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Obsidian sync watcher
+Tests manifest reconciliation, batched sync and event debouncing
+"""
+
+import json
+import os
+
+import pytest
+
+from tools.obsidian.obsidian_sync_watcher import ObsidianSyncWatcher, SyncConfig
+
+
+def write_note(vault, rel_path, body, tags="osmen", bump=0):
+    path = vault / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\ntags: [{tags}]\n---\n{body}", encoding="utf-8")
+    if bump:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump))
+
+
+@pytest.fixture
+def vault(tmp_path):
+    vault = tmp_path / "vault"
+    write_note(vault, "alpha.md", "alpha")
+    write_note(vault, "notes/beta.md", "beta")
+    write_note(vault, "private.md", "private", tags="diary")
+    write_note(vault, ".obsidian/ignored.md", "ignored")
+    return vault
+
+
+def make_watcher(vault, **kwargs):
+    config = SyncConfig(
+        vault_path=str(vault),
+        knowledge_path=str(vault.parent / "knowledge"),
+        read_filters={"folders": [], "tags": ["osmen"], "exclude_folders": [".obsidian"]},
+        **kwargs,
+    )
+    return ObsidianSyncWatcher(config)
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Paths opened for hashing/tag extraction"""
+    opened = []
+    original = ObsidianSyncWatcher._read_note
+
+    def counting(self, file_path):
+        opened.append(str(file_path.relative_to(self.vault_path)))
+        return original(self, file_path)
+
+    monkeypatch.setattr(ObsidianSyncWatcher, "_read_note", counting)
+    return opened
+
+
+class TestChangeDetection:
+    def test_initial_sync_copies_readable_notes(self, vault):
+        watcher = make_watcher(vault)
+        changes = watcher.detect_changes()
+        assert sorted(c.path for c in changes) == ["alpha.md", os.path.join("notes", "beta.md")]
+        assert {c.change_type for c in changes} == {"created"}
+
+        result = watcher.sync_to_knowledge(changes)
+        assert result["synced"] == 2
+        assert (watcher.knowledge_path / "notes" / "beta.md").exists()
+        assert not (watcher.knowledge_path / "private.md").exists()
+
+    def test_restart_does_not_reread_unchanged_files(self, vault, reads):
+        watcher = make_watcher(vault)
+        watcher.sync_to_knowledge(watcher.detect_changes())
+        reads.clear()
+
+        restarted = make_watcher(vault)
+        assert restarted.detect_changes() == []
+        # Non-readable notes are remembered too
+        assert reads == []
+
+    def test_touch_without_edit_is_not_a_change(self, vault, reads):
+        watcher = make_watcher(vault)
+        watcher.sync_to_knowledge(watcher.detect_changes())
+        reads.clear()
+
+        write_note(vault, "alpha.md", "alpha", bump=10**9)
+        assert watcher.detect_changes() == []
+        assert reads == ["alpha.md"]
+        assert watcher.detect_changes() == []
+        assert reads == ["alpha.md"]
+
+    def test_edits_deletions_and_filter_changes(self, vault):
+        watcher = make_watcher(vault)
+        watcher.sync_to_knowledge(watcher.detect_changes())
+
+        write_note(vault, "alpha.md", "alpha edited", bump=10**9)
+        write_note(vault, "private.md", "now shared", bump=10**9)
+        write_note(vault, "notes/beta.md", "beta", tags="diary", bump=10**9)
+        changes = {c.path: c.change_type for c in watcher.detect_changes()}
+        assert changes == {
+            "alpha.md": "modified",
+            "private.md": "created",
+            os.path.join("notes", "beta.md"): "deleted",
+        }
+
+        watcher.sync_to_knowledge([c for c in watcher.detect_changes()])
+        assert not (watcher.knowledge_path / "notes" / "beta.md").exists()
+        assert (watcher.knowledge_path / "alpha.md").read_text().endswith("alpha edited")
+
+        (vault / "alpha.md").unlink()
+        deleted = watcher.detect_changes()
+        assert [(c.path, c.change_type) for c in deleted] == [("alpha.md", "deleted")]
+        watcher.sync_to_knowledge(deleted)
+        assert watcher.detect_changes() == []
+
+    def test_legacy_mtime_state_is_upgraded_without_changes(self, vault):
+        state = {"alpha.md": str((vault / "alpha.md").stat().st_mtime)}
+        (vault / ".osmen_sync_state.json").write_text(json.dumps(state))
+
+        watcher = make_watcher(vault)
+        assert [c.path for c in watcher.detect_changes()] == [os.path.join("notes", "beta.md")]
+        assert watcher.sync_state["alpha.md"]["readable"] is True
+
+
+class TestBatching:
+    def test_sync_saves_manifest_once_and_collapses_repeats(self, vault, monkeypatch):
+        watcher = make_watcher(vault)
+        changes = watcher.detect_changes()
+        saves = []
+        monkeypatch.setattr(watcher, "_save_sync_state", lambda: saves.append(1))
+
+        result = watcher.sync_to_knowledge(changes + changes)
+        assert result["synced"] == 2
+        assert len(saves) == 1
+
+    def test_events_are_debounced_and_coalesced(self, vault):
+        watcher = make_watcher(vault, debounce_seconds=1.0, max_batch_delay_seconds=10.0)
+        watcher.sync_to_knowledge(watcher.detect_changes())
+
+        write_note(vault, "alpha.md", "alpha edited", bump=10**9)
+        for _ in range(3):
+            watcher._queue_path(str(vault / "alpha.md"))
+        watcher._queue_path(str(vault / "image.png"))
+        watcher._queue_path("/elsewhere/note.md")
+
+        first = watcher._first_event
+        assert watcher._take_pending(now=first + 0.5) is None
+        assert watcher._take_pending(now=first + 1.5) == ["alpha.md"]
+        assert watcher._take_pending(now=first + 3.0) is None
+
+        changes = watcher.detect_changes(["alpha.md"])
+        assert [(c.path, c.change_type) for c in changes] == [("alpha.md", "modified")]
+
+    def test_constant_activity_is_flushed_after_max_delay(self, vault):
+        watcher = make_watcher(vault, debounce_seconds=1.0, max_batch_delay_seconds=5.0)
+        watcher._queue_path(str(vault / "alpha.md"))
+        first = watcher._first_event
+        watcher._last_event = first + 4.9
+        assert watcher._take_pending(now=first + 5.0) == ["alpha.md"]
+
+    def test_directory_events_request_full_rescan(self, vault):
+        watcher = make_watcher(vault)
+        watcher._request_rescan()
+        assert watcher._take_pending(now=watcher._last_event + 5) == []
+
+    def test_polling_loop_syncs_batches(self, vault, monkeypatch):
+        watcher = make_watcher(vault, watch_mode="polling", poll_interval_seconds=60)
+        batches = []
+        original = watcher.sync_to_knowledge
+
+        def record(changes=None):
+            batches.append(len(changes))
+            result = original(changes)
+            watcher._stop_event.set()
+            return result
+
+        monkeypatch.setattr(watcher, "sync_to_knowledge", record)
+        watcher.start_watching()
+        watcher._watcher_thread.join(timeout=5)
+        watcher.stop_watching()
+        assert batches == [2]
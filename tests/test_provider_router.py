@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Test suite for the latency-aware LLM provider router
+Tests failover, cooldowns, hedged requests and capability-aware routing
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("loguru")
+
+from integrations.llm_providers import (
+    AnthropicProvider,
+    LLMConfig,
+    LLMProvider,
+    LLMResponse,
+    ModelCapability,
+    OllamaProvider,
+    OpenAIProvider,
+    ProviderRouter,
+    ProviderRoutingError,
+    ProviderType,
+)
+
+MODEL_TABLES = {
+    ProviderType.OLLAMA: OllamaProvider.RECOMMENDED_MODELS,
+    ProviderType.OPENAI: OpenAIProvider.MODELS,
+    ProviderType.ANTHROPIC: AnthropicProvider.MODELS,
+}
+
+
+class FakeProvider(LLMProvider):
+    """Answers after `delay` seconds, or raises `error`"""
+
+    def __init__(self, provider_type, model, delay=0.0, error=None):
+        super().__init__(LLMConfig(provider=provider_type, model=model, api_key="test"))
+        self.MODELS = MODEL_TABLES[provider_type]
+        self.provider_type = provider_type
+        self.delay = delay
+        self.error = error
+        self.calls = []
+        self.cancelled = 0
+
+    async def _respond(self, method):
+        self.calls.append(method)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error:
+            raise Exception(self.error)
+        return LLMResponse(
+            content=self.provider_type.value,
+            model=self.config.model,
+            provider=self.provider_type,
+            finish_reason="stop",
+        )
+
+    async def generate(self, prompt, **kwargs):
+        return await self._respond("generate")
+
+    async def chat(self, messages, **kwargs):
+        return await self._respond("chat")
+
+    async def tool_call(self, messages, tools, **kwargs):
+        return await self._respond("tool_call")
+
+    async def stream(self, messages, **kwargs):
+        response = await self._respond("stream")
+        for word in response.content.split():
+            yield word
+
+
+def make_router(*providers, **kwargs):
+    router = ProviderRouter(**kwargs)
+    for provider in providers:
+        router.register(provider.provider_type, provider)
+    return router
+
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+class TestFailover:
+    def test_fails_over_and_records_stats(self):
+        ollama = FakeProvider(ProviderType.OLLAMA, "llama3.2", error="Ollama API error 500: down")
+        openai = FakeProvider(ProviderType.OPENAI, "gpt-4o-mini")
+        router = make_router(ollama, openai)
+
+        response = asyncio.run(router.chat(MESSAGES))
+        assert response.provider == ProviderType.OPENAI
+
+        stats = router.get_stats()
+        assert stats["ollama"]["failures"] == 1
+        assert stats["openai"]["requests"] == 1
+        assert stats["openai"]["p50_ms"] is not None
+
+    def test_rate_limit_benches_provider_without_retrying(self):
+        openai = FakeProvider(ProviderType.OPENAI, "gpt-4o-mini", error="OpenAI API error 429: slow down")
+        anthropic = FakeProvider(ProviderType.ANTHROPIC, "claude-3-haiku-20240307")
+        router = make_router(openai, anthropic)
+
+        asyncio.run(router.chat(MESSAGES))
+        assert not openai.retry_rate_limited
+        assert router.ranked() == [ProviderType.ANTHROPIC, ProviderType.OPENAI]
+        assert router.get_stats()["openai"]["rate_limited"] == 1
+        assert router.get_stats()["openai"]["cooldown_remaining_s"] > 0
+
+        asyncio.run(router.chat(MESSAGES))
+        assert openai.calls == ["chat"]
+
+    def test_all_failures_raise_routing_error(self):
+        router = make_router(
+            FakeProvider(ProviderType.OLLAMA, "llama3.2", error="Ollama API error 500: a"),
+            FakeProvider(ProviderType.OPENAI, "gpt-4o", error="OpenAI API error 500: b"),
+        )
+        with pytest.raises(ProviderRoutingError) as excinfo:
+            asyncio.run(router.generate("hello"))
+        assert set(excinfo.value.errors) == {"ollama", "openai"}
+
+    def test_stream_fails_over_before_first_chunk(self):
+        router = make_router(
+            FakeProvider(ProviderType.OLLAMA, "llama3.2", error="Ollama API error 500: x"),
+            FakeProvider(ProviderType.OPENAI, "gpt-4o"),
+        )
+
+        async def collect():
+            return [chunk async for chunk in router.stream(MESSAGES)]
+
+        assert asyncio.run(collect()) == ["openai"]
+
+
+class TestRanking:
+    def test_latency_reorders_providers(self):
+        slow = FakeProvider(ProviderType.OLLAMA, "llama3.2", delay=0.03)
+        fast = FakeProvider(ProviderType.OPENAI, "gpt-4o-mini")
+        router = make_router(slow, fast, min_samples=2)
+        assert router.ranked() == [ProviderType.OLLAMA, ProviderType.OPENAI]
+
+        async def warm_up():
+            for _ in range(2):
+                await router._call(ProviderType.OLLAMA, "chat", (MESSAGES,), {})
+                await router._call(ProviderType.OPENAI, "chat", (MESSAGES,), {})
+
+        asyncio.run(warm_up())
+        assert router.ranked() == [ProviderType.OPENAI, ProviderType.OLLAMA]
+        assert router.get_provider() is fast
+
+    def test_capabilities_route_tool_calls_and_vision(self):
+        ollama = FakeProvider(ProviderType.OLLAMA, "llama3.2")
+        anthropic = FakeProvider(ProviderType.ANTHROPIC, "claude-3-haiku-20240307")
+        router = make_router(ollama, anthropic)
+
+        # Native tool use is preferred; Ollama stays as a last resort
+        response = asyncio.run(router.tool_call(MESSAGES, tools=[]))
+        assert response.provider == ProviderType.ANTHROPIC
+        assert router.ranked(preferred=[ModelCapability.TOOL_USE])[-1] == ProviderType.OLLAMA
+
+        # Required capabilities exclude providers outright
+        assert router.ranked(required=[ModelCapability.VISION]) == [ProviderType.ANTHROPIC]
+        with pytest.raises(ProviderRoutingError):
+            asyncio.run(router.chat(MESSAGES, capabilities=[ModelCapability.JSON_MODE]))
+
+
+class TestHedging:
+    def test_slow_primary_is_hedged(self):
+        slow = FakeProvider(ProviderType.OLLAMA, "llama3.2", delay=1.0)
+        fast = FakeProvider(ProviderType.OPENAI, "gpt-4o-mini")
+        router = make_router(slow, fast, hedge=True, hedge_delay=0.02)
+
+        response = asyncio.run(router.chat(MESSAGES))
+        assert response.provider == ProviderType.OPENAI
+        assert slow.cancelled == 1
+
+        stats = router.get_stats()["ollama"]
+        assert stats["hedges"] == 1 and stats["hedge_wins"] == 1
+        # The cancelled request is not counted as a failure
+        assert stats["failures"] == 0
+
+    def test_fast_primary_is_not_hedged(self):
+        primary = FakeProvider(ProviderType.OLLAMA, "llama3.2")
+        backup = FakeProvider(ProviderType.OPENAI, "gpt-4o-mini")
+        router = make_router(primary, backup, hedge=True, hedge_delay=0.5)
+
+        assert asyncio.run(router.chat(MESSAGES)).provider == ProviderType.OLLAMA
+        assert backup.calls == []
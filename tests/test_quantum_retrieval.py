@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Test suite for the quantum-inspired retrieval matrix
+Tests quantized scoring accuracy, content-dependent ranking and top-k order
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("loguru")
+
+from integrations.quantum_retrieval import (
+    OptimizedRAG,
+    QuantizedSparseMatrix,
+    QuantumInspiredRetrieval,
+    _top_k,
+)
+
+
+def make_embeddings(n=200, dim=64, seed=3):
+    return np.random.default_rng(seed).standard_normal((n, dim)).astype(np.float32)
+
+
+class TestQuantizedSparseMatrix:
+    def test_dense_int8_scores_match_cosine(self):
+        vectors = make_embeddings()
+        matrix = QuantizedSparseMatrix(64, sparse_ratio=1.0)
+        matrix.add(vectors)
+
+        query = vectors[5] / np.linalg.norm(vectors[5])
+        exact = (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)) @ query
+        assert np.allclose(matrix.scores(query)[0], exact, atol=0.02)
+
+    def test_sparse_rows_keep_top_dimensions(self):
+        matrix = QuantizedSparseMatrix(64, sparse_ratio=0.25)
+        assert matrix.k == 16
+        matrix.add(make_embeddings(n=10))
+        assert len(matrix) == 10
+        assert matrix.nbytes < 10 * 64 * 4
+
+    def test_scores_span_chunks(self, monkeypatch):
+        monkeypatch.setattr(QuantizedSparseMatrix, "CHUNK_ROWS", 7)
+        vectors = make_embeddings(n=50)
+        matrix = QuantizedSparseMatrix(64, sparse_ratio=0.5)
+        for start in range(0, 50, 9):
+            matrix.add(vectors[start:start + 9])
+
+        scores = matrix.scores(vectors[:2])
+        assert scores.shape == (2, 50)
+        assert scores[0].argmax() == 0
+        assert scores[1].argmax() == 1
+
+    def test_dimension_mismatch_rejected(self):
+        with pytest.raises(ValueError):
+            QuantizedSparseMatrix(64).add(np.ones((1, 32)))
+
+
+def test_top_k_orders_best_first():
+    scores = np.array([0.1, 0.9, 0.4, 0.7, 0.2])
+    assert _top_k(scores, 3).tolist() == [1, 3, 2]
+    assert _top_k(scores, 10).tolist() == [1, 3, 2, 4, 0]
+
+
+class TestOptimizedRAG:
+    def test_query_ranks_by_content(self):
+        vectors = make_embeddings()
+        rag = OptimizedRAG(sparse_ratio=0.5)
+        ids = rag.add_documents([f"doc {i}" for i in range(len(vectors))], vectors)
+
+        # An ambiguous query still ranks the nearest document first
+        results = rag.query("What is it?", top_k=3, query_embedding=vectors[42])
+        assert results[0]["id"] == ids[42]
+        assert results[0]["text"] == "doc 42"
+        assert results[0]["score"] >= results[1]["score"] >= results[2]["score"]
+
+    def test_embed_fn_used_for_interpretations(self):
+        vectors = make_embeddings(n=20)
+        calls = []
+
+        def embed(texts):
+            calls.append(texts)
+            return [vectors[7]] * len(texts)
+
+        rag = OptimizedRAG(sparse_ratio=1.0, embed_fn=embed)
+        rag.add_documents([f"doc {i}" for i in range(20)], vectors)
+
+        results = rag.query("What is it", top_k=1, context={"previous_topic": "agents"})
+        assert results[0]["text"] == "doc 7"
+        assert results[0]["interpretation"]["focus"] == "anaphoric"
+        # Interpretations share the query text, so it is embedded once
+        assert calls == [["What is it"]]
+
+    def test_query_without_embedding_falls_back_to_priors(self):
+        rag = OptimizedRAG()
+        rag.add_documents(["a", "b", "c"], make_embeddings(n=3))
+
+        results = rag.query("anything", top_k=2)
+        assert [r["text"] for r in results] == ["a", "b"]
+        assert results[0]["score"] == results[1]["score"] > 0
+
+    def test_sparse_mode_reranks_candidates_exactly(self):
+        vectors = make_embeddings(n=500)
+        unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        query = unit[:40].sum(axis=0)
+        exact = [f"doc_{row}" for row in np.argsort(-(unit @ query))[:10]]
+
+        def top_ids(rerank_factor):
+            rag = OptimizedRAG(sparse_ratio=0.25, rerank_factor=rerank_factor)
+            rag.add_documents([f"doc {i}" for i in range(250)], vectors[:250])
+            rag.add_documents([f"doc {i}" for i in range(250, 500)], vectors[250:])
+            return [r["id"] for r in rag.query("find this", top_k=10, query_embedding=query)]
+
+        # The sparse pass alone misses neighbours; reranking 5x candidates recovers them
+        assert top_ids(1) != exact
+        assert top_ids(5) == exact
+
+    def test_stats_report_matrix_memory(self):
+        rag = OptimizedRAG()
+        assert rag.get_stats()["total_documents"] == 0
+        rag.add_documents(["a", "b"], make_embeddings(n=2, dim=384))
+        stats = rag.get_stats()
+        assert stats["total_documents"] == 2
+        # int8 dense by default
+        assert stats["avg_sparse_dimensions"] == 384
+        assert stats["rerank_bytes"] == 0
+        assert stats["matrix_bytes"] < 2 * 384 * 4
+
+        sparse = OptimizedRAG(sparse_ratio=0.1)
+        sparse.add_documents(["a", "b"], make_embeddings(n=2, dim=384))
+        stats = sparse.get_stats()
+        assert stats["avg_sparse_dimensions"] == 38
+        assert stats["rerank_bytes"] == 2 * 384 * 4
+
+
+def test_retrieve_scores_document_content():
+    retrieval = QuantumInspiredRetrieval(sparse_ratio=0.5)
+    vectors = make_embeddings(n=30)
+    documents = [retrieval.quantum_compress(v) for v in vectors]
+
+    results = retrieval.retrieve("find this", documents, top_k=2, query_embedding=vectors[11])
+    assert results[0][0] is documents[11]
+
+    state = retrieval.create_query_state("find this")
+    near = retrieval.interference_score(state, documents[11], vectors[11])
+    far = retrieval.interference_score(state, documents[11], -vectors[11])
+    assert near > far
+
+
+def test_retrieve_without_embedding_keeps_old_signature():
+    retrieval = QuantumInspiredRetrieval()
+    documents = [retrieval.quantum_compress(v) for v in make_embeddings(n=4)]
+
+    results = retrieval.retrieve("What is it?", documents, 2)
+    assert [doc for doc, _, _ in results] == documents[:2]
+    assert all(0 < score <= 1 for _, score, _ in results)
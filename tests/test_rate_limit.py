@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test suite for the gateway rate limiting middleware
+Tests the sliding window counter strategy and idle key sweeping
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from gateway.middleware.rate_limit import (
+    FixedWindowStrategy,
+    RateLimitConfig,
+    RateLimiter,
+    SlidingWindowCounterStrategy,
+    SlidingWindowStrategy,
+    TokenBucketStrategy,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock(6000.0)
+    with patch("gateway.middleware.rate_limit.time.time", fake):
+        yield fake
+
+
+class MockRequest:
+    def __init__(self, ip: str, path: str = "/api/test"):
+        self.client = type("Client", (), {"host": ip})()
+        self.url = type("URL", (), {"path": path})()
+
+
+class TestSlidingWindowCounter:
+    """Test the two-bucket sliding window counter"""
+
+    def test_enforces_limit_within_window(self, clock):
+        strategy = SlidingWindowCounterStrategy(window_size=60)
+        config = RateLimitConfig(requests_per_minute=5)
+        results = [strategy.check("k", config) for _ in range(6)]
+        assert [r.allowed for r in results] == [True] * 5 + [False]
+        assert results[4].remaining == 0
+        assert results[5].retry_after > 0
+
+    def test_previous_window_is_weighted(self, clock):
+        strategy = SlidingWindowCounterStrategy(window_size=60)
+        config = RateLimitConfig(requests_per_minute=10)
+        for _ in range(10):
+            assert strategy.check("k", config).allowed
+
+        # Halfway through the next window, half of the previous count still applies
+        clock.now += 90
+        allowed = [strategy.check("k", config).allowed for _ in range(6)]
+        assert allowed == [True] * 5 + [False]
+
+        # Two full windows later the old count no longer matters
+        clock.now += 120
+        assert strategy.check("k", config).remaining == 9
+
+    def test_state_is_constant_per_key(self, clock):
+        strategy = SlidingWindowCounterStrategy(window_size=60)
+        config = RateLimitConfig(requests_per_minute=1000)
+        for _ in range(500):
+            strategy.check("k", config)
+        assert strategy.tracked_keys() == 1
+        assert strategy._counters["k"].current == 500
+
+
+class TestSweep:
+    """Test idle key expiry"""
+
+    @pytest.mark.parametrize("factory", [
+        TokenBucketStrategy,
+        lambda: SlidingWindowStrategy(window_size=60),
+        lambda: SlidingWindowCounterStrategy(window_size=60),
+        lambda: FixedWindowStrategy(window_size=3600),
+    ])
+    def test_sweep_expires_only_idle_keys(self, clock, factory):
+        strategy = factory()
+        config = RateLimitConfig(requests_per_second=10, requests_per_minute=100, burst_size=5)
+        for i in range(50):
+            strategy.check(f"key-{i}", config)
+
+        assert strategy.sweep() == 0
+        assert strategy.tracked_keys() == 50
+
+        clock.now += 7200
+        strategy.check("active", config)
+        assert strategy.sweep() == 50
+        assert strategy.tracked_keys() == 1
+
+    def test_token_bucket_new_key_starts_full(self, clock):
+        strategy = TokenBucketStrategy()
+        config = RateLimitConfig(requests_per_second=1, burst_size=3)
+        allowed = [strategy.check("k", config).allowed for _ in range(4)]
+        assert allowed == [True, True, True, False]
+
+    def test_limiter_sweep_prunes_stats(self, clock):
+        limiter = RateLimiter(RateLimitConfig(burst_size=5))
+        for i in range(20):
+            limiter.check(MockRequest(f"10.0.0.{i}"))
+        assert limiter.get_stats()["tracked_keys"]["minute"] == 20
+
+        clock.now += 7200
+        assert limiter.sweep() == 60
+        assert limiter.get_stats()["tracked_keys"] == {"burst": 0, "minute": 0, "hour": 0}
+        assert not limiter._stats["by_key"]
+
+    def test_background_sweeper(self, clock):
+        async def run():
+            limiter = RateLimiter(sweep_interval=0.01)
+            limiter.check(MockRequest("10.0.0.1"))
+            clock.now += 7200
+            assert limiter.start_sweeper() is limiter.start_sweeper()
+            await asyncio.sleep(0.05)
+            await limiter.stop_sweeper()
+            return limiter.get_stats()["tracked_keys"]
+
+        assert asyncio.run(run()) == {"burst": 0, "minute": 0, "hour": 0}
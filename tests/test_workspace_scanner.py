@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test suite for the workspace scanner
+Tests incremental rescans, delta reporting and process-pool analysis
+"""
+
+import os
+from dataclasses import asdict
+
+import pytest
+
+pytest.importorskip("watchdog")
+
+from agents.workspace_scanner import WorkspaceScannerAgent
+
+FILES = {
+    "agents/demo/demo_agent.py": '"""Demo agent for calendar reminders"""\nclass DemoAgent:\n    pass\n',
+    "agents/demo/README.md": "Demo agent folder\n",
+    "integrations/mail.py": '"""Email integration"""\n',
+    "tools/speak.py": '"""TTS tool"""\n',
+    "langflow/flows/other_flow.json": '{"description": "flow", "nodes": [1, 2]}',
+    "docs/guide.md": "# Guide\n",
+}
+
+
+def write(root, rel_path, text, bump=0):
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    if bump:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump))
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    for rel_path, text in FILES.items():
+        write(tmp_path, rel_path, text)
+    return tmp_path
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Paths analyzed (read) by the scanner"""
+    analyzed = []
+    original = WorkspaceScannerAgent._analyze_file
+
+    def counting(self, rel_path, stat=None):
+        analyzed.append(rel_path)
+        return original(self, rel_path, stat)
+
+    monkeypatch.setattr(WorkspaceScannerAgent, "_analyze_file", counting)
+    return analyzed
+
+
+def comparable(workspace_map):
+    data = asdict(workspace_map)
+    for key in ("generated_at", "last_updated"):
+        data.pop(key)
+    return data
+
+
+class TestIncrementalScan:
+    def test_unchanged_workspace_reads_nothing(self, workspace, reads, tmp_path_factory):
+        scanner = WorkspaceScannerAgent(str(workspace))
+        full = comparable(scanner.scan_workspace())
+        assert sorted(scanner.last_delta.added) == sorted(
+            os.path.normpath(p) for p in FILES
+        )
+        reads.clear()
+
+        # A restarted scanner picks up the saved map
+        map_path = tmp_path_factory.mktemp("map") / "workspace_map.json"
+        scanner.save_map(map_path)
+        restarted = WorkspaceScannerAgent(str(workspace))
+        restarted.load_map(map_path)
+        assert comparable(restarted.scan_workspace(incremental=True)) == full
+        assert restarted.last_delta.is_empty
+        assert restarted.last_delta.unchanged == len(FILES)
+        assert reads == []
+
+    def test_delta_reports_changes(self, workspace, reads):
+        scanner = WorkspaceScannerAgent(str(workspace))
+        scanner.scan_workspace()
+        reads.clear()
+
+        write(workspace, "tools/speak.py", '"""Whisper transcription tool"""\n', bump=10**9)
+        write(workspace, "docs/guide.md", "# Guide\n", bump=10**9)  # touched only
+        write(workspace, "langflow/flows/demo_flow.json", '{"nodes": []}')
+        (workspace / "integrations" / "mail.py").unlink()
+
+        updated = scanner.scan_workspace(incremental=True)
+        delta = scanner.last_delta
+        assert delta.added == [os.path.join("langflow", "flows", "demo_flow.json")]
+        assert delta.changed == [os.path.join("tools", "speak.py")]
+        assert delta.removed == [os.path.join("integrations", "mail.py")]
+        assert sorted(reads) == sorted(
+            os.path.join(*p.split("/"))
+            for p in ("tools/speak.py", "docs/guide.md", "langflow/flows/demo_flow.json")
+        )
+
+        # The result matches a full scan, including derived sections
+        assert comparable(updated) == comparable(
+            WorkspaceScannerAgent(str(workspace)).scan_workspace()
+        )
+        agent = updated.agents[os.path.join("agents", "demo", "demo_agent.py")]
+        assert agent["has_langflow_flow"] is True
+        assert "speech_to_text" in updated.capabilities
+
+    def test_walk_stat_is_reused_for_analysis(self, workspace, monkeypatch):
+        passed = []
+        original = WorkspaceScannerAgent._process_file
+
+        def recording(self, path, stat=None):
+            passed.append(stat)
+            return original(self, path, stat)
+
+        monkeypatch.setattr(WorkspaceScannerAgent, "_process_file", recording)
+        WorkspaceScannerAgent(str(workspace)).scan_workspace(workers=1)
+        assert len(passed) == len(FILES)
+        assert all(isinstance(stat, os.stat_result) for stat in passed)
+
+    def test_readme_change_refreshes_directory_description(self, workspace):
+        scanner = WorkspaceScannerAgent(str(workspace))
+        scanner.scan_workspace()
+        write(workspace, "agents/demo/README.md", "Renamed folder\n", bump=10**9)
+
+        updated = scanner.scan_workspace(incremental=True)
+        assert updated.directories[os.path.join("agents", "demo")]["description"] == (
+            "Renamed folder"
+        )
+
+
+def test_process_pool_matches_inline(workspace, monkeypatch):
+    inline = comparable(WorkspaceScannerAgent(str(workspace)).scan_workspace(workers=1))
+
+    monkeypatch.setattr(WorkspaceScannerAgent, "PARALLEL_MIN_FILES", 1)
+    pooled = comparable(WorkspaceScannerAgent(str(workspace)).scan_workspace(workers=2))
+    assert pooled == inline
@@ -6,7 +6,10 @@ Provides bidirectional sync between OsMEN knowledge base and Obsidian vault.
 Implements watcher-based detection with permission protocols and approval queues.
 
 Key Features:
-- Watcher-based file change detection (polling or watchdog)
+- Watcher-based file change detection (watchdog events with debouncing,
+  or polling as a fallback)
+- Persistent (mtime, size, hash) manifest: unchanged files are never
+  re-read, including across restarts
 - Read filters: Only read notes with specific tags or from specific folders
 - Write-only to exports/: Agents can only write to designated export folder
 - Permission protocols: Respect agent roles and approval requirements
@@ -24,17 +27,27 @@ import time
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from integrations.obsidian_indexer import FileStat, scan_vault
 from tools.obsidian.obsidian_integration import ObsidianIntegration
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Optional dependencies
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
 
 @dataclass
 class SyncConfig:
@@ -54,6 +67,9 @@ class SyncConfig:
     poll_interval_seconds: int = 30
     sync_state_file: str = ".osmen_sync_state.json"
     enabled: bool = True
+    watch_mode: str = "auto"  # 'auto' (events if watchdog is installed), 'events', 'polling'
+    debounce_seconds: float = 1.0  # Quiet period before a batch of events is synced
+    max_batch_delay_seconds: float = 10.0  # Upper bound on delay under constant activity
 
 
 @dataclass
@@ -107,8 +123,11 @@ class ObsidianSyncWatcher:
         # Initialize Obsidian integration
         self.obsidian = ObsidianIntegration(str(self.vault_path))
 
-        # Sync state tracking
-        self.sync_state: Dict[str, str] = {}
+        # Sync state: manifest of path -> {mtime_ns, size, hash, tags, readable}.
+        # Entries written by older versions are plain mtime strings.
+        self.sync_state: Dict[str, Any] = {}
+        self._state_dirty = False
+        self._lock = threading.RLock()
         self._load_sync_state()
 
         # Change tracking
@@ -118,9 +137,19 @@ class ObsidianSyncWatcher:
 
         # Watcher control
         self._running = False
+        self._stop_event = threading.Event()
         self._watcher_thread: Optional[threading.Thread] = None
+        self._observer: Optional[Any] = None
+        self._active_mode: Optional[str] = None
         self._callbacks: List[Callable[[FileChange], None]] = []
 
+        # Paths reported by filesystem events, waiting for the debounce
+        self._pending_lock = threading.Lock()
+        self._pending_paths: set = set()
+        self._rescan_requested = False
+        self._first_event = 0.0
+        self._last_event = 0.0
+
         logger.info(f"ObsidianSyncWatcher initialized for vault: {self.vault_path}")
 
     def _load_config(self) -> SyncConfig:
@@ -155,6 +184,11 @@ class ObsidianSyncWatcher:
                     "state_file", ".osmen_sync_state.json"
                 ),
                 enabled=obsidian_config.get("enabled", True),
+                watch_mode=obsidian_config.get("watch_mode", "auto"),
+                debounce_seconds=obsidian_config.get("debounce_seconds", 1.0),
+                max_batch_delay_seconds=obsidian_config.get(
+                    "max_batch_delay_seconds", 10.0
+                ),
             )
 
         return default_config
@@ -172,15 +206,37 @@ class ObsidianSyncWatcher:
                 self.sync_state = {}
 
     def _save_sync_state(self):
-        """Save sync state to file."""
+        """Save sync state to file (atomically, so a crash cannot truncate it)."""
         state_file = self.vault_path / self.config.sync_state_file
+        temp_file = state_file.with_name(state_file.name + ".tmp")
 
         try:
-            with open(state_file, "w") as f:
-                json.dump(self.sync_state, f, indent=2)
+            with open(temp_file, "w") as f:
+                json.dump(self.sync_state, f)
+            os.replace(temp_file, state_file)
+            self._state_dirty = False
         except Exception as e:
             logger.warning(f"Failed to save sync state: {e}")
 
+    def _record(
+        self, relative_path: str, file_stat: FileStat, content_hash: str,
+        tags: List[str], readable: bool,
+    ):
+        """Record a file's stat, hash and filter result in the manifest."""
+        self.sync_state[relative_path] = {
+            "mtime_ns": file_stat[0],
+            "size": file_stat[1],
+            "hash": content_hash,
+            "tags": tags,
+            "readable": readable,
+        }
+        self._state_dirty = True
+
+    @staticmethod
+    def _was_readable(entry: Any) -> bool:
+        # Legacy entries only ever recorded synced (readable) files
+        return isinstance(entry, str) or bool(entry and entry.get("readable"))
+
     # =========================================================================
     # Read Filtering
     # =========================================================================
@@ -188,62 +244,65 @@ class ObsidianSyncWatcher:
     def _should_read_file(self, file_path: Path) -> bool:
         """Check if a file should be read based on filters."""
         relative_path = file_path.relative_to(self.vault_path)
+        if self._is_excluded(relative_path) or not self._path_allowed(relative_path):
+            return False
+        return self._tags_allowed(self._extract_tags_from_file(file_path))
 
-        # Check excluded folders
+    def _is_excluded(self, relative_path: Path) -> bool:
+        """Check excluded folders."""
         exclude_folders = self.config.read_filters.get("exclude_folders", [])
-        for folder in exclude_folders:
-            if relative_path.parts[0] == folder or folder in relative_path.parts:
-                return False
+        return any(folder in relative_path.parts for folder in exclude_folders)
 
-        # Check allowed folders (if specified)
+    def _path_allowed(self, relative_path: Path) -> bool:
+        """Check allowed folders (if specified)."""
         allowed_folders = self.config.read_filters.get("folders", [])
-        if allowed_folders:
-            if not any(
-                relative_path.is_relative_to(folder) for folder in allowed_folders
-            ):
-                return False
+        return not allowed_folders or any(
+            relative_path.is_relative_to(folder) for folder in allowed_folders
+        )
 
-        # Check file content for tags (if tag filter is active)
+    def _tags_allowed(self, tags: List[str]) -> bool:
+        """Check file tags (if tag filter is active)."""
         required_tags = self.config.read_filters.get("tags", [])
-        if required_tags:
-            tags = self._extract_tags_from_file(file_path)
-            if not any(tag in required_tags for tag in tags):
-                return False
-
-        return True
+        return not required_tags or any(tag in required_tags for tag in tags)
 
     def _extract_tags_from_file(self, file_path: Path) -> List[str]:
         """Extract tags from a markdown file."""
-        if not file_path.exists():
-            return []
+        note = self._read_note(file_path)
+        return note[1] if note else []
 
+    def _read_note(self, file_path: Path) -> Optional[Tuple[str, List[str]]]:
+        """Read a file once for both its content hash and its tags."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Extract frontmatter tags
-            tags = []
-            if content.startswith("---"):
-                parts = content.split("---", 2)
-                if len(parts) >= 3:
-                    frontmatter = parts[1]
-                    tag_match = re.search(r"tags:\s*\[(.*?)\]", frontmatter)
-                    if tag_match:
-                        tags.extend(
-                            [
-                                t.strip().strip("\"'")
-                                for t in tag_match.group(1).split(",")
-                            ]
-                        )
+            with open(file_path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to read {file_path}: {e}")
+            return None
+        content = raw.decode("utf-8", errors="replace")
+        return hashlib.md5(raw).hexdigest(), self._tags_from_content(content)
+
+    @staticmethod
+    def _tags_from_content(content: str) -> List[str]:
+        """Extract frontmatter and inline tags from markdown content."""
+        # Extract frontmatter tags
+        tags = []
+        if content.startswith("---"):
+            parts = content.split("---", 2)
+            if len(parts) >= 3:
+                frontmatter = parts[1]
+                tag_match = re.search(r"tags:\s*\[(.*?)\]", frontmatter)
+                if tag_match:
+                    tags.extend(
+                        [t.strip().strip("\"'") for t in tag_match.group(1).split(",")]
+                    )
 
-            # Extract inline tags
-            inline_tags = re.findall(r"(?:^|\s)#([a-zA-Z][a-zA-Z0-9_/-]*)", content)
-            tags.extend(inline_tags)
+        # Extract inline tags
+        inline_tags = re.findall(r"(?:^|\s)#([a-zA-Z][a-zA-Z0-9_/-]*)", content)
+        tags.extend(inline_tags)
 
-            return list(set(tags))
-        except Exception as e:
-            logger.warning(f"Failed to extract tags from {file_path}: {e}")
-            return []
+        return list(set(tags))
 
     # =========================================================================
     # Write Permissions
@@ -354,9 +413,21 @@ class ObsidianSyncWatcher:
             with open(target_path, "w", encoding="utf-8") as f:
                 f.write("\n".join(full_content))
 
-            # Update sync state
-            self.sync_state[str(relative_path)] = str(target_path.stat().st_mtime)
-            self._save_sync_state()
+            # Record in the manifest so the watcher does not sync it back
+            stat = target_path.stat()
+            note = self._read_note(target_path)
+            if note:
+                content_hash, tags = note
+                with self._lock:
+                    self._record(
+                        str(relative_path),
+                        (stat.st_mtime_ns, stat.st_size),
+                        content_hash,
+                        tags,
+                        readable=self._path_allowed(relative_path)
+                        and self._tags_allowed(tags),
+                    )
+                    self._save_sync_state()
 
             # Log sync record
             self.sync_history.append(
@@ -384,64 +455,130 @@ class ObsidianSyncWatcher:
     # Change Detection
     # =========================================================================
 
-    def detect_changes(self) -> List[FileChange]:
+    def detect_changes(self, paths: Optional[Iterable[str]] = None) -> List[FileChange]:
         """
-        Detect all file changes since last sync.
+        Detect file changes since last sync.
+
+        Files whose mtime and size match the manifest are not opened. A
+        file whose content hash is unchanged (e.g. touched) only has its
+        manifest entry refreshed.
+
+        Args:
+            paths: Vault-relative paths to check (from watcher events);
+                the whole vault is scanned when omitted
 
         Returns:
             List of FileChange objects
         """
-        changes = []
-        current_files: Set[str] = set()
-
-        # Scan vault for markdown files
-        for md_file in self.vault_path.rglob("*.md"):
-            relative_path = str(md_file.relative_to(self.vault_path))
-            current_files.add(relative_path)
-
-            # Check if file should be read
-            if not self._should_read_file(md_file):
-                continue
-
-            # Get current modification time
-            current_mtime = str(md_file.stat().st_mtime)
-            previous_mtime = self.sync_state.get(relative_path)
-
-            if previous_mtime is None:
-                # New file
-                changes.append(
-                    FileChange(
-                        path=relative_path,
-                        change_type="created",
-                        timestamp=datetime.now().isoformat(),
-                        content_hash=self._hash_file(md_file),
-                        tags=self._extract_tags_from_file(md_file),
-                    )
-                )
-            elif current_mtime != previous_mtime:
-                # Modified file
-                changes.append(
-                    FileChange(
-                        path=relative_path,
-                        change_type="modified",
-                        timestamp=datetime.now().isoformat(),
-                        content_hash=self._hash_file(md_file),
-                        tags=self._extract_tags_from_file(md_file),
-                    )
-                )
-
-        # Detect deleted files
-        for prev_path in list(self.sync_state.keys()):
-            if prev_path not in current_files:
-                changes.append(
-                    FileChange(
-                        path=prev_path,
-                        change_type="deleted",
-                        timestamp=datetime.now().isoformat(),
+        with self._lock:
+            if paths is None:
+                found = dict(self._scan_vault())
+                candidates = list(self.sync_state)
+            else:
+                candidates = list(dict.fromkeys(paths))
+                found = {}
+                for relative_path in candidates:
+                    file_stat = self._stat_note(relative_path)
+                    if file_stat:
+                        found[relative_path] = file_stat
+
+            changes = []
+            for relative_path, file_stat in found.items():
+                change = self._check_file(relative_path, file_stat)
+                if change:
+                    changes.append(change)
+
+            # Detect deleted files
+            for prev_path in candidates:
+                if prev_path in found or prev_path not in self.sync_state:
+                    continue
+                if self._was_readable(self.sync_state[prev_path]):
+                    changes.append(
+                        FileChange(
+                            path=prev_path,
+                            change_type="deleted",
+                            timestamp=datetime.now().isoformat(),
+                        )
                     )
+                else:
+                    del self.sync_state[prev_path]
+                    self._state_dirty = True
+
+            if self._state_dirty:
+                self._save_sync_state()
+            return changes
+
+    def _check_file(self, relative_path: str, file_stat: FileStat) -> Optional[FileChange]:
+        """Compare one file with its manifest entry, reading it only if its stat changed."""
+        entry = self.sync_state.get(relative_path)
+        if isinstance(entry, dict) and (entry.get("mtime_ns"), entry.get("size")) == file_stat:
+            return None
+
+        note = self._read_note(self.vault_path / relative_path)
+        if note is None:
+            return None
+        content_hash, tags = note
+        was_readable = self._was_readable(entry)
+
+        if not self._tags_allowed(tags):
+            if was_readable:
+                # No longer passes the read filter: drop it from the knowledge base
+                return FileChange(
+                    path=relative_path,
+                    change_type="deleted",
+                    timestamp=datetime.now().isoformat(),
+                    content_hash=content_hash,
+                    tags=tags,
                 )
+            # Remembered so it is not read again until it changes
+            self._record(relative_path, file_stat, content_hash, tags, readable=False)
+            return None
+
+        if was_readable and (
+            (isinstance(entry, dict) and entry.get("hash") == content_hash)
+            or (isinstance(entry, str) and self._legacy_unchanged(relative_path, entry))
+        ):
+            self._record(relative_path, file_stat, content_hash, tags, readable=True)
+            return None
+
+        return FileChange(
+            path=relative_path,
+            change_type="modified" if was_readable else "created",
+            timestamp=datetime.now().isoformat(),
+            content_hash=content_hash,
+            tags=tags,
+        )
 
-        return changes
+    def _legacy_unchanged(self, relative_path: str, mtime: str) -> bool:
+        """Whether a file still has the mtime recorded by the old state format."""
+        try:
+            return str((self.vault_path / relative_path).stat().st_mtime) == mtime
+        except OSError:
+            return False
+
+    def _scan_vault(self) -> Iterator[Tuple[str, FileStat]]:
+        """Yield (relative path, stat) for notes passing the folder filters."""
+        for relative_path, file_stat in scan_vault(
+            self.vault_path,
+            lambda path: self._is_excluded(path.relative_to(self.vault_path)),
+        ):
+            if self._path_allowed(Path(relative_path)):
+                yield relative_path, file_stat
+
+    def _stat_note(self, relative_path: str) -> Optional[FileStat]:
+        """Stat a note that passes the folder filters, or None."""
+        path = Path(relative_path)
+        if (
+            path.suffix != ".md"
+            or self._is_excluded(path)
+            or not self._path_allowed(path)
+        ):
+            return None
+        try:
+            stat = (self.vault_path / path).stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
 
     def _hash_file(self, file_path: Path) -> str:
         """Compute MD5 hash of file content."""
@@ -461,66 +598,90 @@ class ObsidianSyncWatcher:
         """
         Sync changed files from vault to knowledge base.
 
+        The whole batch is applied under one lock and the manifest is
+        written once at the end. Repeated changes to a path collapse to
+        the latest one.
+
         Args:
             changes: List of changes to sync (or detect automatically)
 
         Returns:
             Sync result summary
         """
-        if changes is None:
-            changes = self.detect_changes()
+        with self._lock:
+            if changes is None:
+                changes = self.detect_changes()
 
-        results = {"synced": 0, "failed": 0, "skipped": 0, "details": []}
+            results = {"synced": 0, "failed": 0, "skipped": 0, "details": []}
+            latest = {change.path: change for change in changes}
+            created_dirs = set()
 
-        for change in changes:
-            if change.change_type == "deleted":
-                # Handle deletion
-                knowledge_path = self.knowledge_path / change.path
-                if knowledge_path.exists():
+            for change in latest.values():
+                knowledge_file = self.knowledge_path / change.path
+
+                if change.change_type == "deleted":
+                    # Handle deletion
                     try:
-                        knowledge_path.unlink()
+                        knowledge_file.unlink()
+                    except FileNotFoundError:
+                        pass
+                    except Exception as e:
+                        results["failed"] += 1
+                        logger.error(f"Failed to delete {change.path}: {e}")
+                        continue
+                    else:
                         results["synced"] += 1
                         results["details"].append(
                             {"path": change.path, "action": "deleted"}
                         )
-                        # Remove from sync state
-                        self.sync_state.pop(change.path, None)
-                    except Exception as e:
-                        results["failed"] += 1
-                        logger.error(f"Failed to delete {change.path}: {e}")
-                continue
-
-            # Read from vault
-            vault_file = self.vault_path / change.path
-            if not vault_file.exists():
-                results["skipped"] += 1
-                continue
-
-            try:
-                with open(vault_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                # Write to knowledge base
-                knowledge_file = self.knowledge_path / change.path
-                knowledge_file.parent.mkdir(parents=True, exist_ok=True)
-
-                with open(knowledge_file, "w", encoding="utf-8") as f:
-                    f.write(content)
-
-                # Update sync state
-                self.sync_state[change.path] = str(vault_file.stat().st_mtime)
+                    # Remove from sync state
+                    if self.sync_state.pop(change.path, None) is not None:
+                        self._state_dirty = True
+                    continue
+
+                # Read from vault; stat first, so a write racing with the
+                # copy leaves a stale stat and is picked up again
+                vault_file = self.vault_path / change.path
+                try:
+                    stat = vault_file.stat()
+                    with open(vault_file, "rb") as f:
+                        raw = f.read()
+                except FileNotFoundError:
+                    results["skipped"] += 1
+                    continue
+
+                try:
+                    content = raw.decode("utf-8")
+
+                    # Write to knowledge base
+                    if knowledge_file.parent not in created_dirs:
+                        knowledge_file.parent.mkdir(parents=True, exist_ok=True)
+                        created_dirs.add(knowledge_file.parent)
+
+                    with open(knowledge_file, "wb") as f:
+                        f.write(raw)
+
+                    # Update sync state
+                    self._record(
+                        change.path,
+                        (stat.st_mtime_ns, stat.st_size),
+                        hashlib.md5(raw).hexdigest(),
+                        self._tags_from_content(content),
+                        readable=True,
+                    )
 
-                results["synced"] += 1
-                results["details"].append(
-                    {"path": change.path, "action": change.change_type}
-                )
+                    results["synced"] += 1
+                    results["details"].append(
+                        {"path": change.path, "action": change.change_type}
+                    )
 
-            except Exception as e:
-                results["failed"] += 1
-                logger.error(f"Failed to sync {change.path}: {e}")
+                except Exception as e:
+                    results["failed"] += 1
+                    logger.error(f"Failed to sync {change.path}: {e}")
 
-        self._save_sync_state()
-        return results
+            if self._state_dirty:
+                self._save_sync_state()
+            return results
 
     # =========================================================================
     # Watcher Thread
@@ -531,45 +692,175 @@ class ObsidianSyncWatcher:
         self._callbacks.append(callback)
 
     def start_watching(self):
-        """Start the background watcher thread."""
+        """
+        Start the background watcher thread.
+
+        Uses filesystem events when watchdog is available (or polling when
+        configured or not installed). Either way the thread first
+        reconciles the vault against the manifest, which only reads files
+        changed while the watcher was stopped.
+        """
         if self._running:
             logger.warning("Watcher already running")
             return
 
+        mode = self._resolve_watch_mode()
         self._running = True
-        self._watcher_thread = threading.Thread(target=self._watch_loop, daemon=True)
+        self._stop_event.clear()
+        self._active_mode = mode
+
+        if mode == "events":
+            # Subscribe before reconciling so no change falls in between;
+            # paths seen twice are filtered by the manifest
+            self._observer = Observer()
+            self._observer.schedule(
+                self._make_event_handler(), str(self.vault_path), recursive=True
+            )
+            self._observer.start()
+            target = self._event_loop
+        else:
+            target = self._watch_loop
+
+        self._watcher_thread = threading.Thread(target=target, daemon=True)
         self._watcher_thread.start()
-        logger.info("Obsidian vault watcher started")
+        logger.info(f"Obsidian vault watcher started ({mode})")
 
     def stop_watching(self):
         """Stop the background watcher thread."""
         self._running = False
+        self._stop_event.set()
+        if self._observer:
+            self._observer.stop()
+            self._observer.join(timeout=5.0)
+            self._observer = None
         if self._watcher_thread:
             self._watcher_thread.join(timeout=5.0)
+        self._active_mode = None
         logger.info("Obsidian vault watcher stopped")
 
-    def _watch_loop(self):
-        """Main watcher loop (polling-based)."""
-        while self._running:
-            try:
-                changes = self.detect_changes()
+    def _resolve_watch_mode(self) -> str:
+        mode = self.config.watch_mode
+        if mode == "polling":
+            return "polling"
+        if WATCHDOG_AVAILABLE:
+            return "events"
+        if mode == "events":
+            logger.warning(
+                "watchdog not available, falling back to polling. "
+                "Install with: pip install watchdog"
+            )
+        return "polling"
+
+    def _make_event_handler(self):
+        watcher = self
+
+        class VaultEventHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.event_type in ("opened", "closed_no_write"):
+                    return
+                if event.is_directory:
+                    # Moving or deleting a folder changes every note in it
+                    if event.event_type in ("created", "moved", "deleted"):
+                        watcher._request_rescan()
+                    return
+                watcher._queue_path(event.src_path)
+                dest_path = getattr(event, "dest_path", "")
+                if dest_path:
+                    watcher._queue_path(dest_path)
+
+        return VaultEventHandler()
+
+    def _queue_path(self, src_path: str):
+        """Record a path reported by a filesystem event (called on watchdog's thread)."""
+        if not str(src_path).endswith(".md"):
+            return
+        try:
+            relative_path = str(Path(src_path).relative_to(self.vault_path))
+        except ValueError:
+            return
+        with self._pending_lock:
+            self._mark_event()
+            self._pending_paths.add(relative_path)
+
+    def _request_rescan(self):
+        with self._pending_lock:
+            self._mark_event()
+            self._rescan_requested = True
+
+    def _mark_event(self):
+        now = time.monotonic()
+        if not self._pending_paths and not self._rescan_requested:
+            self._first_event = now
+        self._last_event = now
+
+    def _take_pending(self, now: Optional[float] = None) -> Optional[List[str]]:
+        """
+        Hand over the coalesced event paths once the vault has been quiet for
+        debounce_seconds, or once the oldest event is max_batch_delay_seconds
+        old. Returns None when nothing is ready and [] for a full rescan.
+        """
+        now = time.monotonic() if now is None else now
+        with self._pending_lock:
+            if not self._pending_paths and not self._rescan_requested:
+                return None
+            quiet = now - self._last_event >= self.config.debounce_seconds
+            overdue = now - self._first_event >= self.config.max_batch_delay_seconds
+            if not (quiet or overdue):
+                return None
+            paths = [] if self._rescan_requested else sorted(self._pending_paths)
+            self._pending_paths = set()
+            self._rescan_requested = False
+            return paths
+
+    def _process_changes(self, changes: List[FileChange]) -> Optional[Dict[str, Any]]:
+        """Notify callbacks, then sync the whole batch at once."""
+        if not changes:
+            return None
 
-                for change in changes:
-                    # Notify callbacks
-                    for callback in self._callbacks:
-                        try:
-                            callback(change)
-                        except Exception as e:
-                            logger.error(f"Callback error: {e}")
+        for change in changes:
+            for callback in self._callbacks:
+                try:
+                    callback(change)
+                except Exception as e:
+                    logger.error(f"Callback error: {e}")
+
+        # Auto-sync to knowledge base
+        result = self.sync_to_knowledge(changes)
+        logger.info(
+            f"Synced {result['synced']} of {len(changes)} vault changes "
+            f"({result['failed']} failed)"
+        )
+        return result
 
-                    # Auto-sync to knowledge base
-                    self.sync_to_knowledge([change])
+    def _event_loop(self):
+        """Main watcher loop (event-driven): sync debounced batches of events."""
+        tick = max(0.05, min(self.config.debounce_seconds / 2, 1.0))
+        try:
+            self._process_changes(self.detect_changes())
+        except Exception as e:
+            logger.error(f"Watcher error: {e}")
 
-                time.sleep(self.config.poll_interval_seconds)
+        while not self._stop_event.wait(tick):
+            try:
+                paths = self._take_pending()
+                if paths is None:
+                    continue
+                self._process_changes(self.detect_changes(paths or None))
+            except Exception as e:
+                logger.error(f"Watcher error: {e}")
 
+    def _watch_loop(self):
+        """Main watcher loop (polling-based)."""
+        while self._running:
+            try:
+                self._process_changes(self.detect_changes())
+                delay = self.config.poll_interval_seconds
             except Exception as e:
                 logger.error(f"Watcher error: {e}")
-                time.sleep(5)  # Short retry delay on error
+                delay = 5  # Short retry delay on error
+
+            if self._stop_event.wait(delay):
+                break
 
     # =========================================================================
     # Status and Queries
@@ -584,6 +875,8 @@ class ObsidianSyncWatcher:
             "export_path": str(self.export_path),
             "write_policy": self.config.write_policy,
             "poll_interval": self.config.poll_interval_seconds,
+            "watch_mode": self._active_mode or self._resolve_watch_mode(),
+            "pending_events": len(self._pending_paths),
             "tracked_files": len(self.sync_state),
             "pending_changes": len(self.pending_changes),
             "approval_queue": len(self.approval_queue),
@@ -594,17 +887,22 @@ class ObsidianSyncWatcher:
         """List all notes that pass read filters."""
         readable = []
 
-        for md_file in self.vault_path.rglob("*.md"):
-            if self._should_read_file(md_file):
-                relative_path = md_file.relative_to(self.vault_path)
+        with self._lock:
+            for relative_path, file_stat in self._scan_vault():
+                # Reuse the manifest's tags for files that have not changed
+                entry = self.sync_state.get(relative_path)
+                if isinstance(entry, dict) and (entry.get("mtime_ns"), entry.get("size")) == file_stat:
+                    tags = entry.get("tags", [])
+                else:
+                    tags = self._extract_tags_from_file(self.vault_path / relative_path)
+                if not self._tags_allowed(tags):
+                    continue
                 readable.append(
                     {
-                        "path": str(relative_path),
-                        "title": md_file.stem,
-                        "tags": self._extract_tags_from_file(md_file),
-                        "modified": datetime.fromtimestamp(
-                            md_file.stat().st_mtime
-                        ).isoformat(),
+                        "path": relative_path,
+                        "title": Path(relative_path).stem,
+                        "tags": tags,
+                        "modified": datetime.fromtimestamp(file_stat[0] / 1e9).isoformat(),
                     }
                 )
 